@@ -0,0 +1,36 @@
+"""Index journal entry listings for keyset pagination
+
+Revision ID: a3c5e7f9b1d2
+Revises: f2b8d4e6a1c7
+Create Date: 2025-03-20 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c5e7f9b1d2'
+down_revision = 'f2b8d4e6a1c7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add idx_entry_journal_pinned_datetime (journal listings sort pinned first, newest first)."""
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+
+    indexes = {index["name"] for index in inspector.get_indexes("entry")}
+    if "idx_entry_journal_pinned_datetime" not in indexes:
+        op.create_index(
+            "idx_entry_journal_pinned_datetime",
+            "entry",
+            ["journal_id", "is_pinned", "entry_datetime_utc"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Drop idx_entry_journal_pinned_datetime."""
+    op.drop_index("idx_entry_journal_pinned_datetime", table_name="entry")
@@ -0,0 +1,64 @@
+"""Add deletion_jobs table for background journal deletion
+
+Revision ID: a9c3e5f7b2d4
+Revises: a3c5e7f9b1d2
+Create Date: 2025-03-23 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9c3e5f7b2d4'
+down_revision = 'a3c5e7f9b1d2'
+branch_labels = None
+depends_on = None
+
+JOB_STATUSES = ('pending', 'running', 'completed', 'failed', 'cancelled')
+
+
+def upgrade() -> None:
+    """Create deletion_jobs."""
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+
+    if "deletion_jobs" in inspector.get_table_names():
+        return
+
+    # job_status_enum already exists on PostgreSQL (export/import jobs)
+    job_status = sa.Enum(*JOB_STATUSES, name='job_status_enum').with_variant(
+        postgresql.ENUM(*JOB_STATUSES, name='job_status_enum', create_type=False),
+        'postgresql',
+    )
+
+    op.create_table('deletion_jobs',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('user_id', sa.Uuid(), nullable=False),
+    sa.Column('journal_id', sa.Uuid(), nullable=False),
+    sa.Column('status', job_status, nullable=False),
+    sa.Column('progress', sa.Integer(), nullable=False),
+    sa.Column('total_items', sa.Integer(), nullable=False),
+    sa.Column('processed_items', sa.Integer(), nullable=False),
+    sa.Column('result_data', sa.JSON(), nullable=True),
+    sa.Column('errors', sa.JSON(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_deletion_jobs_id'), 'deletion_jobs', ['id'], unique=False)
+    op.create_index(op.f('ix_deletion_jobs_journal_id'), 'deletion_jobs', ['journal_id'], unique=False)
+    op.create_index(op.f('ix_deletion_jobs_status'), 'deletion_jobs', ['status'], unique=False)
+    op.create_index(op.f('ix_deletion_jobs_user_id'), 'deletion_jobs', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop deletion_jobs."""
+    op.drop_index(op.f('ix_deletion_jobs_user_id'), table_name='deletion_jobs')
+    op.drop_index(op.f('ix_deletion_jobs_status'), table_name='deletion_jobs')
+    op.drop_index(op.f('ix_deletion_jobs_journal_id'), table_name='deletion_jobs')
+    op.drop_index(op.f('ix_deletion_jobs_id'), table_name='deletion_jobs')
+    op.drop_table('deletion_jobs')
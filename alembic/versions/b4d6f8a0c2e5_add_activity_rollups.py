@@ -0,0 +1,167 @@
+"""Add daily and monthly activity rollups, replacing entry_day_count
+
+Revision ID: b4d6f8a0c2e5
+Revises: a9c3e5f7b2d4
+Create Date: 2025-03-30 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4d6f8a0c2e5'
+down_revision = 'a9c3e5f7b2d4'
+branch_labels = None
+depends_on = None
+
+COUNTERS = (
+    "entry_count",
+    "word_count",
+    "mood_count",
+    "positive_mood_count",
+    "neutral_mood_count",
+    "negative_mood_count",
+)
+
+
+def _counter_columns(prefix: str):
+    columns = [sa.Column(name, sa.Integer(), nullable=False, server_default="0") for name in COUNTERS]
+    constraints = [
+        sa.CheckConstraint(f"{name} >= 0", name=f"check_{prefix}_{name}_positive")
+        for name in ("entry_count", "word_count", "mood_count")
+    ]
+    return columns + constraints
+
+
+def _month_expression(dialect: str) -> str:
+    if dialect == "postgresql":
+        return "CAST(date_trunc('month', activity_date) AS DATE)"
+    return "date(activity_date, 'start of month')"
+
+
+def upgrade() -> None:
+    """Create the rollup tables, backfill them and drop entry_day_count."""
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    tables = inspector.get_table_names()
+
+    if "daily_activity" not in tables:
+        op.create_table(
+            "daily_activity",
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.Column("user_id", sa.Uuid(), nullable=False),
+            sa.Column("activity_date", sa.Date(), nullable=False),
+            *_counter_columns("daily_activity"),
+            sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("user_id", "activity_date"),
+        )
+
+    if "monthly_activity" not in tables:
+        op.create_table(
+            "monthly_activity",
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.Column("user_id", sa.Uuid(), nullable=False),
+            sa.Column("month", sa.Date(), nullable=False),
+            *_counter_columns("monthly_activity"),
+            sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("user_id", "month"),
+        )
+
+    if "daily_tag_usage" not in tables:
+        op.create_table(
+            "daily_tag_usage",
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.Column("user_id", sa.Uuid(), nullable=False),
+            sa.Column("activity_date", sa.Date(), nullable=False),
+            sa.Column("tag_id", sa.Uuid(), nullable=False),
+            sa.Column("usage_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.CheckConstraint("usage_count >= 0", name="check_daily_tag_usage_positive"),
+            sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(["tag_id"], ["tag.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("user_id", "activity_date", "tag_id"),
+        )
+        op.create_index("idx_daily_tag_usage_tag", "daily_tag_usage", ["tag_id"], unique=False)
+
+    # Backfill from the source tables
+    op.execute(sa.text('DELETE FROM daily_tag_usage'))
+    op.execute(sa.text('DELETE FROM monthly_activity'))
+    op.execute(sa.text('DELETE FROM daily_activity'))
+    op.execute(sa.text('''
+        INSERT INTO daily_activity (created_at, updated_at, user_id, activity_date,
+            entry_count, word_count, mood_count, positive_mood_count, neutral_mood_count, negative_mood_count)
+        SELECT CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, user_id, entry_date,
+            COUNT(*), COALESCE(SUM(word_count), 0), 0, 0, 0, 0
+        FROM entry
+        WHERE user_id IS NOT NULL AND entry_date IS NOT NULL
+        GROUP BY user_id, entry_date
+    '''))
+    op.execute(sa.text('''
+        INSERT INTO daily_activity (created_at, updated_at, user_id, activity_date,
+            entry_count, word_count, mood_count, positive_mood_count, neutral_mood_count, negative_mood_count)
+        SELECT CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, mood_log.user_id, mood_log.logged_date,
+            0, 0, COUNT(*),
+            SUM(CASE WHEN mood.category = 'positive' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN mood.category = 'neutral' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN mood.category = 'negative' THEN 1 ELSE 0 END)
+        FROM mood_log
+        JOIN mood ON mood.id = mood_log.mood_id
+        WHERE mood_log.user_id IS NOT NULL AND mood_log.logged_date IS NOT NULL
+        GROUP BY mood_log.user_id, mood_log.logged_date
+        ON CONFLICT (user_id, activity_date) DO UPDATE SET
+            mood_count = excluded.mood_count,
+            positive_mood_count = excluded.positive_mood_count,
+            neutral_mood_count = excluded.neutral_mood_count,
+            negative_mood_count = excluded.negative_mood_count
+    '''))
+    month = _month_expression(connection.dialect.name)
+    op.execute(sa.text(f'''
+        INSERT INTO monthly_activity (created_at, updated_at, user_id, month,
+            entry_count, word_count, mood_count, positive_mood_count, neutral_mood_count, negative_mood_count)
+        SELECT CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, user_id, {month},
+            SUM(entry_count), SUM(word_count), SUM(mood_count),
+            SUM(positive_mood_count), SUM(neutral_mood_count), SUM(negative_mood_count)
+        FROM daily_activity
+        GROUP BY user_id, {month}
+    '''))
+    op.execute(sa.text('''
+        INSERT INTO daily_tag_usage (created_at, updated_at, user_id, activity_date, tag_id, usage_count)
+        SELECT CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, entry.user_id, entry.entry_date, entry_tag_link.tag_id, COUNT(*)
+        FROM entry_tag_link
+        JOIN entry ON entry.id = entry_tag_link.entry_id
+        WHERE entry.user_id IS NOT NULL AND entry.entry_date IS NOT NULL
+        GROUP BY entry.user_id, entry.entry_date, entry_tag_link.tag_id
+    '''))
+
+    # Superseded by daily_activity.entry_count
+    if "entry_day_count" in tables:
+        op.drop_table("entry_day_count")
+
+
+def downgrade() -> None:
+    """Restore entry_day_count from daily_activity and drop the rollups."""
+    op.create_table(
+        "entry_day_count",
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("entry_date", sa.Date(), nullable=False),
+        sa.Column("entry_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.CheckConstraint("entry_count >= 0", name="check_entry_day_count_positive"),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "entry_date"),
+    )
+    op.execute(sa.text('''
+        INSERT INTO entry_day_count (created_at, updated_at, user_id, entry_date, entry_count)
+        SELECT CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, user_id, activity_date, entry_count
+        FROM daily_activity
+        WHERE entry_count > 0
+    '''))
+
+    op.drop_index("idx_daily_tag_usage_tag", table_name="daily_tag_usage")
+    op.drop_table("daily_tag_usage")
+    op.drop_table("monthly_activity")
+    op.drop_table("daily_activity")
@@ -0,0 +1,55 @@
+"""Add pg_trgm indexes for tag and prompt substring search (PostgreSQL only)
+
+Revision ID: c1e3f5a7b9d2
+Revises: b4d6f8a0c2e5
+Create Date: 2025-04-06 00:00:00.000000
+
+"""
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+# revision identifiers, used by Alembic.
+revision = 'c1e3f5a7b9d2'
+down_revision = 'b4d6f8a0c2e5'
+branch_labels = None
+depends_on = None
+
+TRIGRAM_INDEXES = (
+    ("idx_tag_name_trgm", "tag", "name"),
+    ("idx_prompt_text_trgm", "prompt", "text"),
+)
+
+
+def upgrade() -> None:
+    """Create GIN trigram indexes so ILIKE '%q%' searches use an index."""
+    connection = op.get_bind()
+    if connection.dialect.name != "postgresql":
+        return
+
+    # The extension needs a privileged role; without it searches keep working unindexed
+    try:
+        with connection.begin_nested():
+            connection.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except sa.exc.DBAPIError as exc:
+        logger.warning("Skipping trigram indexes, pg_trgm is unavailable: %s", exc)
+        return
+
+    for index_name, table, column in TRIGRAM_INDEXES:
+        op.execute(sa.text(
+            f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} USING gin ({column} gin_trgm_ops)"
+        ))
+
+
+def downgrade() -> None:
+    """Drop the trigram indexes (the extension is left installed)."""
+    connection = op.get_bind()
+    if connection.dialect.name != "postgresql":
+        return
+
+    for index_name, _, _ in TRIGRAM_INDEXES:
+        op.execute(sa.text(f"DROP INDEX IF EXISTS {index_name}"))
@@ -0,0 +1,107 @@
+"""Add full-text search index for entries
+
+Revision ID: d1f3a9c2b7e4
+Revises: abc123def456
+Create Date: 2025-03-02 00:00:00.000000
+
+SQLite gets an FTS5 virtual table (entry_fts) kept in sync with the entry
+table by triggers. PostgreSQL gets a weighted, generated tsvector column
+(search_vector) with a GIN index. Both are backfilled from existing rows.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd1f3a9c2b7e4'
+down_revision = 'abc123def456'
+branch_labels = None
+depends_on = None
+
+
+def _upgrade_sqlite() -> None:
+    op.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS entry_fts USING fts5(
+            entry_id UNINDEXED,
+            title,
+            content,
+            tokenize = 'unicode61 remove_diacritics 2'
+        )
+    ''')
+
+    op.execute('''
+        CREATE TRIGGER IF NOT EXISTS entry_fts_after_insert AFTER INSERT ON entry
+        BEGIN
+            INSERT INTO entry_fts (entry_id, title, content)
+            VALUES (new.id, coalesce(new.title, ''), new.content);
+        END
+    ''')
+    op.execute('''
+        CREATE TRIGGER IF NOT EXISTS entry_fts_after_delete AFTER DELETE ON entry
+        BEGIN
+            DELETE FROM entry_fts WHERE entry_id = old.id;
+        END
+    ''')
+    op.execute('''
+        CREATE TRIGGER IF NOT EXISTS entry_fts_after_update AFTER UPDATE OF title, content ON entry
+        BEGIN
+            DELETE FROM entry_fts WHERE entry_id = old.id;
+            INSERT INTO entry_fts (entry_id, title, content)
+            VALUES (new.id, coalesce(new.title, ''), new.content);
+        END
+    ''')
+
+    # Backfill existing entries
+    op.execute('DELETE FROM entry_fts')
+    op.execute('''
+        INSERT INTO entry_fts (entry_id, title, content)
+        SELECT id, coalesce(title, ''), content FROM entry
+    ''')
+
+
+def _upgrade_postgresql(inspector) -> None:
+    entry_columns = {col["name"] for col in inspector.get_columns("entry")}
+    if "search_vector" not in entry_columns:
+        # A stored generated column backfills existing rows and stays in sync
+        # on every insert/update without application involvement.
+        op.execute(sa.text('''
+            ALTER TABLE entry ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+                setweight(to_tsvector('simple', coalesce(content, '')), 'B')
+            ) STORED
+        '''))
+
+    entry_indexes = {idx["name"] for idx in inspector.get_indexes("entry")}
+    if "idx_entry_search_vector" not in entry_indexes:
+        op.create_index(
+            "idx_entry_search_vector",
+            "entry",
+            ["search_vector"],
+            postgresql_using="gin",
+        )
+
+
+def upgrade() -> None:
+    """Create the full-text search index and backfill it."""
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+
+    if connection.dialect.name == "sqlite":
+        _upgrade_sqlite()
+    else:
+        _upgrade_postgresql(inspector)
+
+
+def downgrade() -> None:
+    """Drop the full-text search index."""
+    connection = op.get_bind()
+
+    if connection.dialect.name == "sqlite":
+        op.execute('DROP TRIGGER IF EXISTS entry_fts_after_update')
+        op.execute('DROP TRIGGER IF EXISTS entry_fts_after_delete')
+        op.execute('DROP TRIGGER IF EXISTS entry_fts_after_insert')
+        op.execute('DROP TABLE IF EXISTS entry_fts')
+    else:
+        op.execute(sa.text('DROP INDEX IF EXISTS idx_entry_search_vector'))
+        op.execute(sa.text('ALTER TABLE entry DROP COLUMN IF EXISTS search_vector'))
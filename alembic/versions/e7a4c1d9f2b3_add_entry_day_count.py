@@ -0,0 +1,49 @@
+"""Add per-user per-day entry count table
+
+Revision ID: e7a4c1d9f2b3
+Revises: d1f3a9c2b7e4
+Create Date: 2025-03-09 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a4c1d9f2b3'
+down_revision = 'd1f3a9c2b7e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create entry_day_count and backfill it from existing entries."""
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+
+    if "entry_day_count" not in inspector.get_table_names():
+        op.create_table(
+            "entry_day_count",
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.Column("user_id", sa.Uuid(), nullable=False),
+            sa.Column("entry_date", sa.Date(), nullable=False),
+            sa.Column("entry_count", sa.Integer(), nullable=False, server_default="0"),
+            sa.CheckConstraint("entry_count >= 0", name="check_entry_day_count_positive"),
+            sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("user_id", "entry_date"),
+        )
+
+    op.execute(sa.text('DELETE FROM entry_day_count'))
+    op.execute(sa.text('''
+        INSERT INTO entry_day_count (created_at, updated_at, user_id, entry_date, entry_count)
+        SELECT CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, user_id, entry_date, COUNT(*)
+        FROM entry
+        WHERE user_id IS NOT NULL AND entry_date IS NOT NULL
+        GROUP BY user_id, entry_date
+    '''))
+
+
+def downgrade() -> None:
+    """Drop entry_day_count."""
+    op.drop_table("entry_day_count")
@@ -0,0 +1,34 @@
+"""Track background processing attempts on entry media
+
+Revision ID: f2b8d4e6a1c7
+Revises: e7a4c1d9f2b3
+Create Date: 2025-03-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2b8d4e6a1c7'
+down_revision = 'e7a4c1d9f2b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add entry_media.processing_attempts."""
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+
+    columns = {col["name"] for col in inspector.get_columns("entry_media")}
+    if "processing_attempts" not in columns:
+        op.add_column(
+            "entry_media",
+            sa.Column("processing_attempts", sa.Integer(), nullable=False, server_default="0"),
+        )
+
+
+def downgrade() -> None:
+    """Drop entry_media.processing_attempts."""
+    op.drop_column("entry_media", "processing_attempts")
@@ -2,6 +2,7 @@
 Shared API dependencies.
 """
 import logging
+import uuid
 from typing import Annotated, Optional
 
 from fastapi import Depends, HTTPException, status, Cookie
@@ -10,6 +11,7 @@ from jose import JWTError, ExpiredSignatureError
 from sqlmodel import Session
 
 from app.core.database import get_session
+from app.core.principal_cache import get_principal_cache
 from app.core.security import verify_token
 from app.middleware.request_logging import request_id_ctx
 from app.models.user import User
@@ -86,11 +88,22 @@ async def get_current_user(
         logger.error("Unexpected token validation error", extra={"error": str(e)})
         raise credentials_exception
 
-    # Get user from database
-    user = UserService(session).get_user_by_id(user_id)
-    if user is None:
+    try:
+        user_uuid = uuid.UUID(user_id)
+    except ValueError:
         raise credentials_exception
 
+    # Active users are usually cached; fall back to the database on a miss
+    principal_cache = get_principal_cache()
+    user = principal_cache.get(user_uuid)
+    if user is None:
+        version = principal_cache.version(user_uuid)
+        user = UserService(session).get_user_by_id(user_id)
+        if user is None:
+            raise credentials_exception
+        if user.is_active:
+            principal_cache.put(user, version)
+
     # Check if user is active
     if not user.is_active:
         logger.info("Inactive user access attempt", extra={"user_id": user_id})
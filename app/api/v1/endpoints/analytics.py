@@ -2,17 +2,18 @@
 Analytics endpoints.
 """
 import logging
-from typing import Annotated, Dict, Any
+from typing import Annotated, Dict, Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.dependencies import get_current_user
-from app.core.database import get_session
+from app.core.database import get_async_session
+from app.core.time_utils import utc_now
 
 logger = logging.getLogger(__name__)
 from app.models.user import User
-from app.services.analytics_service import AnalyticsService
+from app.services.async_services import AsyncAnalyticsService
 
 router = APIRouter()
 
@@ -30,7 +31,7 @@ router = APIRouter()
 )
 async def get_writing_streak(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """
     Get writing streak analytics.
@@ -38,8 +39,8 @@ async def get_writing_streak(
     Returns current streak, longest streak, and total entries written.
     """
     try:
-        analytics_service = AnalyticsService(session)
-        analytics = analytics_service.get_writing_analytics(current_user.id)
+        analytics_service = AsyncAnalyticsService(session)
+        analytics = await analytics_service.get_writing_analytics(current_user.id)
         return analytics
     except Exception as e:
         logger.error(
@@ -63,7 +64,7 @@ async def get_writing_streak(
 )
 async def get_writing_patterns(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     days: int = Query(30, ge=1, le=365)
 ):
     """
@@ -72,8 +73,8 @@ async def get_writing_patterns(
     Analyzes writing frequency, peak times, and trends for the specified period.
     """
     try:
-        analytics_service = AnalyticsService(session)
-        patterns = analytics_service.get_writing_patterns(current_user.id, days)
+        analytics_service = AsyncAnalyticsService(session)
+        patterns = await analytics_service.get_writing_patterns(current_user.id, days)
         return patterns
     except Exception as e:
         logger.error(
@@ -95,7 +96,7 @@ async def get_writing_patterns(
 )
 async def get_productivity_metrics(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """
     Get productivity metrics.
@@ -103,8 +104,8 @@ async def get_productivity_metrics(
     Returns entries per day, words per entry, and consistency scores.
     """
     try:
-        analytics_service = AnalyticsService(session)
-        metrics = analytics_service.get_productivity_metrics(current_user.id)
+        analytics_service = AsyncAnalyticsService(session)
+        metrics = await analytics_service.get_productivity_metrics(current_user.id)
         return metrics
     except Exception as e:
         logger.error(
@@ -114,6 +115,39 @@ async def get_productivity_metrics(
         raise HTTPException(status_code=500, detail="An error occurred while fetching productivity metrics")
 
 
+# Activity Heatmap
+@router.get(
+    "/heatmap",
+    response_model=Dict[str, Any],
+    responses={
+        401: {"description": "Not authenticated"},
+        403: {"description": "Account inactive"},
+        500: {"description": "Internal server error"},
+    }
+)
+async def get_activity_heatmap(
+    current_user: Annotated[User, Depends(get_current_user)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    year: Optional[int] = Query(None, ge=1900, le=9999, description="Calendar year (defaults to the current year)")
+):
+    """
+    Get a calendar heatmap of daily activity.
+
+    Returns entry, word and mood counts for every active day of the year.
+    """
+    year = year or utc_now().year
+    try:
+        analytics_service = AsyncAnalyticsService(session)
+        heatmap = await analytics_service.get_activity_heatmap(current_user.id, year)
+        return heatmap
+    except Exception as e:
+        logger.error(
+            "Unexpected error fetching activity heatmap",
+            extra={"user_id": str(current_user.id), "year": year, "error": str(e)}
+        )
+        raise HTTPException(status_code=500, detail="An error occurred while fetching activity heatmap")
+
+
 # Journal Analytics
 @router.get(
     "/journals",
@@ -126,7 +160,7 @@ async def get_productivity_metrics(
 )
 async def get_journal_analytics(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """
     Get analytics for all journals.
@@ -134,8 +168,8 @@ async def get_journal_analytics(
     Returns entry counts, activity breakdown, and statistics per journal.
     """
     try:
-        analytics_service = AnalyticsService(session)
-        analytics = analytics_service.get_journal_analytics(current_user.id)
+        analytics_service = AsyncAnalyticsService(session)
+        analytics = await analytics_service.get_journal_analytics(current_user.id)
         return analytics
     except Exception as e:
         logger.error(
@@ -157,7 +191,7 @@ async def get_journal_analytics(
 )
 async def get_analytics_dashboard(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     days: int = Query(30, ge=1, le=365)
 ):
     """
@@ -166,27 +200,9 @@ async def get_analytics_dashboard(
     Combines all analytics data into a single response with summary statistics.
     """
     try:
-        analytics_service = AnalyticsService(session)
-
-        # Get all analytics data
-        writing_analytics = analytics_service.get_writing_analytics(current_user.id)
-        writing_patterns = analytics_service.get_writing_patterns(current_user.id, days)
-        productivity_metrics = analytics_service.get_productivity_metrics(current_user.id)
-        journal_analytics = analytics_service.get_journal_analytics(current_user.id)
-
-        result = {
-            "writing_streak": writing_analytics,
-            "writing_patterns": writing_patterns,
-            "productivity": productivity_metrics,
-            "journals": journal_analytics,
-            "summary": {
-                "total_journals": len(journal_analytics.get("journals", [])),
-                "total_entries": writing_analytics.get("total_entries", 0),
-                "current_streak": writing_analytics.get("current_streak", 0),
-                "longest_streak": writing_analytics.get("longest_streak", 0)
-            }
-        }
-        return result
+        analytics_service = AsyncAnalyticsService(session)
+        dashboard = await analytics_service.get_dashboard(current_user.id, days)
+        return dashboard
     except Exception as e:
         logger.error(
             "Unexpected error fetching analytics dashboard",
@@ -6,18 +6,19 @@ import uuid
 from datetime import date
 from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.dependencies import get_current_user
-from app.core.database import get_session
+from app.core.database import get_async_session
 from app.core.exceptions import EntryNotFoundError, JournalNotFoundError, ValidationError
 from app.core.logging_config import log_user_action, log_error
+from app.core.pagination import NEXT_CURSOR_HEADER, InvalidCursorError, next_cursor
 from app.models.user import User
 from app.schemas.entry import EntryCreate, EntryUpdate, EntryResponse, EntryMediaCreate, EntryMediaResponse
 from app.schemas.tag import TagResponse
+from app.services.async_services import AsyncEntryService, AsyncTagService
 from app.services.entry_service import EntryService
-from app.services.tag_service import TagService
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -37,12 +38,12 @@ logger = logging.getLogger(__name__)
 async def create_entry(
     entry_data: EntryCreate,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Create a new journal entry."""
-    entry_service = EntryService(session)
+    entry_service = AsyncEntryService(session)
     try:
-        entry = entry_service.create_entry(current_user.id, entry_data)
+        entry = await entry_service.create_entry(current_user.id, entry_data)
         log_user_action(current_user.email, f"created entry {entry.id}", request_id=None)
         return entry
     except JournalNotFoundError:
@@ -58,26 +59,35 @@ async def create_entry(
     "/",
     response_model=List[EntryResponse],
     responses={
+        400: {"description": "Invalid pagination cursor"},
         401: {"description": "Not authenticated"},
         403: {"description": "Account inactive"},
         500: {"description": "Internal server error"},
     }
 )
 async def get_user_entries(
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, max_length=512),
 ):
     """
     Get all entries for the current user.
 
-    Supports pagination via limit and offset parameters.
+    Supports pagination via limit and offset, or via cursor: when a page is
+    full, the X-Next-Cursor response header holds the cursor for the next one.
     """
     try:
-        entry_service = EntryService(session)
-        entries = entry_service.get_user_entries(current_user.id, limit, offset)
+        entry_service = AsyncEntryService(session)
+        entries = await entry_service.get_user_entries(current_user.id, limit, offset, cursor)
+        token = next_cursor(entries, limit, EntryService.timeline_page_key)
+        if token:
+            response.headers[NEXT_CURSOR_HEADER] = token
         return entries
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(
             "Unexpected error fetching entries",
@@ -90,6 +100,7 @@ async def get_user_entries(
     "/journal/{journal_id}",
     response_model=List[EntryResponse],
     responses={
+        400: {"description": "Invalid pagination cursor"},
         401: {"description": "Not authenticated"},
         403: {"description": "Account inactive"},
         404: {"description": "Journal not found"},
@@ -98,25 +109,33 @@ async def get_user_entries(
 )
 async def get_journal_entries(
     journal_id: uuid.UUID,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
     include_pinned: bool = Query(True),
+    cursor: Optional[str] = Query(None, max_length=512),
 ):
     """
     Get entries for a specific journal.
 
-    Pinned entries appear first when include_pinned=true.
+    Pinned entries appear first when include_pinned=true. When a page is
+    full, the X-Next-Cursor response header holds the cursor for the next one.
     """
-    entry_service = EntryService(session)
+    entry_service = AsyncEntryService(session)
     try:
-        entries = entry_service.get_journal_entries(
-            journal_id, current_user.id, limit, offset, include_pinned
+        entries = await entry_service.get_journal_entries(
+            journal_id, current_user.id, limit, offset, include_pinned, cursor
         )
+        token = next_cursor(entries, limit, EntryService.journal_page_key)
+        if token:
+            response.headers[NEXT_CURSOR_HEADER] = token
         return entries
     except JournalNotFoundError:
         raise HTTPException(status_code=404, detail="Journal not found")
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(
             "Unexpected error fetching journal entries",
@@ -137,7 +156,7 @@ async def get_journal_entries(
 )
 async def search_entries(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     q: str = Query(..., min_length=1),
     journal_id: Optional[uuid.UUID] = Query(None),
     limit: int = Query(50, ge=1, le=100),
@@ -149,8 +168,8 @@ async def search_entries(
     Searches title and content fields. Optionally filter by journal_id.
     """
     try:
-        entry_service = EntryService(session)
-        entries = entry_service.search_entries(
+        entry_service = AsyncEntryService(session)
+        entries = await entry_service.search_entries(
             current_user.id, q, journal_id, limit, offset
         )
         return entries
@@ -174,7 +193,7 @@ async def search_entries(
 )
 async def get_entries_by_date_range(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     start_date: date = Query(...),
     end_date: date = Query(...),
     journal_id: Optional[uuid.UUID] = Query(None),
@@ -185,8 +204,8 @@ async def get_entries_by_date_range(
     Based on entry_date field. Optionally filter by journal_id.
     """
     try:
-        entry_service = EntryService(session)
-        entries = entry_service.get_entries_by_date_range(
+        entry_service = AsyncEntryService(session)
+        entries = await entry_service.get_entries_by_date_range(
             current_user.id, start_date, end_date, journal_id
         )
         return entries
@@ -211,12 +230,12 @@ async def get_entries_by_date_range(
 async def get_entry(
     entry_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Get a specific entry by ID."""
     try:
-        entry_service = EntryService(session)
-        entry = entry_service.get_entry_by_id(entry_id, current_user.id)
+        entry_service = AsyncEntryService(session)
+        entry = await entry_service.get_entry_by_id(entry_id, current_user.id)
         if not entry:
             raise HTTPException(status_code=404, detail="Entry not found")
         return entry
@@ -246,12 +265,12 @@ async def update_entry(
     entry_id: uuid.UUID,
     entry_data: EntryUpdate,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Update an entry's content, title, or other properties."""
-    entry_service = EntryService(session)
+    entry_service = AsyncEntryService(session)
     try:
-        entry = entry_service.update_entry(entry_id, current_user.id, entry_data)
+        entry = await entry_service.update_entry(entry_id, current_user.id, entry_data)
         log_user_action(current_user.email, "Updated entry", request_id=None)
         return entry
     except EntryNotFoundError:
@@ -283,12 +302,12 @@ async def update_entry(
 async def delete_entry(
     entry_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """
     Delete an entry.
     """
-    entry_service = EntryService(session)
+    entry_service = AsyncEntryService(session)
     try:
         await entry_service.delete_entry(entry_id, current_user.id)
         log_user_action(current_user.email, "Deleted entry", request_id=None)
@@ -315,12 +334,12 @@ async def delete_entry(
 async def toggle_pin(
     entry_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Toggle pin status of an entry (on/off)."""
-    entry_service = EntryService(session)
+    entry_service = AsyncEntryService(session)
     try:
-        entry = entry_service.toggle_pin(entry_id, current_user.id)
+        entry = await entry_service.toggle_pin(entry_id, current_user.id)
         log_user_action(current_user.email, f"toggled pin for entry {entry_id}", request_id=None)
         return entry
     except EntryNotFoundError:
@@ -349,12 +368,12 @@ async def add_media_to_entry(
     entry_id: uuid.UUID,
     media_data: EntryMediaCreate,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Add media (image/video/audio) to an entry."""
-    entry_service = EntryService(session)
+    entry_service = AsyncEntryService(session)
     try:
-        media = entry_service.add_media_to_entry(entry_id, current_user.id, media_data)
+        media = await entry_service.add_media_to_entry(entry_id, current_user.id, media_data)
         log_user_action(current_user.email, f"added media to entry {entry_id}", request_id=None)
         return media
     except EntryNotFoundError:
@@ -382,12 +401,12 @@ async def add_media_to_entry(
 async def get_entry_media(
     entry_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Get all media attached to an entry."""
-    entry_service = EntryService(session)
+    entry_service = AsyncEntryService(session)
     try:
-        media = entry_service.get_entry_media(entry_id, current_user.id)
+        media = await entry_service.get_entry_media(entry_id, current_user.id)
         return [EntryMediaResponse.model_validate(media_item) for media_item in media]
     except EntryNotFoundError:
         raise HTTPException(status_code=404, detail="Entry not found")
@@ -413,12 +432,12 @@ async def get_entry_media(
 async def get_entry_tags(
     entry_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Get all tags associated with an entry."""
-    tag_service = TagService(session)
+    tag_service = AsyncTagService(session)
     try:
-        tags = tag_service.get_entry_tags(entry_id, current_user.id)
+        tags = await tag_service.get_entry_tags(entry_id, current_user.id)
         return tags
     except EntryNotFoundError:
         raise HTTPException(status_code=404, detail="Entry not found")
@@ -445,16 +464,16 @@ async def bulk_add_tags_to_entry(
     entry_id: uuid.UUID,
     tag_names: List[str],
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """
     Add multiple tags to an entry by name.
 
     Creates tags if they don't exist. Returns all tags on the entry after operation.
     """
-    tag_service = TagService(session)
+    tag_service = AsyncTagService(session)
     try:
-        tags = tag_service.bulk_add_tags_to_entry(entry_id, tag_names, current_user.id)
+        tags = await tag_service.bulk_add_tags_to_entry(entry_id, tag_names, current_user.id)
         log_user_action(current_user.email, f"bulk added tags to entry {entry_id}", request_id=None)
         return tags
     except EntryNotFoundError:
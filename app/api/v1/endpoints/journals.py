@@ -5,15 +5,19 @@ import uuid
 from typing import Annotated, List
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.dependencies import get_current_user
-from app.core.database import get_session
-from app.core.exceptions import JournalNotFoundError
+from app.core.database import get_async_session
+from app.core.exceptions import DeletionJobNotFoundError, JournalNotFoundError
 from app.core.logging_config import log_user_action, log_error
+from app.models.deletion_job import DeletionJob
 from app.models.user import User
+from app.schemas.dto import DeletionJobStatusResponse
 from app.schemas.journal import JournalCreate, JournalUpdate, JournalResponse
-from app.services.journal_service import JournalService
+from app.services.async_services import AsyncJournalService
 
 router = APIRouter()
 
@@ -32,12 +36,12 @@ router = APIRouter()
 async def create_journal(
     journal_data: JournalCreate,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Create a new journal."""
-    journal_service = JournalService(session)
+    journal_service = AsyncJournalService(session)
     try:
-        journal = journal_service.create_journal(current_user.id, journal_data)
+        journal = await journal_service.create_journal(current_user.id, journal_data)
         log_user_action(current_user.email, f"created journal {journal.id}", request_id=None)
         return journal
     except ValueError as e:
@@ -58,7 +62,7 @@ async def create_journal(
 )
 async def get_user_journals(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     include_archived: bool = False,
 ):
     """
@@ -66,9 +70,9 @@ async def get_user_journals(
 
     By default excludes archived journals. Set include_archived=true to include them.
     """
-    journal_service = JournalService(session)
+    journal_service = AsyncJournalService(session)
     try:
-        journals = journal_service.get_user_journals(current_user.id, include_archived)
+        journals = await journal_service.get_user_journals(current_user.id, include_archived)
         return journals
     except Exception as e:
         log_error(e, request_id=None, user_email=current_user.email)
@@ -86,12 +90,12 @@ async def get_user_journals(
 )
 async def get_favorite_journals(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Get all journals marked as favorites."""
-    journal_service = JournalService(session)
+    journal_service = AsyncJournalService(session)
     try:
-        journals = journal_service.get_favorite_journals(current_user.id)
+        journals = await journal_service.get_favorite_journals(current_user.id)
         return journals
     except Exception as e:
         log_error(e, request_id=None, user_email=current_user.email)
@@ -111,12 +115,12 @@ async def get_favorite_journals(
 async def get_journal(
     journal_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Get a specific journal by ID."""
-    journal_service = JournalService(session)
+    journal_service = AsyncJournalService(session)
     try:
-        journal = journal_service.get_journal_by_id(journal_id, current_user.id)
+        journal = await journal_service.get_journal_by_id(journal_id, current_user.id)
         if not journal:
             raise HTTPException(status_code=404, detail="Journal not found")
         return journal
@@ -142,12 +146,12 @@ async def update_journal(
     journal_id: uuid.UUID,
     journal_data: JournalUpdate,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Update a journal's name, description, or other properties."""
-    journal_service = JournalService(session)
+    journal_service = AsyncJournalService(session)
     try:
-        journal = journal_service.update_journal(journal_id, current_user.id, journal_data)
+        journal = await journal_service.update_journal(journal_id, current_user.id, journal_data)
         log_user_action(current_user.email, f"updated journal {journal_id}", request_id=None)
         return journal
     except JournalNotFoundError:
@@ -159,10 +163,26 @@ async def update_journal(
         raise HTTPException(status_code=500, detail="An error occurred while updating journal")
 
 
+def _deletion_job_response(job: DeletionJob) -> DeletionJobStatusResponse:
+    return DeletionJobStatusResponse(
+        id=str(job.id),
+        status=job.status.value,
+        progress=job.progress,
+        total_items=job.total_items,
+        processed_items=job.processed_items,
+        created_at=job.created_at,
+        completed_at=job.completed_at,
+        result_data=job.result_data,
+        errors=job.errors,
+        journal_id=str(job.journal_id),
+    )
+
+
 @router.delete(
     "/{journal_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     responses={
+        202: {"model": DeletionJobStatusResponse, "description": "Large journal queued for background deletion"},
         401: {"description": "Not authenticated"},
         403: {"description": "Account inactive"},
         404: {"description": "Journal not found"},
@@ -172,14 +192,24 @@ async def update_journal(
 async def delete_journal(
     journal_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """
     Delete a journal.
+
+    Journals with more entries than the background threshold are archived
+    and deleted by a worker; the response is then 202 with the deletion
+    job, whose progress is available from `/journals/deletions/{job_id}`.
     """
-    journal_service = JournalService(session)
+    journal_service = AsyncJournalService(session)
     try:
-        await journal_service.delete_journal(journal_id, current_user.id)
+        job = await journal_service.delete_journal(journal_id, current_user.id)
+        if job is not None:
+            log_user_action(current_user.email, f"queued deletion of journal {journal_id} (job {job.id})", request_id=None)
+            return JSONResponse(
+                status_code=status.HTTP_202_ACCEPTED,
+                content=jsonable_encoder(_deletion_job_response(job)),
+            )
         log_user_action(current_user.email, f"deleted journal {journal_id}", request_id=None)
     except JournalNotFoundError:
         raise HTTPException(status_code=404, detail="Journal not found")
@@ -188,6 +218,33 @@ async def delete_journal(
         raise HTTPException(status_code=500, detail="An error occurred while deleting journal")
 
 
+@router.get(
+    "/deletions/{job_id}",
+    response_model=DeletionJobStatusResponse,
+    responses={
+        401: {"description": "Not authenticated"},
+        403: {"description": "Account inactive"},
+        404: {"description": "Deletion job not found"},
+        500: {"description": "Internal server error"},
+    }
+)
+async def get_journal_deletion_status(
+    job_id: uuid.UUID,
+    current_user: Annotated[User, Depends(get_current_user)],
+    session: Annotated[AsyncSession, Depends(get_async_session)]
+):
+    """Get the progress of a background journal deletion."""
+    journal_service = AsyncJournalService(session)
+    try:
+        job = await journal_service.get_deletion_job(job_id, current_user.id)
+        return _deletion_job_response(job)
+    except DeletionJobNotFoundError:
+        raise HTTPException(status_code=404, detail="Deletion job not found")
+    except Exception as e:
+        log_error(e, request_id=None, user_email=current_user.email)
+        raise HTTPException(status_code=500, detail="An error occurred while retrieving deletion status")
+
+
 @router.post(
     "/{journal_id}/favorite",
     response_model=JournalResponse,
@@ -201,12 +258,12 @@ async def delete_journal(
 async def toggle_favorite(
     journal_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Toggle favorite status of a journal (on/off)."""
-    journal_service = JournalService(session)
+    journal_service = AsyncJournalService(session)
     try:
-        journal = journal_service.toggle_favorite(journal_id, current_user.id)
+        journal = await journal_service.toggle_favorite(journal_id, current_user.id)
         log_user_action(current_user.email, f"toggled favorite for journal {journal_id}", request_id=None)
         return journal
     except JournalNotFoundError:
@@ -229,16 +286,16 @@ async def toggle_favorite(
 async def archive_journal(
     journal_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """
     Archive a journal.
 
     Archived journals are hidden from default listings but remain accessible.
     """
-    journal_service = JournalService(session)
+    journal_service = AsyncJournalService(session)
     try:
-        journal = journal_service.archive_journal(journal_id, current_user.id)
+        journal = await journal_service.archive_journal(journal_id, current_user.id)
         log_user_action(current_user.email, f"archived journal {journal_id}", request_id=None)
         return journal
     except JournalNotFoundError:
@@ -261,12 +318,12 @@ async def archive_journal(
 async def unarchive_journal(
     journal_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Unarchive a journal to restore it to active listings."""
-    journal_service = JournalService(session)
+    journal_service = AsyncJournalService(session)
     try:
-        journal = journal_service.unarchive_journal(journal_id, current_user.id)
+        journal = await journal_service.unarchive_journal(journal_id, current_user.id)
         log_user_action(current_user.email, f"unarchived journal {journal_id}", request_id=None)
         return journal
     except JournalNotFoundError:
@@ -7,7 +7,8 @@ import uuid
 from pathlib import Path
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, BackgroundTasks, Header, Request
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, BackgroundTasks, Header, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse, StreamingResponse
 from sqlmodel import Session
 
@@ -21,10 +22,13 @@ from app.core.exceptions import (
     FileValidationError
 )
 from app.core.logging_config import LogCategory
+from app.models.entry import EntryMedia
+from app.models.enums import MediaType
 from app.models.user import User
 from app.schemas.entry import EntryMediaResponse
 from app.services import media_service as media_service_module
 from app.services.file_processing_service import FileProcessingService
+from app.services.media_derivative_service import MediaDerivativeService
 
 file_logger = logging.getLogger(LogCategory.FILE_UPLOADS.value)
 error_logger = logging.getLogger(LogCategory.ERRORS.value)
@@ -60,6 +64,21 @@ def _send_bytes_range_requests(file_path: Path, start: int, end: int):
             yield chunk
 
 
+async def _derivative_response(media_service, media: EntryMedia, width: int, accept: Optional[str]) -> FileResponse:
+    """Serve a resized derivative in the best format the client accepts."""
+    fmt = MediaDerivativeService.negotiate_format(accept)
+    # Resizing is CPU-bound; keep it off the event loop
+    derivative_path = await run_in_threadpool(media_service.get_media_derivative_path, media, width, fmt)
+    return FileResponse(
+        path=derivative_path,
+        media_type=MediaDerivativeService.content_type(fmt),
+        headers={
+            "Cache-Control": "public, max-age=3600",
+            "Vary": "Accept",
+        },
+    )
+
+
 
 @router.post(
     "/upload",
@@ -101,16 +120,13 @@ async def upload_media(
         media_record = result["media_record"]
         full_file_path = result["full_file_path"]
 
-        # Queue background processing if we have a real media record
+        # Queue background processing if we have a real media record. The
+        # record is committed as PENDING, so the job is recovered even if
+        # this hand-off is lost.
         if media_record and hasattr(media_record, 'id') and full_file_path:
             try:
                 processing_service = FileProcessingService(session)
-                background_tasks.add_task(
-                    processing_service.process_uploaded_file_async,
-                    str(media_record.id),
-                    full_file_path,
-                    str(current_user.id)
-                )
+                background_tasks.add_task(processing_service.enqueue, media_record.id)
             except Exception as e:
                 error_logger.warning(
                     "Failed to queue background processing task",
@@ -211,12 +227,23 @@ async def get_media(
     media_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
     session: Annotated[Session, Depends(_get_db_session)],
-    range_header: Optional[str] = Header(None, alias="range")
+    range_header: Optional[str] = Header(None, alias="range"),
+    accept: Optional[str] = Header(None),
+    w: Optional[int] = Query(None, ge=1, le=4096, description="Serve an image resized to about this width"),
 ):
-    """Get media file by ID with proper Range request support for video streaming."""
+    """Get media file by ID with proper Range request support for video streaming.
+
+    With ``w``, images are served as a cached, resized derivative instead of
+    the original; other media types ignore it.
+    """
     media_service = _get_media_service()
 
     try:
+        if w:
+            media = media_service.get_media_by_id(media_id, current_user.id, session)
+            if media.media_type == MediaType.IMAGE:
+                return await _derivative_response(media_service, media, w, accept)
+
         file_info = media_service.get_media_file_for_serving(
             media_id, current_user.id, session, range_header
         )
@@ -290,13 +317,18 @@ async def get_media(
 async def get_media_thumbnail(
     media_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(_get_db_session)]
+    session: Annotated[Session, Depends(_get_db_session)],
+    accept: Optional[str] = Header(None),
+    w: Optional[int] = Query(None, ge=1, le=4096, description="Serve the thumbnail at about this width"),
 ):
-    """Get media thumbnail by ID."""
+    """Get media thumbnail by ID, optionally resized to width ``w``."""
     media_service = _get_media_service()
 
     try:
         media = media_service.get_media_by_id(media_id, current_user.id, session)
+        if w and media.media_type in (MediaType.IMAGE, MediaType.VIDEO):
+            return await _derivative_response(media_service, media, w, accept)
+
         thumbnail_path = media_service.get_media_thumbnail_path(media)
 
         return FileResponse(thumbnail_path)
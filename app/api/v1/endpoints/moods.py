@@ -5,18 +5,20 @@ import uuid
 from datetime import date
 from typing import Annotated, List, Optional, Dict, Any
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.dependencies import get_current_user
-from app.core.database import get_session
+from app.core.database import get_async_session
 from app.core.exceptions import MoodNotFoundError, EntryNotFoundError
 from app.core.logging_config import log_error
+from app.core.pagination import NEXT_CURSOR_HEADER, InvalidCursorError, next_cursor
 from app.models.user import User
 from app.schemas.mood import (
     MoodResponse,
     MoodLogCreate, MoodLogUpdate, MoodLogResponse
 )
+from app.services.async_services import AsyncMoodService
 from app.services.mood_service import MoodService
 
 router = APIRouter()
@@ -34,7 +36,7 @@ router = APIRouter()
 )
 async def get_all_moods(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     category: Optional[str] = Query(None, pattern="^(positive|negative|neutral)$")
 ):
     """
@@ -42,13 +44,10 @@ async def get_all_moods(
 
     Categories: positive, negative, neutral.
     """
-    mood_service = MoodService(session)
+    mood_service = AsyncMoodService(session)
     try:
-        if category:
-            moods = mood_service.get_moods_by_category(category)
-        else:
-            moods = mood_service.get_all_moods()
-        return moods
+        payload = await mood_service.get_moods_payload(category)
+        return Response(content=payload, media_type="application/json")
     except Exception as e:
         log_error(e, request_id="", user_email=current_user.email)
         raise HTTPException(
@@ -61,31 +60,41 @@ async def get_all_moods(
     "/logs",
     response_model=List[MoodLogResponse],
     responses={
+        400: {"description": "Invalid pagination cursor"},
         401: {"description": "Not authenticated"},
         403: {"description": "Account inactive"},
     }
 )
 async def get_user_mood_logs(
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
     mood_id: Optional[uuid.UUID] = Query(None),
     entry_id: Optional[uuid.UUID] = Query(None),
     start_date: Optional[date] = Query(None),
-    end_date: Optional[date] = Query(None)
+    end_date: Optional[date] = Query(None),
+    cursor: Optional[str] = Query(None, max_length=512)
 ):
     """
     Get mood logs for the current user with optional filters.
 
-    Supports filtering by mood, entry, and date range with pagination.
+    Supports filtering by mood, entry, and date range with pagination. When a
+    page is full, the X-Next-Cursor response header holds the cursor for the
+    next one.
     """
-    mood_service = MoodService(session)
+    mood_service = AsyncMoodService(session)
     try:
-        mood_logs = mood_service.get_user_mood_logs(
-            current_user.id, limit, offset, mood_id, entry_id, start_date, end_date
+        mood_logs = await mood_service.get_user_mood_logs(
+            current_user.id, limit, offset, mood_id, entry_id, start_date, end_date, cursor
         )
+        token = next_cursor(mood_logs, limit, MoodService.mood_log_page_key)
+        if token:
+            response.headers[NEXT_CURSOR_HEADER] = token
         return mood_logs
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         log_error(e, request_id="", user_email=current_user.email)
         raise HTTPException(
@@ -105,7 +114,7 @@ async def get_user_mood_logs(
 )
 async def get_recent_moods(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     limit: int = Query(10, ge=1, le=50)
 ):
     """
@@ -113,9 +122,9 @@ async def get_recent_moods(
 
     Returns most recent mood logs ordered by logged_at timestamp (descending).
     """
-    mood_service = MoodService(session)
+    mood_service = AsyncMoodService(session)
     try:
-        mood_logs = mood_service.get_recent_moods(current_user.id, limit)
+        mood_logs = await mood_service.get_recent_moods(current_user.id, limit)
         return mood_logs
     except Exception as e:
         log_error(e, request_id="", user_email=current_user.email)
@@ -139,12 +148,12 @@ async def get_recent_moods(
 async def log_mood(
     mood_log_data: MoodLogCreate,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Log a mood for the current user."""
-    mood_service = MoodService(session)
+    mood_service = AsyncMoodService(session)
     try:
-        mood_log = mood_service.log_mood(current_user.id, mood_log_data)
+        mood_log = await mood_service.log_mood(current_user.id, mood_log_data)
         return mood_log
     except MoodNotFoundError:
         raise HTTPException(
@@ -181,12 +190,12 @@ async def log_mood(
 async def get_mood_log(
     mood_log_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Get a specific mood log by ID."""
-    mood_service = MoodService(session)
+    mood_service = AsyncMoodService(session)
     try:
-        mood_log = mood_service.get_mood_log_by_id(mood_log_id, current_user.id)
+        mood_log = await mood_service.get_mood_log_by_id(mood_log_id, current_user.id)
         if not mood_log:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -217,12 +226,12 @@ async def update_mood_log(
     mood_log_id: uuid.UUID,
     mood_log_data: MoodLogUpdate,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Update a mood log."""
-    mood_service = MoodService(session)
+    mood_service = AsyncMoodService(session)
     try:
-        mood_log = mood_service.update_mood_log(mood_log_id, current_user.id, mood_log_data)
+        mood_log = await mood_service.update_mood_log(mood_log_id, current_user.id, mood_log_data)
         return mood_log
     except MoodNotFoundError:
         raise HTTPException(
@@ -254,12 +263,12 @@ async def update_mood_log(
 async def delete_mood_log(
     mood_log_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Delete a mood log."""
-    mood_service = MoodService(session)
+    mood_service = AsyncMoodService(session)
     try:
-        mood_service.delete_mood_log(mood_log_id, current_user.id)
+        await mood_service.delete_mood_log(mood_log_id, current_user.id)
     except MoodNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -284,7 +293,7 @@ async def delete_mood_log(
 )
 async def get_mood_statistics(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None)
 ):
@@ -293,9 +302,9 @@ async def get_mood_statistics(
 
     Includes mood distribution, trends, and patterns over the specified date range.
     """
-    mood_service = MoodService(session)
+    mood_service = AsyncMoodService(session)
     try:
-        statistics = mood_service.get_mood_statistics(current_user.id, start_date, end_date)
+        statistics = await mood_service.get_mood_statistics(current_user.id, start_date, end_date)
         return statistics
     except Exception as e:
         log_error(e, request_id="", user_email=current_user.email)
@@ -315,16 +324,16 @@ async def get_mood_statistics(
 )
 async def get_mood_streak(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """
     Get mood logging streak for the current user.
 
     Tracks consecutive days with mood logging activity.
     """
-    mood_service = MoodService(session)
+    mood_service = AsyncMoodService(session)
     try:
-        streak = mood_service.get_mood_streak(current_user.id)
+        streak = await mood_service.get_mood_streak(current_user.id)
         return streak
     except Exception as e:
         log_error(e, request_id="", user_email=current_user.email)
@@ -346,12 +355,12 @@ async def get_mood_streak(
 async def get_mood(
     mood_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Get a specific mood by ID."""
-    mood_service = MoodService(session)
+    mood_service = AsyncMoodService(session)
     try:
-        mood = mood_service.get_mood_by_id(mood_id)
+        mood = await mood_service.get_mood_by_id(mood_id)
         if not mood:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
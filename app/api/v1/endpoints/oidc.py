@@ -65,7 +65,7 @@ async def oidc_login(request: Request):
     state = uuid.uuid4().hex
     nonce = uuid.uuid4().hex
     verifier, challenge = build_pkce()
-    request.app.state.cache.set(
+    await request.app.state.cache.set(
         f"oidc:{state}",
         {"nonce": nonce, "verifier": verifier},
         ex=180
@@ -91,7 +91,7 @@ async def oidc_callback(request: Request, session: Annotated[Session, Depends(ge
     if not settings.oidc_enabled:
         raise HTTPException(status_code=404, detail="OIDC authentication is not enabled")
     state = request.query_params.get("state")
-    cached_data = request.app.state.cache.get(f"oidc:{state}") if state else None
+    cached_data = await request.app.state.cache.get(f"oidc:{state}") if state else None
     if not state or not cached_data:
         log_error(f"Invalid or expired OIDC state: {state}")
         raise HTTPException(status_code=400, detail="Invalid or expired state parameter")
@@ -170,7 +170,7 @@ async def oidc_callback(request: Request, session: Annotated[Session, Depends(ge
         "is_oidc_user": True
     }
     ticket = uuid.uuid4().hex
-    request.app.state.cache.set(
+    await request.app.state.cache.set(
         f"ticket:{ticket}",
         {"access_token": access_token, "refresh_token": refresh_token, "user": user_payload},
         ex=60
@@ -199,11 +199,11 @@ async def oidc_exchange(request: Request):
     ticket = body.get("ticket")
     if not ticket:
         raise HTTPException(status_code=400, detail="Missing ticket parameter")
-    ticket_data = request.app.state.cache.get(f"ticket:{ticket}")
+    ticket_data = await request.app.state.cache.get(f"ticket:{ticket}")
     if not ticket_data:
         log_error(f"Invalid or expired OIDC ticket: {ticket}")
         raise HTTPException(status_code=400, detail="Invalid or expired ticket")
-    request.app.state.cache.delete(f"ticket:{ticket}")
+    await request.app.state.cache.delete(f"ticket:{ticket}")
     return LoginResponse(
         access_token=ticket_data["access_token"],
         refresh_token=ticket_data["refresh_token"],
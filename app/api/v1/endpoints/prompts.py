@@ -5,15 +5,15 @@ import uuid
 from typing import Annotated, List, Optional, Dict, Any
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.dependencies import get_current_user
-from app.core.database import get_session
+from app.core.database import get_async_session
 from app.core.exceptions import PromptNotFoundError
 from app.core.logging_config import log_error
 from app.models.user import User
 from app.schemas.prompt import PromptResponse
-from app.services.prompt_service import PromptService
+from app.services.async_services import AsyncPromptService
 
 router = APIRouter()
 
@@ -29,7 +29,7 @@ router = APIRouter()
 )
 async def get_system_prompts(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     category: Optional[str] = Query(None),
     difficulty_level: Optional[int] = Query(None, ge=1, le=5),
     limit: int = Query(50, ge=1, le=100)
@@ -39,10 +39,10 @@ async def get_system_prompts(
 
     Supports filtering by category, difficulty level, and pagination.
     """
-    prompt_service = PromptService(session)
+    prompt_service = AsyncPromptService(session)
     try:
-        prompts = prompt_service.get_system_prompts(category, difficulty_level, limit)
-        return prompts
+        payload = await prompt_service.get_system_prompts_payload(category, difficulty_level, limit)
+        return Response(content=payload, media_type="application/json")
     except Exception as e:
         log_error(e, request_id="", user_email=current_user.email)
         raise HTTPException(
@@ -62,7 +62,7 @@ async def get_system_prompts(
 )
 async def get_random_prompt(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     category: Optional[str] = Query(None),
     difficulty_level: Optional[int] = Query(None, ge=1, le=5)
 ):
@@ -71,9 +71,9 @@ async def get_random_prompt(
 
     Randomly selects from available system prompts, optionally filtered by category or difficulty.
     """
-    prompt_service = PromptService(session)
+    prompt_service = AsyncPromptService(session)
     try:
-        prompt = prompt_service.get_random_prompt(
+        prompt = await prompt_service.get_random_prompt(
             user_id=None, category=category, difficulty_level=difficulty_level
         )
         if not prompt:
@@ -103,16 +103,16 @@ async def get_random_prompt(
 )
 async def get_daily_prompt(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """
     Get a daily prompt for the current user.
 
     Returns a new prompt each day. Tracks answered prompts to avoid repetition.
     """
-    prompt_service = PromptService(session)
+    prompt_service = AsyncPromptService(session)
     try:
-        prompt = prompt_service.get_daily_prompt(current_user.id)
+        prompt = await prompt_service.get_daily_prompt(current_user.id)
         if not prompt:
             return Response(status_code=status.HTTP_204_NO_CONTENT)
         return prompt
@@ -135,7 +135,7 @@ async def get_daily_prompt(
 )
 async def search_prompts(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     q: str = Query(..., min_length=1)
 ):
     """
@@ -143,9 +143,9 @@ async def search_prompts(
 
     Searches both prompt text and categories.
     """
-    prompt_service = PromptService(session)
+    prompt_service = AsyncPromptService(session)
     try:
-        prompts = prompt_service.search_prompts(q, user_id=None)
+        prompts = await prompt_service.search_prompts(q, user_id=None)
         return prompts
     except Exception as e:
         log_error(e, request_id="", user_email=current_user.email)
@@ -166,16 +166,16 @@ async def search_prompts(
 )
 async def get_prompt_statistics(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """
     Get prompt usage statistics for the current user.
 
     Includes answered prompts count, favorite categories, and completion trends.
     """
-    prompt_service = PromptService(session)
+    prompt_service = AsyncPromptService(session)
     try:
-        statistics = prompt_service.get_prompt_statistics(current_user.id)
+        statistics = await prompt_service.get_prompt_statistics(current_user.id)
         return statistics
     except Exception as e:
         log_error(e, request_id="", user_email=current_user.email)
@@ -197,12 +197,12 @@ async def get_prompt_statistics(
 async def get_prompt(
     prompt_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Get a specific prompt by ID."""
-    prompt_service = PromptService(session)
+    prompt_service = AsyncPromptService(session)
     try:
-        prompt = prompt_service.get_prompt_by_id(prompt_id)
+        prompt = await prompt_service.get_prompt_by_id(prompt_id)
         if not prompt:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -4,17 +4,19 @@ Tag endpoints.
 import uuid
 from typing import Annotated, List, Optional, Dict, Any
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.dependencies import get_current_user
-from app.core.database import get_session
+from app.core.database import get_async_session
 from app.core.exceptions import TagNotFoundError
 from app.core.logging_config import log_error
+from app.core.pagination import NEXT_CURSOR_HEADER, InvalidCursorError, next_cursor
 from app.models.user import User
 from app.schemas.entry import EntryPreviewResponse
-from app.schemas.tag import TagCreate, TagUpdate, TagResponse, EntryTagLinkResponse
-from app.services.tag_service import TagService
+from app.schemas.tag import TagCreate, TagUpdate, TagResponse, TagSuggestion, EntryTagLinkResponse
+from app.services.async_services import AsyncTagService
+from app.services.entry_service import EntryService
 
 router = APIRouter()
 
@@ -34,12 +36,12 @@ router = APIRouter()
 async def create_tag(
     tag_data: TagCreate,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Create a new tag."""
-    tag_service = TagService(session)
+    tag_service = AsyncTagService(session)
     try:
-        tag = tag_service.create_tag(current_user.id, tag_data)
+        tag = await tag_service.create_tag(current_user.id, tag_data)
         return tag
     except ValueError as e:
         raise HTTPException(
@@ -64,7 +66,7 @@ async def create_tag(
 )
 async def get_user_tags(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
     search: Optional[str] = Query(None)
@@ -74,8 +76,8 @@ async def get_user_tags(
 
     Supports pagination and optional search filtering.
     """
-    tag_service = TagService(session)
-    tags = tag_service.get_user_tags(current_user.id, limit, offset, search)
+    tag_service = AsyncTagService(session)
+    tags = await tag_service.get_user_tags(current_user.id, limit, offset, search)
     return tags
 
 
@@ -89,7 +91,7 @@ async def get_user_tags(
 )
 async def get_popular_tags(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     limit: int = Query(20, ge=1, le=50)
 ):
     """
@@ -97,8 +99,8 @@ async def get_popular_tags(
 
     Returns tags ordered by usage count (descending).
     """
-    tag_service = TagService(session)
-    tags = tag_service.get_popular_tags(current_user.id, limit)
+    tag_service = AsyncTagService(session)
+    tags = await tag_service.get_popular_tags(current_user.id, limit)
     return tags
 
 
@@ -112,16 +114,40 @@ async def get_popular_tags(
 )
 async def search_tags(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     q: str = Query(..., min_length=1),
     limit: int = Query(20, ge=1, le=50)
 ):
     """Search tags by name."""
-    tag_service = TagService(session)
-    tags = tag_service.search_tags(current_user.id, q, limit)
+    tag_service = AsyncTagService(session)
+    tags = await tag_service.search_tags(current_user.id, q, limit)
     return tags
 
 
+@router.get(
+    "/autocomplete",
+    response_model=List[TagSuggestion],
+    responses={
+        401: {"description": "Not authenticated"},
+        403: {"description": "Account inactive"},
+    }
+)
+async def autocomplete_tags(
+    current_user: Annotated[User, Depends(get_current_user)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50)
+):
+    """
+    Suggest tags for a partially typed name.
+
+    Tags starting with the query come first, then (for three or more
+    characters) tags containing it; each group is ordered by usage count.
+    """
+    tag_service = AsyncTagService(session)
+    return await tag_service.autocomplete_tags(current_user.id, q, limit)
+
+
 @router.get(
     "/statistics",
     response_model=Dict[str, Any],
@@ -132,15 +158,15 @@ async def search_tags(
 )
 async def get_tag_statistics_alt(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """
     Get tag usage statistics for the current user.
 
     Includes total tags count, most used tags, and usage trends.
     """
-    tag_service = TagService(session)
-    statistics = tag_service.get_tag_statistics(current_user.id)
+    tag_service = AsyncTagService(session)
+    statistics = await tag_service.get_tag_statistics(current_user.id)
     return statistics
 
 
@@ -156,12 +182,12 @@ async def get_tag_statistics_alt(
 async def get_tag(
     tag_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Get a specific tag by ID."""
-    tag_service = TagService(session)
+    tag_service = AsyncTagService(session)
     try:
-        tag = tag_service.get_tag_by_id(tag_id, current_user.id)
+        tag = await tag_service.get_tag_by_id(tag_id, current_user.id)
         if not tag:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -198,12 +224,12 @@ async def update_tag(
     tag_id: uuid.UUID,
     tag_data: TagUpdate,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Update a tag."""
-    tag_service = TagService(session)
+    tag_service = AsyncTagService(session)
     try:
-        tag = tag_service.update_tag(tag_id, current_user.id, tag_data)
+        tag = await tag_service.update_tag(tag_id, current_user.id, tag_data)
         return tag
     except TagNotFoundError:
         raise HTTPException(
@@ -236,12 +262,12 @@ async def update_tag(
 async def delete_tag(
     tag_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Delete a tag."""
-    tag_service = TagService(session)
+    tag_service = AsyncTagService(session)
     try:
-        tag_service.delete_tag(tag_id, current_user.id)
+        await tag_service.delete_tag(tag_id, current_user.id)
     except TagNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -272,12 +298,12 @@ async def add_tag_to_entry(
     entry_id: uuid.UUID,
     tag_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Add a tag to an entry."""
-    tag_service = TagService(session)
+    tag_service = AsyncTagService(session)
     try:
-        link = tag_service.add_tag_to_entry(entry_id, tag_id, current_user.id)
+        link = await tag_service.add_tag_to_entry(entry_id, tag_id, current_user.id)
         return link
     except TagNotFoundError:
         raise HTTPException(
@@ -311,12 +337,12 @@ async def remove_tag_from_entry(
     entry_id: uuid.UUID,
     tag_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Remove a tag from an entry."""
-    tag_service = TagService(session)
+    tag_service = AsyncTagService(session)
     try:
-        tag_service.remove_tag_from_entry(entry_id, tag_id, current_user.id)
+        await tag_service.remove_tag_from_entry(entry_id, tag_id, current_user.id)
     except TagNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -347,11 +373,11 @@ async def remove_tag_from_entry(
 async def get_entry_tags(
     entry_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """Get all tags for an entry."""
-    tag_service = TagService(session)
-    tags = tag_service.get_entry_tags(entry_id, current_user.id)
+    tag_service = AsyncTagService(session)
+    tags = await tag_service.get_entry_tags(entry_id, current_user.id)
     return tags
 
 
@@ -370,7 +396,7 @@ async def bulk_add_tags_to_entry(
     entry_id: uuid.UUID,
     tag_names: List[str],
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """
     Add multiple tags to an entry by name.
@@ -383,9 +409,9 @@ async def bulk_add_tags_to_entry(
             detail="Tag names list cannot be empty"
         )
 
-    tag_service = TagService(session)
+    tag_service = AsyncTagService(session)
     try:
-        tags = tag_service.bulk_add_tags_to_entry(entry_id, tag_names, current_user.id)
+        tags = await tag_service.bulk_add_tags_to_entry(entry_id, tag_names, current_user.id)
         return tags
     except ValueError as e:
         raise HTTPException(
@@ -404,6 +430,7 @@ async def bulk_add_tags_to_entry(
     "/{tag_id}/entries",
     response_model=List[EntryPreviewResponse],
     responses={
+        400: {"description": "Invalid pagination cursor"},
         401: {"description": "Not authenticated"},
         403: {"description": "Account inactive"},
         404: {"description": "Tag not found"},
@@ -411,19 +438,25 @@ async def bulk_add_tags_to_entry(
 )
 async def get_entries_by_tag(
     tag_id: uuid.UUID,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     limit: int = Query(50, ge=1, le=100),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, max_length=512)
 ):
     """
     Get entries that have a specific tag.
 
-    Returns entry previews with truncated content.
+    Returns entry previews with truncated content. When a page is full, the
+    X-Next-Cursor response header holds the cursor for the next one.
     """
-    tag_service = TagService(session)
+    tag_service = AsyncTagService(session)
     try:
-        entries = tag_service.get_entries_by_tag(tag_id, current_user.id, limit, offset)
+        entries = await tag_service.get_entries_by_tag(tag_id, current_user.id, limit, offset, cursor)
+        token = next_cursor(entries, limit, EntryService.timeline_page_key)
+        if token:
+            response.headers[NEXT_CURSOR_HEADER] = token
         # Truncate content for preview
         return [
             EntryPreviewResponse(
@@ -443,6 +476,11 @@ async def get_entries_by_tag(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tag not found"
         )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
 
 # Tag Analytics
@@ -456,13 +494,13 @@ async def get_entries_by_tag(
 )
 async def get_tag_statistics(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_async_session)]
 ):
     """
     Get tag usage statistics for the current user.
 
     Includes total tags count, most used tags, and usage trends.
     """
-    tag_service = TagService(session)
-    statistics = tag_service.get_tag_statistics(current_user.id)
+    tag_service = AsyncTagService(session)
+    statistics = await tag_service.get_tag_statistics(current_user.id)
     return statistics
@@ -0,0 +1,5 @@
+"""
+One-off maintenance commands.
+
+Run with ``python -m app.commands.<name>`` inside the application container.
+"""
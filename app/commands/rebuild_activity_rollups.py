@@ -0,0 +1,52 @@
+"""
+Rebuild activity rollups and recompute writing streaks.
+
+Usage:
+    python -m app.commands.rebuild_activity_rollups [--user-id UUID]
+
+The migration that creates ``daily_activity``, ``monthly_activity`` and
+``daily_tag_usage`` already backfills them and writes keep them current;
+this command repairs drift (e.g. after manual database edits) and refreshes
+the streak values derived from them.
+"""
+import argparse
+import uuid
+from typing import Optional
+
+from sqlmodel import Session, select
+
+from app.core.database import engine
+from app.core.logging_config import log_info
+from app.models.analytics import WritingStreak
+from app.services.activity_rollup_service import ActivityRollupService
+from app.services.analytics_service import AnalyticsService
+
+
+def rebuild(user_id: Optional[uuid.UUID] = None) -> int:
+    """Rebuild rollups and recompute streaks; returns the number of streaks refreshed."""
+    with Session(engine) as session:
+        ActivityRollupService(session).rebuild(user_id)
+
+        analytics_service = AnalyticsService(session)
+        statement = select(WritingStreak.user_id)
+        if user_id is not None:
+            statement = statement.where(WritingStreak.user_id == user_id)
+        streak_user_ids = list(session.exec(statement))
+
+        for streak_user_id in streak_user_ids:
+            analytics_service.recalculate_writing_streak_stats(streak_user_id)
+
+    log_info(f"Writing streaks recalculated for {len(streak_user_ids)} users")
+    return len(streak_user_ids)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user-id", type=uuid.UUID, default=None, help="Only rebuild this user")
+    args = parser.parse_args()
+    refreshed = rebuild(args.user_id)
+    print(f"Rebuilt activity rollups; refreshed {refreshed} writing streaks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Recompute tag and prompt usage counts and report drift.
+
+Usage:
+    python -m app.commands.reconcile_usage_counts [--batch-size N]
+
+Writes keep the counters current with atomic updates; this repairs drift
+left by paths that bypass them (imports, cascaded deletes, manual edits).
+With Celery beat running the same job is scheduled every
+``USAGE_COUNT_RECONCILE_INTERVAL_SECONDS``.
+"""
+import argparse
+from typing import Dict
+
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.services.usage_count_service import DEFAULT_RECONCILE_BATCH_SIZE, UsageCountService
+
+
+def reconcile(batch_size: int = DEFAULT_RECONCILE_BATCH_SIZE) -> Dict[str, Dict[str, int]]:
+    """Reconcile usage counts; returns the drift found per counter."""
+    with Session(engine) as session:
+        return UsageCountService(session).reconcile(batch_size)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_RECONCILE_BATCH_SIZE, help="Rows checked per chunk"
+    )
+    args = parser.parse_args()
+    report = reconcile(args.batch_size)
+    for counter, drift in report.items():
+        print(
+            f"{counter}: checked {drift['checked']}, corrected {drift['corrected']}, "
+            f"total drift {drift['drift']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Versioned cache of analytics results.
+
+Analytics sections (and the dashboard built from them) are cached per user
+under the user's data version. Entry, journal, mood and tag writes replace
+the version with a fresh token once they commit, so a cached result is only
+served while nothing it was computed from has changed. A cache hit costs one
+round trip: the version and the result are fetched together.
+
+A result is tagged with the version read *before* it was computed, so a
+write that commits during the computation always outdates it. Caching needs
+``REDIS_URL``: the version must be shared by every worker, otherwise a write
+handled by one worker would leave the others serving old results.
+
+Reads and writes from async endpoints go through a ``redis.asyncio`` client
+so they never block the event loop. Invalidations come from sync service
+code: outside an event loop (Celery, threads) they use the sync client; on
+the event loop (services run through ``AsyncSession.run_sync``) they are
+scheduled on the async client and awaited by ``flush_invalidations`` before
+the response is sent.
+"""
+import asyncio
+import logging
+import threading
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.cache import AsyncInMemoryCache, AsyncRedisCache, InMemoryCache, RedisCache, create_cache
+from app.core.config import settings
+from app.core.metrics import record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY_PREFIX = "analytics:version:"
+RESULT_KEY_PREFIX = "analytics:result:"
+# Version keys must outlive any result cached under them
+VERSION_KEY_TTL_SECONDS = 86400
+
+
+class AnalyticsCache:
+    """Per-user analytics results validated by a data version token."""
+
+    def __init__(self, cache=None, ttl_seconds: Optional[int] = None, async_cache=None):
+        self._cache = cache
+        if async_cache is None and isinstance(cache, InMemoryCache):
+            async_cache = AsyncInMemoryCache(cache)
+        self._async_cache = async_cache
+        self.ttl_seconds = settings.analytics_cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._pending: Set["asyncio.Task[None]"] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache is not None and self._async_cache is not None and self.ttl_seconds > 0
+
+    @staticmethod
+    def _version_key(user_id: uuid.UUID) -> str:
+        return f"{VERSION_KEY_PREFIX}{user_id}"
+
+    @staticmethod
+    def _result_key(user_id: uuid.UUID, section: str, params: Dict[str, Any]) -> str:
+        suffix = ",".join(f"{name}={params[name]}" for name in sorted(params))
+        return f"{RESULT_KEY_PREFIX}{user_id}:{section}:{suffix}"
+
+    async def get(self, user_id: uuid.UUID, section: str, params: Dict[str, Any]) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Look up a cached result.
+
+        Returns:
+            ``(result, version)``; ``result`` is None on a miss, and a fresh
+            result may be stored under ``version`` unless that is None
+        """
+        if not self.enabled:
+            return None, None
+
+        try:
+            version, cached = await self._async_cache.get_many([
+                self._version_key(user_id),
+                self._result_key(user_id, section, params),
+            ])
+        except Exception as exc:
+            logger.warning("Failed to read analytics cache", extra={"error": str(exc)})
+            record_cache_lookup("analytics", False)
+            return None, None
+
+        if version is None:
+            # No version yet: start one, but do not cache what is computed now
+            # (a write may have replaced the version since it was found missing)
+            await self._set_version_async(user_id)
+            record_cache_lookup("analytics", False)
+            return None, None
+        hit = isinstance(cached, dict) and cached.get("version") == version
+        record_cache_lookup("analytics", hit)
+        if hit:
+            return cached.get("data"), version
+        return None, version
+
+    async def put(self, user_id: uuid.UUID, section: str, params: Dict[str, Any], version: Optional[str], data: Any) -> None:
+        """Store a result computed after ``version`` was read."""
+        if not self.enabled or version is None:
+            return
+        try:
+            await self._async_cache.set(
+                self._result_key(user_id, section, params),
+                {"version": version, "data": data},
+                ex=self.ttl_seconds,
+            )
+        except Exception as exc:
+            logger.warning("Failed to write analytics cache", extra={"error": str(exc)})
+
+    async def get_or_compute(
+        self,
+        user_id: uuid.UUID,
+        section: str,
+        params: Dict[str, Any],
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached result for a section, computing and caching it on a miss."""
+        cached, version = await self.get(user_id, section, params)
+        if cached is not None:
+            return cached
+
+        # Cached and computed results must look the same to callers
+        data = jsonable_encoder(await compute())
+        await self.put(user_id, section, params, version, data)
+        return data
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        """
+        Replace a user's data version so every cached analytics result is dropped.
+
+        On the event loop the write is scheduled instead of blocking it;
+        ``flush_invalidations`` waits for it.
+        """
+        if not self.enabled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._set_version(user_id)
+            return
+        task = loop.create_task(self._set_version_async(user_id))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def flush_invalidations(self) -> None:
+        """Wait until invalidations scheduled on the event loop have been written."""
+        if self._pending:
+            await asyncio.gather(*list(self._pending))
+
+    def _set_version(self, user_id: uuid.UUID) -> None:
+        try:
+            self._cache.set(self._version_key(user_id), uuid.uuid4().hex, ex=VERSION_KEY_TTL_SECONDS)
+        except Exception as exc:
+            self._log_version_error(user_id, exc)
+
+    async def _set_version_async(self, user_id: uuid.UUID) -> None:
+        try:
+            await self._async_cache.set(self._version_key(user_id), uuid.uuid4().hex, ex=VERSION_KEY_TTL_SECONDS)
+        except Exception as exc:
+            self._log_version_error(user_id, exc)
+
+    @staticmethod
+    def _log_version_error(user_id: uuid.UUID, exc: Exception) -> None:
+        logger.error(
+            "Failed to replace analytics data version",
+            extra={"user_id": str(user_id), "error": str(exc)},
+        )
+
+
+_analytics_cache: Optional[AnalyticsCache] = None
+_analytics_cache_lock = threading.Lock()
+
+
+def get_analytics_cache() -> AnalyticsCache:
+    """Get the process-wide analytics cache, creating it on first use."""
+    global _analytics_cache
+    if _analytics_cache is None:
+        with _analytics_cache_lock:
+            if _analytics_cache is None:
+                cache = create_cache(settings.redis_url) if settings.redis_url else None
+                async_cache = None
+                if isinstance(cache, RedisCache):
+                    async_cache = _create_async_redis_cache(settings.redis_url)
+                else:
+                    logger.info("Analytics cache disabled: it needs REDIS_URL to stay consistent across workers")
+                    cache = None
+                _analytics_cache = AnalyticsCache(cache, async_cache=async_cache)
+    return _analytics_cache
+
+
+def _create_async_redis_cache(redis_url: str) -> Optional[AsyncRedisCache]:
+    # Connections are opened lazily on the worker's event loop
+    try:
+        from redis import asyncio as redis_asyncio
+
+        return AsyncRedisCache(redis_asyncio.from_url(
+            redis_url,
+            decode_responses=True,
+            socket_connect_timeout=5,
+            socket_timeout=5,
+            max_connections=settings.redis_max_connections,
+        ))
+    except Exception as exc:
+        logger.error(f"Failed to create async Redis client for the analytics cache: {exc}")
+        return None
+
+
+def invalidate_analytics(user_id: uuid.UUID) -> None:
+    """Drop a user's cached analytics after a committed write."""
+    get_analytics_cache().invalidate(user_id)
+
+
+async def flush_analytics_invalidations() -> None:
+    """Wait for analytics invalidations scheduled by sync code on the event loop."""
+    await get_analytics_cache().flush_invalidations()
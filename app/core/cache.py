@@ -5,27 +5,122 @@ Supports Redis (production) and in-memory fallback (development).
 """
 import json
 import logging
+import sys
+import threading
 import time
-from typing import Any, Optional, Dict
+import weakref
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Optional, Dict, List, Tuple
+
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class CacheStats:
+    """Hit, miss and eviction counters of a cache instance."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    def record_lookups(self, values: List[Optional[Any]]) -> None:
+        found = sum(1 for value in values if value is not None)
+        self.hits += found
+        self.misses += len(values) - found
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+def _estimate_size(key: str, value: Any) -> int:
+    """Approximate memory held by an entry (its JSON size, as stored in Redis)."""
+    try:
+        value_size = len(json.dumps(value))
+    except (TypeError, ValueError):
+        value_size = sys.getsizeof(value)
+    return len(key) + value_size
+
+
+class _ExpirySweeper:
+    """
+    One daemon thread that periodically drops expired entries from every
+    live InMemoryCache, so keys that are never read again (abandoned OIDC
+    states) do not stay in memory until they happen to be evicted.
+    """
+
+    def __init__(self):
+        self._caches: "weakref.WeakSet[InMemoryCache]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, cache: "InMemoryCache") -> None:
+        interval = settings.cache_sweep_interval_seconds
+        if interval <= 0:
+            return
+        with self._lock:
+            self._caches.add(cache)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, args=(interval,), name="cache-expiry-sweeper", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self, interval: float) -> None:
+        while True:
+            time.sleep(interval)
+            with self._lock:
+                caches = list(self._caches)
+            for cache in caches:
+                try:
+                    cache.sweep()
+                except Exception as exc:
+                    logger.warning("Cache expiry sweep failed", extra={"error": str(exc)})
+
+
+_sweeper = _ExpirySweeper()
+
+
 class InMemoryCache:
     """
-    Simple in-memory cache with TTL support for development.
+    Bounded in-memory LRU cache with TTL support for development.
+
+    Entries are evicted least recently used first once ``max_entries`` or
+    ``max_bytes`` (approximate, measured as the JSON size of the values) is
+    exceeded; expired entries are dropped on access and by a periodic
+    background sweep.
 
     This is NOT suitable for production with multiple workers.
     Use Redis for production deployments.
     """
 
-    def __init__(self):
-        self._store: Dict[str, tuple[Any, Optional[float]]] = {}
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        self.max_entries = settings.cache_max_entries if max_entries is None else max_entries
+        self.max_bytes = settings.cache_max_bytes if max_bytes is None else max_bytes
+        self._store: "OrderedDict[str, Tuple[Any, Optional[float], int]]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+        _sweeper.register(self)
         logger.warning(
             "Using in-memory cache. This is only suitable for development "
             "with a single worker. Use Redis (REDIS_URL) for production."
         )
 
+    def __len__(self) -> int:
+        return len(self._store)
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate memory held by the cached entries."""
+        return self._size_bytes
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._store.pop(key)
+        self._size_bytes -= size
+
     def set(self, key: str, value: Any, ex: Optional[int] = None) -> None:
         """
         Set a key-value pair with optional expiration.
@@ -35,8 +130,45 @@ class InMemoryCache:
             value: Value to store
             ex: Expiration time in seconds (optional)
         """
-        expiry = time.time() + ex if ex else None
-        self._store[key] = (value, expiry)
+        expiry = time.monotonic() + ex if ex else None
+        size = _estimate_size(key, value)
+        with self._lock:
+            if key in self._store:
+                self._remove(key)
+            self._store[key] = (value, expiry, size)
+            self._size_bytes += size
+            while self._store and (
+                len(self._store) > self.max_entries or self._size_bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._store)))
+                self.stats.evictions += 1
+
+    def set_many(self, mapping: Dict[str, Any], ex: Optional[int] = None) -> None:
+        """
+        Set several key-value pairs with the same optional expiration.
+
+        Args:
+            mapping: Keys and values to store
+            ex: Expiration time in seconds (optional)
+        """
+        for key, value in mapping.items():
+            self.set(key, value, ex=ex)
+
+    def _lookup(self, key: str) -> Optional[Any]:
+        """Return a live value and mark it recently used (caller holds the lock)."""
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+
+        value, expiry, _ = entry
+        # Check if expired
+        if expiry is not None and time.monotonic() > expiry:
+            self._remove(key)
+            self.stats.expirations += 1
+            return None
+
+        self._store.move_to_end(key)
+        return value
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -48,17 +180,25 @@ class InMemoryCache:
         Returns:
             Cached value or None if not found/expired
         """
-        if key not in self._store:
-            return None
+        with self._lock:
+            value = self._lookup(key)
+            self.stats.record_lookups([value])
+        return value
 
-        value, expiry = self._store[key]
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get several values from cache.
 
-        # Check if expired
-        if expiry and time.time() > expiry:
-            del self._store[key]
-            return None
+        Args:
+            keys: Cache keys
 
-        return value
+        Returns:
+            Values in key order, None for missing/expired keys
+        """
+        with self._lock:
+            values = [self._lookup(key) for key in keys]
+            self.stats.record_lookups(values)
+        return values
 
     def delete(self, key: str) -> None:
         """
@@ -67,11 +207,28 @@ class InMemoryCache:
         Args:
             key: Cache key
         """
-        self._store.pop(key, None)
+        with self._lock:
+            if key in self._store:
+                self._remove(key)
+
+    def sweep(self) -> int:
+        """Drop every expired entry; returns the number removed."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                key for key, (_, expiry, _) in self._store.items()
+                if expiry is not None and now > expiry
+            ]
+            for key in expired:
+                self._remove(key)
+            self.stats.expirations += len(expired)
+        return len(expired)
 
     def clear(self) -> None:
         """Clear all cached data."""
-        self._store.clear()
+        with self._lock:
+            self._store.clear()
+            self._size_bytes = 0
 
 
 class RedisCache:
@@ -83,6 +240,7 @@ class RedisCache:
 
     def __init__(self, redis_client):
         self._redis = redis_client
+        self.stats = CacheStats()
         logger.info("Using Redis cache for OIDC state management")
 
     def set(self, key: str, value: Any, ex: Optional[int] = None) -> None:
@@ -111,10 +269,25 @@ class RedisCache:
             Cached value or None if not found
         """
         value = self._redis.get(key)
+        self.stats.record_lookups([value])
         if value is None:
             return None
         return json.loads(value)
 
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get several values from cache in one round trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Values in key order, None for missing keys
+        """
+        values = self._redis.mget(keys)
+        self.stats.record_lookups(values)
+        return [None if value is None else json.loads(value) for value in values]
+
     def delete(self, key: str) -> None:
         """
         Delete a key from cache.
@@ -129,6 +302,105 @@ class RedisCache:
         self._redis.flushdb()
 
 
+class AsyncRedisCache:
+    """
+    Redis-based cache for async code paths (OIDC endpoints).
+
+    Uses ``redis.asyncio`` over a bounded connection pool so a round trip
+    never blocks the event loop; multi-key operations use ``MGET`` and a
+    single pipeline.
+    """
+
+    def __init__(self, redis_client):
+        self._redis = redis_client
+        self.stats = CacheStats()
+        logger.info("Using async Redis cache for OIDC state management")
+
+    async def set(self, key: str, value: Any, ex: Optional[int] = None) -> None:
+        """Set a key-value pair (JSON serialized) with optional expiration in seconds."""
+        serialized = json.dumps(value)
+        if ex:
+            await self._redis.setex(key, ex, serialized)
+        else:
+            await self._redis.set(key, serialized)
+
+    async def set_many(self, mapping: Dict[str, Any], ex: Optional[int] = None) -> None:
+        """Set several key-value pairs in one round trip."""
+        if not mapping:
+            return
+        serialized = {key: json.dumps(value) for key, value in mapping.items()}
+        if not ex:
+            await self._redis.mset(serialized)
+            return
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, value in serialized.items():
+                pipe.setex(key, ex, value)
+            await pipe.execute()
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a value from cache, None if not found."""
+        value = await self._redis.get(key)
+        self.stats.record_lookups([value])
+        if value is None:
+            return None
+        return json.loads(value)
+
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values in one round trip, None for missing keys."""
+        if not keys:
+            return []
+        values = await self._redis.mget(keys)
+        self.stats.record_lookups(values)
+        return [None if value is None else json.loads(value) for value in values]
+
+    async def delete(self, key: str) -> None:
+        """Delete a key from cache."""
+        await self._redis.delete(key)
+
+    async def clear(self) -> None:
+        """Clear all cached data (use with caution!)."""
+        await self._redis.flushdb()
+
+    async def close(self) -> None:
+        """Release the connection pool."""
+        await self._redis.aclose()
+
+
+class AsyncInMemoryCache:
+    """
+    Async facade over InMemoryCache, so async callers use one interface
+    whether or not Redis is configured. Operations never block on I/O.
+    """
+
+    def __init__(self, cache: Optional[InMemoryCache] = None):
+        self._cache = cache if cache is not None else InMemoryCache()
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    async def set(self, key: str, value: Any, ex: Optional[int] = None) -> None:
+        self._cache.set(key, value, ex=ex)
+
+    async def set_many(self, mapping: Dict[str, Any], ex: Optional[int] = None) -> None:
+        self._cache.set_many(mapping, ex=ex)
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(key)
+
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        return self._cache.get_many(keys)
+
+    async def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+    async def clear(self) -> None:
+        self._cache.clear()
+
+    async def close(self) -> None:
+        self._cache.clear()
+
+
 def create_cache(redis_url: Optional[str] = None):
     """
     Create a cache instance based on configuration.
@@ -169,3 +441,45 @@ def create_cache(redis_url: Optional[str] = None):
 
     # Fallback to in-memory cache
     return InMemoryCache()
+
+
+async def create_async_cache(redis_url: Optional[str] = None):
+    """
+    Create an async cache instance based on configuration.
+
+    Args:
+        redis_url: Redis connection URL (e.g., "redis://localhost:6379/0")
+                  If None, falls back to the in-memory cache
+
+    Returns:
+        Cache instance (AsyncRedisCache or AsyncInMemoryCache)
+    """
+    if redis_url:
+        try:
+            from redis import asyncio as redis_asyncio
+
+            redis_client = redis_asyncio.from_url(
+                redis_url,
+                decode_responses=True,
+                socket_connect_timeout=5,
+                socket_timeout=5,
+                max_connections=settings.redis_max_connections,
+            )
+
+            # Test connection
+            await redis_client.ping()
+
+            return AsyncRedisCache(redis_client)
+        except ImportError:
+            logger.error(
+                "Redis URL provided but 'redis' package not installed. "
+                "Falling back to in-memory cache."
+            )
+        except Exception as exc:
+            logger.error(
+                f"Failed to connect to Redis at {redis_url}: {exc}. "
+                "Falling back to in-memory cache."
+            )
+
+    # Fallback to in-memory cache
+    return AsyncInMemoryCache()
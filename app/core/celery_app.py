@@ -1,8 +1,9 @@
 """
-Celery application configuration for async import/export tasks.
+Celery application configuration for async import/export and media tasks.
 """
 from celery import Celery
 from app.core.config import settings
+from app.core.metrics import register_celery_metrics
 
 # Create Celery app instance
 celery_app = Celery("journiv")
@@ -24,8 +25,32 @@ celery_app.conf.update(
     task_acks_late=True,  # Acknowledge tasks after completion
     task_reject_on_worker_lost=True,  # Requeue tasks if worker dies
     broker_connection_retry_on_startup=True,  # Retry broker connection on startup
+    # Media processing gets its own queue so thumbnails are not stuck behind
+    # long-running imports; workers consume it via `-Q celery,media`
+    task_routes={"app.tasks.media.*": {"queue": "media"}},
 )
 
+# Periodic maintenance (requires a `celery beat` process)
+beat_schedule = {}
+if settings.usage_count_reconcile_interval_seconds > 0:
+    beat_schedule["reconcile-usage-counts"] = {
+        "task": "app.tasks.maintenance.reconcile_usage_counts",
+        "schedule": settings.usage_count_reconcile_interval_seconds,
+    }
+if settings.job_recovery_interval_seconds > 0:
+    beat_schedule["recover-deletion-jobs"] = {
+        "task": "app.tasks.deletion.recover_deletion_jobs",
+        "schedule": settings.job_recovery_interval_seconds,
+    }
+    beat_schedule["recover-media-jobs"] = {
+        "task": "app.tasks.media.recover_media_jobs",
+        "schedule": settings.job_recovery_interval_seconds,
+    }
+celery_app.conf.beat_schedule = beat_schedule
+
+# Task durations for /metrics (aggregated when the worker shares PROMETHEUS_MULTIPROC_DIR)
+register_celery_metrics()
+
 # Auto-discover tasks from app.tasks module
 celery_app.autodiscover_tasks(["app.tasks"])
 
@@ -6,7 +6,7 @@ import logging
 import os
 import secrets
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import field_validator, model_validator, ValidationInfo, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -28,6 +28,66 @@ REDIS_OIDC_REQUIRED_MSG = (
 # Define the project root directory
 PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
 
+# URL query parameters that asyncpg.connect() accepts as keywords; SQLAlchemy
+# passes the query through unchanged, so libpq-only parameters must not reach it
+ASYNCPG_QUERY_PARAMS = frozenset({
+    "host", "port", "passfile", "timeout", "command_timeout", "statement_cache_size",
+    "max_cached_statement_lifetime", "max_cacheable_statement_size",
+    "prepared_statement_cache_size", "ssl", "direct_tls", "target_session_attrs",
+    "krbsrvname", "gsslib",
+})
+# libpq parameters translated into asyncpg connect arguments
+LIBPQ_SSL_FILE_PARAMS = ("sslrootcert", "sslcert", "sslkey")
+LIBPQ_TRANSLATED_PARAMS = frozenset({"sslmode", "connect_timeout", "application_name", *LIBPQ_SSL_FILE_PARAMS})
+
+
+def _libpq_ssl_context(sslmode: str, files: Dict[str, str]):
+    """SSL context matching a libpq sslmode with certificate files."""
+    import ssl
+
+    context = ssl.create_default_context(cafile=files.get("sslrootcert"))
+    if sslmode != "verify-full":
+        context.check_hostname = False
+    if sslmode not in ("verify-ca", "verify-full") and "sslrootcert" not in files:
+        context.verify_mode = ssl.CERT_NONE
+    if "sslcert" in files:
+        context.load_cert_chain(files["sslcert"], files.get("sslkey"))
+    return context
+
+
+def asyncpg_connect_args(query: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Translate the libpq parameters of a PostgreSQL URL query into asyncpg
+    connect arguments (``sslmode`` -> ``ssl``, ``connect_timeout`` ->
+    ``timeout``, ``application_name`` -> ``server_settings``).
+
+    Parameters asyncpg has no equivalent for are dropped with a warning.
+    """
+    params = {name: value[-1] if isinstance(value, tuple) else value for name, value in query.items()}
+    connect_args: Dict[str, Any] = {}
+
+    sslmode = params.get("sslmode")
+    ssl_files = {name: params[name] for name in LIBPQ_SSL_FILE_PARAMS if name in params}
+    if sslmode == "disable":
+        connect_args["ssl"] = False
+    elif ssl_files:
+        connect_args["ssl"] = _libpq_ssl_context(sslmode or "prefer", ssl_files)
+    elif sslmode:
+        # asyncpg accepts the libpq mode names
+        connect_args["ssl"] = sslmode
+
+    if "connect_timeout" in params:
+        connect_args["timeout"] = float(params["connect_timeout"])
+    if "application_name" in params:
+        connect_args["server_settings"] = {"application_name": params["application_name"]}
+
+    ignored = sorted(set(params) - ASYNCPG_QUERY_PARAMS - LIBPQ_TRANSLATED_PARAMS)
+    if ignored:
+        logger.warning(
+            "Ignoring database URL parameters not supported by asyncpg: %s", ", ".join(ignored)
+        )
+    return connect_args
+
 
 class Settings(BaseSettings):
     """Application settings."""
@@ -80,6 +140,24 @@ class Settings(BaseSettings):
 
     # Redis Configuration (for OIDC state/cache and Celery)
     redis_url: Optional[str] = None  # e.g., "redis://localhost:6379/0"
+    redis_max_connections: int = 20  # Connection pool size of the async Redis client
+
+    # In-memory cache fallback (used when REDIS_URL is unset)
+    cache_max_entries: int = 10000
+    cache_max_bytes: int = 64 * 1024 * 1024  # Approximate, measured as JSON size
+    cache_sweep_interval_seconds: float = 60.0  # Expired entry sweep; 0 disables it
+
+    # Authenticated principal cache (skips the user lookup on most requests)
+    auth_principal_cache_ttl_seconds: int = 60  # 0 disables the cache
+    auth_principal_cache_max_entries: int = 10000
+    auth_principal_cache_poll_seconds: float = 2.0  # How often a hit re-checks the user's version in Redis
+
+    # Analytics result cache (requires REDIS_URL; invalidated by writes)
+    analytics_cache_ttl_seconds: int = 3600  # 0 disables the cache
+
+    # Reference data cache (system moods and prompts; shared through REDIS_URL when set)
+    reference_cache_ttl_seconds: int = 3600  # 0 disables the cache
+    reference_cache_poll_seconds: float = 2.0  # How often workers re-check for invalidations
 
     # Celery Configuration
     celery_broker_url: Optional[str] = None  # e.g., "redis://localhost:6379/0"
@@ -89,12 +167,21 @@ class Settings(BaseSettings):
     celery_accept_content: List[str] = Field(default_factory=lambda: ["json"])
     celery_timezone: str = "UTC"
     celery_enable_utc: bool = True
+    usage_count_reconcile_interval_seconds: int = 86400  # Celery beat schedule; 0 disables it
+    job_recovery_interval_seconds: int = 300  # Sweep for interrupted background jobs (Celery beat or local media pool); 0 disables it
 
     # Import/Export Configuration
     import_export_max_file_size_mb: int = 500  # Max size for import/export files
     export_cleanup_days: int = 7  # Days to keep export files before cleanup
     import_temp_dir: str = "/data/imports/temp"
     export_dir: str = "/data/exports"
+    import_batch_size: int = 500  # Rows per bulk INSERT during import
+
+    # Journal Deletion
+    journal_delete_background_threshold: int = 1000  # Entries above which deletion runs as a background job
+    journal_delete_batch_size: int = 500  # Entries deleted per transaction by a background job
+    journal_delete_stale_seconds: int = 900  # RUNNING deletion jobs not updated for this long are picked up again
+    media_unlink_concurrency: int = 8  # Threads removing media files after a delete
 
     # CSP Configuration
     enable_csp: bool = True
@@ -113,6 +200,13 @@ class Settings(BaseSettings):
     ffprobe_timeout: int = 300  # 5 minutes for video metadata extraction
     ffmpeg_timeout: int = 300   # 5 minutes for video thumbnail generation
 
+    # Media Processing Queue
+    media_processing_concurrency: int = 2  # Local process pool size (Celery workers use --concurrency)
+    media_processing_max_attempts: int = 3  # Attempts before a media job stays FAILED
+    media_processing_retry_delay_seconds: int = 30
+    media_processing_stale_seconds: int = 900  # PROCESSING jobs older than this are picked up again
+    media_derivative_cache_mb: int = 1024  # Disk quota for resized image variants (LRU evicted)
+
 
     # Application configuration
     app_port: int = 8000
@@ -121,6 +215,13 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
     log_file: Optional[str] = None
     log_dir: str = "/data/logs"
+    log_queue_size: int = 10000  # Records buffered for the writer thread; overflow is dropped and counted
+    request_log_sample_rate: float = 1.0  # Share of successful requests logged; errors are always logged
+    request_log_sample_rates: Optional[Dict[str, float]] = None  # Per path prefix, e.g. {"/api/v1/health": 0}
+
+    # Metrics
+    metrics_enabled: bool = False  # Prometheus metrics at GET /metrics
+    metrics_token: Optional[str] = None  # Bearer token required by GET /metrics when set
 
     # Disable signup
     disable_signup: bool = Field(
@@ -131,7 +232,10 @@ class Settings(BaseSettings):
     rate_limiting_enabled: bool = Field(
         default_factory=lambda: os.getenv("RATE_LIMITING_ENABLED", "false" if os.getenv("ENVIRONMENT") == "test" else "true").lower() == "true"
     )
-    rate_limit_storage_uri: str = "memory://"
+    rate_limit_storage_uri: str = "memory://"  # leased+redis://host:6379/1 shares limits across workers
+    rate_limit_strategy: Optional[str] = None  # Defaults to sliding-window-counter for leased+ storage, else fixed-window
+    rate_limit_lease_size: int = 10  # Tokens a worker reserves per round trip (at most a tenth of a limit)
+    rate_limit_max_leases: int = 10000  # Leased rate limit keys kept per worker
     rate_limit_default_limits: Optional[List[str]] = None
     rate_limit_config: Optional[Dict[str, Dict[str, str]]] = None
 
@@ -198,6 +302,32 @@ class Settings(BaseSettings):
         # DB_DRIVER=sqlite: use DATABASE_URL (defaults to SQLite)
         return self.database_url
 
+    @property
+    def effective_async_database_url(self) -> str:
+        """
+        Get the effective database URL rewritten for an async driver.
+
+        SQLite URLs use aiosqlite and PostgreSQL URLs use asyncpg; any
+        explicit sync driver (e.g. +psycopg2) is replaced. libpq query
+        parameters are removed from PostgreSQL URLs; see
+        ``async_database_connect_args`` for their asyncpg equivalents.
+        """
+        url = make_url(self.effective_database_url)
+        if url.get_backend_name() == "sqlite":
+            return url.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+        if url.get_backend_name() in ("postgresql", "postgres"):
+            query = {name: value for name, value in url.query.items() if name in ASYNCPG_QUERY_PARAMS}
+            return url.set(drivername="postgresql+asyncpg", query=query).render_as_string(hide_password=False)
+        return url.render_as_string(hide_password=False)
+
+    @property
+    def async_database_connect_args(self) -> Dict[str, Any]:
+        """asyncpg connect arguments translated from the PostgreSQL URL's libpq parameters."""
+        url = make_url(self.effective_database_url)
+        if url.get_backend_name() not in ("postgresql", "postgres"):
+            return {}
+        return asyncpg_connect_args(url.query)
+
     @field_validator('secret_key')
     @classmethod
     def validate_secret_key(cls, v: str, info: ValidationInfo) -> str:
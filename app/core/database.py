@@ -8,10 +8,13 @@ from pathlib import Path
 
 from sqlalchemy import event
 from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel, create_engine, Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings, PROJECT_ROOT
+from app.core.metrics import instrument_engine
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +43,16 @@ if database_type == "sqlite":
     engine = create_engine(database_url, **engine_kwargs)
     logger.info(f"Configured SQLite engine ({'in-memory' if is_sqlite_memory else 'file-based'})")
 
+    # Async engine shares the same file; in-memory databases cannot be shared
+    # across engines, so the async path is only useful for file-based SQLite.
+    async_engine = create_async_engine(
+        settings.effective_async_database_url,
+        echo=False,
+        poolclass=StaticPool if is_sqlite_memory else None,
+    )
+
     @event.listens_for(engine, "connect")
+    @event.listens_for(async_engine.sync_engine, "connect")
     def set_sqlite_pragma(dbapi_connection, connection_record):
         """Set SQLite-specific pragma settings for optimal performance."""
         cursor = dbapi_connection.cursor()
@@ -63,7 +75,12 @@ elif database_type == "postgresql":
     }
 
     engine = create_engine(database_url, **engine_kwargs)
-    logger.info("Configured PostgreSQL engine with connection pooling")
+    async_engine = create_async_engine(
+        settings.effective_async_database_url,
+        connect_args=settings.async_database_connect_args,
+        **engine_kwargs,
+    )
+    logger.info("Configured PostgreSQL engines with connection pooling")
 
 else:
     # Fallback for other database types
@@ -72,12 +89,17 @@ else:
         "pool_pre_ping": True,
     }
     engine = create_engine(database_url, **engine_kwargs)
+    async_engine = create_async_engine(settings.effective_async_database_url, **engine_kwargs)
     logger.warning(
         f"Using unsupported database type '{database_type}'. "
         "Install the appropriate DB driver for production use."
     )
 
 
+instrument_engine(engine, "sync")
+instrument_engine(async_engine.sync_engine, "async")
+
+
 def create_db_and_tables():
     """Create database tables using Alembic migrations."""
     import os
@@ -115,12 +137,27 @@ def create_db_and_tables():
             raise
 
 
+# Objects must stay readable after commit: an expired attribute would trigger
+# lazy I/O outside the greenlet once the response is being serialized.
+async_session_maker = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+
 def get_session():
     """Get database session."""
     with Session(engine) as session:
         yield session
 
 
+async def get_async_session():
+    """Get async database session (non-blocking I/O on the event loop)."""
+    async with async_session_maker() as session:
+        yield session
+
+
 def seed_initial_data():
     """Seed initial data if database is empty."""
     import os
@@ -194,13 +231,17 @@ def _seed_data_from_json(session: Session, model: type[SQLModel], file_path: Pat
 def seed_moods(session: Session):
     """Seed moods from JSON file."""
     from app.models.mood import Mood
+    from app.services.mood_service import MoodService
     _seed_data_from_json(session, Mood, PROJECT_ROOT / "scripts/moods.json", "name")
+    MoodService.invalidate_mood_cache()
 
 
 def seed_prompts(session: Session):
     """Seed prompts from JSON file."""
     from app.models.prompt import Prompt
+    from app.services.prompt_service import PromptService
     _seed_data_from_json(session, Prompt, PROJECT_ROOT / "scripts/prompts.json", "text")
+    PromptService.invalidate_cache()
 
 
 def init_db():
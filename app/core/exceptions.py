@@ -67,6 +67,11 @@ class TagNotFoundError(JournivAppException):
     pass
 
 
+class DeletionJobNotFoundError(JournivAppException):
+    """Raised when a journal deletion job is not found."""
+    pass
+
+
 class UnauthorizedError(JournivAppException):
     """Raised when user is not authorized."""
     pass
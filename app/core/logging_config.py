@@ -1,10 +1,21 @@
 """
 Simple logging configuration.
+
+Loggers hand records to a bounded in-memory queue; a background
+``QueueListener`` thread formats them and writes the console and file
+handlers, so logging on the request path never waits on I/O. When the queue
+is full, records are dropped and counted instead of blocking.
 """
+import atexit
 import logging
 import logging.handlers
+import queue
+import threading
 from enum import Enum
 from pathlib import Path
+from typing import Dict, Optional
+
+from app.core.metrics import LOG_RECORDS_DROPPED
 
 
 class LogCategory(str, Enum):
@@ -134,14 +145,88 @@ def _get_settings():
     return settings
 
 
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that never blocks the caller.
+
+    Records are enqueued unformatted; the message, arguments and traceback
+    are rendered by the listener thread. Records that do not fit in the
+    queue are dropped and counted.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener runs in this process, so the record can be formatted there
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+            LOG_RECORDS_DROPPED.inc()
+
+
+class _LogPipeline:
+    """The queue handler and the listener thread writing its records."""
+
+    def __init__(self, handler: NonBlockingQueueHandler, listener: logging.handlers.QueueListener):
+        self.handler = handler
+        self.listener = listener
+        self._stopped = False
+
+    def stop(self) -> None:
+        """Write out the queued records and stop the listener thread."""
+        if self._stopped:
+            return
+        self._stopped = True
+        self.listener.stop()
+
+
+_pipeline: Optional[_LogPipeline] = None
+
+
+def _stop_log_pipeline() -> None:
+    if _pipeline is not None:
+        _pipeline.stop()
+
+
+atexit.register(_stop_log_pipeline)
+
+
+def get_log_pipeline_stats() -> Dict[str, int]:
+    """Queued and dropped record counts of the background logging pipeline."""
+    if _pipeline is None:
+        return {"queued": 0, "dropped": 0}
+    return {"queued": _pipeline.handler.queue.qsize(), "dropped": _pipeline.handler.dropped}
+
+
+def get_dropped_log_records() -> int:
+    """Records dropped because the logging queue was full."""
+    return get_log_pipeline_stats()["dropped"]
+
+
 def setup_logging():
     """Setup logging configuration."""
+    global _pipeline
     settings = _get_settings()
     # Create logs directory
 
     log_dir = Path(settings.log_dir)
     log_dir.mkdir(parents=True, exist_ok=True)
 
+    # Stop a previous pipeline, writing out what it still holds
+    _stop_log_pipeline()
+
     # Clear existing handlers
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
@@ -171,10 +256,17 @@ def setup_logging():
     file_handler.setFormatter(formatter)
     file_handler.setLevel(resolved_level)
 
-    # Configure root logger
+    # Configure root logger; handlers run on the listener thread
+    log_queue: queue.Queue = queue.Queue(maxsize=max(0, settings.log_queue_size))
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    _pipeline = _LogPipeline(queue_handler, listener)
+
     root_logger.setLevel(resolved_level)
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(queue_handler)
 
     # Configure specific loggers
     logging.getLogger(LogCategory.APP).setLevel(resolved_level)
@@ -197,8 +289,8 @@ def setup_logging():
         "Logging configured - Level: %s",
         logging.getLevelName(resolved_level)
     )
-    logger.info(f"Console logging: Enabled")
-    logger.info(f"File logging: {log_dir / 'app.log'}")
+    logger.info("Console logging: Enabled")
+    logger.info("File logging: %s", log_dir / "app.log")
 
 
 def get_request_logger():
@@ -209,9 +301,34 @@ def get_request_logger():
     return RequestContextLogger(LogCategory.REQUEST)
 
 
+class _ContextMessage:
+    """Log message with request ID and extra context, rendered when the record is formatted."""
+
+    __slots__ = ("message", "request_id", "context")
+
+    def __init__(self, message: str, request_id: Optional[str], context: dict):
+        self.message = message
+        self.request_id = request_id
+        self.context = context
+
+    def __str__(self) -> str:
+        # Build the log message with request ID
+        log_message = f"[{self.request_id}] {self.message}" if self.request_id else str(self.message)
+
+        # Append any extra context to the message (with sanitization)
+        if self.context:
+            sanitized_context = _sanitize_data(self.context)
+            extra_context = ", ".join(f"{k}={v}" for k, v in sanitized_context.items())
+            log_message = f"{log_message} ({extra_context})"
+        return log_message
+
+
 def _log_with_context(logger: logging.Logger, level: int, message: str, request_id: str = None, exc_info: bool = False, **kwargs):
     """Internal helper to format logs with an optional request ID and extra context.
 
+    Nothing is built when the level is disabled; otherwise the message is
+    rendered by the logging listener thread, off the caller's path.
+
     Args:
         logger: Logger instance to use
         level: Logging level
@@ -221,17 +338,11 @@ def _log_with_context(logger: logging.Logger, level: int, message: str, request_
         **kwargs: Additional context to append to message (e.g., media_id, user_id)
                    Sensitive fields will be automatically masked
     """
-    # Build the log message with request ID
-    log_message = f"[{request_id}] {message}" if request_id else message
-
-    # Append any extra context to the message (with sanitization)
-    if kwargs:
-        sanitized_kwargs = _sanitize_data(kwargs)
-        extra_context = ", ".join(f"{k}={v}" for k, v in sanitized_kwargs.items())
-        log_message = f"{log_message} ({extra_context})"
+    if not logger.isEnabledFor(level):
+        return
 
     # Call logger with only supported parameters
-    logger.log(level, log_message, exc_info=exc_info)
+    logger.log(level, _ContextMessage(message, request_id, kwargs), exc_info=exc_info)
 
 
 def log_user_action(user_email: str, action: str, request_id: str = None, **kwargs):
@@ -282,6 +393,6 @@ def log_error(error: Exception | str, request_id: str = None, user_email: str =
     logger = logging.getLogger(LogCategory.ERRORS)
     user_info = f" (user: {user_email})" if user_email else ""
     message = f"Error: {str(error)}{user_info}"
-    # exc_info should only be True if we have an actual Exception
-    exc_info = isinstance(error, Exception)
+    # exc_info should only be True if we have an actual Exception (unless overridden)
+    exc_info = kwargs.pop("exc_info", isinstance(error, Exception))
     _log_with_context(logger, logging.ERROR, message, request_id, exc_info=exc_info, **kwargs)
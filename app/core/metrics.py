@@ -0,0 +1,222 @@
+"""
+Prometheus metrics.
+
+Metrics are recorded with ``prometheus_client`` and served in the text
+exposition format by ``GET /metrics``. Under gunicorn every worker is a
+separate process; when ``PROMETHEUS_MULTIPROC_DIR`` is set (the Docker
+entrypoints and compose files do this) each process writes its samples to
+memory-mapped files in that directory. Every service gets its own
+subdirectory of a shared root (``/data/metrics/app``,
+``/data/metrics/celery-worker``) so each can empty its directory on startup
+without touching the others, and ``render_metrics`` aggregates all of them.
+Gauges are summed over live processes.
+"""
+import glob
+import os
+import secrets
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+NAMESPACE = "journiv"
+
+DB_QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+JOB_BUCKETS = (0.5, 1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"],
+    namespace=NAMESPACE,
+)
+DB_QUERIES = Counter(
+    "db_queries_total",
+    "SQL statements executed.",
+    ["engine", "operation"],
+    namespace=NAMESPACE,
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "SQL statement execution time.",
+    ["engine", "operation"],
+    namespace=NAMESPACE,
+    buckets=DB_QUERY_BUCKETS,
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the pool.",
+    ["engine"],
+    namespace=NAMESPACE,
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Connections open beyond the pool size.",
+    ["engine"],
+    namespace=NAMESPACE,
+    multiprocess_mode="livesum",
+)
+MEDIA_PROCESSING_QUEUE_DEPTH = Gauge(
+    "media_processing_queue_depth",
+    "Media jobs submitted to the local process pool and not finished yet.",
+    namespace=NAMESPACE,
+    multiprocess_mode="livesum",
+)
+CELERY_TASK_DURATION = Histogram(
+    "celery_task_duration_seconds",
+    "Celery task run time (import, export, media, deletion and maintenance jobs).",
+    ["task", "status"],
+    namespace=NAMESPACE,
+    buckets=JOB_BUCKETS,
+)
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total",
+    "Cache lookups by cache and result; the hit ratio is hit / (hit + miss).",
+    ["cache", "result"],
+    namespace=NAMESPACE,
+)
+LOG_RECORDS_DROPPED = Counter(
+    "log_records_dropped_total",
+    "Log records dropped because the logging queue was full.",
+    namespace=NAMESPACE,
+)
+
+
+def multiprocess_enabled() -> bool:
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+class SharedDirectoryCollector:
+    """Merge the samples of every service directory under a shared root."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def collect(self):
+        files = glob.glob(os.path.join(self.root, "*", "*.db"))
+        return multiprocess.MultiProcessCollector.merge(files, accumulate=True)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Metrics in the Prometheus text format. When ``PROMETHEUS_MULTIPROC_DIR``
+    is set they are aggregated over every process writing to it or to one of
+    its sibling directories.
+
+    Returns:
+        ``(body, content_type)``
+    """
+    if multiprocess_enabled():
+        registry = CollectorRegistry()
+        root = os.path.dirname(os.path.normpath(os.environ["PROMETHEUS_MULTIPROC_DIR"]))
+        registry.register(SharedDirectoryCollector(root))
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def is_authorized(authorization: Optional[str], token: Optional[str]) -> bool:
+    """Check an ``Authorization: Bearer`` header against the configured token."""
+    if not token:
+        return True
+    scheme, _, credentials = (authorization or "").partition(" ")
+    return scheme.lower() == "bearer" and secrets.compare_digest(credentials.strip(), token)
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drop the live gauges of an exited worker process (gunicorn ``child_exit``)."""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(pid)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc()
+
+
+# SQLAlchemy
+_OPERATIONS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+
+def _operation(statement: str) -> str:
+    keyword = statement.lstrip()[:6].upper()
+    return keyword if keyword in _OPERATIONS else "OTHER"
+
+
+def instrument_engine(engine: Any, name: str) -> None:
+    """
+    Count and time every statement of a (sync) engine and track its pool.
+
+    Args:
+        engine: SQLAlchemy ``Engine`` (``AsyncEngine.sync_engine`` for async engines)
+        name: ``engine`` label of the samples
+    """
+    from sqlalchemy import event
+
+    checked_out = DB_POOL_CHECKED_OUT.labels(name)
+    overflow = DB_POOL_OVERFLOW.labels(name)
+    pool = engine.pool
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metrics_started_at = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started_at = getattr(context, "_metrics_started_at", None)
+        operation = _operation(statement)
+        DB_QUERIES.labels(name, operation).inc()
+        if started_at is not None:
+            DB_QUERY_DURATION.labels(name, operation).observe(time.perf_counter() - started_at)
+
+    def _update_overflow() -> None:
+        if hasattr(pool, "overflow"):
+            overflow.set(max(pool.overflow(), 0))
+
+    @event.listens_for(pool, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        checked_out.inc()
+        _update_overflow()
+
+    @event.listens_for(pool, "checkin")
+    def _checkin(dbapi_connection, connection_record):
+        checked_out.dec()
+        _update_overflow()
+
+
+# Celery
+_task_started_at: Dict[str, float] = {}
+
+
+def register_celery_metrics() -> None:
+    """Time Celery tasks and clean up after exiting pool processes."""
+    from celery import signals
+
+    @signals.task_prerun.connect(weak=False)
+    def _task_prerun(task_id=None, **kwargs):
+        _task_started_at[task_id] = time.perf_counter()
+
+    @signals.task_postrun.connect(weak=False)
+    def _task_postrun(task_id=None, task=None, retval=None, state=None, **kwargs):
+        started_at = _task_started_at.pop(task_id, None)
+        if started_at is None or task is None:
+            return
+        # Import and export tasks report failures in their return value
+        status: Optional[str] = retval.get("status") if isinstance(retval, dict) else None
+        CELERY_TASK_DURATION.labels(task.name, status or (state or "unknown").lower()).observe(
+            time.perf_counter() - started_at
+        )
+
+    @signals.worker_process_shutdown.connect(weak=False)
+    def _worker_process_shutdown(**kwargs):
+        mark_process_dead(os.getpid())
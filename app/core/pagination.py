@@ -0,0 +1,100 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Listings are ordered by a fixed sort key ending in a unique column (the row
+ID), all descending. A cursor is the sort key of the last row of a page,
+encoded as an opaque URL-safe token; the next page is everything strictly
+after it. Unlike ``OFFSET`` this lets the database seek straight into the
+index, so every page costs the same and rows do not shift when new rows are
+written while a client scrolls.
+"""
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+
+from sqlalchemy import literal, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.time_utils import ensure_utc
+
+# Response header carrying the cursor for the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+    pass
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return ensure_utc(value).isoformat()
+    if isinstance(value, uuid.UUID):
+        return value.hex
+    return value
+
+
+def _decode_value(value: Any, value_type: type) -> Any:
+    if value_type is datetime:
+        return ensure_utc(datetime.fromisoformat(value))
+    if value_type is uuid.UUID:
+        return uuid.UUID(value)
+    if value_type is bool:
+        if not isinstance(value, bool):
+            raise TypeError("expected a boolean")
+        return value
+    return value_type(value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode a row's sort key as an opaque cursor token."""
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, types: Sequence[type]) -> Tuple[Any, ...]:
+    """
+    Decode a cursor token produced by ``encode_cursor``.
+
+    Args:
+        token: Cursor from a previous page
+        types: Expected type of each sort key component
+
+    Raises:
+        InvalidCursorError: If the token is malformed or does not match ``types``
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("unexpected cursor length")
+        return tuple(_decode_value(value, value_type) for value, value_type in zip(values, types))
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+def after_cursor(columns: Sequence[ColumnElement], values: Sequence[Any]) -> ColumnElement:
+    """
+    Condition selecting rows after ``values`` in a descending ``columns`` ordering.
+
+    Uses a row-value comparison, which both SQLite and PostgreSQL can satisfy
+    with a range scan on an index over the same columns.
+    """
+    bound = [literal(value, column.type) for column, value in zip(columns, values)]
+    return tuple_(*columns) < tuple_(*bound)
+
+
+def next_cursor(rows: Sequence[Any], limit: int, key: Any) -> Optional[str]:
+    """
+    Cursor for the page following ``rows``, or None if this was the last page.
+
+    Args:
+        rows: The page just fetched
+        limit: Page size the rows were fetched with
+        key: Callable returning a row's sort key
+    """
+    if not rows or len(rows) < limit:
+        return None
+    return encode_cursor(key(rows[-1]))
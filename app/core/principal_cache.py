@@ -0,0 +1,190 @@
+"""
+Per-worker cache of authenticated principals.
+
+``get_current_user`` resolves the token subject to a ``User`` on every
+request. Active users are kept here for ``auth_principal_cache_ttl_seconds``
+so most authenticated requests need no database query for authentication.
+
+Every user has a version counter that ``invalidate`` bumps whenever the user
+row changes (profile update, role or activation change, deletion). Entries
+remember the version they were loaded under and are discarded once it moves
+on. With ``REDIS_URL`` configured the counters live in Redis, so a change
+made through one worker is seen by all of them; otherwise they are
+per-process and other workers see the change once their entry expires.
+
+A hit re-reads the version at most every ``auth_principal_cache_poll_seconds``
+(as ``reference_cache`` does), so most hits need no Redis round trip on the
+event loop. A change made through another worker is seen within one poll
+interval; the worker that made it drops its own entry immediately.
+"""
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import record_cache_lookup
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY_PREFIX = "auth:principal_version:"
+# Version keys must outlive any entry cached under them
+VERSION_KEY_TTL_SECONDS = 86400
+# Never cached: the password hash stays in the database
+EXCLUDED_FIELDS = frozenset({"password"})
+
+
+class PrincipalCache:
+    """Bounded TTL cache of active users, invalidated by per-user version counters."""
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        redis_client=None,
+        poll_seconds: Optional[float] = None,
+    ):
+        self.ttl_seconds = settings.auth_principal_cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self.max_entries = settings.auth_principal_cache_max_entries if max_entries is None else max_entries
+        self.poll_seconds = settings.auth_principal_cache_poll_seconds if poll_seconds is None else poll_seconds
+        self._redis = redis_client
+        # user_id -> (expires_at, version, version_checked_at, fields)
+        self._entries: "OrderedDict[uuid.UUID, Tuple[float, int, float, Dict[str, Any]]]" = OrderedDict()
+        self._versions: Dict[uuid.UUID, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def version(self, user_id: uuid.UUID) -> Optional[int]:
+        """
+        Current version of a user's principal.
+
+        Read it *before* loading the user and pass it to ``put``, so a change
+        committed in between is never cached as current.
+
+        Returns:
+            The version, or None if it could not be determined (nothing is cached then)
+        """
+        if self._redis is None:
+            with self._lock:
+                return self._versions.get(user_id, 0)
+        try:
+            return int(self._redis.get(f"{VERSION_KEY_PREFIX}{user_id}") or 0)
+        except Exception as exc:
+            logger.warning("Failed to read principal version from Redis", extra={"error": str(exc)})
+            return None
+
+    def get(self, user_id: uuid.UUID) -> Optional[User]:
+        """Return a detached copy of a cached active user, or None on a miss."""
+        if not self.enabled:
+            return None
+
+        user = self._lookup(user_id)
+        record_cache_lookup("principal", user is not None)
+        return user
+
+    def _lookup(self, user_id: uuid.UUID) -> Optional[User]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, cached_version, checked_at, fields = entry
+            if expires_at <= now:
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+
+        if now - checked_at >= self.poll_seconds:
+            if self.version(user_id) != cached_version:
+                with self._lock:
+                    self._entries.pop(user_id, None)
+                return None
+            with self._lock:
+                if user_id in self._entries:
+                    self._entries[user_id] = (expires_at, cached_version, now, fields)
+
+        # A fresh instance per request so callers cannot change the cached fields
+        return User(**fields)
+
+    def put(self, user: User, version: Optional[int]) -> None:
+        """Cache a user loaded under ``version`` (as returned by ``version``)."""
+        if not self.enabled or version is None:
+            return
+
+        fields = {
+            column.name: getattr(user, column.name)
+            for column in User.__table__.columns
+            if column.name not in EXCLUDED_FIELDS
+        }
+        with self._lock:
+            # The version was read before the user was loaded; confirm it on the first hit
+            self._entries[user.id] = (time.monotonic() + self.ttl_seconds, version, float("-inf"), fields)
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        """Bump a user's version so every worker drops its cached principal."""
+        with self._lock:
+            self._entries.pop(user_id, None)
+            if self._redis is None:
+                self._versions[user_id] = self._versions.get(user_id, 0) + 1
+                return
+
+        key = f"{VERSION_KEY_PREFIX}{user_id}"
+        try:
+            pipeline = self._redis.pipeline()
+            pipeline.incr(key)
+            pipeline.expire(key, VERSION_KEY_TTL_SECONDS)
+            pipeline.execute()
+        except Exception as exc:
+            logger.error(
+                "Failed to bump principal version in Redis",
+                extra={"user_id": str(user_id), "error": str(exc)},
+            )
+
+    def clear(self) -> None:
+        """Drop all cached principals held by this worker."""
+        with self._lock:
+            self._entries.clear()
+
+
+_principal_cache: Optional[PrincipalCache] = None
+_principal_cache_lock = threading.Lock()
+
+
+def _connect_redis(redis_url: Optional[str]):
+    if not redis_url:
+        return None
+    try:
+        import redis
+
+        client = redis.from_url(
+            redis_url,
+            decode_responses=True,
+            socket_connect_timeout=5,
+            socket_timeout=5,
+        )
+        client.ping()
+        return client
+    except ImportError:
+        logger.error("Redis URL provided but 'redis' package not installed; principal versions are per-worker")
+    except Exception as exc:
+        logger.error(f"Failed to connect to Redis at {redis_url}: {exc}; principal versions are per-worker")
+    return None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Get the process-wide principal cache, creating it on first use."""
+    global _principal_cache
+    if _principal_cache is None:
+        with _principal_cache_lock:
+            if _principal_cache is None:
+                _principal_cache = PrincipalCache(redis_client=_connect_redis(settings.redis_url))
+    return _principal_cache
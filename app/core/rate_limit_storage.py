@@ -0,0 +1,186 @@
+"""
+Redis-backed sliding window rate limit storage with local token leases.
+
+Registered with ``limits`` under the ``leased+redis://`` (and
+``leased+rediss://``) schemes, so it plugs into the slowapi ``limiter``
+through ``RATE_LIMIT_STORAGE_URI``. Counters live in Redis and are shared by
+every worker and node; limits use the sliding window counter strategy.
+
+A worker reserves tokens in batches and hands them out locally, so a hot
+endpoint pays one Redis round trip per batch instead of per request.
+Reserved tokens count against the shared limit as soon as they are leased,
+so leasing can only admit fewer requests than the limit, never more. Batches
+are capped at a tenth of the limit, which keeps small limits (login) exact.
+
+``leased+fakeredis://`` runs the same code against an in-process fake
+Redis, for tests and single-process development.
+"""
+import threading
+import time
+from collections import OrderedDict
+from math import floor
+from typing import Optional, Tuple
+
+from limits.storage import Storage, SlidingWindowCounterSupport
+from limits.storage.base import TimestampedSlidingWindow
+
+from app.core.config import settings
+
+KEY_PREFIX = "rate_limit:"
+
+# Shared by every fake storage in the process, like one Redis server
+_fake_server = None
+
+
+def _fake_redis():
+    global _fake_server
+    import fakeredis
+
+    if _fake_server is None:
+        _fake_server = fakeredis.FakeServer()
+    return fakeredis.FakeRedis(server=_fake_server, decode_responses=True)
+
+
+class LeasedRedisStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """Rate limit storage that leases batches of sliding window tokens from Redis."""
+
+    STORAGE_SCHEME = ["leased+redis", "leased+rediss", "leased+fakeredis"]
+
+    def __init__(
+        self,
+        uri: str,
+        wrap_exceptions: bool = False,
+        lease_size: Optional[int] = None,
+        max_leases: Optional[int] = None,
+        **options,
+    ):
+        import redis
+
+        self._redis_errors = redis.RedisError
+        scheme, _, address = uri.partition("://")
+        if scheme == "leased+fakeredis":
+            self._redis = _fake_redis()
+        else:
+            redis_url = f"{scheme.removeprefix('leased+')}://{address}"
+            self._redis = redis.from_url(redis_url, decode_responses=True, **options)
+
+        self.lease_size = settings.rate_limit_lease_size if lease_size is None else lease_size
+        self.max_leases = settings.rate_limit_max_leases if max_leases is None else max_leases
+        self._leases: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        super().__init__(uri, wrap_exceptions=wrap_exceptions)
+
+    @property
+    def base_exceptions(self):
+        return self._redis_errors
+
+    def _batch_size(self, limit: int) -> int:
+        return max(1, min(self.lease_size, limit // 10))
+
+    # Local leases
+    def _take_leased(self, window_key: str, amount: int) -> bool:
+        with self._lock:
+            remaining = self._leases.get(window_key, 0)
+            if remaining < amount:
+                return False
+            if remaining == amount:
+                del self._leases[window_key]
+            else:
+                self._leases[window_key] = remaining - amount
+                self._leases.move_to_end(window_key)
+            return True
+
+    def _keep_leased(self, window_key: str, tokens: int) -> None:
+        if tokens <= 0:
+            return
+        with self._lock:
+            self._leases[window_key] = self._leases.get(window_key, 0) + tokens
+            self._leases.move_to_end(window_key)
+            while len(self._leases) > self.max_leases:
+                self._leases.popitem(last=False)
+
+    # Sliding window counter
+    @staticmethod
+    def _window_ttls(previous_count: int, expiry: int, now: float) -> Tuple[float, float]:
+        previous_ttl = 0.0 if previous_count == 0 else (1 - (((now - expiry) / expiry) % 1)) * expiry
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous_ttl, current_ttl
+
+    def _reserve(self, previous_key: str, current_key: str, limit: int, expiry: int, requested: int, now: float) -> int:
+        """
+        Take up to ``requested`` tokens from the shared window in one round
+        trip; any excess over the limit is handed back.
+        """
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.incrby(current_key, requested)
+        pipe.expire(current_key, 2 * expiry)
+        pipe.get(previous_key)
+        current_count, _, previous_count = pipe.execute()
+
+        previous_count = int(previous_count or 0)
+        previous_ttl, _ = self._window_ttls(previous_count, expiry, now)
+        used_before = floor(previous_count * previous_ttl / expiry) + current_count - requested
+        granted = max(0, min(requested, limit - used_before))
+        if granted < requested:
+            self._redis.decrby(current_key, requested - granted)
+        return granted
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(f"{KEY_PREFIX}{key}", expiry, now)
+        if self._take_leased(current_key, amount):
+            return True
+
+        granted = self._reserve(previous_key, current_key, limit, expiry, max(amount, self._batch_size(limit)), now)
+        if granted < amount:
+            # Too few for this hit; keep them for a cheaper one
+            self._keep_leased(current_key, granted)
+            return False
+        self._keep_leased(current_key, granted - amount)
+        return True
+
+    def get_sliding_window(self, key: str, expiry: int) -> Tuple[int, float, int, float]:
+        """Shared window counts; tokens leased by workers count as used."""
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(f"{KEY_PREFIX}{key}", expiry, now)
+        previous_count, current_count = (int(value or 0) for value in self._redis.mget(previous_key, current_key))
+        previous_ttl, current_ttl = self._window_ttls(previous_count, expiry, now)
+        return previous_count, previous_ttl, current_count, current_ttl
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(f"{KEY_PREFIX}{key}", expiry, now)
+        with self._lock:
+            self._leases.pop(current_key, None)
+        self._redis.delete(previous_key, current_key)
+
+    # Fixed window counters (other strategies)
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        value = self._redis.incrby(f"{KEY_PREFIX}{key}", amount)
+        if value == amount:
+            # First hit of the window
+            self._redis.expire(f"{KEY_PREFIX}{key}", expiry)
+        return value
+
+    def get(self, key: str) -> int:
+        return int(self._redis.get(f"{KEY_PREFIX}{key}") or 0)
+
+    def get_expiry(self, key: str) -> float:
+        return max(self._redis.ttl(f"{KEY_PREFIX}{key}"), 0) + time.time()
+
+    def clear(self, key: str) -> None:
+        self._redis.delete(f"{KEY_PREFIX}{key}")
+
+    def check(self) -> bool:
+        try:
+            return bool(self._redis.ping())
+        except Exception:
+            return False
+
+    def reset(self) -> Optional[int]:
+        with self._lock:
+            self._leases.clear()
+        keys = list(self._redis.scan_iter(f"{KEY_PREFIX}*"))
+        return self._redis.delete(*keys) if keys else 0
@@ -15,6 +15,8 @@ try:
     from slowapi import Limiter
     from slowapi.util import get_remote_address
     from slowapi.errors import RateLimitExceeded
+    # Registers the leased+redis:// storage scheme with limits
+    from app.core import rate_limit_storage  # noqa: F401
     SLOWAPI_AVAILABLE = True
 except ImportError:
     SLOWAPI_AVAILABLE = False
@@ -127,6 +129,15 @@ def get_default_limits():
     return ["1000/hour"]  # Production default
 
 
+def get_rate_limit_strategy() -> str:
+    """Get the rate limiting strategy for the configured storage."""
+    if settings.rate_limit_strategy:
+        return settings.rate_limit_strategy
+    if settings.rate_limit_storage_uri.startswith("leased+"):
+        return "sliding-window-counter"
+    return "fixed-window"
+
+
 # Initialize limiter only if rate limiting is active
 limiter = None
 
@@ -138,6 +149,7 @@ def get_limiter():
             limiter = Limiter(
                 key_func=get_remote_address,
                 storage_uri=settings.rate_limit_storage_uri,
+                strategy=get_rate_limit_strategy(),
                 default_limits=get_default_limits()
             )
         else:
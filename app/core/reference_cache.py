@@ -0,0 +1,198 @@
+"""
+Shared cache of reference data (system moods and prompts).
+
+Listings are cached as pre-serialized JSON bytes so a hit can be written
+straight to the response. Every namespace has a version token in the shared
+cache backend; cached listings are keyed by it and a write replaces it.
+
+Each worker keeps the listings of the current version in memory and
+re-reads the version at most every ``reference_cache_poll_seconds``, so a
+hit usually costs no round trip at all and an invalidation made by any
+worker (or Celery, or the seeding entrypoint) reaches every other worker
+within one poll interval. With ``REDIS_URL`` unset the backend is the
+per-process in-memory cache and invalidation stays local, as before.
+"""
+import json
+import logging
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.cache import create_cache
+from app.core.config import settings
+from app.core.metrics import record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+MOODS_NAMESPACE = "moods"
+PROMPTS_NAMESPACE = "prompts"
+
+VERSION_KEY_PREFIX = "reference:version:"
+PAYLOAD_KEY_PREFIX = "reference:payload:"
+
+
+@dataclass
+class _LocalNamespace:
+    """Listings of one namespace held by this worker."""
+    version: Optional[str] = None
+    checked_at: float = 0.0
+    payloads: Dict[str, bytes] = field(default_factory=dict)
+
+
+class ReferenceCache:
+    """Versioned cache of serialized reference data listings."""
+
+    def __init__(self, cache=None, ttl_seconds: Optional[int] = None, poll_seconds: Optional[float] = None):
+        self._cache = cache
+        self.ttl_seconds = settings.reference_cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self.poll_seconds = settings.reference_cache_poll_seconds if poll_seconds is None else poll_seconds
+        self._local: Dict[str, _LocalNamespace] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache is not None and self.ttl_seconds > 0
+
+    @staticmethod
+    def _version_key(namespace: str) -> str:
+        return f"{VERSION_KEY_PREFIX}{namespace}"
+
+    @staticmethod
+    def _payload_key(namespace: str, version: str, key: str) -> str:
+        return f"{PAYLOAD_KEY_PREFIX}{namespace}:{version}:{key}"
+
+    def _current_version(self, namespace: str) -> Tuple[_LocalNamespace, Optional[str]]:
+        """This worker's view of a namespace, re-reading the shared version when due."""
+        with self._lock:
+            local = self._local.setdefault(namespace, _LocalNamespace())
+            if local.version is not None and time.monotonic() - local.checked_at < self.poll_seconds:
+                return local, local.version
+
+        try:
+            version = self._cache.get(self._version_key(namespace))
+            if version is None:
+                version = self._set_version(namespace)
+        except Exception as exc:
+            logger.warning("Failed to read reference data version", extra={"namespace": namespace, "error": str(exc)})
+            return local, None
+
+        with self._lock:
+            if version != local.version:
+                local.version = version
+                local.payloads = {}
+            local.checked_at = time.monotonic()
+        return local, version
+
+    def version(self, namespace: str) -> Optional[str]:
+        """
+        Current version token of a namespace, for data derived from it in
+        memory; None when the cache is disabled or unreachable.
+        """
+        if not self.enabled:
+            return None
+        return self._current_version(namespace)[1]
+
+    def get(self, namespace: str, key: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Look up a serialized listing.
+
+        Returns:
+            ``(payload, version)``; ``payload`` is None on a miss, and a fresh
+            listing may be stored under ``version`` unless that is None
+        """
+        if not self.enabled:
+            return None, None
+
+        local, version = self._current_version(namespace)
+        if version is None:
+            return None, None
+
+        payload = local.payloads.get(key)
+        if payload is not None:
+            record_cache_lookup("reference", True)
+            return payload, version
+
+        try:
+            text = self._cache.get(self._payload_key(namespace, version, key))
+        except Exception as exc:
+            logger.warning("Failed to read reference data cache", extra={"namespace": namespace, "error": str(exc)})
+            text = None
+        record_cache_lookup("reference", text is not None)
+        if text is None:
+            return None, version
+
+        payload = text.encode("utf-8")
+        with self._lock:
+            if local.version == version:
+                local.payloads[key] = payload
+        return payload, version
+
+    def put(self, namespace: str, key: str, version: Optional[str], data: Any) -> bytes:
+        """Serialize a listing loaded after ``version`` was read and store it."""
+        # Same encoding as FastAPI's JSONResponse
+        payload = json.dumps(
+            jsonable_encoder(data), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode("utf-8")
+        if not self.enabled or version is None:
+            return payload
+
+        try:
+            self._cache.set(self._payload_key(namespace, version, key), payload.decode("utf-8"), ex=self.ttl_seconds)
+        except Exception as exc:
+            logger.warning("Failed to write reference data cache", extra={"namespace": namespace, "error": str(exc)})
+        with self._lock:
+            local = self._local.get(namespace)
+            if local is not None and local.version == version:
+                local.payloads[key] = payload
+        return payload
+
+    def get_or_load(self, namespace: str, key: str, load: Callable[[], Any]) -> bytes:
+        """Return the serialized listing, loading and caching it on a miss."""
+        payload, version = self.get(namespace, key)
+        if payload is not None:
+            return payload
+        return self.put(namespace, key, version, load())
+
+    def invalidate(self, namespace: str) -> None:
+        """Replace a namespace's version so every worker drops its listings."""
+        if not self.enabled:
+            return
+        try:
+            version = self._set_version(namespace)
+        except Exception as exc:
+            logger.error(
+                "Failed to replace reference data version",
+                extra={"namespace": namespace, "error": str(exc)},
+            )
+            version = None
+        with self._lock:
+            self._local[namespace] = _LocalNamespace(version=version, checked_at=time.monotonic())
+
+    def _set_version(self, namespace: str) -> str:
+        version = uuid.uuid4().hex
+        # Outlives every listing cached under it
+        self._cache.set(self._version_key(namespace), version, ex=self.ttl_seconds * 2)
+        return version
+
+
+_reference_cache: Optional[ReferenceCache] = None
+_reference_cache_lock = threading.Lock()
+
+
+def get_reference_cache() -> ReferenceCache:
+    """Get the process-wide reference data cache, creating it on first use."""
+    global _reference_cache
+    if _reference_cache is None:
+        with _reference_cache_lock:
+            if _reference_cache is None:
+                _reference_cache = ReferenceCache(create_cache(settings.redis_url))
+    return _reference_cache
+
+
+def invalidate_reference_data(namespace: str) -> None:
+    """Drop cached listings of a namespace in every worker after a committed write."""
+    get_reference_cache().invalidate(namespace)
@@ -17,11 +17,12 @@ from fastapi.responses import JSONResponse, FileResponse, Response
 from starlette.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from sqlmodel import Session
 
 from app.api.v1.api import api_router
 from app.core.config import settings
-from app.core.database import init_db
-from app.core.cache import create_cache
+from app.core.database import async_engine, engine, init_db
+from app.core.cache import create_async_cache
 from app.core.exceptions import (
     JournivAppException, UserNotFoundError, UserAlreadyExistsError,
     InvalidCredentialsError, JournalNotFoundError, EntryNotFoundError,
@@ -30,8 +31,13 @@ from app.core.exceptions import (
     TagNotFoundError, UnauthorizedError,
 )
 from app.core.logging_config import setup_logging, log_info, log_warning, log_error
+from app.core.metrics import is_authorized, render_metrics
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.core.rate_limiting import limiter, rate_limit_exceeded_handler
+from app.services.bulk_delete_service import BulkDeleteService
+from app.services.file_processing_service import FileProcessingService, start_recovery_sweep
 from app.middleware.request_logging import request_id_ctx, RequestLoggingMiddleware
+from app.middleware.metrics import MetricsMiddleware
 from app.middleware.csp_middleware import create_csp_middleware
 
 # -----------------------------------------------------------------------------
@@ -48,14 +54,26 @@ async def lifespan(app: FastAPI):
         init_db()
         log_info("Database initialization completed!")
 
+        if not settings.celery_broker_url:
+            # Without a Celery worker, media and journal deletion jobs run in this
+            # process; pick up any that were queued or interrupted before the last shutdown
+            with Session(engine) as session:
+                FileProcessingService(session).recover_pending_media()
+                BulkDeleteService(session).recover_deletion_jobs()
+            start_recovery_sweep()
+
         if settings.oidc_enabled:
-            app.state.cache = create_cache(settings.redis_url)
+            app.state.cache = await create_async_cache(settings.redis_url)
             log_info("Cache initialization completed!")
     except Exception as exc:
         log_error(exc)
         raise
     yield
     log_info("Shutting down Journiv Service...")
+    cache = getattr(app.state, "cache", None)
+    if cache is not None:
+        await cache.close()
+    await async_engine.dispose()
 
 
 # -----------------------------------------------------------------------------
@@ -97,6 +115,7 @@ if cors_enabled:
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
         allow_headers=["Authorization", "Content-Type", "Accept", "Origin", "X-Requested-With"],
+        expose_headers=[NEXT_CURSOR_HEADER],
         max_age=3600,
     )
     log_info(f"CORS enabled for origins: {cors_origins}")
@@ -170,6 +189,10 @@ app.add_middleware(TrustedHostMiddleware, allowed_hosts=trusted_hosts)
 # Logging Middleware
 app.add_middleware(RequestLoggingMiddleware)
 
+# Metrics Middleware (request latency per route)
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 # CSP / HSTS Middleware
 CSPMiddlewareClass = create_csp_middleware(
     environment=settings.environment,
@@ -262,6 +285,22 @@ async def general_exception_handler(request: Request, exc: Exception):
 # -----------------------------------------------------------------------------
 app.include_router(api_router, prefix=settings.api_v1_prefix)
 
+if settings.metrics_enabled:
+    if not settings.metrics_token:
+        log_warning("METRICS_TOKEN not set; /metrics is readable without authentication.")
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics(request: Request):
+        """Prometheus metrics, aggregated over all workers."""
+        if not is_authorized(request.headers.get("Authorization"), settings.metrics_token):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid metrics token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        body, content_type = render_metrics()
+        return Response(content=body, media_type=content_type)
+
 media_path = Path(settings.media_root)
 if media_path.exists():
     app.mount("/media", StaticFiles(directory=str(media_path)), name="media")
@@ -1,6 +1,7 @@
 """
 Middleware modules.
 """
+from .metrics import MetricsMiddleware
 from .request_logging import RequestLoggingMiddleware
 
-__all__ = ["RequestLoggingMiddleware"]
+__all__ = ["MetricsMiddleware", "RequestLoggingMiddleware"]
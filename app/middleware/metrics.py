@@ -0,0 +1,44 @@
+"""
+Request latency middleware for the Prometheus metrics.
+"""
+import time
+
+from app.core.metrics import HTTP_REQUEST_DURATION
+
+# Label of requests that matched no route (static files, 404s)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Records the latency of every HTTP request by method, route template
+    (``/api/v1/entries/{entry_id}``, not the raw path) and status code.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start_time = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message.get("status", status_code)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # The router stores the matched route in the scope
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                scope.get("method", "UNKNOWN"),
+                getattr(route, "path", UNMATCHED_ROUTE),
+                str(status_code),
+            ).observe(time.perf_counter() - start_time)
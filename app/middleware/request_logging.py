@@ -2,10 +2,13 @@
 Request logging middleware with request ID tracking, context propagation, and structured logging.
 """
 import logging
+import random
 import time
 import uuid
 from contextvars import ContextVar
-from typing import Optional
+from typing import Dict, Optional
+
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +19,33 @@ request_id_ctx: ContextVar[str] = ContextVar('request_id', default='unknown')
 DEFAULT_STATUS_CODE = 500
 
 
+class RequestLogSampler:
+    """
+    Decides which successful requests are logged.
+
+    Rates are configured per path prefix (the longest matching prefix wins)
+    with a default for every other path; 1 logs every request, 0 none.
+    """
+
+    def __init__(self, default_rate: float = 1.0, route_rates: Optional[Dict[str, float]] = None):
+        self.default_rate = default_rate
+        self._route_rates = sorted((route_rates or {}).items(), key=lambda item: len(item[0]), reverse=True)
+
+    @classmethod
+    def from_settings(cls) -> "RequestLogSampler":
+        return cls(settings.request_log_sample_rate, settings.request_log_sample_rates)
+
+    def rate(self, path: str) -> float:
+        for prefix, rate in self._route_rates:
+            if path.startswith(prefix):
+                return rate
+        return self.default_rate
+
+    def sample(self, path: str) -> bool:
+        rate = self.rate(path)
+        return rate >= 1 or (rate > 0 and random.random() < rate)
+
+
 class RequestLoggingMiddleware:
     """
     Request logging middleware with request ID tracking, context propagation, and structured logging.
@@ -27,10 +57,12 @@ class RequestLoggingMiddleware:
     - Exception handling with proper error logging
     - Response header injection (x-request-id)
     - Performance timing
+    - Per-route sampling of successful requests (4xx/5xx and exceptions are always logged)
     """
 
-    def __init__(self, app):
+    def __init__(self, app, sampler: Optional[RequestLogSampler] = None):
         self.app = app
+        self.sampler = sampler or RequestLogSampler.from_settings()
 
     async def __call__(self, scope, receive, send):
         if scope["type"] == "http":
@@ -48,17 +80,20 @@ class RequestLoggingMiddleware:
             path = scope.get("path", "/")
             client_host = scope.get("client", ["unknown", 0])[0] if scope.get("client") else "unknown"
 
-            # Structured logging for request start
-            logger.info(
-                "Request started",
-                extra={
-                    "request_id": request_id,
-                    "method": method,
-                    "path": path,
-                    "client_ip": client_host,
-                    "event": "request_start"
-                }
-            )
+            # Request start is only logged at DEBUG; completion carries the same fields
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Request started: %s %s",
+                    method,
+                    path,
+                    extra={
+                        "request_id": request_id,
+                        "method": method,
+                        "path": path,
+                        "client_ip": client_host,
+                        "event": "request_start"
+                    }
+                )
 
             # Process request and capture response
             response_captured = None
@@ -114,32 +149,51 @@ class RequestLoggingMiddleware:
                     # No response was captured, likely due to an exception
                     status_code = DEFAULT_STATUS_CODE
 
-                # Structured logging for request completion
-                log_extra = {
-                    "request_id": request_id,
-                    "method": method,
-                    "path": path,
-                    "client_ip": client_host,
-                    "status_code": status_code,
-                    "duration_ms": duration_ms,
-                    "event": "request_complete"
-                }
-
-                if error_occurred:
-                    log_extra["error"] = error_message
-                    logger.error("Request completed with error", extra=log_extra)
-                else:
-                    # Log at different levels based on status code
-                    if status_code >= 500:
-                        logger.error("Request completed with server error", extra=log_extra)
-                    elif status_code >= 400:
-                        logger.warning("Request completed with client error", extra=log_extra)
-                    else:
-                        logger.info("Request completed successfully", extra=log_extra)
+                # Successful requests are sampled per route
+                if error_occurred or status_code >= 400 or self._should_log_success(path):
+                    self._log_completion(
+                        request_id, method, path, client_host, status_code, duration_ms,
+                        error_message if error_occurred else None,
+                    )
         else:
             # Non-HTTP scope (e.g., WebSocket, lifespan)
             await self.app(scope, receive, send)
 
+    def _should_log_success(self, path: str) -> bool:
+        return logger.isEnabledFor(logging.INFO) and self.sampler.sample(path)
+
+    @staticmethod
+    def _log_completion(
+        request_id: str,
+        method: str,
+        path: str,
+        client_host: str,
+        status_code: int,
+        duration_ms: float,
+        error_message: Optional[str],
+    ) -> None:
+        """Structured logging for request completion."""
+        log_extra = {
+            "request_id": request_id,
+            "method": method,
+            "path": path,
+            "client_ip": client_host,
+            "status_code": status_code,
+            "duration_ms": duration_ms,
+            "event": "request_complete"
+        }
+        args = (method, path, status_code, duration_ms)
+
+        if error_message is not None:
+            log_extra["error"] = error_message
+            logger.error("Request completed with error: %s %s %s (%sms)", *args, extra=log_extra)
+        # Log at different levels based on status code
+        elif status_code >= 500:
+            logger.error("Request completed with server error: %s %s %s (%sms)", *args, extra=log_extra)
+        elif status_code >= 400:
+            logger.warning("Request completed with client error: %s %s %s (%sms)", *args, extra=log_extra)
+        else:
+            logger.info("Request completed successfully: %s %s %s (%sms)", *args, extra=log_extra)
 
 
 class RequestContextLogger:
@@ -1,6 +1,7 @@
 # Import all models for easy access
-from .analytics import WritingStreak
+from .analytics import DailyActivity, DailyTagUsage, MonthlyActivity, WritingStreak
 from .base import BaseModel
+from .deletion_job import DeletionJob
 from .entry import Entry, EntryMedia
 from .entry_tag_link import EntryTagLink
 from .export_job import ExportJob
@@ -25,7 +26,11 @@ __all__ = [
     "Tag",
     "EntryTagLink",
     "WritingStreak",
+    "DailyActivity",
+    "MonthlyActivity",
+    "DailyTagUsage",
     "ExternalIdentity",
     "ImportJob",
     "ExportJob",
+    "DeletionJob",
 ]
@@ -9,10 +9,10 @@ from datetime import date
 from typing import Optional, TYPE_CHECKING
 
 from pydantic import field_validator
-from sqlalchemy import Column, ForeignKey
-from sqlmodel import Field, Relationship, Index, CheckConstraint
+from sqlalchemy import Column, Date, ForeignKey
+from sqlmodel import Field, Relationship, Index, CheckConstraint, SQLModel
 
-from .base import BaseModel
+from .base import BaseModel, TimestampMixin
 
 if TYPE_CHECKING:
     from .user import User
@@ -115,3 +115,115 @@ class WritingStreak(BaseModel, table=True):
         if v < current_streak:
             raise ValueError('longest_streak must be >= current_streak')
         return v
+
+
+class ActivityCounters(SQLModel):
+    """Counters shared by the daily and monthly activity rollups."""
+    entry_count: int = Field(default=0, ge=0, description="Entries written")
+    word_count: int = Field(default=0, ge=0, description="Words written")
+    mood_count: int = Field(default=0, ge=0, description="Moods logged")
+    positive_mood_count: int = Field(default=0, ge=0, description="Positive moods logged")
+    neutral_mood_count: int = Field(default=0, ge=0, description="Neutral moods logged")
+    negative_mood_count: int = Field(default=0, ge=0, description="Negative moods logged")
+
+
+class DailyActivity(TimestampMixin, ActivityCounters, table=True):
+    """
+    Per-user activity for each local day.
+
+    Maintained incrementally by entry and mood log writes so streaks,
+    writing patterns and the heatmap read one compact row per active day
+    instead of aggregating entries. Rows are removed when every counter
+    drops to zero.
+    """
+    __tablename__ = "daily_activity"
+
+    user_id: uuid.UUID = Field(
+        sa_column=Column(
+            ForeignKey("user.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False
+        ),
+        description="User the activity belongs to"
+    )
+    activity_date: date = Field(
+        sa_column=Column(Date, primary_key=True, nullable=False),
+        description="User's local date (matches Entry.entry_date / MoodLog.logged_date)"
+    )
+
+    # Table constraints and indexes
+    __table_args__ = (
+        CheckConstraint('entry_count >= 0', name='check_daily_activity_entry_count_positive'),
+        CheckConstraint('word_count >= 0', name='check_daily_activity_word_count_positive'),
+        CheckConstraint('mood_count >= 0', name='check_daily_activity_mood_count_positive'),
+    )
+
+
+class MonthlyActivity(TimestampMixin, ActivityCounters, table=True):
+    """
+    Per-user activity for each local calendar month.
+
+    Same counters as DailyActivity, keyed by the first day of the month.
+    """
+    __tablename__ = "monthly_activity"
+
+    user_id: uuid.UUID = Field(
+        sa_column=Column(
+            ForeignKey("user.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False
+        ),
+        description="User the activity belongs to"
+    )
+    month: date = Field(
+        sa_column=Column(Date, primary_key=True, nullable=False),
+        description="First day of the user's local month"
+    )
+
+    # Table constraints and indexes
+    __table_args__ = (
+        CheckConstraint('entry_count >= 0', name='check_monthly_activity_entry_count_positive'),
+        CheckConstraint('word_count >= 0', name='check_monthly_activity_word_count_positive'),
+        CheckConstraint('mood_count >= 0', name='check_monthly_activity_mood_count_positive'),
+    )
+
+
+class DailyTagUsage(TimestampMixin, SQLModel, table=True):
+    """
+    Number of a user's entries on each local day that carry a tag.
+
+    Rows are removed when their count drops to zero.
+    """
+    __tablename__ = "daily_tag_usage"
+
+    user_id: uuid.UUID = Field(
+        sa_column=Column(
+            ForeignKey("user.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False
+        ),
+        description="User the usage belongs to"
+    )
+    activity_date: date = Field(
+        sa_column=Column(Date, primary_key=True, nullable=False),
+        description="Local date of the tagged entries"
+    )
+    tag_id: uuid.UUID = Field(
+        sa_column=Column(
+            ForeignKey("tag.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False
+        ),
+        description="Tag applied to the entries"
+    )
+    usage_count: int = Field(
+        default=0,
+        ge=0,
+        description="Entries on this date carrying the tag"
+    )
+
+    # Table constraints and indexes
+    __table_args__ = (
+        CheckConstraint('usage_count >= 0', name='check_daily_tag_usage_positive'),
+        Index('idx_daily_tag_usage_tag', 'tag_id'),
+    )
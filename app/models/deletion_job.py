@@ -0,0 +1,94 @@
+"""
+Deletion job model for tracking background journal deletions.
+"""
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+import uuid
+
+from sqlalchemy import Column, ForeignKey, Enum as SAEnum
+from sqlmodel import Field, Column as SQLModelColumn, JSON
+
+from app.models.base import BaseModel
+from app.models.enums import JobStatus
+from app.core.time_utils import utc_now
+
+
+class DeletionJob(BaseModel, table=True):
+    """
+    Track progress of a large journal deletion.
+
+    Journals above the background threshold are archived and deleted in
+    batches by a worker instead of inside the request.
+    """
+    __tablename__ = "deletion_jobs"
+
+    # Foreign key to user who requested the deletion
+    user_id: uuid.UUID = Field(
+        sa_column=Column(
+            ForeignKey("user.id", ondelete="CASCADE"),
+            nullable=False,
+            index=True
+        )
+    )
+
+    # Journal being deleted (no foreign key: the job outlives the journal)
+    journal_id: uuid.UUID = Field(index=True, description="Journal being deleted")
+
+    # Job status and progress
+    status: JobStatus = Field(
+        default=JobStatus.PENDING,
+        sa_column=Column(
+            SAEnum(JobStatus, name="job_status_enum", values_callable=lambda x: [e.value for e in x]),
+            nullable=False,
+            index=True
+        )
+    )
+    progress: int = Field(default=0, ge=0, le=100, description="Progress percentage 0-100")
+
+    # Progress tracking
+    total_items: int = Field(default=0, description="Total number of entries to delete")
+    processed_items: int = Field(default=0, description="Number of entries deleted so far")
+
+    # Results and errors
+    result_data: Optional[Dict[str, Any]] = Field(
+        default=None,
+        sa_column=SQLModelColumn(JSON),
+        description="Deletion statistics (entry count, media count)"
+    )
+    errors: Optional[List[str]] = Field(
+        default=None,
+        sa_column=SQLModelColumn(JSON),
+        description="List of error messages"
+    )
+
+    # Completion timestamp
+    completed_at: Optional[datetime] = Field(default=None, description="When the job completed or failed")
+
+    def __repr__(self) -> str:
+        return f"<DeletionJob(id={self.id}, journal_id={self.journal_id}, status={self.status}, progress={self.progress}%)>"
+
+    def mark_running(self):
+        """Mark job as running."""
+        self.status = JobStatus.RUNNING
+
+    def update_progress(self, processed: int, total: int):
+        """Update progress based on processed/total items."""
+        self.processed_items = processed
+        self.total_items = total
+        if total > 0:
+            self.progress = min(100, int((processed / total) * 100))
+
+    def mark_completed(self, result_data: Dict[str, Any]):
+        """Mark job as completed with results."""
+        self.status = JobStatus.COMPLETED
+        self.progress = 100
+        self.result_data = result_data
+        self.completed_at = utc_now()
+
+    def mark_failed(self, error_message: str):
+        """Mark job as failed with error."""
+        self.status = JobStatus.FAILED
+        if self.errors is None:
+            self.errors = []
+        self.errors.append(error_message)
+        self.completed_at = utc_now()
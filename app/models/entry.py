@@ -89,6 +89,7 @@ class Entry(BaseModel, table=True):
         Index('idx_entries_created_at', 'created_at'),
         Index('idx_entries_prompt_id', 'prompt_id'),
         Index('idx_entry_user_datetime', 'user_id', 'entry_datetime_utc'),
+        Index('idx_entry_journal_pinned_datetime', 'journal_id', 'is_pinned', 'entry_datetime_utc'),
 
         # Constraints
         CheckConstraint('length(content) > 0', name='check_content_not_empty'),
@@ -154,6 +155,7 @@ class EntryMedia(BaseModel, table=True):
     )
     file_metadata: Optional[str] = Field(None, max_length=2000)  # JSON metadata
     processing_error: Optional[str] = Field(None, max_length=1000)  # Error message if processing failed
+    processing_attempts: int = Field(default=0, ge=0)  # Background processing runs claimed so far
     checksum: Optional[str] = Field(
         default=None,
         sa_column=Column(String(64), nullable=True)
@@ -105,7 +105,12 @@ class MoodLog(BaseModel, table=True):
     # Relations
     user: "User" = Relationship(back_populates="mood_logs")
     entry: Optional["Entry"] = Relationship(back_populates="mood_log")
-    mood: "Mood" = Relationship(back_populates="mood_logs")
+    # Eager-loaded: every mood log response embeds its mood, and lazy loads are
+    # not possible once an AsyncSession has handed the object back.
+    mood: "Mood" = Relationship(
+        back_populates="mood_logs",
+        sa_relationship_kwargs={"lazy": "joined"}
+    )
 
     # Table constraints and indexes
     __table_args__ = (
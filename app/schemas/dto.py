@@ -311,6 +311,15 @@ class ImportJobStatusResponse(JobStatusResponse):
     source_type: ImportSourceType = Field(..., description="Source type: journiv, markdown, dayone")
 
 
+class DeletionJobStatusResponse(JobStatusResponse):
+    """
+    Background journal deletion status.
+
+    Maps to: DeletionJob model (app/models/deletion_job.py)
+    """
+    journal_id: str = Field(..., description="Journal being deleted (UUID)")
+
+
 # ============================================================================
 # Import Result DTOs
 # ============================================================================
@@ -337,6 +346,11 @@ class ImportResultSummary(BaseModel):
     entries_skipped: int = Field(0, description="Entries skipped (duplicates or errors)")
     media_files_skipped: int = Field(0, description="Media files skipped (errors)")
 
+    # Throughput
+    rows_inserted: int = Field(0, description="Database rows written by the import")
+    duration_seconds: float = Field(0.0, description="Wall-clock time spent importing data")
+    rows_per_second: float = Field(0.0, description="Rows written per second")
+
     # Warnings and errors (non-fatal issues that occurred during import)
     warnings: List[str] = Field(
         default_factory=list,
@@ -47,6 +47,12 @@ class TagResponse(TagBase, TimestampMixin):
     updated_at: datetime
 
 
+class TagSuggestion(TagBase):
+    """Tag autocomplete suggestion schema."""
+    id: uuid.UUID
+    usage_count: int
+
+
 class EntryTagLinkBase(BaseModel):
     """Base entry tag link schema."""
     entry_id: uuid.UUID
@@ -0,0 +1,291 @@
+"""
+Per-user daily and monthly activity rollups.
+
+``daily_activity``, ``monthly_activity`` and ``daily_tag_usage`` hold the
+entry, word, mood and tag counts analytics read instead of aggregating
+entries and mood logs on every request. Writes collect their change as an
+``ActivityDelta`` and apply it in their own transaction; ``rebuild``
+recomputes the rollups from the source tables to repair drift.
+"""
+import uuid
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session, select, func
+
+from app.core.logging_config import log_info, log_error
+from app.core.time_utils import utc_now
+from app.models.analytics import DailyActivity, DailyTagUsage, MonthlyActivity
+from app.models.entry import Entry
+from app.models.entry_tag_link import EntryTagLink
+from app.models.enums import MoodCategory
+from app.models.mood import Mood, MoodLog
+from app.models.tag import Tag
+from app.models.user import User
+
+ACTIVITY_COUNTERS = (
+    "entry_count",
+    "word_count",
+    "mood_count",
+    "positive_mood_count",
+    "neutral_mood_count",
+    "negative_mood_count",
+)
+
+MOOD_CATEGORY_COUNTERS = {
+    MoodCategory.POSITIVE.value: "positive_mood_count",
+    MoodCategory.NEUTRAL.value: "neutral_mood_count",
+    MoodCategory.NEGATIVE.value: "negative_mood_count",
+}
+
+
+def month_start(day: date) -> date:
+    """First day of the month containing ``day``."""
+    return day.replace(day=1)
+
+
+@dataclass
+class ActivityDelta:
+    """Change to a user's activity rollups, keyed by local date."""
+    days: DefaultDict[date, Counter] = field(default_factory=lambda: defaultdict(Counter))
+    tags: Counter = field(default_factory=Counter)
+
+    def __bool__(self) -> bool:
+        return any(any(counters.values()) for counters in self.days.values()) or any(self.tags.values())
+
+    def add_entries(self, day: Optional[date], count: int, words: int = 0) -> "ActivityDelta":
+        if day is not None:
+            self.days[day]["entry_count"] += count
+            self.days[day]["word_count"] += words
+        return self
+
+    def add_moods(self, day: Optional[date], category: Optional[str], count: int = 1) -> "ActivityDelta":
+        if day is not None:
+            self.days[day]["mood_count"] += count
+            category_counter = MOOD_CATEGORY_COUNTERS.get(category)
+            if category_counter:
+                self.days[day][category_counter] += count
+        return self
+
+    def add_tag(self, day: Optional[date], tag_id: uuid.UUID, count: int = 1) -> "ActivityDelta":
+        if day is not None:
+            self.tags[(day, tag_id)] += count
+        return self
+
+    def merge(self, other: "ActivityDelta", sign: int = 1) -> "ActivityDelta":
+        """Add ``other`` (negated when ``sign`` is -1) into this delta."""
+        for day, counters in other.days.items():
+            for name, value in counters.items():
+                self.days[day][name] += sign * value
+        for key, value in other.tags.items():
+            self.tags[key] += sign * value
+        return self
+
+    def negated(self) -> "ActivityDelta":
+        return ActivityDelta().merge(self, sign=-1)
+
+    def months(self) -> Dict[date, Counter]:
+        """Day counters summed per month."""
+        months: DefaultDict[date, Counter] = defaultdict(Counter)
+        for day, counters in self.days.items():
+            months[month_start(day)].update(counters)
+        return months
+
+
+class ActivityRollupService:
+    """Service class for maintaining and reading activity rollups."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    # Collecting deltas
+    def mood_category(self, mood_id: Optional[uuid.UUID]) -> Optional[str]:
+        """Category of a mood, used to bucket mood log counts."""
+        if mood_id is None:
+            return None
+        return self.session.exec(select(Mood.category).where(Mood.id == mood_id)).first()
+
+    def entry_activity(self, user_id: uuid.UUID, *criteria) -> ActivityDelta:
+        """
+        Activity contributed by a user's entries matching ``criteria``.
+
+        Includes the entries' words, tags and attached mood logs. Three
+        grouped queries, so it is cheap enough to run before a set-based
+        delete or after a bulk insert.
+        """
+        criteria = (Entry.user_id == user_id, *criteria)
+        delta = ActivityDelta()
+
+        for day, count, words in self.session.exec(
+            select(Entry.entry_date, func.count(Entry.id), func.coalesce(func.sum(Entry.word_count), 0))
+            .where(*criteria)
+            .group_by(Entry.entry_date)
+        ):
+            delta.add_entries(day, int(count), int(words))
+
+        for day, tag_id, count in self.session.exec(
+            select(Entry.entry_date, EntryTagLink.tag_id, func.count())
+            .join(Entry, EntryTagLink.entry_id == Entry.id)
+            .where(*criteria)
+            .group_by(Entry.entry_date, EntryTagLink.tag_id)
+        ):
+            delta.add_tag(day, tag_id, int(count))
+
+        self._add_mood_activity(
+            delta, MoodLog.user_id == user_id, MoodLog.entry_id.in_(select(Entry.id).where(*criteria))
+        )
+        return delta
+
+    def user_activity(self, user_id: uuid.UUID) -> ActivityDelta:
+        """All activity of a user, recomputed from entries, tag links and mood logs."""
+        delta = self.entry_activity(user_id)
+        # entry_activity only counted mood logs attached to entries
+        self._add_mood_activity(delta, MoodLog.user_id == user_id, MoodLog.entry_id.is_(None))
+        return delta
+
+    def _add_mood_activity(self, delta: ActivityDelta, *criteria) -> None:
+        for day, category, count in self.session.exec(
+            select(MoodLog.logged_date, Mood.category, func.count(MoodLog.id))
+            .join(Mood, MoodLog.mood_id == Mood.id)
+            .where(*criteria)
+            .group_by(MoodLog.logged_date, Mood.category)
+        ):
+            delta.add_moods(day, category, int(count))
+
+    # Applying deltas
+    def apply(self, user_id: uuid.UUID, delta: ActivityDelta) -> None:
+        """
+        Apply an activity delta to a user's rollups (caller commits).
+
+        Each touched day, month and tag row is upserted once with every
+        counter adjusted relatively (never below zero), then rows whose
+        counters all reached zero are removed.
+        """
+        if not delta:
+            return
+
+        now = utc_now()
+        for key_column, table, rows in (
+            ("activity_date", DailyActivity.__table__, delta.days),
+            ("month", MonthlyActivity.__table__, delta.months()),
+        ):
+            for key, counters in rows.items():
+                if any(counters.values()):
+                    self._upsert(
+                        table, {"user_id": user_id, key_column: key}, dict(counters), now
+                    )
+
+        tag_table = DailyTagUsage.__table__
+        for (day, tag_id), count in delta.tags.items():
+            if count:
+                self._upsert(
+                    tag_table,
+                    {"user_id": user_id, "activity_date": day, "tag_id": tag_id},
+                    {"usage_count": count},
+                    now,
+                )
+
+    def _upsert(self, table: sa.Table, keys: Dict[str, Any], counters: Dict[str, int], now) -> None:
+        dialect = self.session.get_bind().dialect.name
+        insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+
+        adjusted = {}
+        for name, value in counters.items():
+            if not value:
+                continue
+            new_value = table.c[name] + value
+            adjusted[name] = sa.case((new_value > 0, new_value), else_=0)
+
+        statement = insert(table).values(
+            **keys,
+            **{name: max(value, 0) for name, value in counters.items()},
+            created_at=now,
+            updated_at=now,
+        ).on_conflict_do_update(
+            index_elements=[table.c[name] for name in keys],
+            set_={**adjusted, "updated_at": now},
+        )
+        self.session.execute(statement)
+
+        if any(value < 0 for value in counters.values()):
+            counter_names = [name for name in table.c.keys() if name in ACTIVITY_COUNTERS or name == "usage_count"]
+            self.session.execute(
+                sa.delete(table).where(
+                    *(table.c[name] == value for name, value in keys.items()),
+                    *(table.c[name] <= 0 for name in counter_names),
+                )
+            )
+
+    def rebuild(self, user_id: Optional[uuid.UUID] = None, commit: bool = True) -> int:
+        """
+        Recompute rollups from entries, tag links and mood logs.
+
+        Rebuilds a single user when ``user_id`` is given, otherwise every
+        user. Returns the number of users rebuilt.
+        """
+        if user_id is not None:
+            user_ids: List[uuid.UUID] = [user_id]
+        else:
+            user_ids = list(self.session.exec(select(User.id)))
+
+        try:
+            for rebuild_user_id in user_ids:
+                for table in (DailyActivity.__table__, MonthlyActivity.__table__, DailyTagUsage.__table__):
+                    self.session.execute(sa.delete(table).where(table.c.user_id == rebuild_user_id))
+                self.apply(rebuild_user_id, self.user_activity(rebuild_user_id))
+            if commit:
+                self.session.commit()
+        except SQLAlchemyError as exc:
+            self.session.rollback()
+            log_error(exc)
+            raise
+
+        log_info(f"Activity rollups rebuilt for {len(user_ids)} users", user_id=str(user_id) if user_id else None)
+        return len(user_ids)
+
+    # Reading rollups
+    def get_daily_activity(self, user_id: uuid.UUID, start_date: date, end_date: date) -> List[DailyActivity]:
+        """Daily rows between two dates (inclusive), oldest first; one primary key range read."""
+        statement = (
+            select(DailyActivity)
+            .where(
+                DailyActivity.user_id == user_id,
+                DailyActivity.activity_date >= start_date,
+                DailyActivity.activity_date <= end_date,
+            )
+            .order_by(DailyActivity.activity_date)
+        )
+        return list(self.session.exec(statement))
+
+    def get_monthly_activity(self, user_id: uuid.UUID, month: date) -> Optional[MonthlyActivity]:
+        """Monthly row for the month containing ``month``, if any activity was recorded."""
+        statement = select(MonthlyActivity).where(
+            MonthlyActivity.user_id == user_id,
+            MonthlyActivity.month == month_start(month),
+        )
+        return self.session.exec(statement).first()
+
+    def get_top_tags(
+        self, user_id: uuid.UUID, start_date: date, end_date: date, limit: int = 10
+    ) -> List[Tuple[str, int]]:
+        """Most used tags between two dates as ``(tag_name, usage_count)`` pairs."""
+        usage = func.sum(DailyTagUsage.usage_count)
+        statement = (
+            select(Tag.name, usage)
+            .join(Tag, DailyTagUsage.tag_id == Tag.id)
+            .where(
+                DailyTagUsage.user_id == user_id,
+                DailyTagUsage.activity_date >= start_date,
+                DailyTagUsage.activity_date <= end_date,
+            )
+            .group_by(Tag.id, Tag.name)
+            .order_by(usage.desc(), Tag.name)
+            .limit(limit)
+        )
+        return [(name, int(count)) for name, count in self.session.exec(statement)]
@@ -2,19 +2,20 @@
 Analytics service for managing analytics data.
 """
 import uuid
-from datetime import datetime, date, timedelta, timezone
-from typing import Optional, Dict, Any
+from datetime import date, timedelta
+from typing import Optional, Dict, Any, List
 
+import sqlalchemy as sa
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select, func
 
+from app.core.analytics_cache import invalidate_analytics
 from app.core.logging_config import log_info, log_error
-from app.models.analytics import WritingStreak
+from app.models.analytics import DailyActivity, WritingStreak
 from app.core.time_utils import utc_now
 from app.models.entry import Entry
 from app.models.journal import Journal
-from app.models.mood import MoodLog
-from app.models.tag import Tag, EntryTagLink
+from app.services.activity_rollup_service import ActivityDelta, ActivityRollupService
 
 
 class AnalyticsService:
@@ -45,54 +46,6 @@ class AnalyticsService:
             log_info(f"Writing streak created for user {user_id}")
         return streak
 
-    def update_writing_streak(self, user_id: uuid.UUID, entry_date: date) -> WritingStreak:
-        """Update writing streak when a new entry is created."""
-        streak = self.get_writing_streak(user_id)
-        if not streak:
-            streak = self.create_writing_streak(user_id)
-
-        # Calculate if this is a consecutive day
-        if streak.last_entry_date:
-            days_diff = (entry_date - streak.last_entry_date).days
-            if days_diff == 1:
-                # Consecutive day - increment streak
-                streak.current_streak += 1
-                if streak.current_streak > streak.longest_streak:
-                    streak.longest_streak = streak.current_streak
-            elif days_diff > 1:
-                # Gap in entries - reset streak
-                streak.current_streak = 1
-                streak.streak_start_date = entry_date
-                # Update longest streak if needed
-                if streak.current_streak > streak.longest_streak:
-                    streak.longest_streak = streak.current_streak
-            # If days_diff == 0, it's the same day, don't change streak
-        else:
-            # First entry
-            streak.current_streak = 1
-            streak.streak_start_date = entry_date
-            # Update longest streak if needed
-            if streak.current_streak > streak.longest_streak:
-                streak.longest_streak = streak.current_streak
-
-        # Update last entry date
-        streak.last_entry_date = entry_date
-
-        # Update total entries and words
-        self._update_entry_stats(user_id, streak)
-
-        try:
-            self.session.add(streak)
-            self.session.commit()
-            self.session.refresh(streak)
-        except SQLAlchemyError as exc:
-            self.session.rollback()
-            log_error(exc)
-            raise
-        else:
-            log_info(f"Writing streak updated for user {user_id}")
-        return streak
-
     def recalculate_writing_streak_stats(self, user_id: uuid.UUID) -> Optional[WritingStreak]:
         """
         Recalculate writing streak statistics for a user.
@@ -108,12 +61,7 @@ class AnalyticsService:
             return None
 
         self._update_entry_stats(user_id, streak)
-
-        streaks = self._recalculate_streak_metadata(user_id)
-        streak.current_streak = streaks['current_streak']
-        streak.longest_streak = streaks['longest_streak']
-        streak.last_entry_date = streaks['last_entry_date']
-        streak.streak_start_date = streaks['streak_start_date']
+        self._apply_streak_metadata(user_id, streak)
 
         try:
             self.session.add(streak)
@@ -124,9 +72,120 @@ class AnalyticsService:
             log_error(exc)
             raise
 
+        invalidate_analytics(user_id)
         log_info(f"Writing streak stats recalculated for user {user_id}")
         return streak
 
+    def apply_entry_change(self, user_id: uuid.UUID, activity: ActivityDelta) -> None:
+        """
+        Apply an entry write to the user's activity rollups and writing streak.
+
+        Totals are adjusted with a single relative UPDATE, and streak
+        metadata is advanced in place when an entry lands on or after the
+        last entry date; only other day changes (deletes, moves, backdated
+        entries) rescan the daily rollup. Nothing reads the entry table,
+        and statements run in the current transaction, so callers commit
+        together with the entry change itself.
+
+        Args:
+            user_id: Owner of the entries
+            activity: Entry, word, mood and tag changes per local date
+        """
+        if not activity:
+            return
+
+        ActivityRollupService(self.session).apply(user_id, activity)
+
+        day_deltas = {
+            day: counters["entry_count"]
+            for day, counters in activity.days.items()
+            if counters["entry_count"]
+        }
+        entry_delta = sum(day_deltas.values())
+        words_delta = sum(counters["word_count"] for counters in activity.days.values())
+        if not day_deltas and not words_delta:
+            return
+
+        streak = self.get_writing_streak(user_id)
+        if not streak:
+            # First tracked write for this user: seed the row from the entries themselves
+            streak = WritingStreak(user_id=user_id)
+            self._update_entry_stats(user_id, streak)
+            self._apply_streak_metadata(user_id, streak)
+            self.session.add(streak)
+            self.session.flush()
+            return
+
+        if day_deltas:
+            added_days = [day for day, delta in day_deltas.items() if delta > 0]
+            only_new_days = len(added_days) == len(day_deltas) == 1 and (
+                streak.last_entry_date is None or added_days[0] >= streak.last_entry_date
+            )
+            if only_new_days:
+                self._advance_streak(streak, added_days[0])
+            else:
+                self._apply_streak_metadata(user_id, streak)
+            self.session.add(streak)
+            self.session.flush()
+
+        if entry_delta or words_delta:
+            table = WritingStreak.__table__
+            new_entries = table.c.total_entries + entry_delta
+            new_words = table.c.total_words + words_delta
+            self.session.execute(
+                sa.update(table)
+                .where(table.c.user_id == user_id)
+                .values(
+                    total_entries=sa.case((new_entries > 0, new_entries), else_=0),
+                    total_words=sa.case((new_words > 0, new_words), else_=0),
+                    average_words_per_entry=sa.case(
+                        (sa.and_(new_entries > 0, new_words > 0), sa.cast(new_words, sa.Float) / new_entries),
+                        else_=0.0,
+                    ),
+                    updated_at=utc_now(),
+                )
+            )
+            self.session.expire(streak, ["total_entries", "total_words", "average_words_per_entry", "updated_at"])
+
+    def get_active_dates(self, user_id: uuid.UUID) -> List[date]:
+        """Get the distinct days with at least one entry, newest first."""
+        statement = (
+            select(DailyActivity.activity_date)
+            .where(DailyActivity.user_id == user_id, DailyActivity.entry_count > 0)
+            .order_by(DailyActivity.activity_date.desc())
+        )
+        return list(self.session.exec(statement))
+
+    @staticmethod
+    def _advance_streak(streak: WritingStreak, entry_date: date) -> None:
+        """Extend streak metadata with an entry on or after the last entry date."""
+        if streak.last_entry_date:
+            days_diff = (entry_date - streak.last_entry_date).days
+            if days_diff == 1:
+                # Consecutive day - increment streak
+                streak.current_streak += 1
+            elif days_diff > 1:
+                # Gap in entries - reset streak
+                streak.current_streak = 1
+                streak.streak_start_date = entry_date
+            # If days_diff == 0, it's the same day, don't change streak
+        else:
+            # First entry
+            streak.current_streak = 1
+            streak.streak_start_date = entry_date
+
+        if streak.current_streak > streak.longest_streak:
+            streak.longest_streak = streak.current_streak
+        streak.last_entry_date = entry_date
+
+    def _apply_streak_metadata(self, user_id: uuid.UUID, streak: WritingStreak) -> None:
+        """Recalculate streak metadata from the per-day entry counts."""
+        streaks = self._recalculate_streak_metadata(user_id)
+        streak.current_streak = streaks['current_streak']
+        streak.longest_streak = streaks['longest_streak']
+        streak.last_entry_date = streaks['last_entry_date']
+        streak.streak_start_date = streaks['streak_start_date']
+
     def _update_entry_stats(self, user_id: uuid.UUID, streak: WritingStreak):
         """Update total entries and words statistics."""
         result = self.session.exec(
@@ -154,22 +213,16 @@ class AnalyticsService:
 
     def _recalculate_streak_metadata(self, user_id: uuid.UUID) -> Dict[str, Any]:
         """
-        Recalculate streak metadata from all user entries.
+        Recalculate streak metadata from the per-day entry counts.
 
         Streaks are based on UNIQUE days that have at least one entry.
         Multiple entries on the same day count as one day for streak purposes.
+        Runs in O(active days) and never loads entry rows.
 
         Returns:
             Dict with current_streak, longest_streak, last_entry_date, streak_start_date
         """
-        entries = self.session.exec(
-            select(Entry).where(Entry.user_id == user_id).order_by(Entry.entry_date.desc())
-        ).all()
-
-        unique_dates = sorted(
-            {e.entry_date for e in entries if e.entry_date is not None},
-            reverse=True
-        )
+        unique_dates = self.get_active_dates(user_id)
 
         if not unique_dates:
             return {
@@ -234,119 +287,55 @@ class AnalyticsService:
         }
 
     def get_writing_patterns(self, user_id: uuid.UUID, days: int = 30) -> Dict[str, Any]:
-        """Get writing patterns for the last N days."""
+        """Get writing patterns for the last N days from the activity rollups."""
         end_date = utc_now().date()
         start_date = end_date - timedelta(days=days)
 
-        # Get entries by day
-        entries_by_day = self.session.exec(
-            select(
-                Entry.entry_date.label('entry_date'),
-                func.count(Entry.id).label('entry_count'),
-                func.sum(Entry.word_count).label('total_words')
-            )
-            .where(
-                Entry.user_id == user_id,
-                Entry.entry_date >= start_date,
-                Entry.entry_date <= end_date
-            )
-            .group_by(Entry.entry_date)
-            .order_by(Entry.entry_date)
-        ).all()
-
-        # Get mood patterns
-        mood_patterns = self.session.exec(
-            select(
-                MoodLog.logged_date.label('mood_date'),
-                func.count(MoodLog.id).label('mood_count')
-            )
-            .where(
-                MoodLog.user_id == user_id,
-                MoodLog.logged_date >= start_date,
-                MoodLog.logged_date <= end_date
-            )
-            .group_by(MoodLog.logged_date)
-            .order_by(MoodLog.logged_date)
-        ).all()
-
-        # Get tag usage
-        tag_usage = self.session.exec(
-            select(
-                Tag.name,
-                func.count(EntryTagLink.entry_id).label('usage_count')
-            )
-            .join(EntryTagLink, Tag.id == EntryTagLink.tag_id)
-            .join(Entry, EntryTagLink.entry_id == Entry.id)
-            .where(
-                Tag.user_id == user_id,
-                Entry.user_id == user_id,
-                Entry.entry_date >= start_date,
-                Entry.entry_date <= end_date
-            )
-            .group_by(Tag.name)
-            .order_by(func.count(EntryTagLink.entry_id).desc())
-            .limit(10)
-        ).all()
+        rollups = ActivityRollupService(self.session)
+        daily_activity = rollups.get_daily_activity(user_id, start_date, end_date)
+        tag_usage = rollups.get_top_tags(user_id, start_date, end_date, limit=10)
 
         return {
             'period_days': days,
             'entries_by_day': [
                 {
-                    'date': str(day.entry_date),
+                    'date': str(day.activity_date),
                     'entry_count': day.entry_count,
-                    'total_words': day.total_words or 0
+                    'total_words': day.word_count
                 }
-                for day in entries_by_day
+                for day in daily_activity
+                if day.entry_count > 0
             ],
             'mood_patterns': [
                 {
-                    'date': str(day.mood_date),
+                    'date': str(day.activity_date),
                     'mood_count': day.mood_count
                 }
-                for day in mood_patterns
+                for day in daily_activity
+                if day.mood_count > 0
             ],
             'top_tags': [
                 {
-                    'tag_name': tag.name,
-                    'usage_count': tag.usage_count
+                    'tag_name': tag_name,
+                    'usage_count': usage_count
                 }
-                for tag in tag_usage
+                for tag_name, usage_count in tag_usage
             ]
         }
 
     def get_productivity_metrics(self, user_id: uuid.UUID) -> Dict[str, Any]:
-        """Get productivity metrics for a user."""
-        now = utc_now()
-        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-        current_month_entries = self.session.exec(
-            select(func.count(Entry.id))
-            .where(
-                Entry.user_id == user_id,
-                Entry.entry_datetime_utc >= month_start
-            )
-        ).first() or 0
-
-        current_month_words = self.session.exec(
-            select(func.coalesce(func.sum(Entry.word_count), 0))
-            .where(
-                Entry.user_id == user_id,
-                Entry.entry_datetime_utc >= month_start
-            )
-        ).first() or 0
+        """Get productivity metrics for a user from the monthly rollup."""
+        today = utc_now().date()
+        month_start = today.replace(day=1)
+        last_month_start = (month_start - timedelta(days=1)).replace(day=1)
 
-        # Get last month stats for comparison
-        last_month_end = month_start - timedelta(seconds=1)
-        last_month_start = last_month_end.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        rollups = ActivityRollupService(self.session)
+        current_month = rollups.get_monthly_activity(user_id, month_start)
+        last_month = rollups.get_monthly_activity(user_id, last_month_start)
 
-        last_month_entries = self.session.exec(
-            select(func.count(Entry.id))
-            .where(
-                Entry.user_id == user_id,
-                Entry.entry_datetime_utc >= last_month_start,
-                Entry.entry_datetime_utc < month_start
-            )
-        ).first() or 0
+        current_month_entries = current_month.entry_count if current_month else 0
+        current_month_words = current_month.word_count if current_month else 0
+        last_month_entries = last_month.entry_count if last_month else 0
 
         # Calculate growth
         entry_growth = 0
@@ -357,8 +346,41 @@ class AnalyticsService:
             'current_month_entries': current_month_entries,
             'current_month_words': current_month_words,
             'entry_growth_percentage': round(entry_growth, 2),
-            'average_daily_entries': round(current_month_entries / now.day, 2) if now.day > 0 else 0,
-            'average_words_per_day': round(current_month_words / now.day, 2) if now.day > 0 else 0
+            'average_daily_entries': round(current_month_entries / today.day, 2) if today.day > 0 else 0,
+            'average_words_per_day': round(current_month_words / today.day, 2) if today.day > 0 else 0
+        }
+
+    def get_activity_heatmap(self, user_id: uuid.UUID, year: int) -> Dict[str, Any]:
+        """
+        Get a calendar year of daily activity for a heatmap.
+
+        Reads the year's daily rollup rows in one primary key range scan;
+        days without activity are omitted.
+        """
+        start_date = date(year, 1, 1)
+        end_date = date(year, 12, 31)
+        daily_activity = ActivityRollupService(self.session).get_daily_activity(user_id, start_date, end_date)
+
+        return {
+            'year': year,
+            'start_date': str(start_date),
+            'end_date': str(end_date),
+            'active_days': sum(1 for day in daily_activity if day.entry_count > 0),
+            'total_entries': sum(day.entry_count for day in daily_activity),
+            'total_words': sum(day.word_count for day in daily_activity),
+            'max_entry_count': max((day.entry_count for day in daily_activity), default=0),
+            'days': [
+                {
+                    'date': str(day.activity_date),
+                    'entry_count': day.entry_count,
+                    'word_count': day.word_count,
+                    'mood_count': day.mood_count,
+                    'positive_mood_count': day.positive_mood_count,
+                    'neutral_mood_count': day.neutral_mood_count,
+                    'negative_mood_count': day.negative_mood_count
+                }
+                for day in daily_activity
+            ]
         }
 
     def get_journal_analytics(self, user_id: uuid.UUID) -> Dict[str, Any]:
@@ -0,0 +1,244 @@
+"""
+Async variants of the database-bound services.
+
+Each variant wraps an ``AsyncSession`` and runs the corresponding sync
+service method through ``AsyncSession.run_sync``. The business logic stays
+in one place while all database I/O goes through the async driver
+(aiosqlite / asyncpg), so endpoints never block the event loop on a query.
+"""
+import functools
+import inspect
+import uuid
+from typing import Any, Callable, Dict, Generic, List, Optional, Type, TypeVar
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.analytics_cache import flush_analytics_invalidations, get_analytics_cache
+from app.core.reference_cache import MOODS_NAMESPACE, PROMPTS_NAMESPACE, get_reference_cache
+from app.core.time_utils import utc_now
+from app.models.deletion_job import DeletionJob
+from app.schemas.prompt import PromptResponse
+from app.schemas.tag import TagSuggestion
+from app.services.analytics_service import AnalyticsService
+from app.services.bulk_delete_service import dispatch_deletion_job
+from app.services.entry_service import EntryService
+from app.services.journal_service import JournalService
+from app.services.mood_service import MoodService
+from app.services.prompt_index import get_prompt_index
+from app.services.prompt_service import PromptService
+from app.services.tag_index import get_tag_index
+from app.services.tag_service import TagService
+
+ServiceT = TypeVar("ServiceT")
+
+
+class AsyncServiceAdapter(Generic[ServiceT]):
+    """
+    Expose the public methods of a sync service as coroutines.
+
+    Subclasses set ``service_class``; calling ``await adapter.method(...)``
+    instantiates the service on the session's underlying sync ``Session``
+    and runs ``method`` inside ``run_sync``.
+    """
+
+    service_class: Type[ServiceT]
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def run(self, func: Callable[[ServiceT], Any]) -> Any:
+        """Run ``func(service)`` with a sync service bound to this session."""
+        try:
+            return await self.session.run_sync(lambda sync_session: func(self.service_class(sync_session)))
+        finally:
+            # Writes invalidate analytics without blocking the loop; make sure
+            # the new version is in place before the response goes out
+            await flush_analytics_invalidations()
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        method = getattr(self.service_class, name)
+        if not callable(method):
+            raise AttributeError(name)
+        if inspect.iscoroutinefunction(method):
+            raise AttributeError(
+                f"{self.service_class.__name__}.{name} is a coroutine and needs an explicit async variant"
+            )
+
+        @functools.wraps(method)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await self.run(lambda service: getattr(service, name)(*args, **kwargs))
+
+        return call
+
+
+class AsyncEntryService(AsyncServiceAdapter[EntryService]):
+    """Async variant of EntryService."""
+
+    service_class = EntryService
+
+    async def delete_entry(self, entry_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+        """Hard delete an entry, then remove its media files from disk."""
+        media_files_to_delete = await self.run(
+            lambda service: service.delete_entry_records(entry_id, user_id)
+        )
+        await EntryService.delete_media_files(media_files_to_delete)
+        return True
+
+
+class AsyncJournalService(AsyncServiceAdapter[JournalService]):
+    """Async variant of JournalService."""
+
+    service_class = JournalService
+
+    async def delete_journal(self, journal_id: uuid.UUID, user_id: uuid.UUID) -> Optional[DeletionJob]:
+        """
+        Hard delete a journal, then remove its media files from disk.
+
+        Journals above the background threshold are queued instead; the
+        deletion job is returned so callers can report its progress.
+        """
+        job = await self.run(lambda service: service.queue_journal_deletion(journal_id, user_id))
+        if job is not None:
+            dispatch_deletion_job(str(job.id))
+            return job
+
+        media_files_to_delete = await self.run(
+            lambda service: service.delete_journal_records(journal_id, user_id)
+        )
+        await EntryService.delete_media_files(media_files_to_delete)
+        return None
+
+
+class AsyncAnalyticsService(AsyncServiceAdapter[AnalyticsService]):
+    """
+    Async variant of AnalyticsService.
+
+    Read-only sections are served from the versioned analytics cache.
+    Sections that depend on the current date are keyed by it as well.
+    """
+
+    service_class = AnalyticsService
+
+    async def _cached(self, user_id: uuid.UUID, section: str, params: Dict[str, Any], func: Callable[[AnalyticsService], Any]) -> Any:
+        return await get_analytics_cache().get_or_compute(user_id, section, params, lambda: self.run(func))
+
+    async def get_writing_analytics(self, user_id: uuid.UUID) -> Dict[str, Any]:
+        """Writing streak analytics for a user."""
+        return await self._cached(
+            user_id, "writing_streak", {}, lambda service: service.get_writing_analytics(user_id)
+        )
+
+    async def get_writing_patterns(self, user_id: uuid.UUID, days: int = 30) -> Dict[str, Any]:
+        """Writing patterns for the last ``days`` days."""
+        params = {"days": days, "today": utc_now().date().isoformat()}
+        return await self._cached(
+            user_id, "writing_patterns", params, lambda service: service.get_writing_patterns(user_id, days)
+        )
+
+    async def get_productivity_metrics(self, user_id: uuid.UUID) -> Dict[str, Any]:
+        """Productivity metrics for the current month."""
+        params = {"today": utc_now().date().isoformat()}
+        return await self._cached(
+            user_id, "productivity", params, lambda service: service.get_productivity_metrics(user_id)
+        )
+
+    async def get_activity_heatmap(self, user_id: uuid.UUID, year: int) -> Dict[str, Any]:
+        """Daily activity for one calendar year."""
+        return await self._cached(
+            user_id, "heatmap", {"year": year}, lambda service: service.get_activity_heatmap(user_id, year)
+        )
+
+    async def get_journal_analytics(self, user_id: uuid.UUID) -> Dict[str, Any]:
+        """Per-journal analytics for a user."""
+        return await self._cached(
+            user_id, "journals", {}, lambda service: service.get_journal_analytics(user_id)
+        )
+
+    async def get_dashboard(self, user_id: uuid.UUID, days: int = 30) -> Dict[str, Any]:
+        """All analytics sections plus summary statistics in one response."""
+
+        async def build() -> Dict[str, Any]:
+            writing_analytics = await self.get_writing_analytics(user_id)
+            writing_patterns = await self.get_writing_patterns(user_id, days)
+            productivity_metrics = await self.get_productivity_metrics(user_id)
+            journal_analytics = await self.get_journal_analytics(user_id)
+            return {
+                "writing_streak": writing_analytics,
+                "writing_patterns": writing_patterns,
+                "productivity": productivity_metrics,
+                "journals": journal_analytics,
+                "summary": {
+                    "total_journals": len(journal_analytics.get("journals", [])),
+                    "total_entries": writing_analytics.get("total_entries", 0),
+                    "current_streak": writing_analytics.get("current_streak", 0),
+                    "longest_streak": writing_analytics.get("longest_streak", 0)
+                }
+            }
+
+        params = {"days": days, "today": utc_now().date().isoformat()}
+        return await get_analytics_cache().get_or_compute(user_id, "dashboard", params, build)
+
+
+class AsyncTagService(AsyncServiceAdapter[TagService]):
+    """Async variant of TagService."""
+
+    service_class = TagService
+
+    async def autocomplete_tags(self, user_id: uuid.UUID, query: str, limit: int = 10) -> List[TagSuggestion]:
+        """Tag suggestions; served from the worker's tag index without a query when it is current."""
+        autocomplete = get_tag_index().get(user_id)
+        if autocomplete is None:
+            autocomplete = await self.run(lambda service: service.get_tag_autocomplete(user_id))
+        return autocomplete.suggest(query, limit)
+
+
+class AsyncMoodService(AsyncServiceAdapter[MoodService]):
+    """Async variant of MoodService."""
+
+    service_class = MoodService
+
+    async def get_moods_payload(self, category: Optional[str] = None) -> bytes:
+        """Serialized mood listing; cache hits skip the database session entirely."""
+        payload, _ = get_reference_cache().get(MOODS_NAMESPACE, MoodService.moods_cache_key(category))
+        if payload is not None:
+            return payload
+        return await self.run(lambda service: service.get_moods_payload(category))
+
+
+class AsyncPromptService(AsyncServiceAdapter[PromptService]):
+    """Async variant of PromptService."""
+
+    service_class = PromptService
+
+    async def get_system_prompts_payload(
+        self,
+        category: Optional[str] = None,
+        difficulty_level: Optional[int] = None,
+        limit: int = 50
+    ) -> bytes:
+        """Serialized system prompt listing; cache hits skip the database session entirely."""
+        cache_key = PromptService.prompts_cache_key(
+            category=category, difficulty_level=difficulty_level, limit=limit
+        )
+        payload, _ = get_reference_cache().get(PROMPTS_NAMESPACE, cache_key)
+        if payload is not None:
+            return payload
+        return await self.run(
+            lambda service: service.get_system_prompts_payload(category, difficulty_level, limit)
+        )
+
+    async def get_random_prompt(
+        self,
+        user_id: Optional[uuid.UUID] = None,
+        category: Optional[str] = None,
+        difficulty_level: Optional[int] = None
+    ) -> Optional[PromptResponse]:
+        """Random prompt; picked from the worker's prompt index without a query when it is current."""
+        normalized_category = PromptService._normalize_category(category) if category else None
+        selection = get_prompt_index().get(user_id)
+        if selection is None:
+            selection = await self.run(lambda service: service.get_prompt_selection(user_id))
+        return selection.random(normalized_category, difficulty_level)
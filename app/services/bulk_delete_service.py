@@ -0,0 +1,370 @@
+"""
+Set-based deletion of journals and entries.
+
+Entries are removed with one DELETE per table (media, tag links, mood logs,
+entries) scoped by a subquery instead of loading and deleting rows one at a
+time. Media file paths are collected with a single joined query and unlinked
+concurrently after the transaction commits. Journals above
+``journal_delete_background_threshold`` entries are deleted in batches by a
+background job so the write lock is released between batches.
+"""
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Callable, Iterable, List, Optional
+
+import sqlalchemy as sa
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session, select
+
+from app.core.analytics_cache import invalidate_analytics
+from app.core.config import settings
+from app.core.logging_config import log_info, log_warning, log_error
+from app.core.time_utils import utc_now
+from app.models.deletion_job import DeletionJob
+from app.models.entry import Entry, EntryMedia
+from app.models.entry_tag_link import EntryTagLink
+from app.models.enums import JobStatus
+from app.models.journal import Journal
+from app.models.mood import MoodLog
+from app.services.activity_rollup_service import ActivityDelta, ActivityRollupService
+
+# Tables holding rows that belong to an entry, deleted before the entries
+ENTRY_CHILD_COLUMNS = (EntryMedia.entry_id, EntryTagLink.entry_id, MoodLog.entry_id)
+
+
+@dataclass(frozen=True)
+class MediaFile:
+    """A deleted media record's id and absolute file path (None if unsafe or missing)."""
+    media_id: uuid.UUID
+    path: Optional[str] = None
+
+
+@dataclass
+class EntryDeletion:
+    """What a set-based entry delete removed."""
+    entry_count: int = 0
+    word_count: int = 0
+    activity: ActivityDelta = field(default_factory=ActivityDelta)
+    media_files: List[MediaFile] = field(default_factory=list)
+
+
+def unlink_media_files(media_files: Iterable[MediaFile]) -> int:
+    """
+    Remove media files, their thumbnails and derivatives using a small thread pool.
+
+    Failures are logged and skipped. Returns the number of files removed.
+    """
+    from app.services.media_derivative_service import MediaDerivativeService
+    from app.services.media_service import MediaService
+
+    media_files = list(media_files)
+    if not media_files:
+        return 0
+
+    media_service = MediaService()
+    derivatives = MediaDerivativeService(media_service.media_root)
+
+    def unlink(media_file: MediaFile) -> bool:
+        try:
+            derivatives.purge(media_file.media_id)
+        except Exception as exc:
+            log_warning(f"Failed to delete derivatives of media {media_file.media_id} after hard delete: {exc}")
+        if not media_file.path:
+            return False
+        try:
+            return media_service.remove_media_file(media_file.path)
+        except Exception as exc:
+            log_warning(f"Failed to delete media file {media_file.path} after hard delete: {exc}")
+            return False
+
+    workers = max(1, min(settings.media_unlink_concurrency, len(media_files)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="media-unlink") as pool:
+        return sum(pool.map(unlink, media_files))
+
+
+def deletion_retry_delay_seconds() -> int:
+    """Wait before retrying a job found RUNNING, long enough for it to go stale."""
+    return settings.journal_delete_stale_seconds + 60
+
+
+def run_deletion_job(job_id: str) -> bool:
+    """
+    Run one journal deletion job in its own database session.
+
+    Entry point for both the Celery task and the in-process fallback thread.
+
+    Returns:
+        True if the job is RUNNING elsewhere and should be tried again later
+    """
+    from app.core.database import engine
+
+    with Session(engine) as session:
+        return BulkDeleteService(session).process_deletion_job(uuid.UUID(job_id))
+
+
+def _run_local_deletion_job(job_id: str) -> None:
+    if run_deletion_job(job_id):
+        dispatch_deletion_job(job_id, deletion_retry_delay_seconds())
+
+
+def dispatch_deletion_job(job_id: str, delay_seconds: float = 0) -> None:
+    """Hand a deletion job to Celery, or to a background thread without a broker."""
+    if settings.celery_broker_url:
+        from app.tasks.deletion_tasks import process_deletion_job
+        process_deletion_job.apply_async(args=[job_id], countdown=delay_seconds or None)
+        return
+
+    if delay_seconds:
+        thread = threading.Timer(delay_seconds, _run_local_deletion_job, args=(job_id,))
+    else:
+        thread = threading.Thread(target=_run_local_deletion_job, args=(job_id,))
+    thread.name = f"journal-delete-{job_id}"
+    thread.daemon = True
+    thread.start()
+
+
+class BulkDeleteService:
+    """Service class for set-based journal and entry deletion."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _media_files(self, criteria) -> List[MediaFile]:
+        """Ids and absolute paths of media attached to the matching entries, in one query."""
+        from app.services.media_service import MediaService
+
+        media_root = MediaService().media_root
+        root_prefix = str(media_root)
+        rows = self.session.exec(
+            select(EntryMedia.id, EntryMedia.file_path)
+            .join(Entry, EntryMedia.entry_id == Entry.id)
+            .where(*criteria)
+        ).all()
+
+        media_files = []
+        for media_id, relative_path in rows:
+            full_path = None
+            if relative_path:
+                # file_path is relative to media_root; never follow it outside
+                resolved = (media_root / relative_path).resolve()
+                if str(resolved).startswith(root_prefix):
+                    full_path = str(resolved)
+            media_files.append(MediaFile(media_id, full_path))
+        return media_files
+
+    def delete_entries(self, user_id: uuid.UUID, *criteria) -> EntryDeletion:
+        """
+        Delete a user's entries matching ``criteria`` with their dependent rows (caller commits).
+
+        Activity rollups and the writing streak are adjusted in the same
+        transaction. Journal counters are left to the caller.
+        """
+        from app.services.analytics_service import AnalyticsService
+
+        criteria = (Entry.user_id == user_id, *criteria)
+        result = EntryDeletion(media_files=self._media_files(criteria))
+        # Everything the entries (and their tags and mood logs) added to the rollups
+        result.activity = ActivityRollupService(self.session).entry_activity(user_id, *criteria)
+        for counters in result.activity.days.values():
+            result.entry_count += counters["entry_count"]
+            result.word_count += counters["word_count"]
+
+        if not result.entry_count:
+            return result
+
+        entry_ids = select(Entry.id).where(*criteria)
+        for column in ENTRY_CHILD_COLUMNS:
+            self.session.execute(sa.delete(column.table).where(column.in_(entry_ids)))
+        self.session.execute(sa.delete(Entry.__table__).where(*criteria))
+
+        AnalyticsService(self.session).apply_entry_change(user_id, result.activity.negated())
+        return result
+
+    def delete_journal(
+        self,
+        journal: Journal,
+        batch_size: int = 0,
+        progress_callback: Optional[Callable[[int], None]] = None,
+    ) -> List[MediaFile]:
+        """
+        Delete a journal and everything in it, returning media files to unlink.
+
+        With ``batch_size`` 0 everything is removed in one transaction.
+        Otherwise entries are deleted ``batch_size`` at a time, committing
+        (and calling ``progress_callback`` with the running count) after
+        each batch, and the journal row goes last.
+        """
+        journal_id = journal.id
+        user_id = journal.user_id
+        media_files: List[MediaFile] = []
+        deleted = 0
+
+        try:
+            if batch_size > 0:
+                while True:
+                    batch_ids = self.session.exec(
+                        select(Entry.id).where(Entry.journal_id == journal_id).limit(batch_size)
+                    ).all()
+                    if not batch_ids:
+                        break
+                    batch = self.delete_entries(user_id, Entry.id.in_(batch_ids))
+                    self.session.commit()
+                    invalidate_analytics(user_id)
+                    media_files.extend(batch.media_files)
+                    deleted += batch.entry_count
+                    if progress_callback:
+                        progress_callback(deleted)
+            else:
+                batch = self.delete_entries(user_id, Entry.journal_id == journal_id)
+                media_files.extend(batch.media_files)
+                deleted = batch.entry_count
+
+            self.session.expunge(journal)
+            self.session.execute(sa.delete(Journal.__table__).where(Journal.id == journal_id))
+            self.session.commit()
+        except SQLAlchemyError as exc:
+            self.session.rollback()
+            log_error(exc)
+            raise
+
+        invalidate_analytics(user_id)
+        log_info(f"Journal hard-deleted for {user_id}: {journal_id} ({deleted} entries, {len(media_files)} media files)")
+        return media_files
+
+    def get_active_deletion_job(self, journal_id: uuid.UUID) -> Optional[DeletionJob]:
+        """Pending or running deletion job for a journal, if any."""
+        return self.session.exec(
+            select(DeletionJob).where(
+                DeletionJob.journal_id == journal_id,
+                DeletionJob.status.in_([JobStatus.PENDING, JobStatus.RUNNING]),
+            )
+        ).first()
+
+    def create_journal_deletion_job(self, journal: Journal) -> DeletionJob:
+        """
+        Queue a journal for background deletion.
+
+        The journal is archived in the same transaction so it drops out of
+        the default journal list while the job runs.
+        """
+        job = self.get_active_deletion_job(journal.id)
+        if job:
+            return job
+
+        job = DeletionJob(
+            user_id=journal.user_id,
+            journal_id=journal.id,
+            total_items=journal.entry_count,
+        )
+        journal.is_archived = True
+        journal.updated_at = utc_now()
+        self.session.add(journal)
+        self.session.add(job)
+        try:
+            self.session.commit()
+            self.session.refresh(job)
+        except SQLAlchemyError as exc:
+            self.session.rollback()
+            log_error(exc)
+            raise
+
+        log_info(f"Journal deletion queued for {journal.user_id}: {journal.id} (job {job.id})")
+        return job
+
+    def claim_deletion_job(self, job_id: uuid.UUID) -> Optional[DeletionJob]:
+        """
+        Atomically move a deletion job from PENDING (or stale RUNNING) to RUNNING.
+
+        Returns:
+            The claimed job, or None if another worker owns it or it has finished
+        """
+        result = self.session.execute(
+            sa.update(DeletionJob)
+            .where(DeletionJob.id == job_id, self._claimable_condition())
+            .values(status=JobStatus.RUNNING, updated_at=utc_now())
+            .execution_options(synchronize_session=False)
+        )
+        self.session.commit()
+        if result.rowcount == 0:
+            return None
+        return self.session.get(DeletionJob, job_id)
+
+    def process_deletion_job(self, job_id: uuid.UUID) -> bool:
+        """
+        Delete a queued journal in batches, recording progress on the job.
+
+        Returns:
+            True if the job is RUNNING but not stale yet, so it may belong to
+            a worker that died and should be tried again once it goes stale
+        """
+        try:
+            job = self.claim_deletion_job(job_id)
+            if job is None:
+                job = self.session.get(DeletionJob, job_id)
+                if job is not None and job.status == JobStatus.RUNNING:
+                    log_info(f"Deletion job {job_id} is running, retrying later", job_id=str(job_id))
+                    return True
+                log_info(f"Deletion job {job_id} is not pending, skipping", job_id=str(job_id))
+                return False
+        except SQLAlchemyError as exc:
+            self.session.rollback()
+            log_error(exc, job_id=str(job_id))
+            return False
+
+        try:
+            journal = self.session.get(Journal, job.journal_id)
+            media_files: List[MediaFile] = []
+            if journal:
+                total = max(job.total_items, journal.entry_count)
+                already_deleted = job.processed_items
+
+                def handle_progress(deleted: int) -> None:
+                    # Batches commit themselves; the job row rides along and
+                    # its updated_at shows the job is still alive
+                    job.update_progress(min(total, already_deleted + deleted), total)
+                    job.updated_at = utc_now()
+                    self.session.add(job)
+
+                media_files = self.delete_journal(
+                    journal,
+                    batch_size=max(1, settings.journal_delete_batch_size),
+                    progress_callback=handle_progress,
+                )
+
+            media_removed = unlink_media_files(media_files)
+            job.mark_completed({
+                "entry_count": job.processed_items,
+                "media_count": media_removed,
+            })
+            self.session.add(job)
+            self.session.commit()
+        except Exception as exc:
+            self.session.rollback()
+            job = self.session.get(DeletionJob, job_id)
+            if job:
+                job.mark_failed(str(exc))
+                self.session.commit()
+            log_error(exc, job_id=str(job_id))
+        return False
+
+    def recover_deletion_jobs(self) -> int:
+        """Re-dispatch deletion jobs left pending, or running but stale, by a previous process."""
+        job_ids = self.session.exec(
+            select(DeletionJob.id).where(self._claimable_condition())
+        ).all()
+        for job_id in job_ids:
+            dispatch_deletion_job(str(job_id))
+        if job_ids:
+            log_info(f"Re-queued {len(job_ids)} interrupted journal deletion jobs")
+        return len(job_ids)
+
+    @staticmethod
+    def _claimable_condition():
+        stale_before = utc_now() - timedelta(seconds=settings.journal_delete_stale_seconds)
+        return sa.or_(
+            DeletionJob.status == JobStatus.PENDING,
+            (DeletionJob.status == JobStatus.RUNNING) & (DeletionJob.updated_at < stale_before),
+        )
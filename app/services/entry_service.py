@@ -1,17 +1,24 @@
 """
 Entry service for managing journal entries.
 """
+import asyncio
+import re
 import uuid
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+import sqlalchemy as sa
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select
 from zoneinfo import ZoneInfo
 
+from app.core.analytics_cache import invalidate_analytics
 from app.core.exceptions import EntryNotFoundError, JournalNotFoundError, ValidationError
 from app.core.logging_config import log_info, log_warning, log_error
+from app.core.pagination import after_cursor, decode_cursor
 from app.core.time_utils import utc_now, local_date_for_user, ensure_utc, to_utc
+from app.services.activity_rollup_service import ActivityDelta
+from app.services.bulk_delete_service import MediaFile, unlink_media_files
 from app.models.entry import Entry, EntryMedia
 from app.models.entry_tag_link import EntryTagLink
 from app.models.journal import Journal
@@ -20,6 +27,14 @@ from app.schemas.entry import EntryCreate, EntryUpdate, EntryMediaCreate
 DEFAULT_ENTRY_PAGE_LIMIT = 50
 MAX_ENTRY_PAGE_LIMIT = 100
 
+# Full-text search (see migration d1f3a9c2b7e4)
+SEARCH_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+MAX_SEARCH_TOKENS = 16
+SEARCH_TITLE_WEIGHT = 10.0
+SEARCH_CONTENT_WEIGHT = 1.0
+# Cache of whether the FTS structures exist, keyed by dialect name
+_search_index_available: Dict[str, bool] = {}
+
 
 class EntryService:
     """Service class for entry operations."""
@@ -55,6 +70,14 @@ class EntryService:
             log_error(exc)
             raise
 
+    def _analytics_service(self):
+        from app.services.analytics_service import AnalyticsService
+        return AnalyticsService(self.session)
+
+    def _journal_service(self):
+        from app.services.journal_service import JournalService
+        return JournalService(self.session)
+
     @staticmethod
     def _derive_entry_date(entry_datetime_utc: datetime, timezone_name: str) -> date:
         """Determine the local date for an entry based on stored timezone."""
@@ -136,6 +159,14 @@ class EntryService:
 
         try:
             self.session.add(entry)
+            self.session.flush()
+            # Journal and streak stats change in the same transaction as the entry
+            self._journal_service().apply_entry_change(
+                entry.journal_id, 1, word_count, added_at=entry_dt_utc
+            )
+            self._analytics_service().apply_entry_change(
+                user_id, ActivityDelta().add_entries(entry.entry_date, 1, word_count)
+            )
             self._commit()
             self.session.refresh(entry)
         except SQLAlchemyError as exc:
@@ -143,26 +174,8 @@ class EntryService:
             log_error(exc)
             raise
 
+        invalidate_analytics(user_id)
         log_info(f"Entry created for user {user_id} in journal {entry.journal_id}: {entry.id}")
-
-        try:
-            from app.services.journal_service import JournalService
-            JournalService(self.session).recalculate_journal_entry_count(entry.journal_id, user_id)
-        except JournalNotFoundError:
-            log_warning(f"Journal missing during entry recount for user {user_id}: {entry.journal_id}")
-        except SQLAlchemyError as exc:
-            log_error(exc)
-        except Exception as exc:
-            log_error(exc)
-
-        # Update writing streak analytics
-        try:
-            from app.services.analytics_service import AnalyticsService
-            analytics_service = AnalyticsService(self.session)
-            analytics_service.update_writing_streak(user_id, entry.entry_date)
-        except Exception as exc:
-            log_error(exc)
-
         return entry
 
     def get_entry_by_id(self, entry_id: uuid.UUID, user_id: uuid.UUID) -> Optional[Entry]:
@@ -179,12 +192,19 @@ class EntryService:
         user_id: uuid.UUID,
         limit: int = DEFAULT_ENTRY_PAGE_LIMIT,
         offset: int = 0,
-        include_pinned: bool = True
+        include_pinned: bool = True,
+        cursor: Optional[str] = None
     ) -> List[Entry]:
-        """Get entries for a specific journal."""
+        """
+        Get entries for a specific journal, pinned first, newest first.
+
+        Pass the ``cursor`` of the previous page (see ``journal_page_key``)
+        to continue after it; ``offset`` is ignored when a cursor is given.
+        """
         from app.services.journal_service import JournalService
         JournalService(self.session)._get_owned_journal(journal_id, user_id)
 
+        sort_columns = (Entry.is_pinned, Entry.entry_datetime_utc, Entry.id)
         statement = select(Entry).where(
             Entry.journal_id == journal_id,
         )
@@ -192,9 +212,13 @@ class EntryService:
         if not include_pinned:
             statement = statement.where(Entry.is_pinned.is_(False))
 
+        if cursor:
+            position = decode_cursor(cursor, (bool, datetime, uuid.UUID))
+            statement = statement.where(after_cursor(sort_columns, position))
+            offset = 0
+
         statement = statement.order_by(
-            Entry.is_pinned.desc(),
-            Entry.entry_datetime_utc.desc()
+            *(column.desc() for column in sort_columns)
         ).offset(offset).limit(limit)
 
         return list(self.session.exec(statement))
@@ -203,18 +227,47 @@ class EntryService:
         self,
         user_id: uuid.UUID,
         limit: int = DEFAULT_ENTRY_PAGE_LIMIT,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> List[Entry]:
-        """Get all entries for a user across all journals."""
+        """
+        Get all entries for a user across all journals, newest first.
+
+        Pass the ``cursor`` of the previous page (see ``timeline_page_key``)
+        to continue after it; ``offset`` is ignored when a cursor is given.
+        """
+        sort_columns = (Entry.entry_datetime_utc, Entry.id)
         statement = select(Entry).where(
             Entry.user_id == user_id,
-        ).order_by(Entry.entry_datetime_utc.desc()).offset(offset).limit(limit)
+        )
+
+        if cursor:
+            position = decode_cursor(cursor, (datetime, uuid.UUID))
+            statement = statement.where(after_cursor(sort_columns, position))
+            offset = 0
+
+        statement = statement.order_by(
+            *(column.desc() for column in sort_columns)
+        ).offset(offset).limit(limit)
 
         return list(self.session.exec(statement))
 
+    @staticmethod
+    def journal_page_key(entry: Entry) -> tuple:
+        """Sort key of an entry in ``get_journal_entries`` pages."""
+        return (entry.is_pinned, entry.entry_datetime_utc, entry.id)
+
+    @staticmethod
+    def timeline_page_key(entry: Entry) -> tuple:
+        """Sort key of an entry in ``get_user_entries`` and tag entry pages."""
+        return (entry.entry_datetime_utc, entry.id)
+
     def update_entry(self, entry_id: uuid.UUID, user_id: uuid.UUID, entry_data: EntryUpdate) -> Entry:
         """Update an entry."""
         entry = self._get_owned_entry(entry_id, user_id)
+        old_entry_date = entry.entry_date
+        old_entry_datetime = ensure_utc(entry.entry_datetime_utc)
+        old_word_count = entry.word_count or 0
 
         # Handle journal change if requested
         old_journal_id = None
@@ -275,8 +328,40 @@ class EntryService:
             entry.is_pinned = entry_data.is_pinned
 
         entry.updated_at = utc_now()
+        new_entry_datetime = ensure_utc(entry.entry_datetime_utc)
+        words_delta = (entry.word_count or 0) - old_word_count
+        date_changed = entry.entry_date != old_entry_date
+        activity = ActivityDelta()
+        if date_changed or words_delta:
+            activity.add_entries(old_entry_date, -1, -old_word_count)
+            activity.add_entries(entry.entry_date, 1, entry.word_count or 0)
         try:
             self.session.add(entry)
+            self.session.flush()
+            journal_service = self._journal_service()
+            if new_journal_id is not None:
+                journal_service.apply_entry_change(
+                    old_journal_id, -1, -old_word_count, removed_at=old_entry_datetime
+                )
+                journal_service.apply_entry_change(
+                    new_journal_id, 1, entry.word_count or 0, added_at=new_entry_datetime
+                )
+            elif words_delta or new_entry_datetime != old_entry_datetime:
+                datetime_changed = new_entry_datetime != old_entry_datetime
+                journal_service.apply_entry_change(
+                    entry.journal_id,
+                    0,
+                    words_delta,
+                    added_at=new_entry_datetime if datetime_changed else None,
+                    removed_at=old_entry_datetime if datetime_changed else None,
+                )
+            if date_changed:
+                # The entry's tags move to its new day
+                for tag_id in self.session.exec(
+                    select(EntryTagLink.tag_id).where(EntryTagLink.entry_id == entry.id)
+                ):
+                    activity.add_tag(old_entry_date, tag_id, -1).add_tag(entry.entry_date, tag_id, 1)
+            self._analytics_service().apply_entry_change(user_id, activity)
             self._commit()
             self.session.refresh(entry)
         except SQLAlchemyError as exc:
@@ -284,95 +369,51 @@ class EntryService:
             log_error(exc)
             raise
 
-        # Recalculate stats for both journals if journal was changed
-        if old_journal_id is not None and new_journal_id is not None:
-            try:
-                from app.services.journal_service import JournalService
-                journal_service = JournalService(self.session)
-                # Recalculate old journal stats
-                journal_service.recalculate_journal_entry_count(old_journal_id, user_id)
-                # Recalculate new journal stats
-                journal_service.recalculate_journal_entry_count(new_journal_id, user_id)
-            except JournalNotFoundError:
-                log_warning(f"Journal missing during entry update recount for user {user_id}")
-            except SQLAlchemyError as exc:
-                log_error(exc)
-            except Exception as exc:
-                log_error(exc)
-
+        invalidate_analytics(user_id)
         log_info(f"Entry updated for user {user_id}: {entry.id}")
         return entry
 
     async def delete_entry(self, entry_id: uuid.UUID, user_id: uuid.UUID) -> bool:
         """Hard delete an entry and its related records."""
-        entry = self._get_owned_entry(entry_id, user_id)
-
-        # Hard delete related EntryMedia records
-        from app.services.media_service import MediaService
-
-        media_statement = select(EntryMedia).where(EntryMedia.entry_id == entry_id)
-        media_records = self.session.exec(media_statement).all()
-
-        media_service = MediaService()
-        media_files_to_delete = []
+        media_files_to_delete = self.delete_entry_records(entry_id, user_id)
+        await self.delete_media_files(media_files_to_delete)
+        return True
 
-        for media in media_records:
-            # Collect file paths for deletion (file_path is relative to media_root)
-            if media.file_path:
-                full_path = (media_service.media_root / media.file_path).resolve()
-                if full_path.exists() and str(full_path).startswith(str(media_service.media_root.resolve())):
-                    media_files_to_delete.append(str(full_path))
+    @staticmethod
+    async def delete_media_files(media_files: List[MediaFile]) -> None:
+        """Delete physical media files and derivatives left behind by a hard delete."""
+        if media_files:
+            await asyncio.to_thread(unlink_media_files, media_files)
 
-            self.session.delete(media)
+    def delete_entry_records(self, entry_id: uuid.UUID, user_id: uuid.UUID) -> List[MediaFile]:
+        """
+        Hard delete an entry's database records.
 
-        # Hard delete related EntryTagLink records
-        tag_link_statement = select(EntryTagLink).where(EntryTagLink.entry_id == entry_id)
-        tag_link_records = self.session.exec(tag_link_statement).all()
-        for tag_link in tag_link_records:
-            self.session.delete(tag_link)
+        Returns the media files (ids and absolute paths) that should be
+        removed from disk once the transaction has been committed.
+        """
+        from app.services.bulk_delete_service import BulkDeleteService
 
-        # Store journal_id for recount before deleting entry
+        entry = self._get_owned_entry(entry_id, user_id)
         journal_id = entry.journal_id
-
-        # Hard delete the entry
-        self.session.delete(entry)
+        removed_at = ensure_utc(entry.entry_datetime_utc)
 
         try:
+            # Media, tag links and mood log go with the entry; stats change in the same transaction
+            self.session.expunge(entry)
+            deleted = BulkDeleteService(self.session).delete_entries(user_id, Entry.id == entry_id)
+            self._journal_service().apply_entry_change(
+                journal_id, -deleted.entry_count, -deleted.word_count, removed_at=removed_at
+            )
             self._commit()
         except SQLAlchemyError as exc:
             self.session.rollback()
             log_error(exc)
             raise
 
-        try:
-            from app.services.journal_service import JournalService
-            JournalService(self.session).recalculate_journal_entry_count(journal_id, user_id)
-        except JournalNotFoundError:
-            log_warning(f"Journal missing during entry delete recount for user {user_id}: {journal_id}")
-        except SQLAlchemyError as exc:
-            log_error(exc)
-        except Exception as exc:
-            log_error(exc)
-
-        # Recalculate writing streak statistics after entry is deleted
-        # This ensures analytics reflect the correct entry counts
-        try:
-            from app.services.analytics_service import AnalyticsService
-            analytics_service = AnalyticsService(self.session)
-            analytics_service.recalculate_writing_streak_stats(user_id)
-        except Exception as exc:
-            # Log error but don't fail the deletion
-            log_warning(f"Failed to update writing streak stats after entry deletion: {exc}")
-
-        # Delete physical media files from disk
-        for file_path in media_files_to_delete:
-            try:
-                await media_service.delete_media_file(file_path)
-            except Exception as exc:
-                log_warning(f"Failed to delete media file {file_path} after entry deletion: {exc}")
-
+        invalidate_analytics(user_id)
         log_info(f"Entry hard-deleted for user {user_id}: {entry_id}")
-        return True
+        return deleted.media_files
 
     def toggle_pin(self, entry_id: uuid.UUID, user_id: uuid.UUID) -> Entry:
         """Toggle pin status of an entry."""
@@ -392,6 +433,29 @@ class EntryService:
         log_info(f"Entry pin toggled for user {user_id}: {entry.id} -> {entry.is_pinned}")
         return entry
 
+    @staticmethod
+    def _tokenize_search_query(query: str) -> List[str]:
+        """Split a free-text query into word tokens safe for FTS syntax."""
+        return SEARCH_TOKEN_PATTERN.findall(query.lower())[:MAX_SEARCH_TOKENS]
+
+    def _has_search_index(self) -> bool:
+        """Check (once per dialect) whether the full-text index has been migrated."""
+        bind = self.session.get_bind()
+        dialect = bind.dialect.name
+        if dialect not in _search_index_available:
+            inspector = sa.inspect(bind)
+            if dialect == "sqlite":
+                available = "entry_fts" in inspector.get_table_names()
+            elif dialect == "postgresql":
+                columns = {col["name"] for col in inspector.get_columns("entry")}
+                available = "search_vector" in columns
+            else:
+                available = False
+            if not available:
+                log_warning("Full-text search index missing; falling back to ILIKE search", dialect=dialect)
+            _search_index_available[dialect] = available
+        return _search_index_available[dialect]
+
     def search_entries(
         self,
         user_id: uuid.UUID,
@@ -400,10 +464,67 @@ class EntryService:
         limit: int = DEFAULT_ENTRY_PAGE_LIMIT,
         offset: int = 0
     ) -> List[Entry]:
-        """Search entries by content."""
+        """
+        Search entries by title and content.
+
+        Uses the FTS5 table on SQLite and the tsvector column on PostgreSQL.
+        Every query token is prefix-matched, title hits rank above content
+        hits, and ties are broken by entry datetime (newest first).
+        """
+        tokens = self._tokenize_search_query(query)
+        if not tokens:
+            return []
+
+        if not self._has_search_index():
+            return self._search_entries_ilike(user_id, query, journal_id, limit, offset)
+
+        statement = select(Entry).where(Entry.user_id == user_id)
+        if journal_id:
+            statement = statement.where(Entry.journal_id == journal_id)
+
+        if self.session.get_bind().dialect.name == "sqlite":
+            entry_fts = sa.table("entry_fts", sa.column("entry_id"))
+            match_expression = " ".join(f'"{token}"*' for token in tokens)
+            # bm25() returns lower-is-better scores; the unindexed entry_id column gets no weight
+            rank = sa.func.bm25(
+                sa.literal_column("entry_fts"), 0.0, SEARCH_TITLE_WEIGHT, SEARCH_CONTENT_WEIGHT
+            )
+            statement = (
+                statement
+                .join(entry_fts, entry_fts.c.entry_id == Entry.id)
+                .where(sa.text("entry_fts MATCH :match_expression").bindparams(match_expression=match_expression))
+                .order_by(rank.asc(), Entry.entry_datetime_utc.desc())
+            )
+        else:
+            search_vector = sa.literal_column("entry.search_vector")
+            ts_query = sa.func.to_tsquery("simple", " & ".join(f"{token}:*" for token in tokens))
+            # Weights are {D, C, B, A}: title is stored as A, content as B
+            weights = sa.literal_column(
+                f"'{{0, 0, {SEARCH_CONTENT_WEIGHT / SEARCH_TITLE_WEIGHT}, 1}}'::float4[]"
+            )
+            rank = sa.func.ts_rank(weights, search_vector, ts_query)
+            statement = (
+                statement
+                .where(search_vector.op("@@")(ts_query))
+                .order_by(rank.desc(), Entry.entry_datetime_utc.desc())
+            )
+
+        statement = statement.offset(offset).limit(limit)
+        return list(self.session.exec(statement))
+
+    def _search_entries_ilike(
+        self,
+        user_id: uuid.UUID,
+        query: str,
+        journal_id: Optional[uuid.UUID],
+        limit: int,
+        offset: int
+    ) -> List[Entry]:
+        """Substring search used when the full-text index is unavailable."""
+        pattern = f"%{query}%"
         statement = select(Entry).where(
             Entry.user_id == user_id,
-            Entry.content.ilike(f"%{query}%")
+            sa.or_(Entry.title.ilike(pattern), Entry.content.ilike(pattern))
         )
 
         if journal_id:
@@ -7,11 +7,11 @@ import json
 import tempfile
 from datetime import timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, TextIO
 from uuid import UUID
 
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.core.config import settings
 from app.core.logging_config import log_info, log_warning
@@ -19,6 +19,7 @@ from app.core.time_utils import utc_now
 from app.models import User, Journal, Entry, EntryMedia, Mood, Tag
 from app.models.export_job import ExportJob
 from app.models.enums import ExportType
+from app.models.mood import MoodLog
 from app.schemas.dto import (
     JournivExportDTO,
     JournalDTO,
@@ -30,6 +31,8 @@ from app.schemas.dto import (
 )
 from app.utils.import_export import ZipHandler, MediaHandler, validate_export_data
 from app.utils.import_export.constants import ExportConfig
+from app.utils.import_export.export_writer import ExportDataWriter
+from app.utils.import_export.validators import validate_entry, validate_journal
 
 
 class ExportService:
@@ -198,14 +201,7 @@ class ExportService:
         Raises:
             IOError: If ZIP creation fails
         """
-        # Create export directory if needed
-        export_dir = Path(settings.export_dir)
-        export_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate filename
-        timestamp = utc_now().strftime("%Y%m%d_%H%M%S")
-        zip_filename = f"journiv_export_{user_id}_{timestamp}.zip"
-        zip_path = export_dir / zip_filename
+        zip_path = self._build_export_zip_path(user_id)
 
         # Collect media files if requested
         media_files: Dict[str, Path] = {}
@@ -251,6 +247,134 @@ class ExportService:
         log_info(f"Created export ZIP: {zip_path} ({file_size} bytes)", user_id=str(user_id), file_size=file_size, media_count=len(media_files))
         return zip_path, file_size, stats
 
+    def stream_export_zip(
+        self,
+        user_id: UUID,
+        export_type: ExportType,
+        journal_ids: Optional[List[str]] = None,
+        include_media: bool = True,
+        total_entries: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> tuple[Path, int, Dict[str, Any]]:
+        """
+        Build the export and write it straight into a ZIP archive.
+
+        Produces the same archive as ``build_export_data`` followed by
+        ``create_export_zip``, but entries are read in pages of
+        ``ExportConfig.ENTRY_PAGE_SIZE`` and serialized into data.json one at
+        a time, so memory use stays flat regardless of export size. Each
+        journal and entry is validated as it is written.
+
+        Entries are read through a dedicated session so the caller can keep
+        committing job progress on ``self.db`` while the result set is open.
+
+        Args:
+            user_id: User ID to export
+            export_type: Type of export
+            journal_ids: Optional list of journal IDs to export
+            include_media: Whether to include media files
+            total_entries: Pre-computed entry count for progress reporting
+            progress_callback: Called with (processed, total) after each entry
+
+        Returns:
+            Tuple of (zip_path, file_size, stats)
+
+        Raises:
+            ValueError: If user not found or a record fails validation
+            IOError: If ZIP creation fails
+        """
+        if total_entries is None:
+            total_entries = self.count_entries(user_id, export_type, journal_ids)
+
+        zip_path = self._build_export_zip_path(user_id)
+        stats = {"journal_count": 0, "entry_count": 0, "media_count": 0}
+        media_files: Dict[str, Path] = {}
+
+        with Session(bind=self.db.get_bind()) as read_db:
+            user = read_db.query(User).filter(User.id == user_id).first()
+            if not user:
+                raise ValueError(f"User not found: {user_id}")
+
+            journals_query = read_db.query(Journal).filter(Journal.user_id == user_id)
+            if export_type == ExportType.JOURNAL and journal_ids:
+                journal_uuids = [UUID(jid) for jid in journal_ids]
+                journals_query = journals_query.filter(Journal.id.in_(journal_uuids))
+
+            def write_data(stream: TextIO) -> Dict[str, Path]:
+                writer = ExportDataWriter(stream)
+
+                header = JournivExportDTO(
+                    export_version=ExportConfig.EXPORT_VERSION,
+                    export_date=utc_now(),
+                    app_version=settings.app_version,
+                    user_email=user.email,
+                    user_name=user.name or user.email.split('@')[0],
+                    user_settings=self._get_user_settings(user),
+                    journals=[],
+                    mood_definitions=self._get_mood_definitions(),
+                )
+                writer.begin(header.model_dump(mode='json', exclude={"journals", "stats"}))
+
+                for journal in journals_query.all():
+                    stats["journal_count"] += 1
+                    context = f"Journal {stats['journal_count']}"
+                    journal_dto = self._convert_journal_to_dto(journal, include_entries=False)
+                    self._raise_on_invalid(validate_journal(journal_dto, context))
+                    writer.begin_journal(journal_dto.model_dump(mode='json', exclude={"entries"}))
+
+                    entries = (
+                        read_db.query(Entry)
+                        .filter(Entry.journal_id == journal.id)
+                        .options(
+                            selectinload(Entry.tags),
+                            selectinload(Entry.mood_log).joinedload(MoodLog.mood),
+                            selectinload(Entry.media),
+                            selectinload(Entry.prompt),
+                        )
+                        .order_by(Entry.entry_datetime_utc)
+                        .yield_per(ExportConfig.ENTRY_PAGE_SIZE)
+                    )
+                    for entry_index, entry in enumerate(entries, start=1):
+                        entry_dto = self._convert_entry_to_dto(entry)
+                        self._raise_on_invalid(validate_entry(entry_dto, f"{context}, Entry {entry_index}"))
+                        writer.write_entry(entry_dto.model_dump(mode='json'))
+
+                        stats["entry_count"] += 1
+                        stats["media_count"] += len(entry_dto.media)
+                        if include_media:
+                            media_files.update(self._collect_entry_media_files(entry_dto, user_id))
+                        if progress_callback and total_entries:
+                            progress_callback(stats["entry_count"], total_entries)
+
+                    writer.end_journal()
+                    # Converted entries are no longer referenced; keep the identity map small
+                    read_db.expunge_all()
+                    self._media_export_map.clear()
+
+                writer.end({"stats": {
+                    **stats,
+                    "export_size_estimate": "calculated_during_zip_creation",
+                }})
+                return media_files
+
+            file_size = self.zip_handler.create_streaming_export_zip(
+                output_path=zip_path,
+                write_data=write_data,
+                data_filename=ExportConfig.DATA_FILENAME,
+            )
+
+        stats["media_count"] = len(media_files)
+        stats["file_size"] = file_size
+
+        log_info(
+            f"Created streaming export ZIP: {zip_path} ({file_size} bytes)",
+            user_id=str(user_id),
+            file_size=file_size,
+            entry_count=stats["entry_count"],
+            media_count=stats["media_count"],
+        )
+        return zip_path, file_size, stats
+
     def cleanup_old_exports(self) -> int:
         """
         Remove export archives older than the configured retention period.
@@ -301,6 +425,7 @@ class ExportService:
         self,
         journal: Journal,
         entry_progress_callback: Optional[Callable[[], None]] = None,
+        include_entries: bool = True,
     ) -> JournalDTO:
         """
         Convert Journal model to JournalDTO.
@@ -309,28 +434,29 @@ class ExportService:
         - journal.title -> title
         - journal.color -> color (enum to string)
         - journal.is_archived, entry_count, last_entry_at included
+
+        With ``include_entries=False`` the DTO carries no entries; the
+        streaming export writes them separately.
         """
-        from sqlalchemy.orm import joinedload
-        from app.models.mood import MoodLog
-
-        # Get all entries for this journal with eager loading
-        entries = (
-            self.db.query(Entry)
-            .filter(Entry.journal_id == journal.id)
-            .options(
-                joinedload(Entry.tags),
-                joinedload(Entry.mood_log).joinedload(MoodLog.mood),
-                joinedload(Entry.media),
+        entry_dtos = []
+        if include_entries:
+            # Get all entries for this journal with eager loading
+            entries = (
+                self.db.query(Entry)
+                .filter(Entry.journal_id == journal.id)
+                .options(
+                    joinedload(Entry.tags),
+                    joinedload(Entry.mood_log).joinedload(MoodLog.mood),
+                    joinedload(Entry.media),
+                )
+                .order_by(Entry.entry_datetime_utc)
+                .all()
             )
-            .order_by(Entry.entry_datetime_utc)
-            .all()
-        )
 
-        entry_dtos = []
-        for entry in entries:
-            entry_dtos.append(self._convert_entry_to_dto(entry))
-            if entry_progress_callback:
-                entry_progress_callback()
+            for entry in entries:
+                entry_dtos.append(self._convert_entry_to_dto(entry))
+                if entry_progress_callback:
+                    entry_progress_callback()
 
         return JournalDTO(
             title=journal.title,  # Journal has 'title' not 'name'
@@ -507,32 +633,54 @@ class ExportService:
         media_files: Dict[str, Path] = {}
         for journal in export_data.journals:
             for entry in journal.entries:
-                for media in entry.media:
-                    # Skip media without file_path
-                    if not media.file_path:
-                        log_warning(
-                            f"Media {media.filename} has no file_path, skipping",
-                            user_id=str(user_id),
-                            media_filename=media.filename
-                        )
-                        continue
-
-                    source_path = self._media_export_map.get(media.file_path)
-                    if not source_path:
-                        source_path = Path(settings.media_root) / media.file_path
-
-                    if source_path.exists():
-                        media_files[media.file_path] = source_path
-                    else:
-                        log_warning(
-                            f"Media file not found: {source_path} (file_path: {media.file_path})",
-                            user_id=str(user_id),
-                            file_path=media.file_path,
-                            source_path=str(source_path)
-                        )
+                media_files.update(self._collect_entry_media_files(entry, user_id))
+
+        return media_files
+
+    def _collect_entry_media_files(self, entry: EntryDTO, user_id: UUID) -> Dict[str, Path]:
+        """Collect the media files referenced by a single exported entry."""
+        media_files: Dict[str, Path] = {}
+        for media in entry.media:
+            # Skip media without file_path
+            if not media.file_path:
+                log_warning(
+                    f"Media {media.filename} has no file_path, skipping",
+                    user_id=str(user_id),
+                    media_filename=media.filename
+                )
+                continue
+
+            source_path = self._media_export_map.get(media.file_path)
+            if not source_path:
+                source_path = Path(settings.media_root) / media.file_path
+
+            if source_path.exists():
+                media_files[media.file_path] = source_path
+            else:
+                log_warning(
+                    f"Media file not found: {source_path} (file_path: {media.file_path})",
+                    user_id=str(user_id),
+                    file_path=media.file_path,
+                    source_path=str(source_path)
+                )
 
         return media_files
 
+    @staticmethod
+    def _build_export_zip_path(user_id: UUID) -> Path:
+        """Return the output path for a new export archive, creating the export directory."""
+        export_dir = Path(settings.export_dir)
+        export_dir.mkdir(parents=True, exist_ok=True)
+
+        timestamp = utc_now().strftime("%Y%m%d_%H%M%S")
+        return export_dir / f"journiv_export_{user_id}_{timestamp}.zip"
+
+    @staticmethod
+    def _raise_on_invalid(validation) -> None:
+        """Abort a streaming export when a record fails validation."""
+        if not validation.valid:
+            raise ValueError(f"Export validation failed: {validation.errors}")
+
     def _build_media_export_path(self, media: EntryMedia) -> str:
         """Build a sanitized relative path for media inside the export ZIP."""
         original_name = media.original_filename or Path(media.file_path).name
@@ -1,45 +1,111 @@
 """
 File processing service.
-Handles background file processing with thread pool management.
+Handles background media processing (metadata extraction and thumbnails).
+
+Pending work is persisted on ``EntryMedia.upload_status``: a record is
+queued as PENDING, claimed as PROCESSING and ends COMPLETED or FAILED. Jobs
+therefore survive restarts - anything still PENDING, or stuck in PROCESSING
+for longer than ``media_processing_stale_seconds``, is picked up again by
+``recover_pending_media``, which runs at startup and every
+``job_recovery_interval_seconds``.
+
+Jobs run on the Celery ``media`` queue when a broker is configured, otherwise
+in a local process pool so CPU-bound thumbnail work does not contend for the
+API process's GIL.
 """
 import atexit
+import multiprocessing
+import threading
 import uuid
-from concurrent.futures import ThreadPoolExecutor
-from typing import Optional
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import timedelta
+from typing import Optional, Union
 
-from sqlmodel import Session
+from sqlalchemy import or_, update
+from sqlmodel import Session, func, select
 
+from app.core.config import settings
 from app.core.exceptions import MediaNotFoundError
 from app.core.logging_config import log_info, log_warning, log_error
+from app.core.metrics import MEDIA_PROCESSING_QUEUE_DEPTH
+from app.core.time_utils import utc_now
+from app.models.entry import Entry, EntryMedia
+from app.models.enums import UploadStatus
 from app.services.media_service import MediaService
 
-# Thread pool for background processing
-_processing_executor: Optional[ThreadPoolExecutor] = None
+# Local process pool, used when no Celery broker is configured
+_processing_executor: Optional[ProcessPoolExecutor] = None
 _is_shutting_down: bool = False
+_executor_lock = threading.Lock()
+_recovery_thread: Optional[threading.Thread] = None
+_recovery_stop = threading.Event()
 
 
-def _get_processing_executor() -> ThreadPoolExecutor:
-    """Get or create the processing thread pool executor."""
+def _init_worker_process() -> None:
+    """Configure logging in a freshly spawned pool process."""
+    from app.core.logging_config import setup_logging
+    setup_logging()
+
+
+def _get_processing_executor() -> ProcessPoolExecutor:
+    """Get or create the processing process pool executor."""
     global _processing_executor
-    if _processing_executor is None and not _is_shutting_down:
-        _processing_executor = ThreadPoolExecutor(
-            max_workers=4,
-            thread_name_prefix="file-processing"
-        )
-        log_info("File processing thread pool initialized")
+    with _executor_lock:
+        if _processing_executor is None and not _is_shutting_down:
+            _processing_executor = ProcessPoolExecutor(
+                max_workers=settings.media_processing_concurrency,
+                # Spawn rather than fork: the parent holds DB connections and threads
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker_process,
+            )
+            log_info(
+                "File processing process pool initialized",
+                max_workers=settings.media_processing_concurrency,
+            )
+
+        if _processing_executor is None:
+            raise RuntimeError("Process pool executor is not available (shutting down)")
+
+        return _processing_executor
 
-    if _processing_executor is None:
-        raise RuntimeError("Thread pool executor is not available (shutting down)")
 
-    return _processing_executor
+def _recovery_loop(interval_seconds: int) -> None:
+    from app.core.database import engine
+
+    while not _recovery_stop.wait(interval_seconds):
+        try:
+            with Session(engine) as session:
+                FileProcessingService(session).recover_pending_media()
+        except Exception as e:
+            log_error(e, context="media_job_recovery")
+
+
+def start_recovery_sweep() -> None:
+    """
+    Re-queue pending and stale media every ``job_recovery_interval_seconds``.
+
+    Used with the local process pool; with a broker, Celery beat runs the
+    sweep instead.
+    """
+    global _recovery_thread
+    interval_seconds = settings.job_recovery_interval_seconds
+    with _executor_lock:
+        if interval_seconds <= 0 or _recovery_thread is not None:
+            return
+        _recovery_stop.clear()
+        _recovery_thread = threading.Thread(
+            target=_recovery_loop, args=(interval_seconds,), name="media-recovery", daemon=True
+        )
+        _recovery_thread.start()
 
 
 def _shutdown_executor():
-    """Shutdown the thread pool executor on application exit."""
+    """Shutdown the process pool executor on application exit."""
     global _processing_executor, _is_shutting_down
+    _recovery_stop.set()
     if _processing_executor is not None and not _is_shutting_down:
         _is_shutting_down = True
-        log_info("Shutting down file processing thread pool")
+        log_info("Shutting down file processing process pool")
         _processing_executor.shutdown(wait=True)
         _processing_executor = None
         _is_shutting_down = False
@@ -49,115 +115,228 @@ def _shutdown_executor():
 atexit.register(_shutdown_executor)
 
 
+def run_media_job(media_id: str) -> bool:
+    """
+    Process one queued media record in its own database session.
+
+    Entry point for both the Celery task and the local process pool.
+
+    Returns:
+        True if the job failed and was queued for another attempt
+    """
+    from app.core.database import engine
+
+    with Session(engine) as session:
+        return FileProcessingService(session).process_media(media_id)
+
+
+def _dispatch(media_id: str, delay_seconds: float = 0) -> None:
+    """Hand a queued media record to the Celery media queue or the local pool."""
+    if settings.celery_broker_url:
+        from app.tasks.media_tasks import process_media_job
+        process_media_job.apply_async(args=[media_id], countdown=delay_seconds or None)
+        return
+
+    if delay_seconds:
+        timer = threading.Timer(delay_seconds, _submit_local, args=(media_id,))
+        timer.daemon = True
+        timer.start()
+    else:
+        _submit_local(media_id)
+
+
+def _submit_local(media_id: str) -> None:
+    MEDIA_PROCESSING_QUEUE_DEPTH.inc()
+    try:
+        future = _get_processing_executor().submit(run_media_job, media_id)
+    except Exception:
+        MEDIA_PROCESSING_QUEUE_DEPTH.dec()
+        raise
+    future.add_done_callback(lambda done: _on_local_job_done(media_id, done))
+
+
+def _on_local_job_done(media_id: str, future: Future) -> None:
+    MEDIA_PROCESSING_QUEUE_DEPTH.dec()
+    try:
+        retry = future.result()
+    except Exception as e:
+        # The record stays PROCESSING and is recovered once it goes stale
+        log_error(e, media_id=media_id, context="media_processing_job")
+        return
+
+    if retry and not _is_shutting_down:
+        _dispatch(media_id, settings.media_processing_retry_delay_seconds)
+
+
 class FileProcessingService:
-    """Service for managing background file processing tasks."""
+    """Service for queueing and running background media processing jobs."""
 
     def __init__(self, session: Session):
         self.session = session
         self.media_service = MediaService(session)
 
-    def process_uploaded_file_async(self, media_id: str, file_path: str, user_id: str) -> None:
+    def enqueue(self, media_id: Union[str, uuid.UUID]) -> None:
         """
-        Submit file processing to background thread pool.
+        Queue processing for a committed PENDING media record.
 
-        Args:
-            media_id: UUID of the media record
-            file_path: Absolute or relative path to the uploaded file
-            user_id: ID of the user who uploaded the file
+        Only the ID is handed off; the job reads everything else from the
+        database, so a lost hand-off is repaired by ``recover_pending_media``.
         """
+        media_id = str(media_id)
         try:
-            # Validate inputs
-            if not media_id or not file_path or not user_id:
-                raise ValueError("media_id, file_path, and user_id are required")
-
-            # Validate UUID format
-            try:
-                uuid.UUID(media_id)
-                uuid.UUID(user_id)
-            except ValueError as e:
-                raise ValueError(f"Invalid UUID format: {e}")
-
-            # Validate file path
-            if not isinstance(file_path, str) or not file_path.strip():
-                raise ValueError("file_path must be a non-empty string")
-
-            # Submit to thread pool
-            executor = _get_processing_executor()
-            if executor is None:
-                raise RuntimeError("Thread pool executor is not available (shutting down)")
-
-            future = executor.submit(
-                self._process_uploaded_file_sync,
-                media_id,
-                file_path,
-                user_id
-            )
+            uuid.UUID(media_id)
+        except ValueError as e:
+            raise ValueError(f"Invalid UUID format: {e}")
 
-            log_info(f"File processing task submitted for media {media_id}")
+        _dispatch(media_id)
+        log_info(f"File processing task queued for media {media_id}", media_id=media_id)
 
-        except Exception as e:
-            log_error(e)
-            raise
+    def recover_pending_media(self) -> int:
+        """
+        Re-queue media left PENDING or stuck in PROCESSING (e.g. after a crash).
 
-    def _process_uploaded_file_sync(self, media_id: str, file_path: str, user_id: str) -> None:
+        Media stuck in PROCESSING after its last attempt (the file kept
+        killing its worker) is marked FAILED instead.
+
+        Returns:
+            Number of media records queued
         """
-        Synchronous file processing worker.
+        self.fail_exhausted_media()
+        media_ids = self.session.exec(
+            select(EntryMedia.id).where(self._claimable_condition())
+        ).all()
+
+        for media_id in media_ids:
+            _dispatch(str(media_id))
 
-        This method runs in a background thread and handles the actual processing.
-        Each thread creates its own database session to avoid conflicts.
+        if media_ids:
+            log_info(f"Re-queued {len(media_ids)} pending media processing jobs", count=len(media_ids))
+        return len(media_ids)
+
+    def claim(self, media_id: str) -> Optional[EntryMedia]:
         """
-        from app.core.database import engine
+        Atomically move a media record from PENDING (or stale PROCESSING) to PROCESSING.
 
-        # Create a new session for this background thread
-        thread_session = Session(engine)
-        try:
-            log_info(f"Starting file processing for media {media_id}")
+        Returns:
+            The claimed media record, or None if another worker owns it or it
+            is no longer pending
+        """
+        media_uuid = uuid.UUID(media_id)
+        result = self.session.execute(
+            update(EntryMedia)
+            .where(EntryMedia.id == media_uuid, self._claimable_condition())
+            .values(
+                upload_status=UploadStatus.PROCESSING,
+                processing_attempts=EntryMedia.processing_attempts + 1,
+                updated_at=utc_now(),
+            )
+        )
+        self.session.commit()
+        if result.rowcount == 0:
+            return None
+        return self.session.get(EntryMedia, media_uuid)
 
-            # Create a new media service instance with thread-local session
-            media_service = MediaService(thread_session)
-            media_service.process_uploaded_file(media_id, file_path, user_id)
+    def fail_exhausted_media(self) -> int:
+        """
+        Mark stale PROCESSING media that used up its attempts as FAILED.
 
-            log_info(f"File processing completed successfully for media {media_id}")
+        Returns:
+            Number of media records marked FAILED
+        """
+        result = self.session.execute(
+            update(EntryMedia)
+            .where(
+                self._stale_processing_condition(),
+                EntryMedia.processing_attempts >= settings.media_processing_max_attempts,
+            )
+            .values(
+                upload_status=UploadStatus.FAILED,
+                processing_error="Processing did not finish",
+                updated_at=utc_now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.session.commit()
+        if result.rowcount:
+            log_warning(
+                f"Marked {result.rowcount} media records FAILED after {settings.media_processing_max_attempts} unfinished attempts",
+                count=result.rowcount,
+            )
+        return result.rowcount
 
-        except MediaNotFoundError as e:
-            log_warning(f"Media not found during processing: {e}")
-        except Exception as e:
-            log_error(e)
-            # The media service already handles marking as failed
-        finally:
-            # Always close the thread-local session
-            thread_session.close()
+    def process_media(self, media_id: str) -> bool:
+        """
+        Claim and process a queued media record.
 
-    def get_processing_status(self) -> dict:
-        """Get the status of the processing thread pool.
+        Failed attempts are put back to PENDING until
+        ``media_processing_max_attempts`` is reached.
 
-        Note: Uses public ThreadPoolExecutor interface where possible.
-        Some attributes may not be available in future Python versions.
+        Returns:
+            True if the job failed and should be retried
         """
+        media = self.claim(media_id)
+        if media is None:
+            log_info(f"Media {media_id} is not pending, skipping processing", media_id=media_id)
+            return False
+
+        user_id = self.session.exec(
+            select(Entry.user_id).where(Entry.id == media.entry_id)
+        ).first()
+        if user_id is None:
+            log_warning(f"Entry not found for media {media_id}, skipping processing", media_id=media_id)
+            return False
+
+        log_info(f"Starting file processing for media {media_id}", media_id=media_id, attempt=media.processing_attempts)
         try:
-            executor = _get_processing_executor()
+            # MediaService records FAILED itself for processing errors
+            self.media_service.process_uploaded_file(media_id, media.file_path, str(user_id))
+        except MediaNotFoundError as e:
+            log_warning(f"Media not found during processing: {e}", media_id=media_id)
+            return False
+
+        self.session.expire_all()
+        media = self.session.get(EntryMedia, uuid.UUID(media_id))
+        if media is None or media.upload_status != UploadStatus.FAILED:
+            log_info(f"File processing completed for media {media_id}", media_id=media_id)
+            return False
+
+        if media.processing_attempts >= settings.media_processing_max_attempts:
+            log_warning(
+                f"File processing failed for media {media_id} after {media.processing_attempts} attempts",
+                media_id=media_id,
+                processing_error=media.processing_error,
+            )
+            return False
+
+        media.upload_status = UploadStatus.PENDING
+        media.updated_at = utc_now()
+        self.session.add(media)
+        self.session.commit()
+        log_warning(
+            f"File processing failed for media {media_id}, retrying",
+            media_id=media_id,
+            attempt=media.processing_attempts,
+            processing_error=media.processing_error,
+        )
+        return True
 
-            # Use public interface where possible
-            # _threads and _work_queue are implementation details
-            status = {
+    def get_processing_status(self) -> dict:
+        """Get queue depth and worker configuration for media processing."""
+        try:
+            counts = dict(
+                self.session.exec(
+                    select(EntryMedia.upload_status, func.count(EntryMedia.id))
+                    .where(EntryMedia.upload_status.in_([UploadStatus.PENDING, UploadStatus.PROCESSING]))
+                    .group_by(EntryMedia.upload_status)
+                ).all()
+            )
+            return {
+                "backend": "celery" if settings.celery_broker_url else "process_pool",
+                "max_workers": settings.media_processing_concurrency,
+                "pending_tasks": counts.get(UploadStatus.PENDING, 0),
+                "processing_tasks": counts.get(UploadStatus.PROCESSING, 0),
                 "is_shutting_down": _is_shutting_down,
             }
-
-            # Try to get internal details, but don't fail if unavailable
-            try:
-                status["max_workers"] = getattr(executor, "_max_workers", None)
-                status["active_threads"] = len(getattr(executor, "_threads", []))
-                work_queue = getattr(executor, "_work_queue", None)
-                status["pending_tasks"] = work_queue.qsize() if work_queue and hasattr(work_queue, 'qsize') else 0
-                status["shutdown"] = getattr(executor, "_shutdown", False)
-            except (AttributeError, TypeError):
-                # Fallback if private attributes are not available
-                status["max_workers"] = "unavailable"
-                status["active_threads"] = "unavailable"
-                status["pending_tasks"] = "unavailable"
-                status["shutdown"] = "unavailable"
-
-            return status
         except Exception as e:
             log_warning(f"Failed to get processing status: {e}")
             return {
@@ -166,9 +345,23 @@ class FileProcessingService:
             }
 
     def shutdown_processing(self, wait: bool = True) -> None:
-        """Shutdown the processing thread pool."""
+        """Shutdown the local processing pool."""
         _shutdown_executor()
         if wait:
-            log_info("File processing thread pool shutdown completed")
+            log_info("File processing process pool shutdown completed")
         else:
-            log_info("File processing thread pool shutdown initiated")
+            log_info("File processing process pool shutdown initiated")
+
+    @staticmethod
+    def _stale_processing_condition():
+        stale_before = utc_now() - timedelta(seconds=settings.media_processing_stale_seconds)
+        return (EntryMedia.upload_status == UploadStatus.PROCESSING) & (EntryMedia.updated_at < stale_before)
+
+    @classmethod
+    def _claimable_condition(cls):
+        # A stale run that never returned (e.g. the worker was killed) still used an attempt
+        return or_(
+            EntryMedia.upload_status == UploadStatus.PENDING,
+            cls._stale_processing_condition()
+            & (EntryMedia.processing_attempts < settings.media_processing_max_attempts),
+        )
@@ -4,17 +4,21 @@ Import service for importing data into Journiv.
 Handles the business logic for importing data from various sources.
 """
 import shutil
+import time
+import zipfile
+import zlib
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable
+from typing import BinaryIO, Dict, Any, List, Optional, Callable, Iterable, Iterator, Tuple, Union
 from uuid import UUID, uuid4
 
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.core.analytics_cache import invalidate_analytics
 from app.core.config import settings
 from app.core.logging_config import log_info, log_warning, log_error
-from app.models import User, Journal, Entry, EntryMedia, Mood, MoodLog, Tag
+from app.core.reference_cache import MOODS_NAMESPACE, invalidate_reference_data
+from app.models import User, Journal, Entry, EntryMedia, EntryTagLink, Mood, MoodLog, Tag
 from app.models.import_job import ImportJob
 from app.models.enums import ImportSourceType, JournalColor, MediaType, UploadStatus
 from app.schemas.dto import (
@@ -26,26 +30,39 @@ from app.schemas.dto import (
     ImportResultSummary,
 )
 from app.utils.import_export import (
+    ExportDataReader,
     ZipHandler,
+    ZipMediaReader,
     MediaHandler,
     IDMapper,
+    ensure_utc,
     normalize_datetime,
 )
+from app.utils.import_export.bulk_inserter import BulkInserter
 from app.utils.import_export.constants import ExportConfig
 from app.core.time_utils import local_date_for_user
+from app.services.activity_rollup_service import ActivityRollupService
+from app.services.file_processing_service import FileProcessingService
+from app.services.tag_index import invalidate_tag_index
+
+# Where imported media is read from: an extracted media/ directory, or the
+# media/ members of the archive itself
+MediaSource = Union[Path, ZipMediaReader]
 
 
 class ImportService:
     """Service for importing data."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, batch_size: Optional[int] = None):
         """
         Initialize import service.
 
         Args:
             db: Database session
+            batch_size: Rows per bulk INSERT (defaults to settings.import_batch_size)
         """
         self.db = db
+        self.batch_size = batch_size or settings.import_batch_size
         self.zip_handler = ZipHandler()
         self.media_handler = MediaHandler()
 
@@ -126,6 +143,39 @@ class ImportService:
 
         return data, extract_result.get("media_dir")
 
+    def open_import_data(
+        self, file_path: Path
+    ) -> tuple[ExportDataReader, ZipMediaReader]:
+        """
+        Open an import ZIP for streaming import.
+
+        Only data.json is extracted, and it is parsed incrementally by the
+        returned reader. Media files are streamed straight out of the archive
+        by ``_import_media``, so nothing else is written to the temp
+        directory. The caller must close the returned ``ZipMediaReader``.
+
+        Args:
+            file_path: Path to ZIP file
+
+        Returns:
+            Tuple of (reader, media_source)
+
+        Raises:
+            ValueError: If ZIP is invalid
+            IOError: If extraction fails
+        """
+        temp_dir = Path(settings.import_temp_dir)
+        temp_dir.mkdir(parents=True, exist_ok=True)
+
+        open_result = self.zip_handler.open_import_zip(
+            zip_path=file_path,
+            extract_to=temp_dir / file_path.stem,
+            max_size_mb=settings.import_export_max_file_size_mb,
+            data_filename=ExportConfig.DATA_FILENAME,
+        )
+
+        return ExportDataReader(open_result["data_file"]), open_result["media"]
+
     def import_journiv_data(
         self,
         user_id: UUID,
@@ -155,14 +205,131 @@ class ImportService:
         except Exception as e:
             raise ValueError(f"Invalid Journiv export format: {e}") from e
 
+        if total_entries is None:
+            total_entries = self.count_entries_in_data(data)
+
+        journals = (
+            (journal_dto, journal_dto.entries, len(journal_dto.entries))
+            for journal_dto in export_dto.journals
+        )
+        return self._import_journiv_export(
+            user_id=user_id,
+            export_dto=export_dto,
+            journals=journals,
+            media_dir=media_dir,
+            total_entries=total_entries,
+            progress_callback=progress_callback,
+        )
+
+    def import_journiv_stream(
+        self,
+        user_id: UUID,
+        reader: ExportDataReader,
+        media_dir: Optional[MediaSource] = None,
+        *,
+        total_entries: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> ImportResultSummary:
+        """
+        Import Journiv export data read incrementally from the data file.
+
+        Journals are created from the fields collected by ``reader.scan()``
+        and their entries are parsed and imported one at a time, so memory
+        is bounded by the largest single entry rather than the archive.
+
+        Args:
+            user_id: User ID to import for
+            reader: Reader over the extracted data file
+            media_dir: Media directory or ``ZipMediaReader`` over the archive
+
+        Returns:
+            ImportResultSummary with statistics
+
+        Raises:
+            ValueError: If data is invalid
+        """
+        if not reader.scanned:
+            reader.scan()
+        try:
+            export_dto = JournivExportDTO(**{**reader.metadata, "journals": []})
+        except Exception as e:
+            raise ValueError(f"Invalid Journiv export format: {e}") from e
+
+        if total_entries is None:
+            total_entries = reader.total_entries
+
+        return self._import_journiv_export(
+            user_id=user_id,
+            export_dto=export_dto,
+            journals=self._iter_stream_journals(reader),
+            media_dir=media_dir,
+            total_entries=total_entries,
+            progress_callback=progress_callback,
+        )
+
+    @staticmethod
+    def _iter_stream_journals(
+        reader: ExportDataReader,
+    ) -> Iterator[Tuple[JournalDTO, Iterator[EntryDTO], int]]:
+        """Yield (journal_dto, entry_dtos, entry_count) for each journal in the reader."""
+        for journal_index, (journal_fields, entries) in enumerate(reader.iter_journals()):
+            journal_dto = JournalDTO(**journal_fields)
+            entry_dtos = (EntryDTO(**entry) for entry in entries)
+            yield journal_dto, entry_dtos, reader.entry_counts[journal_index]
+
+    def _import_journiv_export(
+        self,
+        user_id: UUID,
+        export_dto: JournivExportDTO,
+        journals: Iterable[Tuple[JournalDTO, Iterable[EntryDTO], int]],
+        media_dir: Optional[MediaSource],
+        total_entries: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> ImportResultSummary:
+        """
+        Import mood definitions, then each journal with its entries.
+
+        ``journals`` yields ``(journal_dto, entries, entry_count)``; entries
+        may be a lazy iterator so only one entry needs to be in memory.
+
+        Entries, tags, mood logs, media and tag links are written through a
+        ``BulkInserter``: primary keys are pre-generated via ``IDMapper`` and
+        foreign keys are resolved from the in-memory lookups below, so no
+        per-row flushes or queries are needed.
+        """
         # Initialize tracking
         summary = ImportResultSummary()
         id_mapper = IDMapper()
+        started_at = time.perf_counter()
+        rows_committed = 0
 
-        # Track existing items for deduplication
+        # Track existing items for deduplication and foreign key resolution
         existing_media_checksums = self._get_existing_media_checksums(user_id)
-        existing_tag_names = self._get_existing_tag_names(user_id)
-        existing_mood_names = self._get_existing_mood_names(user_id)
+        existing_tag_ids = self._get_existing_tag_ids(user_id)
+        existing_mood_ids = self._get_existing_mood_ids(user_id)
+        # checksum -> media record imported in this run (not yet queryable)
+        imported_media: Dict[str, EntryMedia] = {}
+        # Media needing thumbnails/metadata, queued once its journal commits
+        pending_media_ids: List[UUID] = []
+        processing_service = FileProcessingService(self.db)
+
+        bulk = BulkInserter(
+            self.db,
+            [Tag.__table__, Entry.__table__, MoodLog.__table__, EntryMedia.__table__, EntryTagLink.__table__],
+            batch_size=self.batch_size,
+        )
+
+        def restore_lookups():
+            # Rows created by a rolled-back journal must not be referenced again
+            bulk.discard()
+            imported_media.clear()
+            pending_media_ids.clear()
+            existing_media_checksums.clear()
+            existing_media_checksums.update(self._get_existing_media_checksums(user_id))
+            existing_tag_ids.clear()
+            existing_tag_ids.update(self._get_existing_tag_ids(user_id))
+            existing_mood_ids.clear()
+            existing_mood_ids.update(self._get_existing_mood_ids(user_id))
 
         if export_dto.export_version != ExportConfig.EXPORT_VERSION:
             raise ValueError(
@@ -170,9 +337,6 @@ class ImportService:
                 f"Expected {ExportConfig.EXPORT_VERSION}."
             )
 
-        if total_entries is None:
-            total_entries = self.count_entries_in_data(data)
-
         entries_processed = 0
 
         def handle_entry_progress():
@@ -192,7 +356,7 @@ class ImportService:
             if export_dto.mood_definitions:
                 for mood_dto in export_dto.mood_definitions:
                     mood_name_lower = mood_dto.name.lower()
-                    if mood_name_lower not in existing_mood_names:
+                    if mood_name_lower not in existing_mood_ids:
                         # Create new mood definition
                         mood = Mood(
                             name=mood_dto.name,  # Will be normalized to lowercase by validator
@@ -201,29 +365,43 @@ class ImportService:
                         )
                         self.db.add(mood)
                         summary.moods_created += 1
-                        existing_mood_names.add(mood_name_lower)
+                        existing_mood_ids[mood_name_lower] = mood.id
                     else:
                         summary.moods_reused += 1
 
-            # Flush to get mood IDs
-            self.db.flush()
+            # Commit new mood definitions so a failed journal cannot roll them back
+            if summary.moods_created:
+                self.db.commit()
+                invalidate_reference_data(MOODS_NAMESPACE)
+            rows_committed += summary.moods_created
 
             # Import journals and entries with per-journal commits
-            for journal_dto in export_dto.journals:
+            for journal_dto, entry_dtos, entry_count in journals:
+                rows_before_journal = bulk.rows_written
                 try:
                     result = self._import_journal(
                         user_id=user_id,
                         journal_dto=journal_dto,
+                        entries=entry_dtos,
                         media_dir=media_dir,
                         id_mapper=id_mapper,
+                        bulk=bulk,
                         existing_media_checksums=existing_media_checksums,
-                        existing_tag_names=existing_tag_names,
-                        existing_mood_names=existing_mood_names,
+                        imported_media=imported_media,
+                        pending_media_ids=pending_media_ids,
+                        existing_tag_ids=existing_tag_ids,
+                        existing_mood_ids=existing_mood_ids,
                         summary=summary,
                         entry_progress_callback=handle_entry_progress,
                         record_mapping=record_mapping,
                     )
                     self.db.commit()
+                    invalidate_analytics(user_id)
+                    invalidate_tag_index(user_id)
+                    for media_id in pending_media_ids:
+                        processing_service.enqueue(media_id)
+                    pending_media_ids.clear()
+                    rows_committed += bulk.rows_written - rows_before_journal + 1
 
                     # Update summary
                     summary.journals_created += 1
@@ -237,33 +415,43 @@ class ImportService:
                     # Narrow exception handling: catch expected DB/validation errors
                     # but let unexpected errors propagate to outer handler
                     self.db.rollback()
+                    restore_lookups()
                     warning_msg = (
                         f"Failed to import journal '{journal_dto.title}': {journal_error}"
                     )
                     log_error(journal_error, user_id=str(user_id), journal_title=journal_dto.title)
                     summary.warnings.append(warning_msg)
-                    summary.entries_skipped += len(journal_dto.entries)
+                    summary.entries_skipped += entry_count
                 except Exception as journal_error:
                     # Defensive catch-all for truly unexpected errors
                     # This allows continuing with other journals even on programming errors
                     self.db.rollback()
+                    restore_lookups()
                     warning_msg = (
                         f"Failed to import journal '{journal_dto.title}': {journal_error}"
                     )
                     log_error(journal_error, user_id=str(user_id), journal_title=journal_dto.title, context="unexpected_journal_import_error")
                     summary.warnings.append(warning_msg)
-                    summary.entries_skipped += len(journal_dto.entries)
+                    summary.entries_skipped += entry_count
+
+            elapsed = time.perf_counter() - started_at
+            summary.rows_inserted = rows_committed
+            summary.duration_seconds = round(elapsed, 3)
+            summary.rows_per_second = round(rows_committed / elapsed, 1) if elapsed > 0 else 0.0
 
             log_info(
                 f"Import completed: {summary.journals_created} journals, "
                 f"{summary.entries_created} entries, "
                 f"{summary.mood_logs_created} mood logs, "
-                f"{summary.media_files_imported} media files",
+                f"{summary.media_files_imported} media files "
+                f"({summary.rows_per_second} rows/sec)",
                 user_id=str(user_id),
                 journals_created=summary.journals_created,
                 entries_created=summary.entries_created,
                 mood_logs_created=summary.mood_logs_created,
-                media_files_imported=summary.media_files_imported
+                media_files_imported=summary.media_files_imported,
+                rows_inserted=summary.rows_inserted,
+                rows_per_second=summary.rows_per_second,
             )
 
             if summary.warnings:
@@ -281,18 +469,27 @@ class ImportService:
         self,
         user_id: UUID,
         journal_dto: JournalDTO,
-        media_dir: Optional[Path],
+        media_dir: Optional[MediaSource],
         id_mapper: IDMapper,
+        bulk: BulkInserter,
         existing_media_checksums: set,
-        existing_tag_names: set,
-        existing_mood_names: set,
+        imported_media: Dict[str, EntryMedia],
+        pending_media_ids: List[UUID],
+        existing_tag_ids: Dict[str, UUID],
+        existing_mood_ids: Dict[str, UUID],
         summary: ImportResultSummary,
         entry_progress_callback: Optional[Callable[[], None]] = None,
         record_mapping: Optional[Callable[[str, Optional[str], UUID], None]] = None,
+        entries: Optional[Iterable[EntryDTO]] = None,
     ) -> Dict[str, int]:
         """
         Import a single journal with its entries.
 
+        Entries are taken from ``entries`` when given (e.g. a lazy iterator
+        from the streaming reader), otherwise from ``journal_dto.entries``.
+        Entry rows are buffered in ``bulk`` and flushed before returning, so
+        the caller can commit the journal as a unit.
+
         Returns:
             Dictionary with counts of imported items
         """
@@ -342,16 +539,23 @@ class ImportService:
             "tags_reused": 0,
         }
 
+        total_words = 0
+        last_created = None
+
         # Import entries
-        for entry_dto in journal_dto.entries:
+        for entry_dto in (journal_dto.entries if entries is None else entries):
             entry_result = self._import_entry(
                 journal_id=journal.id,
                 user_id=user_id,
                 entry_dto=entry_dto,
                 media_dir=media_dir,
+                id_mapper=id_mapper,
+                bulk=bulk,
                 existing_media_checksums=existing_media_checksums,
-                existing_tag_names=existing_tag_names,
-                existing_mood_names=existing_mood_names,
+                imported_media=imported_media,
+                pending_media_ids=pending_media_ids,
+                existing_tag_ids=existing_tag_ids,
+                existing_mood_ids=existing_mood_ids,
                 summary=summary,
                 record_mapping=record_mapping,
             )
@@ -363,26 +567,25 @@ class ImportService:
             result["tags_created"] += entry_result["tags_created"]
             result["tags_reused"] += entry_result["tags_reused"]
 
+            # Journal stats are accumulated here instead of being
+            # re-queried once the rows are written
+            total_words += entry_result["word_count"]
+            entry_created = ensure_utc(entry_result["created_at"])
+            if last_created is None or entry_created > last_created:
+                last_created = entry_created
+
             if entry_progress_callback:
                 entry_progress_callback()
 
+        bulk.flush()
+        if result["entries_created"]:
+            # One grouped read of the journal's rows feeds the activity rollups
+            rollups = ActivityRollupService(self.db)
+            rollups.apply(user_id, rollups.entry_activity(user_id, Entry.journal_id == journal.id))
+
         # Update journal denormalized fields (entry_count, total_words, last_entry_at)
         # This ensures the journal card statistics are accurate after import
-        self.db.flush()  # Ensure all entries are committed
-        stats = self.db.execute(
-            select(
-                func.count(Entry.id).label("count"),
-                func.sum(Entry.word_count).label("total_words"),
-                func.max(Entry.created_at).label("last_created")
-            ).where(
-                Entry.journal_id == journal.id
-            )
-        ).one()
-
-        entry_count = int(stats.count) if stats and stats.count is not None else 0
-        total_words = int(stats.total_words) if stats and stats.total_words is not None else 0
-        last_created = stats.last_created if stats else None
-
+        entry_count = result["entries_created"]
         journal.entry_count = entry_count
         journal.total_words = total_words
         journal.last_entry_at = last_created
@@ -398,19 +601,41 @@ class ImportService:
 
         return result
 
+    @staticmethod
+    def _new_id(id_mapper: IDMapper, external_id: Optional[str]) -> UUID:
+        """
+        Pre-generate a primary key for a bulk-inserted row.
+
+        External IDs seen earlier in the same import (e.g. a duplicated record)
+        get a fresh UUID so the row never collides with the one already mapped.
+        """
+        if external_id and id_mapper.has(external_id):
+            return uuid4()
+        return id_mapper.map(external_id)
+
     def _import_entry(
         self,
         journal_id: UUID,
         user_id: UUID,
         entry_dto: EntryDTO,
-        media_dir: Optional[Path],
+        media_dir: Optional[MediaSource],
+        id_mapper: IDMapper,
+        bulk: BulkInserter,
         existing_media_checksums: set,
-        existing_tag_names: set,
-        existing_mood_names: set,
+        imported_media: Dict[str, EntryMedia],
+        pending_media_ids: List[UUID],
+        existing_tag_ids: Dict[str, UUID],
+        existing_mood_ids: Dict[str, UUID],
         summary: ImportResultSummary,
         record_mapping: Optional[Callable[[str, Optional[str], UUID], None]] = None,
-    ) -> Dict[str, int]:
-        """Import a single entry with media and tags."""
+    ) -> Dict[str, Any]:
+        """
+        Import a single entry with media and tags.
+
+        Returns:
+            Counts of imported items plus the entry's ``entry_date``,
+            ``word_count`` and ``created_at`` for journal and per-day stats
+        """
         # Calculate word count from content to ensure accuracy
         # (don't trust the DTO value in case it's outdated or incorrect)
         word_count = len(entry_dto.content.split()) if entry_dto.content else 0
@@ -425,6 +650,7 @@ class ImportService:
 
         # Create entry with proper datetime fields
         entry = Entry(
+            id=self._new_id(id_mapper, entry_dto.external_id),
             journal_id=journal_id,
             user_id=user_id,
             title=entry_dto.title,
@@ -441,8 +667,7 @@ class ImportService:
             updated_at=entry_dto.updated_at,
             # Note: latitude, longitude, temperature are placeholders (not in DB)
         )
-        self.db.add(entry)
-        self.db.flush()  # Get entry ID
+        bulk.add(Entry.__table__, BulkInserter.row_from_model(entry))
         if record_mapping and entry_dto.external_id:
             record_mapping("entries", entry_dto.external_id, entry.id)
 
@@ -452,6 +677,9 @@ class ImportService:
             "media_deduplicated": 0,
             "tags_created": 0,
             "tags_reused": 0,
+            "entry_date": entry.entry_date,
+            "word_count": word_count,
+            "created_at": entry.created_at,
         }
 
         # Import mood log if present
@@ -460,7 +688,8 @@ class ImportService:
                 entry_id=entry.id,
                 user_id=user_id,
                 mood_log_dto=entry_dto.mood_log,
-                existing_mood_names=existing_mood_names,
+                bulk=bulk,
+                existing_mood_ids=existing_mood_ids,
                 summary=summary,
             )
             if mood_log_created:
@@ -473,7 +702,11 @@ class ImportService:
                 user_id=user_id,
                 media_dto=media_dto,
                 media_dir=media_dir,
+                id_mapper=id_mapper,
+                bulk=bulk,
                 existing_checksums=existing_media_checksums,
+                imported_media=imported_media,
+                pending_media_ids=pending_media_ids,
                 summary=summary,
                 record_mapping=record_mapping,
             )
@@ -482,13 +715,19 @@ class ImportService:
             elif media_result.get("deduplicated"):
                 result["media_deduplicated"] += 1
 
-        # Import tags
+        # Import tags (a tag listed twice on one entry is linked once)
+        linked_tag_names = set()
         for tag_name in entry_dto.tags:
+            tag_name_lower = tag_name.strip().lower()
+            if tag_name_lower in linked_tag_names:
+                continue
+            linked_tag_names.add(tag_name_lower)
             tag_result = self._import_tag(
                 entry_id=entry.id,
                 user_id=user_id,
                 tag_name=tag_name,
-                existing_tag_names=existing_tag_names,
+                bulk=bulk,
+                existing_tag_ids=existing_tag_ids,
             )
             if tag_result["created"]:
                 result["tags_created"] += 1
@@ -502,7 +741,8 @@ class ImportService:
         entry_id: UUID,
         user_id: UUID,
         mood_log_dto: MoodLogDTO,
-        existing_mood_names: set,
+        bulk: BulkInserter,
+        existing_mood_ids: Dict[str, UUID],
         summary: ImportResultSummary,
     ) -> bool:
         """
@@ -512,14 +752,9 @@ class ImportService:
             True if mood log was created, False otherwise
         """
         # Find mood by name (case-insensitive, since existing records might store mixed case)
-        mood_name_lower = mood_log_dto.mood_name.lower()
-        mood = (
-            self.db.query(Mood)
-            .filter(func.lower(Mood.name) == mood_name_lower)
-            .first()
-        )
+        mood_id = existing_mood_ids.get(mood_log_dto.mood_name.lower())
 
-        if not mood:
+        if not mood_id:
             warning_msg = f"Mood not found: '{mood_log_dto.mood_name}', skipping mood log"
             log_warning(warning_msg, user_id=str(user_id), mood_name=mood_log_dto.mood_name, entry_id=str(entry_id))
             summary.warnings.append(warning_msg)
@@ -535,7 +770,7 @@ class ImportService:
         mood_log = MoodLog(
             user_id=user_id,
             entry_id=entry_id,
-            mood_id=mood.id,
+            mood_id=mood_id,
             note=mood_log_dto.note,
             logged_date=recalculated_logged_date,  # Recalculated local date
             logged_datetime_utc=mood_log_dto.logged_datetime_utc,
@@ -544,7 +779,7 @@ class ImportService:
             created_at=mood_log_dto.created_at,
             updated_at=mood_log_dto.updated_at,
         )
-        self.db.add(mood_log)
+        bulk.add(MoodLog.__table__, BulkInserter.row_from_model(mood_log))
         return True
 
     def _import_media(
@@ -552,14 +787,22 @@ class ImportService:
         entry_id: UUID,
         user_id: UUID,
         media_dto: MediaDTO,
-        media_dir: Optional[Path],
+        media_dir: Optional[MediaSource],
+        id_mapper: IDMapper,
+        bulk: BulkInserter,
         existing_checksums: set,
+        imported_media: Dict[str, EntryMedia],
+        pending_media_ids: List[UUID],
         summary: ImportResultSummary,
         record_mapping: Optional[Callable[[str, Optional[str], UUID], None]] = None,
     ) -> Dict[str, Any]:
         """
         Import a media file with deduplication.
 
+        Duplicates are resolved against media imported earlier in this run
+        (``imported_media``, whose rows may still be buffered in ``bulk``)
+        before falling back to the database.
+
         Returns:
             {"imported": True/False, "deduplicated": True/False, "stored_relative_path": str | None}
         """
@@ -578,13 +821,19 @@ class ImportService:
             summary.media_files_skipped += 1
             return {"imported": False, "deduplicated": False, "stored_relative_path": None}
 
-        source_path = media_dir / media_dto.file_path
-        if not source_path.exists():
-            warning_msg = f"Media file not found: {source_path}"
+        source_stream = self._open_media_source(media_dir, media_dto.file_path)
+        if source_stream is None:
+            source_label = (
+                media_dir.describe(media_dto.file_path)
+                if isinstance(media_dir, ZipMediaReader)
+                else str(media_dir / media_dto.file_path)
+            )
+            warning_msg = f"Media file not found: {source_label}"
             log_warning(warning_msg, user_id=str(user_id), media_filename=media_dto.filename, file_path=media_dto.file_path, entry_id=str(entry_id))
             summary.warnings.append(warning_msg)
             summary.media_files_skipped += 1
             return {"imported": False, "deduplicated": False, "stored_relative_path": None}
+        suffix = Path(media_dto.file_path).suffix
 
         # Choose media subdirectory based on type
         media_type = media_dto.media_type.lower() if media_dto.media_type else "unknown"
@@ -601,32 +850,51 @@ class ImportService:
         dest_dir = media_root / subdir
         dest_dir.mkdir(parents=True, exist_ok=True)
 
-        # Stream copy while calculating checksum to avoid double reads
-        tmp_path = dest_dir / f"tmp_{uuid4().hex}{source_path.suffix}"
+        # Stream copy while calculating checksum to avoid double reads. ZIP
+        # members are decompressed straight into the destination here, and
+        # their CRC is verified once the end of the member is reached.
+        tmp_path = dest_dir / f"tmp_{uuid4().hex}{suffix}"
         sha256 = MediaHandler.sha256_hasher()
 
-        with open(source_path, "rb") as src, open(tmp_path, "wb") as dst:
-            for chunk in iter(lambda: src.read(8192), b""):
-                sha256.update(chunk)
-                dst.write(chunk)
+        try:
+            with source_stream as src, open(tmp_path, "wb") as dst:
+                for chunk in iter(lambda: src.read(ZipMediaReader.CHUNK_SIZE), b""):
+                    sha256.update(chunk)
+                    dst.write(chunk)
+        except (zipfile.BadZipFile, zlib.error, EOFError) as e:
+            tmp_path.unlink(missing_ok=True)
+            warning_msg = f"Corrupted media file in archive, skipping: {media_dto.file_path} ({e})"
+            log_warning(warning_msg, user_id=str(user_id), media_filename=media_dto.filename, file_path=media_dto.file_path, entry_id=str(entry_id))
+            summary.warnings.append(warning_msg)
+            summary.media_files_skipped += 1
+            return {"imported": False, "deduplicated": False, "stored_relative_path": None}
+        except BaseException:
+            # Never leave a partial copy behind, whatever interrupted the copy
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         checksum = sha256.hexdigest()
 
         # Check for duplicate by checksum
         if checksum in existing_checksums:
-            existing_media = (
-                self.db.query(EntryMedia)
-                .join(Entry)
-                .filter(
-                    Entry.user_id == user_id,
-                    EntryMedia.checksum == checksum
+            existing_media = imported_media.get(checksum)
+            if existing_media is None:
+                existing_media = (
+                    self.db.query(EntryMedia)
+                    .join(Entry)
+                    .filter(
+                        Entry.user_id == user_id,
+                        EntryMedia.checksum == checksum
+                    )
+                    .first()
                 )
-                .first()
-            )
+                if existing_media:
+                    imported_media[checksum] = existing_media
 
             if existing_media:
                 tmp_path.unlink(missing_ok=True)
                 media = EntryMedia(
+                    id=self._new_id(id_mapper, media_dto.external_id),
                     entry_id=entry_id,
                     file_path=existing_media.file_path,
                     original_filename=media_dto.filename,
@@ -644,7 +912,9 @@ class ImportService:
                     created_at=media_dto.created_at,
                     updated_at=media_dto.updated_at,
                 )
-                self.db.add(media)
+                bulk.add(EntryMedia.__table__, BulkInserter.row_from_model(media))
+                if media.upload_status == UploadStatus.PENDING:
+                    pending_media_ids.append(media.id)
                 if record_mapping and media_dto.external_id:
                     record_mapping("media", media_dto.external_id, media.id)
                 return {
@@ -655,11 +925,11 @@ class ImportService:
                 }
 
         # Final filename uses checksum for uniqueness
-        target_name = f"{checksum}{source_path.suffix}"
+        target_name = f"{checksum}{suffix}"
         dest_path = dest_dir / target_name
         counter = 1
         while dest_path.exists():
-            dest_path = dest_dir / f"{checksum}_{counter}{source_path.suffix}"
+            dest_path = dest_dir / f"{checksum}_{counter}{suffix}"
             counter += 1
 
         tmp_path.rename(dest_path)
@@ -674,33 +944,18 @@ class ImportService:
             checksum=checksum,
             file_size=dest_path.stat().st_size,
         )
-        self.db.add(media)
+        media.id = self._new_id(id_mapper, media_dto.external_id)
         existing_checksums.add(checksum)
+        imported_media[checksum] = media
 
-        # Generate thumbnail for imported media
+        # Thumbnails and metadata are produced by the media processing
+        # queue once the journal commits
         if media.media_type in [MediaType.IMAGE, MediaType.VIDEO]:
-            try:
-                from app.services.media_service import MediaService
-                media_service = MediaService(self.db)
-
-                # Generate thumbnail synchronously
-                full_path = Path(settings.media_root) / relative_path
-                if not full_path.exists():
-                    log_warning(f"Media file not found for thumbnail generation: {full_path}", media_id=str(media.id), file_path=str(full_path))
-                else:
-                    thumbnail_path = media_service._generate_thumbnail(
-                        str(full_path),
-                        media.media_type
-                    )
-
-                    if thumbnail_path:
-                        # Convert to relative path
-                        media.thumbnail_path = media_service._relative_thumbnail_path(Path(thumbnail_path))
-                        log_info(f"Generated thumbnail for imported media: {media.id}", media_id=str(media.id))
-            except Exception as thumb_error:
-                # Log but don't fail import if thumbnail generation fails
-                log_warning(f"Failed to generate thumbnail for imported media {media.id}: {thumb_error}", media_id=str(media.id))
+            media.upload_status = UploadStatus.PENDING
+            media.thumbnail_path = None
+            pending_media_ids.append(media.id)
 
+        bulk.add(EntryMedia.__table__, BulkInserter.row_from_model(media))
         if record_mapping and media_dto.external_id:
             record_mapping("media", media_dto.external_id, media.id)
 
@@ -711,6 +966,17 @@ class ImportService:
             "stored_filename": dest_path.name,
         }
 
+    @staticmethod
+    def _open_media_source(media_dir: MediaSource, file_path: str) -> Optional[BinaryIO]:
+        """Open a media file from a directory or archive, or return None if it is missing."""
+        if isinstance(media_dir, ZipMediaReader):
+            return media_dir.open(file_path) if file_path in media_dir else None
+
+        source_path = media_dir / file_path
+        if not source_path.exists():
+            return None
+        return open(source_path, "rb")
+
     def _parse_media_type(self, media_type_str: str) -> MediaType:
         """Parse media type string to enum."""
         try:
@@ -778,53 +1044,31 @@ class ImportService:
         entry_id: UUID,
         user_id: UUID,
         tag_name: str,
-        existing_tag_names: set,
+        bulk: BulkInserter,
+        existing_tag_ids: Dict[str, UUID],
     ) -> Dict[str, bool]:
         """
         Import a tag with deduplication.
 
-        Uses existing_tag_names for fast-path check before querying DB.
+        Resolves the tag from existing_tag_ids; new tags are given an ID up
+        front and buffered ahead of their links.
 
         Returns:
             {"created": True/False}
         """
         tag_name_lower = tag_name.strip().lower()
 
-        # Fast-path: check if tag already exists in set
-        if tag_name_lower in existing_tag_names:
-            # Tag exists, just need to link it
-            tag = (
-                self.db.query(Tag)
-                .filter(
-                    Tag.user_id == user_id,
-                    Tag.name == tag_name_lower
-                )
-                .first()
-            )
-            created = False
-        else:
-            # Tag doesn't exist in set, check DB and create if needed
-            tag = (
-                self.db.query(Tag)
-                .filter(
-                    Tag.user_id == user_id,
-                    Tag.name == tag_name_lower
-                )
-                .first()
-            )
-
-            created = False
-            if not tag:
-                tag = Tag(user_id=user_id, name=tag_name_lower)
-                self.db.add(tag)
-                self.db.flush()
-                existing_tag_names.add(tag_name_lower)
-                created = True
+        tag_id = existing_tag_ids.get(tag_name_lower)
+        created = tag_id is None
+        if created:
+            tag = Tag(user_id=user_id, name=tag_name_lower)
+            bulk.add(Tag.__table__, BulkInserter.row_from_model(tag))
+            tag_id = tag.id
+            existing_tag_ids[tag_name_lower] = tag_id
 
         # Link tag to entry
-        from app.models.entry_tag_link import EntryTagLink
-        link = EntryTagLink(entry_id=entry_id, tag_id=tag.id)
-        self.db.add(link)
+        link = EntryTagLink(entry_id=entry_id, tag_id=tag_id)
+        bulk.add(EntryTagLink.__table__, BulkInserter.row_from_model(link))
 
         return {"created": created}
 
@@ -841,20 +1085,20 @@ class ImportService:
         )
         return {c[0] for c in checksums if c[0]}
 
-    def _get_existing_tag_names(self, user_id: UUID) -> set:
-        """Get set of existing tag names for user (lowercase)."""
-        tags = self.db.query(Tag.name).filter(Tag.user_id == user_id).all()
-        return {t[0].lower() for t in tags}
+    def _get_existing_tag_ids(self, user_id: UUID) -> Dict[str, UUID]:
+        """Get mapping of existing tag names (lowercase) to tag IDs for user."""
+        tags = self.db.query(Tag.name, Tag.id).filter(Tag.user_id == user_id).all()
+        return {name.lower(): tag_id for name, tag_id in tags}
 
-    def _get_existing_mood_names(self, user_id: UUID) -> set:
+    def _get_existing_mood_ids(self, user_id: UUID) -> Dict[str, UUID]:
         """
-        Get set of existing mood names (system-wide, lowercase).
+        Get mapping of existing mood names (system-wide, lowercase) to mood IDs.
 
         Note: Moods are system-wide, so user_id parameter is not used.
         It's kept for API consistency with other _get_existing_* methods.
         """
-        moods = self.db.query(Mood.name).all()
-        return {m[0].lower() for m in moods}
+        moods = self.db.query(Mood.name, Mood.id).all()
+        return {name.lower(): mood_id for name, mood_id in moods}
 
     @staticmethod
     def count_entries_in_data(data: Dict[str, Any]) -> int:
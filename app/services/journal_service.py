@@ -2,16 +2,22 @@
 Journal service for handling journal-related operations.
 """
 import uuid
+from datetime import datetime
 from typing import List, Optional
 
+import sqlalchemy as sa
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select, func
 
-from app.core.exceptions import JournalNotFoundError
+from app.core.analytics_cache import invalidate_analytics
+from app.core.config import settings
+from app.core.exceptions import DeletionJobNotFoundError, JournalNotFoundError
 from app.core.logging_config import log_info, log_warning, log_error
 from app.core.time_utils import utc_now
+from app.models.deletion_job import DeletionJob
 from app.models.journal import Journal
 from app.schemas.journal import JournalCreate, JournalUpdate
+from app.services.bulk_delete_service import MediaFile
 
 
 class JournalService:
@@ -52,6 +58,7 @@ class JournalService:
             log_error(exc)
             raise
 
+        invalidate_analytics(user_id)
         log_info(f"Journal created for user {user_id}: {journal.id}")
         return journal
 
@@ -103,71 +110,52 @@ class JournalService:
             log_error(exc)
             raise
 
+        invalidate_analytics(user_id)
         log_info(f"Journal updated for {user_id}: {journal.id}")
         return journal
 
     async def delete_journal(self, journal_id: uuid.UUID, user_id: uuid.UUID) -> bool:
         """Hard delete a journal and all related entries and media."""
-        journal = self._get_owned_journal(journal_id, user_id)
-
-        # Hard delete all related entries and their media first
-        from app.models.entry import Entry, EntryMedia
-        from app.services.media_service import MediaService
-
-        entries = self.session.exec(
-            select(Entry).where(Entry.journal_id == journal_id)
-        ).all()
-
-        media_service = MediaService()
-        media_files_to_delete = []
+        from app.services.entry_service import EntryService
 
-        for entry in entries:
-            # Collect all entry media records with their file paths before deletion
-            entry_media_list = self.session.exec(
-                select(EntryMedia).where(EntryMedia.entry_id == entry.id)
-            ).all()
+        media_files_to_delete = self.delete_journal_records(journal_id, user_id)
+        await EntryService.delete_media_files(media_files_to_delete)
+        return True
 
-            for media in entry_media_list:
-                # Collect file paths for deletion (file_path is relative to media_root)
-                if media.file_path:
-                    full_path = (media_service.media_root / media.file_path).resolve()
-                    if full_path.exists() and str(full_path).startswith(str(media_service.media_root.resolve())):
-                        media_files_to_delete.append(str(full_path))
+    def delete_journal_records(self, journal_id: uuid.UUID, user_id: uuid.UUID) -> List[MediaFile]:
+        """
+        Hard delete a journal and its entries/media from the database.
 
-                self.session.delete(media)
+        Returns the media files (ids and absolute paths) that should be
+        removed from disk once the transaction has been committed.
+        """
+        from app.services.bulk_delete_service import BulkDeleteService
 
-            # Hard delete the entry
-            self.session.delete(entry)
+        journal = self._get_owned_journal(journal_id, user_id)
+        return BulkDeleteService(self.session).delete_journal(journal)
 
-        # Finally, hard delete the journal
-        self.session.delete(journal)
+    def queue_journal_deletion(self, journal_id: uuid.UUID, user_id: uuid.UUID) -> Optional[DeletionJob]:
+        """
+        Queue a large journal for background deletion.
 
-        try:
-            self.session.commit()
-        except SQLAlchemyError as exc:
-            self.session.rollback()
-            log_error(exc)
-            raise
+        Returns the deletion job, or None when the journal is small enough
+        to delete within the request.
+        """
+        from app.services.bulk_delete_service import BulkDeleteService
 
-        # Recalculate writing streak statistics after journal is deleted
-        # This ensures analytics reflect the correct entry counts
-        try:
-            from app.services.analytics_service import AnalyticsService
-            analytics_service = AnalyticsService(self.session)
-            analytics_service.recalculate_writing_streak_stats(user_id)
-        except Exception as exc:
-            # Log error but don't fail the deletion
-            log_warning(f"Failed to update writing streak stats after journal deletion: {exc}")
-
-        # Delete physical media files from disk
-        for file_path in media_files_to_delete:
-            try:
-                await media_service.delete_media_file(file_path)
-            except Exception as exc:
-                log_warning(f"Failed to delete media file {file_path} after journal deletion: {exc}")
-
-        log_info(f"Journal and related entries/media hard-deleted for {user_id}: {journal_id}")
-        return True
+        journal = self._get_owned_journal(journal_id, user_id)
+        if journal.entry_count <= settings.journal_delete_background_threshold:
+            return None
+        return BulkDeleteService(self.session).create_journal_deletion_job(journal)
+
+    def get_deletion_job(self, job_id: uuid.UUID, user_id: uuid.UUID) -> DeletionJob:
+        """Get a journal deletion job owned by the user."""
+        job = self.session.exec(
+            select(DeletionJob).where(DeletionJob.id == job_id, DeletionJob.user_id == user_id)
+        ).first()
+        if not job:
+            raise DeletionJobNotFoundError("Deletion job not found")
+        return job
 
     def get_favorite_journals(self, user_id: uuid.UUID) -> List[Journal]:
         """Get favorite journals for a user."""
@@ -231,6 +219,61 @@ class JournalService:
         log_info(f"Journal unarchived for {user_id}: {journal.id}")
         return journal
 
+    def apply_entry_change(
+        self,
+        journal_id: uuid.UUID,
+        entry_delta: int = 0,
+        words_delta: int = 0,
+        added_at: Optional[datetime] = None,
+        removed_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Apply an entry write to a journal's denormalized stats (caller commits).
+
+        ``entry_count`` and ``total_words`` are adjusted with a relative
+        UPDATE. ``last_entry_at`` moves forward to ``added_at``; it is only
+        looked up again when ``removed_at`` (the datetime an entry had before
+        it was deleted, moved away or re-dated) may have been the latest.
+        The entry change must already be flushed.
+        """
+        from app.models.entry import Entry
+
+        table = Journal.__table__
+        new_count = table.c.entry_count + entry_delta
+        new_words = table.c.total_words + words_delta
+        values = {
+            "entry_count": sa.case((new_count > 0, new_count), else_=0),
+            "total_words": sa.case((new_words > 0, new_words), else_=0),
+            "updated_at": utc_now(),
+        }
+
+        last_entry_at = table.c.last_entry_at
+        if removed_at is not None:
+            latest = (
+                select(func.max(Entry.entry_datetime_utc))
+                .where(Entry.journal_id == journal_id)
+                .scalar_subquery()
+            )
+            last_entry_at = sa.case(
+                (table.c.last_entry_at > sa.literal(removed_at, table.c.last_entry_at.type), table.c.last_entry_at),
+                else_=latest,
+            )
+        if added_at is not None:
+            added = sa.literal(added_at, table.c.last_entry_at.type)
+            last_entry_at = sa.case(
+                (sa.or_(last_entry_at.is_(None), last_entry_at < added), added),
+                else_=last_entry_at,
+            )
+        if removed_at is not None or added_at is not None:
+            values["last_entry_at"] = last_entry_at
+
+        self.session.execute(sa.update(table).where(table.c.id == journal_id).values(**values))
+
+        # Reload the changed columns on next access if the journal is loaded
+        journal = self.session.identity_map.get(self.session.identity_key(Journal, journal_id))
+        if journal is not None:
+            self.session.expire(journal, list(values))
+
     def recalculate_journal_entry_count(self, journal_id: uuid.UUID, user_id: uuid.UUID) -> Journal:
         """
         Recalculate the entry count for a specific journal.
@@ -0,0 +1,221 @@
+"""
+Media derivative service.
+
+Produces resized, re-encoded variants of images (and video posters) on first
+request and caches them on disk. Requested widths are snapped to a fixed set
+so the cache stays bounded per media item, and the cache as a whole is kept
+under ``media_derivative_cache_mb`` by evicting the least recently served
+files.
+"""
+import os
+import threading
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logging_config import log_error, log_info
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+    ImageOps = None
+
+
+class MediaDerivativeService:
+    """Service for on-demand image derivatives with an LRU disk cache."""
+
+    WIDTHS = (160, 320, 640, 1024, 1600, 2048)
+    # Preferred first; each is used only if Pillow can encode it and the client accepts it
+    FORMATS = ("avif", "webp", "jpeg")
+    FORMAT_INFO = {
+        "avif": ("AVIF", "image/avif", 60),
+        "webp": ("WEBP", "image/webp", 80),
+        "jpeg": ("JPEG", "image/jpeg", 85),
+    }
+    CACHE_DIR = "derivatives"
+    # After eviction the cache is trimmed to this fraction of the quota
+    EVICT_TARGET_RATIO = 0.9
+
+    # Cache size is shared by all instances in the process and lazily measured
+    _cache_bytes: Optional[int] = None
+    _cache_lock = threading.Lock()
+
+    def __init__(self, media_root: Optional[Path] = None, max_cache_bytes: Optional[int] = None):
+        self.media_root = Path(media_root or settings.media_root).resolve()
+        self.cache_root = self.media_root / self.CACHE_DIR
+        self.max_cache_bytes = (
+            max_cache_bytes
+            if max_cache_bytes is not None
+            else settings.media_derivative_cache_mb * 1024 * 1024
+        )
+
+    @classmethod
+    def snap_width(cls, width: int) -> int:
+        """Round a requested width up to the nearest supported derivative width."""
+        for candidate in cls.WIDTHS:
+            if width <= candidate:
+                return candidate
+        return cls.WIDTHS[-1]
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def supported_formats() -> Tuple[str, ...]:
+        """Derivative formats the installed Pillow build can encode."""
+        if not Image:
+            return ()
+        Image.init()
+        return tuple(
+            fmt for fmt in MediaDerivativeService.FORMATS
+            if MediaDerivativeService.FORMAT_INFO[fmt][0] in Image.SAVE
+        )
+
+    @classmethod
+    def negotiate_format(cls, accept: Optional[str]) -> str:
+        """Pick the best derivative format for an ``Accept`` header (JPEG fallback)."""
+        accepted = {
+            part.split(";")[0].strip().lower()
+            for part in (accept or "").split(",")
+        }
+        for fmt in cls.supported_formats():
+            if fmt == "jpeg" or cls.FORMAT_INFO[fmt][1] in accepted:
+                return fmt
+        return "jpeg"
+
+    @classmethod
+    def content_type(cls, fmt: str) -> str:
+        return cls.FORMAT_INFO[fmt][1]
+
+    def get_derivative(self, source_path: Path, media_id: uuid.UUID, width: int, fmt: str, variant: str = "") -> Path:
+        """
+        Return the cached derivative for a source image, generating it if needed.
+
+        Args:
+            source_path: Original image (or video poster) on disk
+            media_id: Media record the derivative belongs to (cache key)
+            width: Requested width in pixels; snapped to ``WIDTHS``
+            fmt: One of ``FORMATS``, e.g. from ``negotiate_format``
+            variant: Distinguishes derivatives of different sources for the same media
+
+        Returns:
+            Path to the derivative file
+        """
+        if not Image:
+            raise RuntimeError("PIL not available for derivative generation")
+        if fmt not in self.supported_formats():
+            raise ValueError(f"Unsupported derivative format: {fmt}")
+
+        width = self.snap_width(width)
+        derivative_path = self._derivative_path(media_id, width, fmt, variant)
+
+        try:
+            if derivative_path.stat().st_mtime_ns >= source_path.stat().st_mtime_ns:
+                # Cache hit: bump mtime so eviction sees it as recently used
+                os.utime(derivative_path)
+                return derivative_path
+        except FileNotFoundError:
+            pass
+
+        self._generate(source_path, derivative_path, width, fmt)
+        self._record_write(derivative_path)
+        return derivative_path
+
+    def purge(self, media_id: uuid.UUID) -> None:
+        """Delete all cached derivatives for a media record."""
+        media_dir = self.cache_root / media_id.hex[:2]
+        removed = 0
+        for path in media_dir.glob(f"{media_id.hex}*"):
+            try:
+                removed += path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                continue
+        if removed:
+            with self._cache_lock:
+                if MediaDerivativeService._cache_bytes is not None:
+                    MediaDerivativeService._cache_bytes = max(0, MediaDerivativeService._cache_bytes - removed)
+
+    def _derivative_path(self, media_id: uuid.UUID, width: int, fmt: str, variant: str) -> Path:
+        suffix = f"_{variant}" if variant else ""
+        return self.cache_root / media_id.hex[:2] / f"{media_id.hex}{suffix}_w{width}.{fmt}"
+
+    def _generate(self, source_path: Path, derivative_path: Path, width: int, fmt: str) -> None:
+        pil_format, _, quality = self.FORMAT_INFO[fmt]
+        derivative_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = derivative_path.with_name(f".tmp_{uuid.uuid4().hex}_{derivative_path.name}")
+
+        try:
+            with Image.open(source_path) as img:
+                # Only decode what the target size needs (large JPEG speed-up)
+                img.draft("RGB", (width, width * 4))
+                img = ImageOps.exif_transpose(img)
+
+                has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+                if fmt == "jpeg" or not has_alpha:
+                    img = img.convert("RGB")
+                elif img.mode != "RGBA":
+                    img = img.convert("RGBA")
+
+                # Never upscale: narrow images are only re-encoded
+                if img.width > width:
+                    height = max(1, round(img.height * width / img.width))
+                    img = img.resize((width, height), Image.Resampling.LANCZOS)
+
+                img.save(tmp_path, pil_format, quality=quality)
+            # Atomic publish so concurrent requests never serve a partial file
+            os.replace(tmp_path, derivative_path)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            log_error(f"Failed to generate {fmt} derivative for {source_path}: {e}")
+            raise
+
+    def _record_write(self, path: Path) -> None:
+        written = path.stat().st_size
+        with self._cache_lock:
+            if MediaDerivativeService._cache_bytes is None:
+                MediaDerivativeService._cache_bytes = sum(size for _, size, _ in self._scan())
+            else:
+                MediaDerivativeService._cache_bytes += written
+
+            if MediaDerivativeService._cache_bytes > self.max_cache_bytes:
+                self._evict(keep=path)
+
+    def _scan(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+        for path in self.cache_root.rglob("*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if path.is_file() and not path.name.startswith(".tmp_"):
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self, keep: Path) -> None:
+        """Delete least recently served derivatives (except ``keep``) until under the quota target."""
+        entries = sorted(self._scan())
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_cache_bytes * self.EVICT_TARGET_RATIO)
+        evicted = 0
+
+        for _, size, path in entries:
+            if total <= target:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            evicted += 1
+
+        MediaDerivativeService._cache_bytes = total
+        log_info(
+            f"Evicted {evicted} media derivatives",
+            evicted=evicted,
+            cache_bytes=total,
+            max_cache_bytes=self.max_cache_bytes,
+        )
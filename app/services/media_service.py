@@ -30,6 +30,7 @@ from app.core.logging_config import log_error, log_file_upload, log_warning
 from app.models.entry import Entry, EntryMedia
 from app.models.enums import MediaType, UploadStatus
 from app.models.journal import Journal
+from app.services.media_derivative_service import MediaDerivativeService
 from app.utils.import_export.media_handler import MediaHandler
 
 try:
@@ -51,6 +52,8 @@ class MediaService:
     FFMPEG_DEFAULT_TIMEOUT = 300
     FFPROBE_DEFAULT_TIMEOUT = 300
     VIDEO_THUMBNAIL_SEEK_TIME = "00:00:01"
+    # Uploads are streamed in blocks of this size; the first block is used for MIME sniffing
+    UPLOAD_CHUNK_SIZE = 64 * 1024
 
     # Use MediaHandler constants to avoid duplication
     MIME_TYPE_MAP = MediaHandler.MIME_TYPE_MAP
@@ -162,54 +165,6 @@ class MediaService:
         unique_id = str(uuid.uuid4())
         return f"{user_id}_{unique_id}{file_extension}"
 
-    async def save_uploaded_file(
-        self,
-        file_content: bytes,
-        original_filename: str,
-        user_id: str,
-        media_type: MediaType
-    ) -> Dict[str, Any]:
-        """Save an uploaded file quickly without processing (for async processing)."""
-        # Generate unique filename
-        filename = self._generate_filename(original_filename, user_id)
-        file_path = self._get_media_path(filename, media_type)
-
-        tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
-        async with aiofiles.open(tmp_path, 'wb') as f:
-            await f.write(file_content)
-            await f.flush()
-
-        try:
-            await aiofiles.os.rename(tmp_path, file_path)
-        except Exception:
-            # Attempt cleanup and re-raise
-            try:
-                await aiofiles.os.remove(tmp_path)
-            except FileNotFoundError:
-                pass
-            raise
-
-        # Get basic metadata
-        file_size = len(file_content)
-        mime_type = self._detect_mime(file_content)
-        checksum = hashlib.sha256(file_content).hexdigest()
-
-        # Return relative paths for API responses
-        relative_file_path = str(file_path.relative_to(self.media_root))
-
-        return {
-            "filename": filename,
-            "file_path": relative_file_path,
-            "original_filename": MediaHandler.sanitize_filename(original_filename),
-            "file_size": file_size,
-            "mime_type": mime_type,
-            "thumbnail_path": None,  # Will be generated in background
-            "media_type": media_type,
-            "upload_status": UploadStatus.PENDING,
-            "checksum": checksum,
-            "full_file_path": str(file_path)  # For background processing
-        }
-
     async def get_media_info(self, file_path: str) -> Dict[str, Any]:
         """Get detailed information about a media file."""
         path = Path(file_path)
@@ -287,6 +242,10 @@ class MediaService:
 
     async def delete_media_file(self, file_path: str) -> bool:
         """Delete a media file and its thumbnail."""
+        return self.remove_media_file(file_path)
+
+    def remove_media_file(self, file_path: str) -> bool:
+        """Delete a media file and its thumbnail (blocking; safe to run in a thread)."""
         path = Path(file_path)
         if not path.exists():
             return False
@@ -313,25 +272,28 @@ class MediaService:
             if not MediaHandler.validate_file_size(len(file_content), self.settings.max_file_size_mb):
                 return False, f"File size exceeds maximum limit of {self.settings.max_file_size_mb}MB"
 
-            # Get allowed types (from settings or cached)
-            allowed_mime_types = {mime.lower() for mime in (self.settings.allowed_media_types or [])} or self.allowed_mime_types
-            allowed_extensions = {ext.lower() for ext in (self.settings.allowed_file_extensions or [])} or self.allowed_extensions
-
-            # Check MIME type
-            mime_type = self._detect_mime(file_content)
-            if allowed_mime_types and mime_type.lower() not in allowed_mime_types:
-                return False, f"Mime type {mime_type} not allowed"
-
-            # Check file extension
-            file_ext = Path(filename).suffix.lower()
-            if allowed_extensions and file_ext not in allowed_extensions:
-                return False, f"File extension {file_ext} not allowed"
-
-            return True, "File is valid"
+            return self._validate_file_type(self._detect_mime(file_content), filename)
         except Exception as exc:
             log_error(exc, request_id="", user_email="")
             return False, "File validation failed"
 
+    def _validate_file_type(self, mime_type: str, filename: str) -> Tuple[bool, str]:
+        """Check a sniffed MIME type and the filename extension against the allowlists."""
+        # Get allowed types (from settings or cached)
+        allowed_mime_types = {mime.lower() for mime in (self.settings.allowed_media_types or [])} or self.allowed_mime_types
+        allowed_extensions = {ext.lower() for ext in (self.settings.allowed_file_extensions or [])} or self.allowed_extensions
+
+        # Check MIME type
+        if allowed_mime_types and mime_type.lower() not in allowed_mime_types:
+            return False, f"Mime type {mime_type} not allowed"
+
+        # Check file extension
+        file_ext = Path(filename).suffix.lower()
+        if allowed_extensions and file_ext not in allowed_extensions:
+            return False, f"File extension {file_ext} not allowed"
+
+        return True, "File is valid"
+
     def validate_file_sync(self, file_content: bytes, filename: str) -> Tuple[bool, str]:
         """Validate file content and extension synchronously.
 
@@ -368,54 +330,93 @@ class MediaService:
                     f"File too large. Maximum size: {self.settings.max_file_size_mb}MB"
                 )
 
-    async def _read_file_content(self, file: UploadFile) -> bytes:
-        """Read file content from UploadFile."""
+    async def _read_file_chunk(self, file: UploadFile) -> bytes:
+        """Read the next block of an UploadFile."""
         try:
-            content = await file.read()
-            return content
+            return await file.read(self.UPLOAD_CHUNK_SIZE)
         except Exception as e:
             log_error(e, request_id="", user_email="")
             raise FileValidationError("Failed to read file")
 
-    def _validate_file_content(self, file_content: bytes, filename: str) -> None:
-        """Validate file content and raise appropriate exceptions if invalid.
+    async def save_uploaded_stream(self, file: UploadFile, user_id: str) -> Dict[str, Any]:
+        """
+        Stream an upload to disk without holding it in memory.
 
-        This method uses the centralized validation logic and converts
-        the result to appropriate exceptions.
+        The MIME type is sniffed and validated from the first block, the
+        checksum is computed incrementally, and the size limit is enforced
+        while streaming, so peak memory is one chunk regardless of file size.
+
+        Returns:
+            The stored file's name, relative and absolute paths, size,
+            MIME and media type, and SHA-256 checksum
+
+        Raises:
+            FileTooLargeError: If the stream exceeds max_file_size_mb
+            InvalidFileTypeError: If the sniffed type is not a supported media type
+            FileValidationError: If the file cannot be read or fails validation
         """
-        is_valid, error_message = self._validate_file_internal(file_content, filename)
-
-        if not is_valid:
-            # Convert validation message to appropriate exception
-            normalized_msg = (error_message or "").lower()
-            if "file size" in normalized_msg or "exceeds" in normalized_msg:
-                raise FileTooLargeError(error_message)
-            elif "mime type" in normalized_msg:
-                raise InvalidFileTypeError(error_message)
-            elif "extension" in normalized_msg:
-                raise FileValidationError(error_message)
-            else:
-                # Generic validation error
-                raise FileValidationError(error_message or "File validation failed")
+        original_filename = file.filename or "unknown"
+
+        first_block = await self._read_file_chunk(file)
+        mime_type = self._detect_mime(first_block)
+        validation_ok, validation_message = self._validate_file_type(mime_type, original_filename)
+        if not validation_ok:
+            if "mime type" in (validation_message or "").lower():
+                raise InvalidFileTypeError(validation_message)
+            raise FileValidationError(validation_message)
+        media_type = self._media_type_from_mime(mime_type)
 
-    def _detect_media_type(self, file_content: bytes) -> MediaType:
-        """Detect media type from file content."""
+        filename = self._generate_filename(original_filename, user_id)
+        file_path = self._get_media_path(filename, media_type)
+        tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+
+        hasher = hashlib.sha256()
+        file_size = 0
         try:
-            mime_type = self._detect_mime(file_content)
+            async with aiofiles.open(tmp_path, 'wb') as f:
+                chunk = first_block
+                while chunk:
+                    file_size += len(chunk)
+                    if not MediaHandler.validate_file_size(file_size, self.settings.max_file_size_mb):
+                        raise FileTooLargeError(
+                            f"File too large. Maximum size: {self.settings.max_file_size_mb}MB"
+                        )
+                    hasher.update(chunk)
+                    await f.write(chunk)
+                    chunk = await self._read_file_chunk(file)
+                await f.flush()
+            await aiofiles.os.rename(tmp_path, file_path)
+        except BaseException:
+            # Attempt cleanup and re-raise (covers size aborts and client disconnects)
+            try:
+                await aiofiles.os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
 
-            if mime_type.startswith('image/'):
-                return MediaType.IMAGE
-            elif mime_type.startswith('video/'):
-                return MediaType.VIDEO
-            elif mime_type.startswith('audio/'):
-                return MediaType.AUDIO
-            else:
-                raise InvalidFileTypeError("Unsupported media type")
-        except Exception as e:
-            if isinstance(e, InvalidFileTypeError):
-                raise
-            log_error(e, request_id="", user_email="")
-            raise FileValidationError("Failed to determine media type")
+        return {
+            "filename": filename,
+            "file_path": str(file_path.relative_to(self.media_root)),
+            "original_filename": MediaHandler.sanitize_filename(original_filename),
+            "file_size": file_size,
+            "mime_type": mime_type,
+            "thumbnail_path": None,  # Will be generated in background
+            "media_type": media_type,
+            "upload_status": UploadStatus.PENDING,
+            "checksum": hasher.hexdigest(),
+            "full_file_path": str(file_path)  # For background processing
+        }
+
+    @staticmethod
+    def _media_type_from_mime(mime_type: str) -> MediaType:
+        """Map a MIME type to a MediaType."""
+        if mime_type.startswith('image/'):
+            return MediaType.IMAGE
+        elif mime_type.startswith('video/'):
+            return MediaType.VIDEO
+        elif mime_type.startswith('audio/'):
+            return MediaType.AUDIO
+        raise InvalidFileTypeError("Unsupported media type")
 
     async def upload_media(
         self,
@@ -446,35 +447,13 @@ class MediaService:
             InvalidFileTypeError: If file type is not supported
             EntryNotFoundError: If entry_id is provided but entry doesn't exist
         """
-        # 1. Check file size before reading
+        # 1. Check declared file size before reading
         await self._check_file_size(file)
 
-        # 2. Read file content
-        file_content = await self._read_file_content(file)
-
-        # 3. Validate file
-        validation_ok, validation_message = await self.validate_file(
-            file_content,
-            file.filename or "unknown"
-        )
-        if not validation_ok:
-            normalized = (validation_message or "").lower()
-            if "file too large" in normalized or "exceeds" in normalized:
-                raise FileTooLargeError(validation_message)
-            if "unsupported media type" in normalized or "mime type" in normalized:
-                raise InvalidFileTypeError(validation_message)
-            raise FileValidationError(validation_message)
-
-        # 4. Detect media type
-        media_type = self._detect_media_type(file_content)
-
-        # 5. Save file
-        media_info = await self.save_uploaded_file(
-            file_content,
-            file.filename or "unknown",
-            str(user_id),
-            media_type
-        )
+        # 2. Stream to disk: sniff + validate type from the first block,
+        #    hash incrementally and enforce the size limit mid-stream
+        media_info = await self.save_uploaded_stream(file, str(user_id))
+        media_type = media_info["media_type"]
 
         media_record = None
         if entry_id:
@@ -957,6 +936,28 @@ class MediaService:
 
         return full_path
 
+    def get_media_derivative_path(self, media: EntryMedia, width: int, fmt: str) -> Path:
+        """Get a resized derivative of an image, or of a video's thumbnail.
+
+        Args:
+            media: EntryMedia record
+            width: Requested width in pixels (snapped to supported widths)
+            fmt: Derivative format, see MediaDerivativeService.negotiate_format
+
+        Returns:
+            Path object to the cached derivative file
+
+        Raises:
+            MediaNotFoundError: If the media has no image to derive from
+        """
+        derivatives = MediaDerivativeService(self.media_root)
+        if media.media_type == MediaType.IMAGE:
+            return derivatives.get_derivative(self.get_media_file_path(media), media.id, width, fmt)
+        if media.media_type == MediaType.VIDEO:
+            poster_path = self.get_media_thumbnail_path(media)
+            return derivatives.get_derivative(poster_path, media.id, width, fmt, variant="poster")
+        raise MediaNotFoundError("No image derivative available for this media type")
+
     async def delete_media_by_id(self, media_id: uuid.UUID, user_id: uuid.UUID, session: Session) -> None:
         """Delete media by ID including database record and filesystem file.
 
@@ -988,6 +989,11 @@ class MediaService:
             except Exception as e:
                 log_error(f"Failed to delete thumbnail file: {e}")
 
+        try:
+            MediaDerivativeService(self.media_root).purge(media_id)
+        except Exception as e:
+            log_error(f"Failed to delete media derivatives: {e}")
+
         # Delete file from filesystem
         try:
             full_path = (self.media_root / file_path).resolve()
@@ -1,7 +1,6 @@
 """
 Mood service for handling mood-related operations.
 """
-import threading
 import uuid
 from datetime import datetime, date, timedelta
 from typing import List, Optional, Dict, Any
@@ -10,13 +9,17 @@ from zoneinfo import ZoneInfo
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select, func
 
+from app.core.analytics_cache import invalidate_analytics
+from app.core.reference_cache import MOODS_NAMESPACE, get_reference_cache, invalidate_reference_data
 from app.core.exceptions import MoodNotFoundError, EntryNotFoundError
 from app.core.logging_config import log_error
+from app.core.pagination import after_cursor, decode_cursor
 from app.core.time_utils import utc_now, local_date_for_user, ensure_utc, to_utc
 from app.models.entry import Entry
 from app.models.enums import MoodCategory
 from app.models.mood import Mood, MoodLog
-from app.schemas.mood import MoodLogCreate, MoodLogUpdate
+from app.schemas.mood import MoodLogCreate, MoodLogUpdate, MoodResponse
+from app.services.activity_rollup_service import ActivityDelta, ActivityRollupService
 
 DEFAULT_MOOD_PAGE_LIMIT = 50
 MAX_MOOD_PAGE_LIMIT = 100
@@ -25,56 +28,18 @@ MAX_MOOD_PAGE_LIMIT = 100
 class MoodService:
     """Service class for mood operations."""
 
-    _mood_cache: Dict[str, List[Mood]] = {}
-    _cache_lock = threading.RLock()
-
     def __init__(self, session: Session):
         self.session = session
 
     @staticmethod
-    def _cache_key(category: Optional[str] = None) -> str:
-        return category or "__all__"
-
-    @classmethod
-    def invalidate_mood_cache(cls) -> None:
-        """Clear the mood cache. Thread-safe."""
-        with cls._cache_lock:
-            cls._mood_cache.clear()
-
-    @classmethod
-    def _store_cache(cls, key: str, moods: List[Mood]) -> None:
-        """Store moods in cache. Thread-safe."""
-        with cls._cache_lock:
-            # Create copies to avoid session-related issues
-            cls._mood_cache[key] = [
-                Mood(
-                    id=mood.id,
-                    name=mood.name,
-                    icon=mood.icon,
-                    category=mood.category,
-                    created_at=mood.created_at,
-                    updated_at=mood.updated_at
-                ) for mood in moods
-            ]
-
-    @classmethod
-    def _get_cached_moods(cls, key: str) -> Optional[List[Mood]]:
-        """Get moods from cache. Thread-safe."""
-        with cls._cache_lock:
-            cached = cls._mood_cache.get(key)
-            if cached is None:
-                return None
-            # Return copies to avoid session-related issues
-            return [
-                Mood(
-                    id=mood.id,
-                    name=mood.name,
-                    icon=mood.icon,
-                    category=mood.category,
-                    created_at=mood.created_at,
-                    updated_at=mood.updated_at
-                ) for mood in cached
-            ]
+    def moods_cache_key(category: Optional[str] = None) -> str:
+        """Reference cache key of a mood listing."""
+        return category.lower() if category else "__all__"
+
+    @staticmethod
+    def invalidate_mood_cache() -> None:
+        """Drop cached mood listings in every worker."""
+        invalidate_reference_data(MOODS_NAMESPACE)
 
     @staticmethod
     def _normalize_limit(limit: int) -> int:
@@ -158,15 +123,8 @@ class MoodService:
     # Mood Management (System moods)
     def get_all_moods(self) -> List[Mood]:
         """Get all system moods."""
-        cache_key = self._cache_key()
-        cached = self._get_cached_moods(cache_key)
-        if cached is not None:
-            return cached
-
         statement = select(Mood).order_by(Mood.category, Mood.name)
-        moods = list(self.session.exec(statement))
-        self._store_cache(cache_key, moods)
-        return moods
+        return list(self.session.exec(statement))
 
     def get_mood_by_id(self, mood_id: uuid.UUID) -> Optional[Mood]:
         """Get a mood by ID."""
@@ -176,15 +134,16 @@ class MoodService:
     def get_moods_by_category(self, category: str) -> List[Mood]:
         """Get moods by category."""
         normalized = self._normalize_category(category)
-        cache_key = self._cache_key(normalized)
-        cached = self._get_cached_moods(cache_key)
-        if cached is not None:
-            return cached
-
         statement = select(Mood).where(Mood.category == normalized).order_by(Mood.name)
-        moods = list(self.session.exec(statement))
-        self._store_cache(cache_key, moods)
-        return moods
+        return list(self.session.exec(statement))
+
+    def get_moods_payload(self, category: Optional[str] = None) -> bytes:
+        """System moods (optionally one category) as cached, serialized ``MoodResponse`` JSON."""
+        def load() -> List[MoodResponse]:
+            moods = self.get_moods_by_category(category) if category else self.get_all_moods()
+            return [MoodResponse.model_validate(mood) for mood in moods]
+
+        return get_reference_cache().get_or_load(MOODS_NAMESPACE, self.moods_cache_key(category), load)
 
     def find_mood_by_name(self, mood_name: str) -> Optional[Mood]:
         """Find a mood by name with symbolic lookup support."""
@@ -273,7 +232,11 @@ class MoodService:
         )
 
         self.session.add(mood_log)
+        ActivityRollupService(self.session).apply(
+            user_id, ActivityDelta().add_moods(logged_date, mood.category)
+        )
         self._commit()
+        invalidate_analytics(user_id)
         self.session.refresh(mood_log)
         return mood_log
 
@@ -285,9 +248,16 @@ class MoodService:
         mood_id: Optional[uuid.UUID] = None,
         entry_id: Optional[uuid.UUID] = None,
         start_date: Optional[date] = None,
-        end_date: Optional[date] = None
+        end_date: Optional[date] = None,
+        cursor: Optional[str] = None
     ) -> List[MoodLog]:
-        """Get mood logs for a user with optional filters."""
+        """
+        Get mood logs for a user with optional filters, newest first.
+
+        Pass the ``cursor`` of the previous page (see ``mood_log_page_key``)
+        to continue after it; ``offset`` is ignored when a cursor is given.
+        """
+        sort_columns = (MoodLog.logged_datetime_utc, MoodLog.id)
         statement = select(MoodLog).where(MoodLog.user_id == user_id)
 
         if mood_id:
@@ -302,9 +272,21 @@ class MoodService:
         if end_date:
             statement = statement.where(MoodLog.logged_date <= end_date)
 
-        statement = statement.order_by(MoodLog.logged_datetime_utc.desc()).offset(offset).limit(self._normalize_limit(limit))
+        if cursor:
+            position = decode_cursor(cursor, (datetime, uuid.UUID))
+            statement = statement.where(after_cursor(sort_columns, position))
+            offset = 0
+
+        statement = statement.order_by(
+            *(column.desc() for column in sort_columns)
+        ).offset(offset).limit(self._normalize_limit(limit))
         return list(self.session.exec(statement))
 
+    @staticmethod
+    def mood_log_page_key(mood_log: MoodLog) -> tuple:
+        """Sort key of a mood log in ``get_user_mood_logs`` pages."""
+        return (mood_log.logged_datetime_utc, mood_log.id)
+
     def get_mood_log_by_id(self, mood_log_id: uuid.UUID, user_id: uuid.UUID) -> Optional[MoodLog]:
         """Get a specific mood log by ID for a user."""
         statement = select(MoodLog).where(
@@ -319,6 +301,10 @@ class MoodService:
         if not mood_log:
             raise MoodNotFoundError("Mood log not found")
 
+        rollups = ActivityRollupService(self.session)
+        old_mood_id = mood_log.mood_id
+        old_logged_date = mood_log.logged_date
+
         if mood_log_data.mood_id is not None:
             # Verify the new mood exists
             mood = self.get_mood_by_id(mood_log_data.mood_id)
@@ -344,7 +330,13 @@ class MoodService:
 
         mood_log.updated_at = utc_now()
         self.session.add(mood_log)
+        if mood_log.mood_id != old_mood_id or mood_log.logged_date != old_logged_date:
+            activity = ActivityDelta()
+            activity.add_moods(old_logged_date, rollups.mood_category(old_mood_id), -1)
+            activity.add_moods(mood_log.logged_date, rollups.mood_category(mood_log.mood_id), 1)
+            rollups.apply(user_id, activity)
         self._commit()
+        invalidate_analytics(user_id)
         self.session.refresh(mood_log)
         return mood_log
 
@@ -354,8 +346,14 @@ class MoodService:
         if not mood_log:
             raise MoodNotFoundError("Mood log not found")
 
+        rollups = ActivityRollupService(self.session)
+        rollups.apply(
+            user_id,
+            ActivityDelta().add_moods(mood_log.logged_date, rollups.mood_category(mood_log.mood_id), -1),
+        )
         self.session.delete(mood_log)
         self._commit()
+        invalidate_analytics(user_id)
         return True
 
     def get_mood_statistics(
@@ -555,6 +553,8 @@ class MoodService:
             if len(existing_logs) != len(mood_log_ids):
                 raise MoodNotFoundError("One or more mood logs not found")
 
+        rollups = ActivityRollupService(self.session)
+        activity = ActivityDelta()
         updated_logs = []
         for update_data in updates:
             mood_log_id = update_data.get('id')
@@ -570,6 +570,9 @@ class MoodService:
                 mood = self.get_mood_by_id(update_data['mood_id'])
                 if not mood:
                     raise MoodNotFoundError("Mood not found")
+                if mood_log.mood_id != mood.id:
+                    activity.add_moods(mood_log.logged_date, rollups.mood_category(mood_log.mood_id), -1)
+                    activity.add_moods(mood_log.logged_date, mood.category, 1)
                 mood_log.mood_id = update_data['mood_id']
 
             if 'note' in update_data:
@@ -579,7 +582,9 @@ class MoodService:
             self.session.add(mood_log)
             updated_logs.append(mood_log)
 
+        rollups.apply(user_id, activity)
         self._commit()
+        invalidate_analytics(user_id)
         return updated_logs
 
     def bulk_delete_mood_logs(self, user_id: uuid.UUID, mood_log_ids: List[uuid.UUID]) -> int:
@@ -599,8 +604,13 @@ class MoodService:
             raise MoodNotFoundError("One or more mood logs not found")
 
         # Delete all logs
+        rollups = ActivityRollupService(self.session)
+        activity = ActivityDelta()
         for mood_log in existing_logs:
+            activity.add_moods(mood_log.logged_date, rollups.mood_category(mood_log.mood_id), -1)
             self.session.delete(mood_log)
+        rollups.apply(user_id, activity)
 
         self._commit()
+        invalidate_analytics(user_id)
         return len(existing_logs)
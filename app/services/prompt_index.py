@@ -0,0 +1,113 @@
+"""
+In-memory prompt selection index.
+
+Random and daily prompts are picked from a per-worker snapshot of an
+owner's active prompts, bucketed by (category, difficulty level), so a
+selection is a constant-time pick without loading rows. Snapshots are tied
+to the prompts namespace version of the reference cache: any prompt write
+replaces the version and every worker rebuilds its snapshot on next use.
+
+Daily selection hashes the user and date with blake2b over prompts sorted
+by id, so every worker gives a user the same prompt for the day.
+"""
+import hashlib
+import random
+import threading
+import uuid
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.core.reference_cache import PROMPTS_NAMESPACE, ReferenceCache, get_reference_cache
+from app.schemas.prompt import PromptResponse
+
+# Owners (system plus users with own prompts) kept per worker
+MAX_INDEXED_OWNERS = 1024
+
+BucketKey = Tuple[Optional[str], Optional[int]]
+
+
+def stable_index(seed: str, size: int) -> int:
+    """Position in ``[0, size)`` derived from ``seed``, identical in every process."""
+    digest = hashlib.blake2b(seed.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % size
+
+
+@dataclass(frozen=True)
+class PromptSelection:
+    """Active prompts of one owner, bucketed for constant-time selection."""
+    buckets: Dict[BucketKey, Tuple[PromptResponse, ...]]
+
+    @classmethod
+    def build(cls, prompts: Iterable[PromptResponse]) -> "PromptSelection":
+        buckets: Dict[BucketKey, List[PromptResponse]] = defaultdict(list)
+        for prompt in sorted(prompts, key=lambda prompt: prompt.id.hex):
+            for key in (
+                (None, None),
+                (prompt.category, None),
+                (None, prompt.difficulty_level),
+                (prompt.category, prompt.difficulty_level),
+            ):
+                buckets[key].append(prompt)
+        return cls({key: tuple(bucket) for key, bucket in buckets.items()})
+
+    def __len__(self) -> int:
+        return len(self.buckets.get((None, None), ()))
+
+    def random(self, category: Optional[str] = None, difficulty_level: Optional[int] = None) -> Optional[PromptResponse]:
+        """Random prompt matching the filters (category already normalized)."""
+        bucket = self.buckets.get((category, difficulty_level))
+        return random.choice(bucket) if bucket else None
+
+    def daily(self, user_id: uuid.UUID, day: date) -> Optional[PromptResponse]:
+        """Deterministic prompt of the day for a user."""
+        bucket = self.buckets.get((None, None))
+        if not bucket:
+            return None
+        return bucket[stable_index(f"{user_id}_{day.isoformat()}", len(bucket))]
+
+
+class PromptIndex:
+    """Per-worker prompt selections, valid for one prompts namespace version."""
+
+    def __init__(self, reference_cache: Optional[ReferenceCache] = None, max_owners: int = MAX_INDEXED_OWNERS):
+        self._reference_cache = reference_cache
+        self.max_owners = max_owners
+        self._selections: "OrderedDict[Optional[uuid.UUID], Tuple[str, PromptSelection]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def version(self) -> Optional[str]:
+        """Current prompts version; selections are only kept while it is known."""
+        reference_cache = self._reference_cache or get_reference_cache()
+        return reference_cache.version(PROMPTS_NAMESPACE)
+
+    def get(self, owner_id: Optional[uuid.UUID]) -> Optional[PromptSelection]:
+        """Selection of an owner (None for system prompts) if built for the current version."""
+        version = self.version()
+        if version is None:
+            return None
+        with self._lock:
+            cached = self._selections.get(owner_id)
+            if cached is None or cached[0] != version:
+                return None
+            self._selections.move_to_end(owner_id)
+            return cached[1]
+
+    def put(self, owner_id: Optional[uuid.UUID], version: Optional[str], selection: PromptSelection) -> None:
+        """Keep a selection loaded after ``version`` was read."""
+        if version is None:
+            return
+        with self._lock:
+            self._selections[owner_id] = (version, selection)
+            self._selections.move_to_end(owner_id)
+            while len(self._selections) > self.max_owners:
+                self._selections.popitem(last=False)
+
+
+_prompt_index = PromptIndex()
+
+
+def get_prompt_index() -> PromptIndex:
+    """Get the process-wide prompt selection index."""
+    return _prompt_index
@@ -1,22 +1,23 @@
 """
 Prompt service for handling prompt-related operations.
 """
-import random
-import threading
 import uuid
 from typing import List, Optional, Dict, Any
 
+import sqlalchemy as sa
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select, func
 
 from app.core.exceptions import PromptNotFoundError
 from app.core.logging_config import log_error
+from app.core.reference_cache import PROMPTS_NAMESPACE, get_reference_cache, invalidate_reference_data
 from app.core.time_utils import utc_now
 from app.models.entry import Entry
 from app.models.enums import PromptCategory
 from app.models.journal import Journal
 from app.models.prompt import Prompt
-from app.schemas.prompt import PromptCreate, PromptUpdate
+from app.schemas.prompt import PromptCreate, PromptResponse, PromptUpdate
+from app.services.prompt_index import PromptSelection, get_prompt_index
 
 DEFAULT_PROMPT_PAGE_LIMIT = 50
 MAX_PROMPT_PAGE_LIMIT = 100
@@ -25,9 +26,6 @@ MAX_PROMPT_PAGE_LIMIT = 100
 class PromptService:
     """Service class for prompt operations."""
 
-    _system_prompt_cache: Dict[str, List[Prompt]] = {}
-    _cache_lock = threading.RLock()
-
     def __init__(self, session: Session):
         self.session = session
 
@@ -47,57 +45,15 @@ class PromptService:
             raise PromptNotFoundError(f"Invalid prompt category '{category}'") from exc
 
     @classmethod
-    def _cache_key(cls, *, category: Optional[str], difficulty_level: Optional[int], limit: int) -> str:
-        return f"{category or 'any'}::{difficulty_level or 'any'}::{limit}"
-
-    @classmethod
-    def invalidate_cache(cls) -> None:
-        """Clear the prompt cache. Thread-safe."""
-        with cls._cache_lock:
-            cls._system_prompt_cache.clear()
-
-    @classmethod
-    def _store_cache(cls, key: str, prompts: List[Prompt]) -> None:
-        """Store prompts in cache. Thread-safe."""
-        with cls._cache_lock:
-            # Create copies to avoid session-related issues
-            cls._system_prompt_cache[key] = [
-                Prompt(
-                    id=prompt.id,
-                    text=prompt.text,
-                    category=prompt.category,
-                    difficulty_level=prompt.difficulty_level,
-                    estimated_time_minutes=prompt.estimated_time_minutes,
-                    is_active=prompt.is_active,
-                    usage_count=prompt.usage_count,
-                    user_id=prompt.user_id,
-                    created_at=prompt.created_at,
-                    updated_at=prompt.updated_at
-                ) for prompt in prompts
-            ]
+    def prompts_cache_key(cls, *, category: Optional[str], difficulty_level: Optional[int], limit: int) -> str:
+        """Reference cache key of a system prompt listing."""
+        category = category.lower() if category else None
+        return f"{category or 'any'}::{difficulty_level or 'any'}::{cls._normalize_limit(limit)}"
 
-    @classmethod
-    def _get_cached_prompts(cls, key: str) -> Optional[List[Prompt]]:
-        """Get prompts from cache. Thread-safe."""
-        with cls._cache_lock:
-            cached = cls._system_prompt_cache.get(key)
-            if cached is None:
-                return None
-            # Return copies to avoid session-related issues
-            return [
-                Prompt(
-                    id=prompt.id,
-                    text=prompt.text,
-                    category=prompt.category,
-                    difficulty_level=prompt.difficulty_level,
-                    estimated_time_minutes=prompt.estimated_time_minutes,
-                    is_active=prompt.is_active,
-                    usage_count=prompt.usage_count,
-                    user_id=prompt.user_id,
-                    created_at=prompt.created_at,
-                    updated_at=prompt.updated_at
-                ) for prompt in cached
-            ]
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop cached system prompt listings in every worker."""
+        invalidate_reference_data(PROMPTS_NAMESPACE)
 
     def _commit(self) -> None:
         try:
@@ -269,25 +225,8 @@ class PromptService:
         if difficulty_level is not None:
             statement = statement.where(Prompt.difficulty_level == difficulty_level)
 
-        use_cache = user_id is None and is_active and offset == 0
-        cache_key = None
-        if use_cache:
-            cache_key = self._cache_key(
-                category=normalized_category,
-                difficulty_level=difficulty_level,
-                limit=limit
-            )
-            cached = self._get_cached_prompts(cache_key)
-            if cached is not None:
-                return cached
-
         statement = statement.order_by(Prompt.created_at.desc()).offset(offset).limit(limit)
-        prompts = list(self.session.exec(statement))
-
-        if use_cache and cache_key is not None:
-            self._store_cache(cache_key, prompts)
-
-        return prompts
+        return list(self.session.exec(statement))
 
     def get_system_prompts(
         self,
@@ -303,8 +242,45 @@ class PromptService:
             limit=limit
         )
 
+    def get_system_prompts_payload(
+        self,
+        category: Optional[str] = None,
+        difficulty_level: Optional[int] = None,
+        limit: int = 50
+    ) -> bytes:
+        """System prompts as cached, serialized ``PromptResponse`` JSON."""
+        def load() -> List[PromptResponse]:
+            prompts = self.get_system_prompts(category, difficulty_level, limit)
+            return [PromptResponse.model_validate(prompt) for prompt in prompts]
+
+        cache_key = self.prompts_cache_key(category=category, difficulty_level=difficulty_level, limit=limit)
+        return get_reference_cache().get_or_load(PROMPTS_NAMESPACE, cache_key, load)
 
-    def get_daily_prompt(self, user_id: uuid.UUID) -> Optional[Prompt]:
+
+    def get_prompt_selection(self, user_id: Optional[uuid.UUID] = None) -> PromptSelection:
+        """
+        Active prompts of an owner (system prompts when ``user_id`` is None)
+        as a selection index, built from the database on an index miss.
+        """
+        index = get_prompt_index()
+        selection = index.get(user_id)
+        if selection is not None:
+            return selection
+
+        version = index.version()
+        statement = select(Prompt).where(Prompt.is_active == True)
+        if user_id is not None:
+            statement = statement.where(Prompt.user_id == user_id)
+        else:
+            statement = statement.where(Prompt.user_id.is_(None))
+
+        selection = PromptSelection.build(
+            PromptResponse.model_validate(prompt) for prompt in self.session.exec(statement)
+        )
+        index.put(user_id, version, selection)
+        return selection
+
+    def get_daily_prompt(self, user_id: uuid.UUID) -> Optional[PromptResponse]:
         """Get a deterministic daily prompt for a user based on user ID and current date."""
         from app.services.user_service import UserService
         from app.core.time_utils import local_date_for_user
@@ -314,33 +290,12 @@ class PromptService:
         user_tz = user_service.get_user_timezone(user_id)
         today = local_date_for_user(utc_now(), user_tz)
 
-        # Get total count of active system prompts
-        count_statement = select(func.count(Prompt.id)).where(
-            Prompt.is_active == True,
-            Prompt.user_id.is_(None),
-        )
-        total_prompts = self.session.exec(count_statement).first()
-
-        if total_prompts == 0:
-            return None
-
-        # Create a deterministic seed based on user ID and current date
-        user_date_string = f"{user_id}_{today.isoformat()}"
-        hash_value = hash(user_date_string)
-        prompt_index = abs(hash_value) % total_prompts
-
-        # Get the specific prompt at the calculated index using OFFSET
-        statement = select(Prompt).where(
-            Prompt.is_active == True,
-            Prompt.user_id.is_(None),
-        ).offset(prompt_index).limit(1)
-
-        daily_prompt = self.session.exec(statement).first()
+        daily_prompt = self.get_prompt_selection().daily(user_id, today)
         if not daily_prompt:
             return None
 
         # Check if user has already answered today's prompt
-        existing_entry_statement = select(Entry).where(
+        existing_entry_statement = select(Entry.id).where(
             Entry.user_id == user_id,
             Entry.prompt_id == daily_prompt.id,
             Entry.entry_date == today,
@@ -358,43 +313,31 @@ class PromptService:
         user_id: Optional[uuid.UUID] = None,
         category: Optional[str] = None,
         difficulty_level: Optional[int] = None
-    ) -> Optional[Prompt]:
+    ) -> Optional[PromptResponse]:
         """Get a random prompt with optional filters."""
-        statement = select(Prompt).where(
-            Prompt.is_active == True,
-        )
-
-        if user_id is not None:
-            statement = statement.where(Prompt.user_id == user_id)
-        else:
-            statement = statement.where(Prompt.user_id.is_(None))
-
         normalized_category = self._normalize_category(category) if category else None
-        if normalized_category:
-            statement = statement.where(Prompt.category == normalized_category)
-
-        if difficulty_level is not None:
-            statement = statement.where(Prompt.difficulty_level == difficulty_level)
-
-        available_prompts = list(self.session.exec(statement))
-        if available_prompts:
-            return random.choice(available_prompts)
-        return None
-
-
+        return self.get_prompt_selection(user_id).random(normalized_category, difficulty_level)
 
     def increment_usage_count(self, prompt_id: uuid.UUID) -> Prompt:
-        """Increment the usage count for a prompt."""
-        prompt = self.get_prompt_by_id(prompt_id)
-        if not prompt:
-            raise PromptNotFoundError("Prompt not found")
+        """
+        Increment the usage count for a prompt.
 
-        prompt.usage_count += 1
-        prompt.updated_at = utc_now()
-        self.session.add(prompt)
+        A relative UPDATE, so concurrent uses are never lost. Cached prompt
+        listings are not invalidated for a counter change.
+        """
+        table = Prompt.__table__
+        result = self.session.execute(
+            sa.update(table)
+            .where(table.c.id == prompt_id)
+            .values(usage_count=table.c.usage_count + 1, updated_at=utc_now())
+        )
+        if result.rowcount == 0:
+            self.session.rollback()
+            raise PromptNotFoundError("Prompt not found")
         self._commit()
+
+        prompt = self.get_prompt_by_id(prompt_id)
         self.session.refresh(prompt)
-        self.invalidate_cache()
         return prompt
 
     def get_prompt_statistics(self, user_id: Optional[uuid.UUID] = None) -> Dict[str, Any]:
@@ -530,6 +473,7 @@ class PromptService:
             updated_prompts.append(prompt)
 
         self.session.commit()
+        self.invalidate_cache()
         return updated_prompts
 
     def bulk_delete_prompts(self, user_id: uuid.UUID, prompt_ids: List[uuid.UUID]) -> int:
@@ -564,4 +508,5 @@ class PromptService:
             deleted_count += 1
 
         self.session.commit()
+        self.invalidate_cache()
         return deleted_count
@@ -0,0 +1,138 @@
+"""
+In-memory tag autocomplete index.
+
+Each worker keeps, per user, the tag names sorted for prefix lookups with
+``bisect`` plus a trigram index for matches inside a name, so a suggestion
+never scans the tag table. Matches are ranked by usage count, then name.
+
+An index is tied to the user's tags namespace version in the reference
+cache; tag writes replace the version (``invalidate_tag_index``) and every
+worker rebuilds the user's index on next use.
+"""
+import heapq
+import threading
+import uuid
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core.reference_cache import ReferenceCache, get_reference_cache
+from app.schemas.tag import TagSuggestion
+
+# Users whose index is kept per worker
+MAX_INDEXED_USERS = 1024
+
+TAGS_NAMESPACE_PREFIX = "tags:"
+
+
+def tags_namespace(user_id: uuid.UUID) -> str:
+    """Reference cache namespace of a user's tags."""
+    return f"{TAGS_NAMESPACE_PREFIX}{user_id}"
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[position:position + 3] for position in range(len(text) - 2)}
+
+
+def _rank(tag: TagSuggestion) -> Tuple[int, str]:
+    return -tag.usage_count, tag.name
+
+
+class TagAutocomplete:
+    """Prefix and trigram index over one user's tag names."""
+
+    def __init__(self, tags: Iterable[TagSuggestion]):
+        self._tags: List[TagSuggestion] = sorted(tags, key=lambda tag: tag.name)
+        self._names = [tag.name for tag in self._tags]
+        self._trigrams: Dict[str, Set[int]] = defaultdict(set)
+        for position, name in enumerate(self._names):
+            for trigram in trigrams(name):
+                self._trigrams[trigram].add(position)
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def _prefix_range(self, prefix: str) -> range:
+        start = bisect_left(self._names, prefix)
+        end = bisect_left(self._names, prefix + "\uffff", lo=start)
+        return range(start, end)
+
+    def suggest(self, query: str, limit: int) -> List[TagSuggestion]:
+        """
+        Tags starting with ``query``, then (for queries of three or more
+        characters) tags containing it, each group ranked by usage.
+        """
+        query = query.strip().lower()
+        if not query or limit <= 0:
+            return []
+
+        prefix_range = self._prefix_range(query)
+        suggestions = heapq.nsmallest(limit, (self._tags[position] for position in prefix_range), key=_rank)
+        if len(suggestions) >= limit or len(query) < 3:
+            return suggestions
+
+        postings = sorted((self._trigrams.get(trigram, set()) for trigram in trigrams(query)), key=len)
+        candidates = set.intersection(*postings) if postings else set()
+        infix = (
+            self._tags[position] for position in candidates
+            if position not in prefix_range and query in self._names[position]
+        )
+        return suggestions + heapq.nsmallest(limit - len(suggestions), infix, key=_rank)
+
+
+class TagIndex:
+    """Per-worker tag autocomplete indexes, each valid for one version of a user's tags."""
+
+    def __init__(self, reference_cache: Optional[ReferenceCache] = None, max_users: int = MAX_INDEXED_USERS):
+        self._reference_cache = reference_cache
+        self.max_users = max_users
+        self._indexes: "OrderedDict[uuid.UUID, Tuple[str, TagAutocomplete]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _cache(self) -> ReferenceCache:
+        return self._reference_cache or get_reference_cache()
+
+    def version(self, user_id: uuid.UUID) -> Optional[str]:
+        """Current version of a user's tags; indexes are only kept while it is known."""
+        return self._cache().version(tags_namespace(user_id))
+
+    def get(self, user_id: uuid.UUID) -> Optional[TagAutocomplete]:
+        """Index of a user's tags if built for the current version."""
+        version = self.version(user_id)
+        if version is None:
+            return None
+        with self._lock:
+            cached = self._indexes.get(user_id)
+            if cached is None or cached[0] != version:
+                return None
+            self._indexes.move_to_end(user_id)
+            return cached[1]
+
+    def put(self, user_id: uuid.UUID, version: Optional[str], autocomplete: TagAutocomplete) -> None:
+        """Keep an index loaded after ``version`` was read."""
+        if version is None:
+            return
+        with self._lock:
+            self._indexes[user_id] = (version, autocomplete)
+            self._indexes.move_to_end(user_id)
+            while len(self._indexes) > self.max_users:
+                self._indexes.popitem(last=False)
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        """Make every worker rebuild a user's index after a committed tag write."""
+        self._cache().invalidate(tags_namespace(user_id))
+        with self._lock:
+            self._indexes.pop(user_id, None)
+
+
+_tag_index = TagIndex()
+
+
+def get_tag_index() -> TagIndex:
+    """Get the process-wide tag autocomplete index."""
+    return _tag_index
+
+
+def invalidate_tag_index(user_id: uuid.UUID) -> None:
+    """Drop a user's tag autocomplete index in every worker."""
+    get_tag_index().invalidate(user_id)
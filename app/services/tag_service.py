@@ -2,17 +2,25 @@
 Tag service for handling tag-related operations.
 """
 import uuid
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
 
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select, func
 
+from app.core.analytics_cache import invalidate_analytics
 from app.core.exceptions import TagNotFoundError
 from app.core.logging_config import log_error, log_info
+from app.core.pagination import after_cursor, decode_cursor
 from app.core.time_utils import utc_now
 from app.models.entry import Entry
 from app.models.tag import Tag, EntryTagLink
-from app.schemas.tag import TagCreate, TagUpdate
+from app.schemas.tag import TagCreate, TagSuggestion, TagUpdate
+from app.services.activity_rollup_service import ActivityDelta, ActivityRollupService
+from app.services.tag_index import TagAutocomplete, get_tag_index, invalidate_tag_index
 
 DEFAULT_TAG_PAGE_LIMIT = 50
 MAX_TAG_PAGE_LIMIT = 100
@@ -54,6 +62,7 @@ class TagService:
 
         self.session.add(tag)
         self._commit()
+        invalidate_tag_index(user_id)
         self.session.refresh(tag)
         return tag
 
@@ -117,6 +126,8 @@ class TagService:
         tag.updated_at = utc_now()
         self.session.add(tag)
         self._commit()
+        invalidate_analytics(user_id)
+        invalidate_tag_index(user_id)
         self.session.refresh(tag)
         return tag
 
@@ -142,6 +153,8 @@ class TagService:
             log_error(exc)
             raise
 
+        invalidate_analytics(user_id)
+        invalidate_tag_index(user_id)
         log_info(f"Tag hard-deleted for user {user_id}: {tag_id}")
         return True
 
@@ -171,12 +184,11 @@ class TagService:
         )
 
         self.session.add(link)
-
-        # Update tag usage count
-        tag.usage_count += 1
-        self.session.add(tag)
+        self._adjust_usage_counts([tag_id], 1)
+        self._apply_tag_usage(user_id, entry_id, tag_id, 1)
 
         self._commit()
+        invalidate_analytics(user_id)
         self.session.refresh(link)
         return link
 
@@ -198,15 +210,37 @@ class TagService:
         if link:
             # Hard delete the link
             self.session.delete(link)
-
-            # Update tag usage count
-            tag.usage_count = max(0, tag.usage_count - 1)
-            self.session.add(tag)
+            self._adjust_usage_counts([tag_id], -1)
+            self._apply_tag_usage(user_id, entry_id, tag_id, -1)
 
             self._commit()
+            invalidate_analytics(user_id)
             return True
         return False
 
+    def _adjust_usage_counts(self, tag_ids: List[uuid.UUID], delta: int) -> None:
+        """
+        Adjust usage counts in the database (caller commits).
+
+        A relative UPDATE, so concurrent requests cannot lose each other's
+        changes. Usage counts only rank tags, so the autocomplete index is
+        not invalidated for them; it catches up on the next tag write.
+        """
+        table = Tag.__table__
+        new_count = table.c.usage_count + delta
+        self.session.execute(
+            sa.update(table)
+            .where(table.c.id.in_(tag_ids))
+            .values(usage_count=sa.case((new_count > 0, new_count), else_=0), updated_at=utc_now())
+        )
+
+    def _apply_tag_usage(self, user_id: uuid.UUID, entry_id: uuid.UUID, tag_id: uuid.UUID, delta: int) -> None:
+        """Record a tag being added to or removed from an entry on the entry's day (caller commits)."""
+        entry_date = self.session.exec(
+            select(Entry.entry_date).where(Entry.id == entry_id, Entry.user_id == user_id)
+        ).first()
+        ActivityRollupService(self.session).apply(user_id, ActivityDelta().add_tag(entry_date, tag_id, delta))
+
     def get_entry_tags(self, entry_id: uuid.UUID, user_id: uuid.UUID) -> List[Tag]:
         """Get all tags for an entry"""
         statement = select(Tag).join(EntryTagLink).where(
@@ -220,18 +254,34 @@ class TagService:
         tag_id: uuid.UUID,
         user_id: uuid.UUID,
         limit: int = DEFAULT_TAG_PAGE_LIMIT,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> List[Entry]:
-        """Get entries that have a specific tag."""
+        """
+        Get entries that have a specific tag, newest first.
+
+        Pages follow ``EntryService.timeline_page_key``; ``offset`` is ignored
+        when a ``cursor`` is given.
+        """
         # Verify tag belongs to user
         tag = self.get_tag_by_id(tag_id, user_id)
         if not tag:
             raise TagNotFoundError("Tag not found")
 
+        sort_columns = (Entry.entry_datetime_utc, Entry.id)
         statement = select(Entry).join(EntryTagLink).where(
             EntryTagLink.tag_id == tag_id,
             Entry.user_id == user_id,
-        ).order_by(Entry.entry_datetime_utc.desc()).offset(offset).limit(limit)
+        )
+
+        if cursor:
+            position = decode_cursor(cursor, (datetime, uuid.UUID))
+            statement = statement.where(after_cursor(sort_columns, position))
+            offset = 0
+
+        statement = statement.order_by(
+            *(column.desc() for column in sort_columns)
+        ).offset(offset).limit(limit)
         return list(self.session.exec(statement))
 
     def get_tag_statistics(self, user_id: uuid.UUID) -> Dict[str, Any]:
@@ -277,43 +327,82 @@ class TagService:
             'average_usage': round(avg_usage, 2)
         }
 
+    def _insert(self, table: sa.Table):
+        """Dialect-specific INSERT supporting ON CONFLICT."""
+        dialect = self.session.get_bind().dialect.name
+        insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+        return insert(table)
+
+    @staticmethod
+    def _normalize_tag_names(tag_names: List[str]) -> List[str]:
+        """Lowercased, stripped, non-empty names in first-seen order."""
+        return list(dict.fromkeys(name.lower().strip() for name in tag_names if name.strip()))
+
+    def _resolve_tag_ids(self, user_id: uuid.UUID, names: List[str]) -> Tuple[Dict[str, uuid.UUID], bool]:
+        """
+        Map tag names to IDs, creating missing tags (caller commits).
+
+        One IN query finds existing tags; missing ones are inserted in one
+        ``INSERT ... ON CONFLICT DO NOTHING`` so a concurrent create of the
+        same name is not an error, and are then read back.
+
+        Returns:
+            ``(ids_by_name, created)``
+        """
+        if not names:
+            return {}, False
+
+        def lookup(lookup_names: List[str]) -> Dict[str, uuid.UUID]:
+            rows = self.session.exec(
+                select(Tag.name, Tag.id).where(Tag.user_id == user_id, Tag.name.in_(lookup_names))
+            )
+            return dict(rows.all())
+
+        ids_by_name = lookup(names)
+        missing = [name for name in names if name not in ids_by_name]
+        if not missing:
+            return ids_by_name, False
+
+        now = utc_now()
+        self.session.execute(
+            self._insert(Tag.__table__).values([
+                {"id": uuid.uuid4(), "name": name, "user_id": user_id, "usage_count": 0,
+                 "created_at": now, "updated_at": now}
+                for name in missing
+            ]).on_conflict_do_nothing(index_elements=["user_id", "name"])
+        )
+        ids_by_name.update(lookup(missing))
+        return ids_by_name, True
+
     def create_or_get_tags(self, user_id: uuid.UUID, tag_names: List[str]) -> List[Tag]:
         """Create tags if they don't exist, or get existing ones.
 
-        This method handles the race condition where multiple requests might try to create
-        the same tag simultaneously. It uses a try-catch pattern to handle unique constraint
-        violations gracefully by rolling back and fetching the existing tag.
+        Names are resolved set-based (see ``_resolve_tag_ids``) in a single
+        transaction, so tags created concurrently by another request are
+        picked up instead of failing on the unique constraint.
         """
-        tags = []
-        for name in tag_names:
-            if name.strip():
-                normalized_name = name.lower().strip()
-                # Try to get existing tag first
-                tag = self.get_tag_by_name(user_id, normalized_name)
-                if not tag:
-                    try:
-                        # Try to create the tag, handle unique constraint violation
-                        tag = Tag(
-                            name=normalized_name,
-                            user_id=user_id
-                        )
-                        self.session.add(tag)
-                        self._commit()
-                        self.session.refresh(tag)
-                    except Exception as e:
-                        # If creation fails (e.g., due to unique constraint), rollback and get existing
-                        self.session.rollback()
-                        tag = self.get_tag_by_name(user_id, normalized_name)
-                        if not tag:
-                            # If we still can't find it, something went wrong
-                            raise ValueError(f"Failed to create or find tag '{normalized_name}': {str(e)}")
-                tags.append(tag)
-        return tags
+        names = self._normalize_tag_names(tag_names)
+        if not names:
+            return []
+
+        ids_by_name, created = self._resolve_tag_ids(user_id, names)
+        self._commit()
+        if created:
+            invalidate_tag_index(user_id)
+
+        tags_by_id = {
+            tag.id: tag
+            for tag in self.session.exec(select(Tag).where(Tag.id.in_(list(ids_by_name.values()))))
+        }
+        return [tags_by_id[ids_by_name[name]] for name in names]
 
     def bulk_add_tags_to_entry(self, entry_id: uuid.UUID, tag_names: List[str], user_id: uuid.UUID) -> List[Tag]:
         """Add multiple tags to an entry by name.
 
         Creates tags if they don't exist, then associates them with the entry.
+        Tags are resolved set-based, links are inserted in one statement
+        (existing links are left alone) and usage counts of newly linked tags
+        are raised by one UPDATE, all in one transaction.
         Returns all tags that are associated with the entry after the operation.
         """
         # Verify entry exists and belongs to user
@@ -327,16 +416,38 @@ class TagService:
         if not entry:
             raise ValueError("Entry not found")
 
-        # Get or create tags
-        tags = self.create_or_get_tags(user_id, tag_names)
-
-        # Add each tag to the entry
-        for tag in tags:
+        names = self._normalize_tag_names(tag_names)
+        if names:
             try:
-                self.add_tag_to_entry(entry_id, tag.id, user_id)
-            except Exception:
-                # Tag already associated or other error, skip
-                pass
+                ids_by_name, created = self._resolve_tag_ids(user_id, names)
+
+                now = utc_now()
+                linked_tag_ids = list(self.session.execute(
+                    self._insert(EntryTagLink.__table__).values([
+                        {"entry_id": entry_id, "tag_id": tag_id, "created_at": now, "updated_at": now}
+                        for tag_id in ids_by_name.values()
+                    ]).on_conflict_do_nothing(
+                        index_elements=["entry_id", "tag_id"]
+                    ).returning(EntryTagLink.__table__.c.tag_id)
+                ).scalars())
+
+                if linked_tag_ids:
+                    self._adjust_usage_counts(linked_tag_ids, 1)
+                    activity = ActivityDelta()
+                    for tag_id in linked_tag_ids:
+                        activity.add_tag(entry.entry_date, tag_id)
+                    ActivityRollupService(self.session).apply(user_id, activity)
+
+                self.session.commit()
+            except SQLAlchemyError as exc:
+                self.session.rollback()
+                log_error(exc)
+                raise
+
+            if linked_tag_ids:
+                invalidate_analytics(user_id)
+            if created:
+                invalidate_tag_index(user_id)
 
         # Return all tags currently associated with the entry
         return self.get_entry_tags(entry_id, user_id)
@@ -348,3 +459,24 @@ class TagService:
             Tag.name.ilike(f"%{query}%"),
         ).order_by(Tag.usage_count.desc(), Tag.name.asc()).limit(limit)
         return list(self.session.exec(statement))
+
+    def get_tag_autocomplete(self, user_id: uuid.UUID) -> TagAutocomplete:
+        """A user's tag autocomplete index, built from the database on an index miss."""
+        index = get_tag_index()
+        autocomplete = index.get(user_id)
+        if autocomplete is not None:
+            return autocomplete
+
+        version = index.version(user_id)
+        rows = self.session.exec(
+            select(Tag.id, Tag.name, Tag.usage_count).where(Tag.user_id == user_id)
+        )
+        autocomplete = TagAutocomplete(
+            TagSuggestion(id=tag_id, name=name, usage_count=usage_count) for tag_id, name, usage_count in rows
+        )
+        index.put(user_id, version, autocomplete)
+        return autocomplete
+
+    def autocomplete_tags(self, user_id: uuid.UUID, query: str, limit: int = 10) -> List[TagSuggestion]:
+        """Tag suggestions for a partially typed name, most used first."""
+        return self.get_tag_autocomplete(user_id).suggest(query, limit)
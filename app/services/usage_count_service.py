@@ -0,0 +1,113 @@
+"""
+Reconciliation of denormalized usage counters.
+
+``Tag.usage_count`` and ``Prompt.usage_count`` are adjusted in place by
+atomic ``UPDATE ... SET usage_count = usage_count + :delta`` statements.
+Paths that bypass them (bulk imports, cascaded entry deletes, manual edits)
+leave drift behind; ``reconcile`` recomputes the counters from
+``entry_tag_link`` and ``entry.prompt_id`` in primary key chunks, fixes the
+rows that differ and reports the drift it found.
+"""
+import uuid
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional
+
+import sqlalchemy as sa
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session, select, func
+
+from app.core.logging_config import log_error, log_info, log_warning
+from app.models.entry import Entry
+from app.models.entry_tag_link import EntryTagLink
+from app.models.prompt import Prompt
+from app.models.tag import Tag
+
+DEFAULT_RECONCILE_BATCH_SIZE = 1000
+
+
+@dataclass
+class CounterDrift:
+    """Outcome of reconciling one counter column."""
+    checked: int = 0
+    corrected: int = 0
+    drift: int = 0  # Sum of absolute differences found
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class UsageCountService:
+    """Service class for reconciling tag and prompt usage counts."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def reconcile(self, batch_size: int = DEFAULT_RECONCILE_BATCH_SIZE) -> Dict[str, Dict[str, int]]:
+        """
+        Recompute tag and prompt usage counts, committing per chunk.
+
+        Returns:
+            Drift per counter, e.g. ``{"tags": {...}, "prompts": {...}}``
+        """
+        tags = self._reconcile(
+            Tag,
+            select(func.count()).select_from(EntryTagLink).where(EntryTagLink.tag_id == Tag.id),
+            batch_size,
+        )
+        prompts = self._reconcile(
+            Prompt,
+            select(func.count(Entry.id)).where(Entry.prompt_id == Prompt.id),
+            batch_size,
+        )
+
+        report = {"tags": tags.as_dict(), "prompts": prompts.as_dict()}
+        if tags.corrected or prompts.corrected:
+            log_warning(f"Usage count drift corrected: {report}")
+        else:
+            log_info(f"Usage counts reconciled without drift: {report}")
+        return report
+
+    def _reconcile(self, model: Any, actual_count: sa.Select, batch_size: int) -> CounterDrift:
+        table = model.__table__
+        actual = actual_count.scalar_subquery()
+        result = CounterDrift()
+        last_id: Optional[uuid.UUID] = None
+
+        while True:
+            statement = select(model.id, model.usage_count, actual).order_by(model.id).limit(batch_size)
+            if last_id is not None:
+                statement = statement.where(model.id > last_id)
+            rows = self.session.exec(statement).all()
+            if not rows:
+                break
+
+            corrections: List[Dict[str, Any]] = [
+                {"row_id": row_id, "expected": stored, "actual": count}
+                for row_id, stored, count in rows
+                if stored != count
+            ]
+            result.checked += len(rows)
+            result.corrected += len(corrections)
+            result.drift += sum(abs(item["expected"] - item["actual"]) for item in corrections)
+
+            if corrections:
+                # Only rows still holding the value read above, so a concurrent
+                # increment is not overwritten (it is picked up next run)
+                self._execute_chunk(
+                    sa.update(table)
+                    .where(table.c.id == sa.bindparam("row_id"), table.c.usage_count == sa.bindparam("expected"))
+                    .values(usage_count=sa.bindparam("actual")),
+                    corrections,
+                )
+            last_id = rows[-1][0]
+
+        return result
+
+    def _execute_chunk(self, statement: sa.Update, parameters: List[Dict[str, Any]]) -> None:
+        try:
+            self.session.execute(statement, parameters)
+            self.session.commit()
+        except SQLAlchemyError as exc:
+            self.session.rollback()
+            log_error(exc)
+            raise
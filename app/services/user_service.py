@@ -21,6 +21,7 @@ from app.core.exceptions import (
     UserSettingsNotFoundError,
 )
 from app.core.logging_config import log_error, log_warning, log_info
+from app.core.principal_cache import get_principal_cache
 from app.core.security import get_password_hash, verify_password
 from app.models.user import User, UserSettings
 from app.models.external_identity import ExternalIdentity
@@ -50,7 +51,7 @@ class UserService:
     def is_first_user(self) -> bool:
         try:
             if "sqlite" in str(self.session.bind.url).lower():
-                count = self.session.exec(select(func.count(User.id))).scalar() or 0
+                count = self.session.exec(select(func.count(User.id))).one() or 0
                 return count == 0
             statement = select(User.id).limit(1).with_for_update()
             result = self.session.exec(statement).first()
@@ -63,7 +64,7 @@ class UserService:
         return (
             self.session.exec(
                 select(func.count(User.id)).where(User.role == UserRole.ADMIN)
-            ).scalar()
+            ).one()
             or 0
         )
 
@@ -190,6 +191,7 @@ class UserService:
             log_error(exc, user_email=user.email)
             raise
 
+        get_principal_cache().invalidate(user.id)
         return user
 
     def delete_user(self, user_id: str, bypass_admin_check: bool = False) -> bool:
@@ -203,6 +205,7 @@ class UserService:
                 raise ValueError(msg)
 
         email = user.email
+        user_uuid = user.id
         self.session.delete(user)
 
         try:
@@ -212,6 +215,8 @@ class UserService:
             log_error(exc, user_email=email)
             raise
 
+        get_principal_cache().invalidate(user_uuid)
+
         log_info(f"User and related data deleted via cascade: {email}")
         return True
 
@@ -498,4 +503,5 @@ class UserService:
             log_error(exc, user_email=user.email)
             raise
 
+        get_principal_cache().invalidate(user.id)
         return user
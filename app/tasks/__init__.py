@@ -1,10 +1,18 @@
 """
 Celery tasks for async operations.
 """
+from .deletion_tasks import process_deletion_job, recover_deletion_jobs
 from .export_tasks import process_export_job
 from .import_tasks import process_import_job
+from .maintenance_tasks import reconcile_usage_counts
+from .media_tasks import process_media_job, recover_media_jobs
 
 __all__ = [
+    "process_deletion_job",
     "process_export_job",
     "process_import_job",
+    "process_media_job",
+    "reconcile_usage_counts",
+    "recover_deletion_jobs",
+    "recover_media_jobs",
 ]
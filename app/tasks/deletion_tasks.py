@@ -0,0 +1,46 @@
+"""
+Celery tasks for background journal deletion.
+"""
+from celery.signals import worker_ready
+from sqlmodel import Session
+
+from app.core.celery_app import celery_app
+from app.core.database import engine
+from app.core.logging_config import log_error
+from app.services.bulk_delete_service import (
+    BulkDeleteService,
+    deletion_retry_delay_seconds,
+    run_deletion_job,
+)
+
+
+@celery_app.task(name="app.tasks.deletion.process_deletion_job", bind=True, max_retries=None)
+def process_deletion_job(self, job_id: str):
+    """
+    Delete a queued journal in batches, recording progress on the job.
+
+    A redelivered task can find the job still RUNNING under a worker that
+    died; it retries until the job either finishes or goes stale and can be
+    claimed.
+
+    Args:
+        job_id: Deletion job ID (UUID string)
+    """
+    if run_deletion_job(job_id):
+        raise self.retry(countdown=deletion_retry_delay_seconds())
+
+
+@celery_app.task(name="app.tasks.deletion.recover_deletion_jobs")
+def recover_deletion_jobs():
+    """Re-queue deletion jobs that are pending or were interrupted mid-job."""
+    with Session(engine) as db:
+        return BulkDeleteService(db).recover_deletion_jobs()
+
+
+@worker_ready.connect
+def recover_deletion_jobs_on_startup(**kwargs):
+    """Re-queue deletion jobs that were pending or interrupted when workers stopped."""
+    try:
+        recover_deletion_jobs()
+    except Exception as e:
+        log_error(e, context="deletion_job_recovery")
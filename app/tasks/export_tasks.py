@@ -59,38 +59,28 @@ def process_export_job(job_id: str):
             job.set_progress(ProgressStages.EXPORT_BUILDING_DATA)
             db.commit()
 
-            # Create throttled progress callback for data building stage
-            # Progress range: 10% (BUILDING_DATA) to 50% (CREATING_ZIP)
+            # Create throttled progress callback for the streaming stage.
+            # Data and ZIP are written in one pass, so entries drive progress
+            # from 10% (BUILDING_DATA) to 90% (FINALIZING)
             handle_progress = create_throttled_progress_callback(
                 job=job,
                 db=db,
                 start_progress=ProgressStages.EXPORT_BUILDING_DATA,
-                end_progress=ProgressStages.EXPORT_CREATING_ZIP,
+                end_progress=ProgressStages.EXPORT_FINALIZING,
                 commit_interval=10,
                 percentage_threshold=5,
             )
 
-            # Build export data
-            export_data = export_service.build_export_data(
+            # Stream export data directly into the ZIP archive
+            zip_path, file_size, stats = export_service.stream_export_zip(
                 user_id=job.user_id,
                 export_type=job.export_type,
                 journal_ids=job.journal_ids,
+                include_media=job.include_media,
                 total_entries=total_entries,
                 progress_callback=handle_progress,
             )
 
-            # Update progress: Creating ZIP (ensure minimum, but don't regress)
-            current_progress = job.progress or ProgressStages.EXPORT_CREATING_ZIP
-            job.set_progress(max(current_progress, ProgressStages.EXPORT_CREATING_ZIP))
-            db.commit()
-
-            # Create ZIP archive
-            zip_path, file_size, stats = export_service.create_export_zip(
-                export_data=export_data,
-                user_id=job.user_id,
-                include_media=job.include_media,
-            )
-
             # Update progress: Finalizing (ensure minimum, but don't regress)
             current_progress = job.progress or ProgressStages.EXPORT_FINALIZING
             job.set_progress(max(current_progress, ProgressStages.EXPORT_FINALIZING))
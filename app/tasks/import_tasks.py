@@ -13,7 +13,7 @@ from app.models.import_job import ImportJob
 from app.models.enums import JobStatus, ImportSourceType
 from app.services.import_service import ImportService
 from app.utils.import_export.constants import ProgressStages
-from app.utils.import_export import validate_import_data
+from app.utils.import_export import validate_import_stream
 from app.utils.import_export.progress_utils import create_throttled_progress_callback
 
 
@@ -29,6 +29,7 @@ def process_import_job(self, job_id: str):
         Dictionary with import results
     """
     job_uuid = UUID(job_id)
+    media_source = None
 
     with Session(engine) as db:
         try:
@@ -54,14 +55,15 @@ def process_import_job(self, job_id: str):
             job.set_progress(ProgressStages.IMPORT_EXTRACTING)
             db.commit()
 
-            # Extract import data
+            # Open import archive; the JSON document is read incrementally and
+            # media files are streamed straight out of the ZIP
             file_path = Path(job.file_path)
-            data, media_dir = import_service.extract_import_data(file_path)
-            validation = validate_import_data(data, job.source_type.value)
+            reader, media_source = import_service.open_import_data(file_path)
+            validation = validate_import_stream(reader, job.source_type.value)
             if not validation.valid:
                 raise ValueError(f"Invalid import file: {validation.errors}")
 
-            total_entries = import_service.count_entries_in_data(data)
+            total_entries = reader.total_entries
             job.total_items = total_entries
             job.processed_items = 0
 
@@ -83,10 +85,10 @@ def process_import_job(self, job_id: str):
 
             # Import based on source type
             if job.source_type == ImportSourceType.JOURNIV:
-                summary = import_service.import_journiv_data(
+                summary = import_service.import_journiv_stream(
                     user_id=job.user_id,
-                    data=data,
-                    media_dir=media_dir,
+                    reader=reader,
+                    media_dir=media_source,
                     total_entries=total_entries,
                     progress_callback=handle_progress,
                 )
@@ -110,6 +112,7 @@ def process_import_job(self, job_id: str):
             db.commit()
 
             # Clean up temp files
+            media_source.close()
             import_service.cleanup_temp_files(file_path)
 
             log_info(
@@ -130,6 +133,8 @@ def process_import_job(self, job_id: str):
         except Exception as e:
             # Mark as failed
             user_id = None
+            if media_source is not None:
+                media_source.close()
             try:
                 job = db.query(ImportJob).filter(ImportJob.id == job_uuid).first()
                 if job:
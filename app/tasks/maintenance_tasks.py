@@ -0,0 +1,20 @@
+"""
+Celery tasks for periodic maintenance.
+"""
+from sqlmodel import Session
+
+from app.core.celery_app import celery_app
+from app.core.database import engine
+from app.services.usage_count_service import DEFAULT_RECONCILE_BATCH_SIZE, UsageCountService
+
+
+@celery_app.task(name="app.tasks.maintenance.reconcile_usage_counts")
+def reconcile_usage_counts(batch_size: int = DEFAULT_RECONCILE_BATCH_SIZE):
+    """
+    Recompute tag and prompt usage counts in chunks and report drift.
+
+    Args:
+        batch_size: Rows checked per chunk
+    """
+    with Session(engine) as session:
+        return UsageCountService(session).reconcile(batch_size)
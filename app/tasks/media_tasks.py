@@ -0,0 +1,42 @@
+"""
+Celery tasks for media processing.
+"""
+from celery.signals import worker_ready
+from sqlmodel import Session
+
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.database import engine
+from app.core.logging_config import log_error
+from app.services.file_processing_service import FileProcessingService, run_media_job
+
+
+@celery_app.task(name="app.tasks.media.process_media_job", bind=True, max_retries=None)
+def process_media_job(self, media_id: str):
+    """
+    Extract metadata and generate thumbnails for a queued media record.
+
+    Attempts are counted on the media record itself, so the task retries
+    for as long as the record is put back to PENDING.
+
+    Args:
+        media_id: EntryMedia ID (UUID string)
+    """
+    if run_media_job(media_id):
+        raise self.retry(countdown=settings.media_processing_retry_delay_seconds)
+
+
+@celery_app.task(name="app.tasks.media.recover_media_jobs")
+def recover_media_jobs():
+    """Re-queue media jobs that are pending or stuck in PROCESSING."""
+    with Session(engine) as db:
+        return FileProcessingService(db).recover_pending_media()
+
+
+@worker_ready.connect
+def recover_media_jobs_on_startup(**kwargs):
+    """Re-queue media jobs that were pending or interrupted when workers stopped."""
+    try:
+        recover_media_jobs()
+    except Exception as e:
+        log_error(e, context="media_job_recovery")
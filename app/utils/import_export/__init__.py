@@ -1,16 +1,20 @@
 """
 Import/Export utility modules.
 """
+from .export_reader import ExportDataReader
+from .export_writer import ExportDataWriter
 from .id_mapper import IDMapper
 from .media_handler import MediaHandler
-from .zip_handler import ZipHandler
+from .zip_handler import ZipHandler, ZipMediaReader
 from .date_utils import parse_datetime, ensure_utc, format_datetime, normalize_datetime
-from .validators import validate_import_data, validate_export_data
+from .validators import validate_import_data, validate_import_stream, validate_export_data
 from .progress_utils import create_throttled_progress_callback
 
 __all__ = [
     "create_throttled_progress_callback",
     "ensure_utc",
+    "ExportDataReader",
+    "ExportDataWriter",
     "format_datetime",
     "IDMapper",
     "MediaHandler",
@@ -18,5 +22,7 @@ __all__ = [
     "parse_datetime",
     "validate_export_data",
     "validate_import_data",
+    "validate_import_stream",
     "ZipHandler",
+    "ZipMediaReader",
 ]
@@ -0,0 +1,76 @@
+"""
+Batched multi-row INSERTs for import operations.
+
+Rows are buffered per table and written with ``insert(table).values([...])``
+so a large import costs one round trip per batch instead of one (or more)
+per row.
+"""
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import Table, insert
+from sqlalchemy.orm import Session
+
+# Stay well below the bind-parameter limits (SQLite 32766, PostgreSQL 65535)
+MAX_BIND_PARAMS = 30000
+
+
+class BulkInserter:
+    """
+    Buffer rows and insert them in batches.
+
+    ``tables`` lists every table that will receive rows, parents before
+    children. Buffers are always flushed together in that order, so a child
+    row never reaches the database before the parent row it references,
+    provided the parent row was added first.
+
+    Usage:
+        bulk = BulkInserter(db, [Entry.__table__, EntryTagLink.__table__], batch_size=500)
+        bulk.add(Entry.__table__, entry_row)
+        bulk.add(EntryTagLink.__table__, link_row)
+        bulk.flush()  # before commit
+    """
+
+    def __init__(self, db: Session, tables: Sequence[Table], batch_size: int = 500):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.db = db
+        self.tables = list(tables)
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self._buffers: Dict[Table, List[Dict[str, Any]]] = {table: [] for table in self.tables}
+
+    @staticmethod
+    def row_from_model(model: Any) -> Dict[str, Any]:
+        """Build a complete column dict from an (unsaved) SQLModel table instance."""
+        return {column.name: getattr(model, column.name) for column in model.__table__.columns}
+
+    def add(self, table: Table, row: Dict[str, Any]) -> None:
+        """Buffer a row; flushes all buffers once this table's batch is full."""
+        buffer = self._buffers[table]
+        buffer.append(row)
+        if len(buffer) >= self.batch_size:
+            self.flush()
+
+    def pending(self) -> int:
+        """Number of buffered rows not yet written."""
+        return sum(len(rows) for rows in self._buffers.values())
+
+    def flush(self) -> int:
+        """Write all buffered rows, parents first. Returns the number of rows written."""
+        written = 0
+        for table in self.tables:
+            rows = self._buffers[table]
+            if not rows:
+                continue
+            chunk_size = max(1, min(self.batch_size, MAX_BIND_PARAMS // len(table.columns)))
+            for start in range(0, len(rows), chunk_size):
+                self.db.execute(insert(table).values(rows[start:start + chunk_size]))
+            written += len(rows)
+            rows.clear()
+        self.rows_written += written
+        return written
+
+    def discard(self) -> None:
+        """Drop buffered rows without writing them (e.g. after a rollback)."""
+        for rows in self._buffers.values():
+            rows.clear()
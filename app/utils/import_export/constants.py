@@ -28,6 +28,9 @@ class ExportConfig:
     EXPORT_VERSION = "1.0"
     DATA_FILENAME = "data.json"
 
+    # Entries fetched per round trip when streaming an export
+    ENTRY_PAGE_SIZE = 200
+
 
 class ImportConfig:
     """Configuration constants for import operations."""
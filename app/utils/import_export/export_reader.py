@@ -0,0 +1,181 @@
+"""
+Incremental reader for the Journiv export document (data.json).
+
+Counterpart to ``ExportDataWriter``: parses the document as a stream of
+ijson events and materializes at most one entry at a time, so import memory
+is bounded by the largest single entry rather than the whole archive.
+"""
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import ijson
+
+# (kind, journal_index, payload) emitted while walking the document
+_WalkEvent = Tuple[str, int, Any]
+
+
+class ExportDataReader:
+    """
+    Read a Journiv export document without loading it into memory.
+
+    ``scan()`` makes a first pass that collects the top-level metadata and
+    each journal's own fields (everything except its entries) and counts the
+    entries. ``iter_journals()`` makes a second pass yielding each journal
+    together with an iterator over its entry dicts. Key order inside the
+    document does not matter, so exports written before streaming (mood
+    definitions after journals, journal timestamps after entries) are read
+    the same way.
+
+    Usage:
+        reader = ExportDataReader(data_path).scan()
+        for journal_fields, entries in reader.iter_journals():
+            for entry in entries:
+                ...
+    """
+
+    def __init__(self, data_path: Path):
+        self.data_path = Path(data_path)
+        self.metadata: Dict[str, Any] = {}
+        self.journals: Optional[List[Dict[str, Any]]] = None
+        self.entry_counts: List[int] = []
+        self._scanned = False
+
+    @property
+    def scanned(self) -> bool:
+        """Whether ``scan`` has completed."""
+        return self._scanned
+
+    @property
+    def total_entries(self) -> int:
+        """Total number of entries across all journals (requires ``scan``)."""
+        return sum(self.entry_counts)
+
+    def scan(
+        self,
+        entry_visitor: Optional[Callable[[int, int, Dict[str, Any]], None]] = None,
+    ) -> "ExportDataReader":
+        """
+        Collect metadata, journal fields and entry counts.
+
+        Args:
+            entry_visitor: Optional callback invoked as
+                ``(journal_index, entry_index, entry)`` for every entry, e.g.
+                to validate records during the same pass
+
+        Returns:
+            This reader, for chaining
+
+        Raises:
+            ValueError: If the document is not a JSON object
+            ijson.JSONError: If the document is not valid JSON
+        """
+        self.metadata = {}
+        self.journals = None
+        self.entry_counts = []
+
+        for kind, journal_index, payload in self._walk():
+            if kind == "field":
+                key, value = payload
+                self.metadata[key] = value
+            elif kind == "journals":
+                self.journals = []
+            elif kind == "journal_start":
+                self.journals.append({})
+                self.entry_counts.append(0)
+            elif kind == "journal_field":
+                key, value = payload
+                self.journals[journal_index][key] = value
+            elif kind == "entry":
+                if entry_visitor:
+                    entry_visitor(journal_index, self.entry_counts[journal_index], payload)
+                self.entry_counts[journal_index] += 1
+
+        self._scanned = True
+        return self
+
+    def iter_journals(self) -> Iterator[Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]]:
+        """
+        Yield ``(journal_fields, entries)`` for each journal in document order.
+
+        ``entries`` must be consumed before advancing to the next journal;
+        any entries left unread are skipped when the outer iterator advances.
+        """
+        if not self.scanned:
+            self.scan()
+
+        walk = self._walk()
+        for kind, journal_index, _ in walk:
+            if kind != "journal_start":
+                continue
+            entries = self._journal_entries(walk)
+            yield self.journals[journal_index], entries
+            for _ in entries:
+                pass
+
+    @staticmethod
+    def _journal_entries(walk: Iterator[_WalkEvent]) -> Iterator[Dict[str, Any]]:
+        for kind, _, payload in walk:
+            if kind == "journal_end":
+                return
+            if kind == "entry":
+                yield payload
+
+    def _walk(self) -> Iterator[_WalkEvent]:
+        """Walk the document, yielding top-level fields, journal boundaries and entries."""
+        with open(self.data_path, "rb") as data_file:
+            events = iter(ijson.parse(data_file, use_float=True))
+            _, event, _ = next(events, (None, None, None))
+            if event != "start_map":
+                raise ValueError("Export data must be a JSON object")
+
+            for _, event, key in events:
+                if event == "end_map":
+                    return
+                _, event, value = next(events)
+                if key == "journals" and event == "start_array":
+                    yield "journals", -1, None
+                    yield from self._walk_journals(events)
+                else:
+                    yield "field", -1, (key, self._build_value(events, event, value))
+
+    def _walk_journals(self, events: Iterator[Tuple[str, str, Any]]) -> Iterator[_WalkEvent]:
+        journal_index = -1
+        for _, event, _ in events:
+            if event == "end_array":
+                return
+            if event != "start_map":
+                raise ValueError("Each journal must be a JSON object")
+
+            journal_index += 1
+            yield "journal_start", journal_index, None
+            for _, event, key in events:
+                if event == "end_map":
+                    break
+                _, event, value = next(events)
+                if key == "entries" and event == "start_array":
+                    for _, event, value in events:
+                        if event == "end_array":
+                            break
+                        yield "entry", journal_index, self._build_value(events, event, value)
+                else:
+                    yield "journal_field", journal_index, (key, self._build_value(events, event, value))
+            yield "journal_end", journal_index, None
+
+    @staticmethod
+    def _build_value(events: Iterator[Tuple[str, str, Any]], event: str, value: Any) -> Any:
+        """Materialize the JSON value that starts with ``(event, value)``."""
+        if event not in ("start_map", "start_array"):
+            return value
+
+        builder = ijson.ObjectBuilder()
+        builder.event(event, value)
+        depth = 1
+        for _, event, value in events:
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+                if depth == 0:
+                    break
+        return builder.value
@@ -0,0 +1,82 @@
+"""
+Incremental writer for the Journiv export document (data.json).
+
+Writes the same JSON structure as ``JournivExportDTO.model_dump(mode="json")``
+one journal/entry at a time, so an export never has to be held in memory.
+Top-level metadata and mood definitions are written before the journals so
+the document can also be consumed incrementally on import.
+"""
+import json
+from typing import Any, Dict, TextIO
+
+
+class ExportDataWriter:
+    """
+    Stream a Journiv export document to a text stream.
+
+    Usage:
+        writer = ExportDataWriter(stream)
+        writer.begin({"export_version": "1.0", ..., "mood_definitions": [...]})
+        writer.begin_journal(journal_dict_without_entries)
+        writer.write_entry(entry_dict)
+        writer.end_journal()
+        writer.end({"stats": {...}})
+    """
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+        self._journals_written = 0
+        self._entries_in_journal = 0
+        self._in_journal = False
+
+    @staticmethod
+    def _dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False)
+
+    def _write_fields(self, fields: Dict[str, Any]) -> None:
+        self._stream.write(", ".join(f"{self._dumps(key)}: {self._dumps(value)}" for key, value in fields.items()))
+
+    def begin(self, metadata: Dict[str, Any]) -> None:
+        """Open the document, write top-level metadata and open the journals array."""
+        self._stream.write("{")
+        self._write_fields(metadata)
+        self._stream.write(', "journals": [' if metadata else '"journals": [')
+
+    def begin_journal(self, journal: Dict[str, Any]) -> None:
+        """Write a journal's fields (without entries) and open its entries array."""
+        if self._in_journal:
+            raise RuntimeError("Previous journal has not been closed")
+        if self._journals_written:
+            self._stream.write(", ")
+        self._stream.write("{")
+        self._write_fields(journal)
+        self._stream.write(', "entries": [' if journal else '"entries": [')
+        self._in_journal = True
+        self._entries_in_journal = 0
+
+    def write_entry(self, entry: Dict[str, Any]) -> None:
+        """Append one serialized entry to the current journal."""
+        if not self._in_journal:
+            raise RuntimeError("write_entry called outside of a journal")
+        if self._entries_in_journal:
+            self._stream.write(", ")
+        self._stream.write(self._dumps(entry))
+        self._entries_in_journal += 1
+
+    def end_journal(self) -> None:
+        """Close the current journal."""
+        if not self._in_journal:
+            raise RuntimeError("end_journal called outside of a journal")
+        self._stream.write("]}")
+        self._in_journal = False
+        self._journals_written += 1
+
+    def end(self, trailer: Dict[str, Any]) -> None:
+        """Close the journals array, write trailing fields and close the document."""
+        if self._in_journal:
+            raise RuntimeError("Current journal has not been closed")
+        self._stream.write("]")
+        if trailer:
+            self._stream.write(", ")
+            self._write_fields(trailer)
+        self._stream.write("}")
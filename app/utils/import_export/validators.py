@@ -3,8 +3,9 @@ Validation utilities for import/export data.
 
 Validates data structure and content before processing.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 from pydantic import ValidationError
+import ijson
 
 from app.schemas.dto import (
     JournivExportDTO,
@@ -13,6 +14,7 @@ from app.schemas.dto import (
     MediaDTO,
 )
 from app.core.logging_config import log_error
+from app.utils.import_export.export_reader import ExportDataReader
 
 
 class ValidationResult:
@@ -72,6 +74,119 @@ def validate_import_data(data: Dict[str, Any], source_type: str) -> ValidationRe
     return result
 
 
+def validate_import_stream(reader: ExportDataReader, source_type: str) -> ValidationResult:
+    """
+    Validate import data read incrementally from an export document.
+
+    Scans the document once (populating the reader's metadata, journal
+    fields and entry counts) and validates every record on the way, so an
+    invalid file is rejected before anything is imported.
+
+    Args:
+        reader: Reader over the extracted data file
+        source_type: Source type (journiv/markdown/dayone)
+
+    Returns:
+        ValidationResult with any errors or warnings
+    """
+    if source_type.lower() == "journiv":
+        return validate_journiv_export_stream(reader)
+
+    result = ValidationResult()
+    try:
+        reader.scan()
+    except (ValueError, ijson.JSONError) as e:
+        result.add_error(f"Invalid import data: {e}")
+        return result
+
+    outline = dict(reader.metadata)
+    if reader.journals is not None:
+        outline["journals"] = reader.journals
+    return validate_basic_structure(outline)
+
+
+def validate_journiv_export_stream(reader: ExportDataReader) -> ValidationResult:
+    """
+    Validate Journiv export format one entry at a time.
+
+    Equivalent to ``validate_journiv_export`` but never materializes more
+    than a single entry.
+
+    Args:
+        reader: Reader over the extracted data file
+
+    Returns:
+        ValidationResult
+    """
+    result = ValidationResult()
+    journal_entry_dates: Dict[int, Set[str]] = {}
+    duplicate_date_journals: Set[int] = set()
+
+    def merge(record_result: ValidationResult):
+        result.errors.extend(record_result.errors)
+        result.warnings.extend(record_result.warnings)
+        if record_result.has_errors():
+            result.valid = False
+
+    def visit_entry(journal_index: int, entry_index: int, entry: Dict[str, Any]):
+        context = f"Journal {journal_index + 1}, Entry {entry_index + 1}"
+        try:
+            entry_dto = EntryDTO(**entry)
+        except ValidationError as e:
+            result.add_error(f"{context}: Invalid entry: {e}")
+            return
+
+        seen_dates = journal_entry_dates.setdefault(journal_index, set())
+        entry_date = entry_dto.entry_date.isoformat()
+        if entry_date in seen_dates:
+            duplicate_date_journals.add(journal_index)
+        seen_dates.add(entry_date)
+
+        merge(validate_entry(entry_dto, context))
+
+    try:
+        reader.scan(entry_visitor=visit_entry)
+    except (ValueError, ijson.JSONError) as e:
+        result.add_error(f"Invalid export format: {e}")
+        log_error(e, context="export_validation")
+        return result
+
+    # Journals are validated individually below; only check top-level fields here
+    header = dict(reader.metadata)
+    if reader.journals is not None:
+        header["journals"] = []
+    try:
+        JournivExportDTO(**header)
+    except ValidationError as e:
+        result.add_error(f"Invalid export format: {e}")
+        log_error(e, context="export_validation")
+        return result
+
+    journals = reader.journals or []
+    if not journals:
+        result.add_warning("Export contains no journals")
+
+    if reader.total_entries == 0:
+        result.add_warning("Export contains no entries")
+
+    journal_titles = [str(journal.get("title", "")).lower() for journal in journals]
+    if len(journal_titles) != len(set(journal_titles)):
+        result.add_warning("Export contains duplicate journals")
+
+    for idx, journal in enumerate(journals):
+        context = f"Journal {idx + 1}"
+        try:
+            journal_dto = JournalDTO(**journal)
+        except ValidationError as e:
+            result.add_error(f"{context}: Invalid journal: {e}")
+            continue
+        if idx in duplicate_date_journals:
+            result.add_warning(f"{context}: Contains entries with duplicate dates")
+        merge(validate_journal(journal_dto, context))
+
+    return result
+
+
 def validate_export_data(data: Dict[str, Any]) -> ValidationResult:
     """
     Validate export data before creating ZIP.
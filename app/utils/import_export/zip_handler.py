@@ -3,10 +3,12 @@ ZIP file handling utilities for import/export.
 
 Handles creation and extraction of ZIP archives for data exports/imports.
 """
+import io
+import shutil
 import zipfile
 import json
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, BinaryIO, Callable, TextIO
 
 from app.core.logging_config import log_warning, log_error
 
@@ -89,6 +91,55 @@ class ZipHandler:
             log_error(e, output_path=str(output_path))
             raise IOError(f"ZIP creation failed: {e}") from e
 
+    @staticmethod
+    def create_streaming_export_zip(
+        output_path: Path,
+        write_data: Callable[[TextIO], Dict[str, Path]],
+        data_filename: str = "data.json",
+    ) -> int:
+        """
+        Create a ZIP archive for export, streaming the JSON data member.
+
+        ``write_data`` receives a text stream opened directly on the data
+        member inside the archive and returns the media files to add
+        afterwards as ``{relative_path: source_file_path}``. Nothing is
+        buffered in memory or staged in a temporary file, and the layout is
+        the same as ``create_export_zip``.
+
+        Args:
+            output_path: Path for output ZIP file
+            write_data: Callback that writes the JSON document and returns media files
+            data_filename: Name for the JSON data file
+
+        Returns:
+            Total size of created ZIP file in bytes
+
+        Raises:
+            IOError: If ZIP creation fails
+        """
+        try:
+            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                with zipf.open(data_filename, 'w', force_zip64=True) as raw_stream:
+                    with io.TextIOWrapper(raw_stream, encoding="utf-8") as text_stream:
+                        media_files = write_data(text_stream)
+
+                for relative_path, source_path in (media_files or {}).items():
+                    if source_path.exists():
+                        zipf.write(source_path, f"media/{relative_path}")
+                    else:
+                        log_warning(f"Media file not found: {source_path}", source_path=str(source_path))
+
+            return output_path.stat().st_size
+
+        except ValueError:
+            # Validation failures from write_data are not I/O errors
+            output_path.unlink(missing_ok=True)
+            raise
+        except Exception as e:
+            log_error(e, output_path=str(output_path))
+            output_path.unlink(missing_ok=True)
+            raise IOError(f"ZIP creation failed: {e}") from e
+
     @staticmethod
     def extract_zip(
         zip_path: Path,
@@ -174,6 +225,86 @@ class ZipHandler:
             log_error(e, zip_path=str(zip_path), extract_to=str(extract_to))
             raise IOError(f"Extraction failed: {e}") from e
 
+    @staticmethod
+    def open_import_zip(
+        zip_path: Path,
+        extract_to: Path,
+        max_size_mb: int = 500,
+        data_filename: str = "data.json",
+    ) -> Dict[str, Any]:
+        """
+        Prepare a ZIP archive for import without extracting media.
+
+        Only the data file is written to ``extract_to``. Media members stay in
+        the archive and are read on demand through the returned
+        ``ZipMediaReader``, so each member is decompressed exactly once. No
+        upfront ``testzip()`` pass is made: CRCs are verified as each member
+        is read to the end.
+
+        Args:
+            zip_path: Path to ZIP file
+            extract_to: Directory to write the data file to
+            max_size_mb: Maximum allowed uncompressed size
+            data_filename: Name of the JSON data file inside the archive
+
+        Returns:
+            Dictionary with:
+            {
+                "data_file": Path to the extracted data file,
+                "media": ZipMediaReader over the media/ members (caller closes),
+                "total_size": Total uncompressed size in bytes,
+                "file_count": Number of members in the archive
+            }
+
+        Raises:
+            ValueError: If ZIP is invalid, too large or unsafe
+            IOError: If the data file cannot be extracted
+        """
+        try:
+            media_reader = ZipMediaReader(zip_path)
+        except zipfile.BadZipFile as e:
+            raise ValueError(f"Invalid ZIP file: {e}") from e
+
+        try:
+            infos = media_reader.zip_file.infolist()
+
+            total_size = sum(info.file_size for info in infos)
+            max_bytes = max_size_mb * 1024 * 1024
+            if total_size > max_bytes:
+                raise ValueError(
+                    f"ZIP too large: {total_size / (1024*1024):.1f}MB "
+                    f"(max: {max_size_mb}MB)"
+                )
+
+            # Nothing but the data file is written to disk under its member
+            # name, but reject unsafe paths the same way extract_zip does
+            for info in infos:
+                if ".." in Path(info.filename).parts or info.filename.startswith("/"):
+                    raise ValueError(f"ZIP contains unsafe path: {info.filename}")
+
+            if data_filename not in media_reader.zip_file.namelist():
+                raise ValueError(f"ZIP missing {data_filename} file")
+
+            extract_to.mkdir(parents=True, exist_ok=True)
+            data_file = extract_to / data_filename
+            with media_reader.zip_file.open(data_filename) as src, open(data_file, "wb") as dst:
+                shutil.copyfileobj(src, dst, ZipMediaReader.CHUNK_SIZE)
+
+            return {
+                "data_file": data_file,
+                "media": media_reader,
+                "total_size": total_size,
+                "file_count": len(infos),
+            }
+
+        except ValueError:
+            media_reader.close()
+            raise
+        except Exception as e:
+            media_reader.close()
+            log_error(e, zip_path=str(zip_path), extract_to=str(extract_to))
+            raise IOError(f"Extraction failed: {e}") from e
+
     @staticmethod
     def validate_zip_structure(zip_path: Path) -> Dict[str, Any]:
         """
@@ -273,3 +404,53 @@ class ZipHandler:
                 return zipf.namelist()
         except zipfile.BadZipFile as e:
             raise ValueError(f"Invalid ZIP file: {e}") from e
+
+
+class ZipMediaReader:
+    """
+    Read the ``media/`` members of an import archive without extracting them.
+
+    Paths are relative to ``media/``, matching ``MediaDTO.file_path``. The
+    archive stays open until ``close()``; use as a context manager.
+    """
+
+    MEDIA_PREFIX = "media/"
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, zip_path: Path):
+        self.zip_path = Path(zip_path)
+        self.zip_file = zipfile.ZipFile(self.zip_path, "r")
+        self._members: Dict[str, zipfile.ZipInfo] = {
+            info.filename[len(self.MEDIA_PREFIX):]: info
+            for info in self.zip_file.infolist()
+            if info.filename.startswith(self.MEDIA_PREFIX) and not info.is_dir()
+        }
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, relative_path: str) -> bool:
+        return relative_path in self._members
+
+    def open(self, relative_path: str) -> BinaryIO:
+        """
+        Open a media member for streaming reads.
+
+        Raises:
+            KeyError: If the member does not exist
+            zipfile.BadZipFile: While reading, if the member fails its CRC check
+        """
+        return self.zip_file.open(self._members[relative_path])
+
+    def describe(self, relative_path: str) -> str:
+        """Human-readable location of a member, for log messages."""
+        return f"{self.zip_path.name}:{self.MEDIA_PREFIX}{relative_path}"
+
+    def close(self) -> None:
+        self.zip_file.close()
+
+    def __enter__(self) -> "ZipMediaReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,11 @@
+"""
+Gunicorn settings, loaded automatically from the working directory.
+
+Command line flags in the Docker entrypoints still take precedence.
+"""
+from app.core.metrics import mark_process_dead
+
+
+def child_exit(server, worker):
+    """Drop the live gauges of an exited worker from the shared metrics directory."""
+    mark_process_dead(worker.pid)
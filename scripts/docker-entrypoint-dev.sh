@@ -7,6 +7,11 @@ mkdir -p /data/media /data/logs
 echo "Running database migrations in entrypoint script..."
 alembic upgrade head
 
+echo "Preparing the Prometheus metrics directory..."
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/data/metrics/app}"
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
 echo "Seeding initial data in entrypoint script..."
 SKIP_DATA_SEEDING=false python -c "from app.core.database import seed_initial_data; seed_initial_data()"
 
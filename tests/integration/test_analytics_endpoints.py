@@ -248,6 +248,44 @@ def test_productivity_metrics_compare_current_and_last_month(
     assert metrics["entry_growth_percentage"] == expected_growth
 
 
+def test_activity_heatmap_covers_the_requested_year(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    analytics_dataset: AnalyticsSeedData,
+):
+    """The heatmap should report daily entry, word and mood counts for one year."""
+    year = date.today().year
+    heatmap = api_client.request(
+        "GET",
+        "/analytics/heatmap",
+        token=api_user.access_token,
+        params={"year": year},
+    ).json()
+
+    assert heatmap["year"] == year
+    by_day = {item["date"]: item for item in heatmap["days"]}
+    expected_days = {
+        day: stats
+        for day, stats in analytics_dataset.entries_by_day.items()
+        if day.startswith(str(year))
+    }
+    for day, expected in expected_days.items():
+        assert by_day[day]["entry_count"] == expected["entry_count"]
+        assert by_day[day]["word_count"] == expected["total_words"]
+    for day in analytics_dataset.mood_dates:
+        assert by_day[day]["mood_count"] == 1
+    assert heatmap["active_days"] == len(expected_days)
+    assert heatmap["total_entries"] == sum(stats["entry_count"] for stats in expected_days.values())
+
+    previous_year = api_client.request(
+        "GET",
+        "/analytics/heatmap",
+        token=api_user.access_token,
+        params={"year": year - 2},
+    ).json()
+    assert previous_year["days"] == []
+
+
 def test_journal_analytics_break_down_activity_per_journal(
     api_client: JournivApiClient,
     api_user: ApiUser,
@@ -296,6 +334,7 @@ def test_analytics_requires_authentication(api_client: JournivApiClient):
             EndpointCase("GET", "/analytics/productivity"),
             EndpointCase("GET", "/analytics/journals"),
             EndpointCase("GET", "/analytics/dashboard"),
+            EndpointCase("GET", "/analytics/heatmap"),
         ],
     )
 
@@ -68,6 +68,39 @@ def test_entry_listing_supports_pagination(
     assert first_page[0]["id"] != second_page[0]["id"]
 
 
+
+def test_journal_entry_listing_supports_cursor_pagination(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    journal_factory,
+    entry_factory,
+):
+    """Journal listing pages through X-Next-Cursor without skipping or repeating entries."""
+    journal = journal_factory()
+    created = [entry_factory(journal=journal) for _ in range(3)]
+    pinned = api_client.pin_entry(api_user.access_token, created[1]["id"])
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = api_client.request(
+            "GET", f"/entries/journal/{journal['id']}", token=api_user.access_token, params=params
+        )
+        assert response.status_code == 200
+        seen.extend(entry["id"] for entry in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        params = {"limit": 2, "cursor": cursor}
+
+    assert seen[0] == pinned["id"]
+    assert sorted(seen) == sorted(entry["id"] for entry in created)
+
+    invalid = api_client.request(
+        "GET", "/entries/", token=api_user.access_token, params={"cursor": "not-a-cursor"}
+    )
+    assert invalid.status_code == 400
+
 def test_update_entry_adjusts_metadata(
     api_client: JournivApiClient,
     api_user: ApiUser,
@@ -287,6 +320,49 @@ def test_entry_search_and_date_range_filters(
     assert earlier["id"] not in returned_ids
 
 
+def test_entry_search_ranks_title_matches_and_supports_prefixes(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    journal_factory,
+    entry_factory,
+):
+    """Full-text search should prefix-match, rank title hits first, and track updates."""
+    journal = journal_factory(title="Search Journal")
+    today = date.today().isoformat()
+
+    content_hit = entry_factory(
+        journal=journal,
+        title="Evening notes",
+        content="Finally tried the Zephyrine trail today",
+        entry_date=today,
+    )
+    title_hit = entry_factory(
+        journal=journal,
+        title="Zephyrine plans",
+        content="Packing list for the weekend",
+        entry_date=today,
+    )
+
+    def search(query: str):
+        return api_client.request(
+            "GET",
+            "/entries/search",
+            token=api_user.access_token,
+            params={"q": query},
+        ).json()
+
+    results = search("zephyr")
+    assert [entry["id"] for entry in results] == [title_hit["id"], content_hit["id"]]
+
+    api_client.update_entry(
+        api_user.access_token,
+        content_hit["id"],
+        {"content": "Rewritten without the keyword"},
+    )
+    assert [entry["id"] for entry in search("zephyr")] == [title_hit["id"]]
+    assert [entry["id"] for entry in search("rewrit keyw")] == [content_hit["id"]]
+
+
 def test_journal_listing_respects_pinned_flag(
     api_client: JournivApiClient,
     api_user: ApiUser,
@@ -0,0 +1,178 @@
+"""
+Integration tests for the journal and writing streak stats kept up to date
+by entry writes (entry count, total words, last entry time).
+"""
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from tests.lib import ApiUser, JournivApiClient
+
+
+def _content_with_words(word_count: int) -> str:
+    """Create deterministic entry content with a predictable word count."""
+    return " ".join(f"word{idx}" for idx in range(word_count))
+
+
+def _utc(value: Optional[str]) -> Optional[datetime]:
+    if value is None:
+        return None
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _journal_entries(api_client: JournivApiClient, token: str, journal_id: str) -> List[Dict]:
+    return api_client.request(
+        "GET", f"/entries/journal/{journal_id}", token=token, params={"limit": 100}
+    ).json()
+
+
+def _assert_stats(
+    api_client: JournivApiClient,
+    token: str,
+    journal: Dict,
+    *,
+    entry_count: int,
+    total_words: int,
+    last_entry: Optional[Dict],
+) -> None:
+    """The journal's stats match the expected values and a recount of its entries."""
+    current = api_client.get_journal(token, journal["id"])
+    entries = _journal_entries(api_client, token, journal["id"])
+
+    assert current["entry_count"] == entry_count == len(entries)
+    assert current["total_words"] == total_words == sum(entry["word_count"] for entry in entries)
+    expected_last = _utc(last_entry["entry_datetime_utc"]) if last_entry else None
+    assert _utc(current["last_entry_at"]) == expected_last
+    assert expected_last == max((_utc(entry["entry_datetime_utc"]) for entry in entries), default=None)
+
+
+def _assert_streak_totals(api_client: JournivApiClient, token: str, *, total_entries: int, total_words: int) -> None:
+    streak = api_client.request("GET", "/analytics/writing-streak", token=token).json()
+    assert streak["total_entries"] == total_entries
+    assert streak["total_words"] == total_words
+
+
+def _create_entry(api_client: JournivApiClient, token: str, journal: Dict, entry_date: date, words: int) -> Dict:
+    return api_client.create_entry(
+        token,
+        journal_id=journal["id"],
+        title=f"Entry {entry_date.isoformat()}",
+        content=_content_with_words(words),
+        entry_date=entry_date.isoformat(),
+        entry_timezone="UTC",
+    )
+
+
+def test_create_updates_journal_and_streak_stats(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    journal_factory,
+):
+    journal = journal_factory(title="Stats Journal")
+    token = api_user.access_token
+    today = date.today()
+
+    _assert_stats(api_client, token, journal, entry_count=0, total_words=0, last_entry=None)
+
+    latest = _create_entry(api_client, token, journal, today, 5)
+    _assert_stats(api_client, token, journal, entry_count=1, total_words=5, last_entry=latest)
+    _assert_streak_totals(api_client, token, total_entries=1, total_words=5)
+
+    # A backdated entry does not move last_entry_at back
+    _create_entry(api_client, token, journal, today - timedelta(days=3), 7)
+    _assert_stats(api_client, token, journal, entry_count=2, total_words=12, last_entry=latest)
+    _assert_streak_totals(api_client, token, total_entries=2, total_words=12)
+
+
+def test_content_edit_adjusts_words_only(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    journal_factory,
+):
+    journal = journal_factory(title="Stats Journal")
+    token = api_user.access_token
+    today = date.today()
+    older = _create_entry(api_client, token, journal, today - timedelta(days=1), 10)
+    latest = _create_entry(api_client, token, journal, today, 4)
+
+    api_client.update_entry(token, older["id"], {"content": _content_with_words(3)})
+    _assert_stats(api_client, token, journal, entry_count=2, total_words=7, last_entry=latest)
+    _assert_streak_totals(api_client, token, total_entries=2, total_words=7)
+
+    api_client.update_entry(token, latest["id"], {"content": _content_with_words(12)})
+    _assert_stats(api_client, token, journal, entry_count=2, total_words=15, last_entry=latest)
+    _assert_streak_totals(api_client, token, total_entries=2, total_words=15)
+
+
+def test_redating_onto_and_off_the_latest_entry(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    journal_factory,
+):
+    journal = journal_factory(title="Stats Journal")
+    token = api_user.access_token
+    today = date.today()
+    older = _create_entry(api_client, token, journal, today - timedelta(days=4), 6)
+    middle = _create_entry(api_client, token, journal, today - timedelta(days=2), 6)
+    latest = _create_entry(api_client, token, journal, today, 6)
+
+    # Re-date the oldest entry onto the latest entry's moment
+    moved = api_client.update_entry(
+        token, older["id"], {"entry_datetime_utc": latest["entry_datetime_utc"]}
+    )
+    _assert_stats(api_client, token, journal, entry_count=3, total_words=18, last_entry=moved)
+    assert _utc(moved["entry_datetime_utc"]) == _utc(latest["entry_datetime_utc"])
+
+    # Move both latest entries into the past; last_entry_at falls back to the middle entry
+    api_client.update_entry(token, older["id"], {"entry_date": (today - timedelta(days=5)).isoformat()})
+    api_client.update_entry(token, latest["id"], {"entry_date": (today - timedelta(days=6)).isoformat()})
+    _assert_stats(api_client, token, journal, entry_count=3, total_words=18, last_entry=middle)
+    _assert_streak_totals(api_client, token, total_entries=3, total_words=18)
+
+
+def test_moving_an_entry_between_journals(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    journal_factory,
+):
+    source = journal_factory(title="Source Journal")
+    target = journal_factory(title="Target Journal")
+    token = api_user.access_token
+    today = date.today()
+    remaining = _create_entry(api_client, token, source, today - timedelta(days=2), 3)
+    moved = _create_entry(api_client, token, source, today, 8)
+    target_entry = _create_entry(api_client, token, target, today - timedelta(days=1), 5)
+
+    api_client.update_entry(token, moved["id"], {"journal_id": target["id"]})
+
+    _assert_stats(api_client, token, source, entry_count=1, total_words=3, last_entry=remaining)
+    _assert_stats(api_client, token, target, entry_count=2, total_words=13, last_entry=moved)
+    _assert_streak_totals(api_client, token, total_entries=3, total_words=16)
+
+    # Moving it back with a content change in the same request
+    api_client.update_entry(
+        token, moved["id"], {"journal_id": source["id"], "content": _content_with_words(2)}
+    )
+    _assert_stats(api_client, token, source, entry_count=2, total_words=5, last_entry=moved)
+    _assert_stats(api_client, token, target, entry_count=1, total_words=5, last_entry=target_entry)
+    _assert_streak_totals(api_client, token, total_entries=3, total_words=10)
+
+
+def test_deleting_the_latest_entry(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    journal_factory,
+):
+    journal = journal_factory(title="Stats Journal")
+    token = api_user.access_token
+    today = date.today()
+    older = _create_entry(api_client, token, journal, today - timedelta(days=3), 9)
+    latest = _create_entry(api_client, token, journal, today, 4)
+
+    api_client.delete_entry(token, latest["id"])
+    _assert_stats(api_client, token, journal, entry_count=1, total_words=9, last_entry=older)
+    _assert_streak_totals(api_client, token, total_entries=1, total_words=9)
+
+    api_client.delete_entry(token, older["id"])
+    _assert_stats(api_client, token, journal, entry_count=0, total_words=0, last_entry=None)
+    _assert_streak_totals(api_client, token, total_entries=0, total_words=0)
@@ -91,6 +91,7 @@ def test_journal_endpoints_require_auth(api_client: JournivApiClient):
         [
             EndpointCase("GET", "/journals/"),
             EndpointCase("GET", "/journals/favorites"),
+            EndpointCase("GET", f"/journals/deletions/{UNKNOWN_UUID}"),
             EndpointCase(
                 "POST",
                 "/journals/",
@@ -124,5 +125,6 @@ def test_journal_not_found_errors(
             EndpointCase("POST", f"/journals/{UNKNOWN_UUID}/favorite"),
             EndpointCase("POST", f"/journals/{UNKNOWN_UUID}/archive"),
             EndpointCase("POST", f"/journals/{UNKNOWN_UUID}/unarchive"),
+            EndpointCase("GET", f"/journals/deletions/{UNKNOWN_UUID}"),
         ],
     )
@@ -444,3 +444,46 @@ def test_case_g_deleting_all_entries_from_day_breaks_streak(
     assert analytics_after["streak_start_date"] == nov_23.isoformat()
     assert analytics_after["last_entry_date"] == nov_23.isoformat()
 
+
+
+def test_moving_entry_date_recalculates_streak(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    journal_factory,
+):
+    """Changing an entry's date should update the per-day counts behind the streak."""
+    journal = journal_factory(title="Streak Test Journal")
+    token = api_user.access_token
+
+    base_date = date.today()
+    for offset in (3, 2):
+        api_client.create_entry(
+            token,
+            journal_id=journal["id"],
+            title=f"Entry {offset}",
+            content=_content_with_words(5),
+            entry_date=(base_date - timedelta(days=offset)).isoformat(),
+            entry_timezone="UTC",
+        )
+    moving = api_client.create_entry(
+        token,
+        journal_id=journal["id"],
+        title="Moving entry",
+        content=_content_with_words(5),
+        entry_date=(base_date - timedelta(days=10)).isoformat(),
+        entry_timezone="UTC",
+    )
+
+    api_client.update_entry(
+        token,
+        moving["id"],
+        {"entry_date": (base_date - timedelta(days=1)).isoformat()},
+    )
+
+    analytics = api_client.request(
+        "GET", "/analytics/writing-streak", token=token
+    ).json()
+    assert analytics["current_streak"] == 3
+    assert analytics["longest_streak"] == 3
+    assert analytics["last_entry_date"] == (base_date - timedelta(days=1)).isoformat()
+    assert analytics["streak_start_date"] == (base_date - timedelta(days=3)).isoformat()
@@ -128,6 +128,64 @@ def test_tag_listing_search_and_statistics(
     assert isinstance(analytics.get("most_used_tags", []), list)
 
 
+def test_bulk_tagging_is_idempotent(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    entry_factory,
+):
+    """Re-sending tag names links each tag once and counts each use once."""
+    entry = entry_factory(title="Bulk tagged entry")
+    for names in (["Hiking", " outdoors ", "hiking", ""], ["outdoors", "summit"]):
+        api_client.request(
+            "POST",
+            f"/tags/entry/{entry['id']}/bulk",
+            token=api_user.access_token,
+            json=names,
+            expected=(200,),
+        )
+
+    entry_tags = api_client.request(
+        "GET", f"/tags/entry/{entry['id']}", token=api_user.access_token
+    ).json()
+    assert sorted(tag["name"] for tag in entry_tags) == ["hiking", "outdoors", "summit"]
+    assert all(tag["usage_count"] == 1 for tag in entry_tags)
+
+
+def test_tag_autocomplete_follows_tag_writes(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    entry_factory,
+):
+    """Autocomplete ranks prefix matches by usage and reflects new tags right away."""
+    entry = entry_factory(title="Autocomplete entry")
+    api_client.create_tag(api_user.access_token, name="running", color="#22C55E")
+    rust = api_client.create_tag(api_user.access_token, name="rust", color="#64748B")
+    api_client.request(
+        "POST",
+        f"/tags/entry/{entry['id']}/tag/{rust['id']}",
+        token=api_user.access_token,
+        expected=(201,),
+    )
+
+    suggestions = api_client.request(
+        "GET",
+        "/tags/autocomplete",
+        token=api_user.access_token,
+        params={"q": "ru"},
+    ).json()
+    assert [tag["name"] for tag in suggestions] == ["rust", "running"]
+    assert suggestions[0]["usage_count"] == 1
+
+    api_client.create_tag(api_user.access_token, name="trail-running", color="#F97316")
+    suggestions = api_client.request(
+        "GET",
+        "/tags/autocomplete",
+        token=api_user.access_token,
+        params={"q": "running"},
+    ).json()
+    assert [tag["name"] for tag in suggestions] == ["running", "trail-running"]
+
+
 def test_tag_endpoints_require_auth(api_client: JournivApiClient):
     """All tag routes must enforce authentication."""
     assert_requires_authentication(
@@ -141,6 +199,7 @@ def test_tag_endpoints_require_auth(api_client: JournivApiClient):
             ),
             EndpointCase("GET", "/tags/popular"),
             EndpointCase("GET", "/tags/search", params={"q": "focus"}),
+            EndpointCase("GET", "/tags/autocomplete", params={"q": "focus"}),
             EndpointCase("GET", "/tags/statistics"),
             EndpointCase("GET", "/tags/analytics/statistics"),
             EndpointCase("GET", f"/tags/entry/{UNKNOWN_UUID}"),
@@ -0,0 +1,99 @@
+"""
+Unit tests for the versioned analytics cache.
+"""
+import asyncio
+import uuid
+from datetime import date
+
+from app.core.analytics_cache import AnalyticsCache
+from app.core.cache import AsyncInMemoryCache, InMemoryCache
+
+
+class _BlockingCache:
+    """Sync backend that must not be used on the event loop."""
+
+    def set(self, *args, **kwargs):
+        raise AssertionError("blocking cache write on the event loop")
+
+
+def _compute(result, calls):
+    async def compute():
+        calls.append(1)
+        return result
+    return compute
+
+
+class TestAnalyticsCache:
+    """Test hits, write-driven invalidation and the first-read version handshake."""
+
+    def test_repeat_loads_are_served_from_cache(self):
+        cache = AnalyticsCache(InMemoryCache(), ttl_seconds=60)
+        user_id = uuid.uuid4()
+        calls = []
+        compute = _compute({"last_entry_date": date(2025, 1, 2)}, calls)
+
+        # The first read only starts the user's version
+        asyncio.run(cache.get_or_compute(user_id, "writing_streak", {}, compute))
+        first = asyncio.run(cache.get_or_compute(user_id, "writing_streak", {}, compute))
+        second = asyncio.run(cache.get_or_compute(user_id, "writing_streak", {}, compute))
+
+        assert len(calls) == 2
+        assert first == second == {"last_entry_date": "2025-01-02"}
+
+    def test_invalidate_outdates_cached_results(self):
+        cache = AnalyticsCache(InMemoryCache(), ttl_seconds=60)
+        user_id = uuid.uuid4()
+        cache.invalidate(user_id)
+        _, version = asyncio.run(cache.get(user_id, "journals", {}))
+        asyncio.run(cache.put(user_id, "journals", {}, version, {"journals": []}))
+
+        cache.invalidate(user_id)
+
+        assert asyncio.run(cache.get(user_id, "journals", {}))[0] is None
+
+    def test_result_computed_across_a_write_is_not_served(self):
+        cache = AnalyticsCache(InMemoryCache(), ttl_seconds=60)
+        user_id = uuid.uuid4()
+        cache.invalidate(user_id)
+        _, version = asyncio.run(cache.get(user_id, "dashboard", {"days": 30}))
+
+        # A write commits while the result is being computed
+        cache.invalidate(user_id)
+        asyncio.run(cache.put(user_id, "dashboard", {"days": 30}, version, {"summary": {}}))
+
+        assert asyncio.run(cache.get(user_id, "dashboard", {"days": 30}))[0] is None
+
+    def test_params_and_users_are_isolated(self):
+        cache = AnalyticsCache(InMemoryCache(), ttl_seconds=60)
+        user_id, other_id = uuid.uuid4(), uuid.uuid4()
+        cache.invalidate(user_id)
+        _, version = asyncio.run(cache.get(user_id, "writing_patterns", {"days": 30}))
+        asyncio.run(cache.put(user_id, "writing_patterns", {"days": 30}, version, {"period_days": 30}))
+
+        assert asyncio.run(cache.get(user_id, "writing_patterns", {"days": 7}))[0] is None
+        assert asyncio.run(cache.get(other_id, "writing_patterns", {"days": 30}))[0] is None
+        assert asyncio.run(cache.get(user_id, "writing_patterns", {"days": 30}))[0] == {"period_days": 30}
+
+    def test_disabled_without_backend(self):
+        cache = AnalyticsCache(None, ttl_seconds=60)
+        user_id = uuid.uuid4()
+
+        cache.invalidate(user_id)
+
+        assert asyncio.run(cache.get(user_id, "journals", {})) == (None, None)
+
+    def test_invalidate_on_event_loop_does_not_use_sync_backend(self):
+        cache = AnalyticsCache(_BlockingCache(), ttl_seconds=60, async_cache=AsyncInMemoryCache())
+        user_id = uuid.uuid4()
+
+        async def write_read_write():
+            cache.invalidate(user_id)
+            await cache.flush_invalidations()
+            _, version = await cache.get(user_id, "journals", {})
+            await cache.put(user_id, "journals", {}, version, {"journals": []})
+            before = (await cache.get(user_id, "journals", {}))[0]
+            cache.invalidate(user_id)
+            await cache.flush_invalidations()
+            return before, (await cache.get(user_id, "journals", {}))[0]
+
+        assert asyncio.run(write_read_write()) == ({"journals": []}, None)
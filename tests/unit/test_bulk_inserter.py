@@ -0,0 +1,63 @@
+"""
+Unit tests for batched bulk inserts.
+"""
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, MetaData, String, Table, create_engine, event, select
+from sqlalchemy.orm import Session
+
+from app.utils.import_export.bulk_inserter import BulkInserter
+
+metadata = MetaData()
+parent = Table("parent", metadata, Column("id", Integer, primary_key=True), Column("name", String))
+child = Table(
+    "child",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("parent_id", Integer, ForeignKey("parent.id"), nullable=False),
+)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    event.listen(engine, "connect", lambda conn, _: conn.execute("PRAGMA foreign_keys=ON"))
+    metadata.create_all(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    with Session(engine) as session:
+        session.statements = statements
+        yield session
+
+
+class TestBulkInserter:
+    """Test buffering and batch flushing."""
+
+    def test_batches_rows_and_flushes_parents_first(self, db):
+        bulk = BulkInserter(db, [parent, child], batch_size=3)
+
+        for index in range(4):
+            bulk.add(parent, {"id": index, "name": f"p{index}"})
+            bulk.add(child, {"id": index, "parent_id": index})
+        # The third parent filled its batch and flushed both tables
+        assert bulk.pending() == 3
+
+        bulk.flush()
+        db.commit()
+
+        assert bulk.rows_written == 8
+        assert db.execute(select(child.c.parent_id)).scalars().all() == [0, 1, 2, 3]
+        inserts = [sql for sql in db.statements if sql.startswith("INSERT")]
+        assert len(inserts) == 4
+
+    def test_discard_drops_buffered_rows(self, db):
+        bulk = BulkInserter(db, [parent], batch_size=10)
+        bulk.add(parent, {"id": 1, "name": "dropped"})
+
+        bulk.discard()
+
+        assert bulk.flush() == 0
+        assert db.execute(select(parent)).all() == []
+
+    def test_rejects_invalid_batch_size(self, db):
+        with pytest.raises(ValueError):
+            BulkInserter(db, [parent], batch_size=0)
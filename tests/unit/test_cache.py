@@ -0,0 +1,91 @@
+"""
+Unit tests for the cache backends.
+"""
+import time
+
+import fakeredis.aioredis
+
+from app.core.cache import AsyncInMemoryCache, AsyncRedisCache, InMemoryCache
+
+
+class TestInMemoryCache:
+    """Test LRU bounds, expiry and counters of the in-memory cache."""
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = InMemoryCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        assert cache.get_many(["a", "b", "c"]) == [1, None, 3]
+        assert cache.stats.evictions == 1
+
+    def test_memory_bound_evicts_oldest_entries(self):
+        cache = InMemoryCache(max_entries=100, max_bytes=100)
+        cache.set("first", "x" * 40)
+        cache.set("second", "y" * 40)
+
+        cache.set("third", "z" * 40)
+
+        assert cache.get("first") is None
+        assert cache.get("third") == "z" * 40
+        assert cache.size_bytes <= 100
+
+    def test_overwrite_replaces_size(self):
+        cache = InMemoryCache(max_entries=10)
+        cache.set("key", "x" * 100)
+        cache.set("key", "x")
+
+        assert len(cache) == 1
+        assert cache.size_bytes < 20
+
+    def test_sweep_drops_expired_entries_that_are_never_read(self, monkeypatch):
+        cache = InMemoryCache()
+        cache.set("oidc:abandoned", {"nonce": "n"}, ex=180)
+        cache.set("kept", 1)
+
+        later = time.monotonic() + 181
+        monkeypatch.setattr("app.core.cache.time.monotonic", lambda: later)
+
+        assert cache.sweep() == 1
+        assert len(cache) == 1
+        assert cache.stats.expirations == 1
+
+    def test_hits_and_misses_are_counted(self):
+        cache = InMemoryCache()
+        cache.set("a", 1)
+
+        cache.get("a")
+        cache.get_many(["a", "missing"])
+
+        assert cache.stats.as_dict()["hits"] == 2
+        assert cache.stats.misses == 1
+
+
+class TestAsyncCaches:
+    """Test the async cache interface used by the OIDC endpoints."""
+
+    async def test_redis_cache_round_trips_with_pipelined_writes(self):
+        cache = AsyncRedisCache(fakeredis.aioredis.FakeRedis(decode_responses=True))
+
+        await cache.set_many({"a": {"x": 1}, "b": [2]}, ex=60)
+        await cache.set("c", "three")
+
+        assert await cache.get_many(["a", "b", "missing"]) == [{"x": 1}, [2], None]
+        assert await cache.get("c") == "three"
+        await cache.delete("c")
+        assert await cache.get("c") is None
+        assert cache.stats.hits == 3
+        assert cache.stats.misses == 2
+        await cache.close()
+
+    async def test_in_memory_fallback_matches_interface(self):
+        cache = AsyncInMemoryCache(InMemoryCache())
+
+        await cache.set("ticket:1", {"user": "u"}, ex=60)
+
+        assert await cache.get("ticket:1") == {"user": "u"}
+        await cache.delete("ticket:1")
+        assert await cache.get_many(["ticket:1"]) == [None]
@@ -3,6 +3,8 @@ Unit tests for app.core.config module, specifically testing DB_DRIVER validation
 """
 import pytest
 from pydantic import ValidationError
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
 
 from app.core.config import Settings, DEFAULT_SQLITE_URL
 
@@ -223,3 +225,58 @@ class TestDBDriverValidation:
             )
         assert "DB_DRIVER=postgres requires either DATABASE_URL" in str(exc_info.value)
 
+
+
+class TestAsyncDatabaseURL:
+    """Test rewriting of the database URL for async drivers."""
+
+    def test_sqlite_url_uses_aiosqlite(self):
+        settings = Settings(
+            secret_key="test-secret-key-for-testing-only-32-chars",
+            database_url="sqlite:////data/journiv.db",
+        )
+        assert settings.effective_async_database_url == "sqlite+aiosqlite:////data/journiv.db"
+
+    def test_postgres_url_uses_asyncpg(self):
+        settings = Settings(
+            secret_key="test-secret-key-for-testing-only-32-chars",
+            db_driver="postgres",
+            database_url="postgresql+psycopg2://journiv:secret@db:5432/journiv",
+            postgres_password=None,
+        )
+        assert (
+            settings.effective_async_database_url
+            == "postgresql+asyncpg://journiv:secret@db:5432/journiv"
+        )
+
+    def test_libpq_parameters_are_translated_for_asyncpg(self):
+        settings = Settings(
+            secret_key="test-secret-key-for-testing-only-32-chars",
+            db_driver="postgres",
+            database_url=(
+                "postgresql://journiv:secret@db:5432/journiv"
+                "?sslmode=require&connect_timeout=10&application_name=journiv"
+                "&channel_binding=require&command_timeout=30"
+            ),
+            postgres_password=None,
+        )
+        async_url = settings.effective_async_database_url
+
+        assert async_url == "postgresql+asyncpg://journiv:secret@db:5432/journiv?command_timeout=30"
+        assert settings.async_database_connect_args == {
+            "ssl": "require",
+            "timeout": 10.0,
+            "server_settings": {"application_name": "journiv"},
+        }
+        _, connect_kwargs = create_async_engine(async_url).dialect.create_connect_args(make_url(async_url))
+        assert "sslmode" not in connect_kwargs and "channel_binding" not in connect_kwargs
+
+    def test_sslmode_disable_turns_ssl_off(self):
+        settings = Settings(
+            secret_key="test-secret-key-for-testing-only-32-chars",
+            db_driver="postgres",
+            database_url="postgresql://journiv:secret@db:5432/journiv?sslmode=disable",
+            postgres_password=None,
+        )
+        assert settings.effective_async_database_url == "postgresql+asyncpg://journiv:secret@db:5432/journiv"
+        assert settings.async_database_connect_args == {"ssl": False}
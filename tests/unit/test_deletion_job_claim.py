@@ -0,0 +1,63 @@
+"""
+Unit tests for claiming background journal deletion jobs.
+"""
+import uuid
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, create_engine
+
+from app.core.time_utils import utc_now
+from app.models.deletion_job import DeletionJob
+from app.models.enums import JobStatus
+from app.models.user import User
+from app.services.bulk_delete_service import BulkDeleteService
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    User.__table__.create(engine)
+    DeletionJob.__table__.create(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def _job(db, status=JobStatus.PENDING, updated_at=None):
+    job = DeletionJob(user_id=uuid.uuid4(), journal_id=uuid.uuid4(), status=status)
+    if updated_at is not None:
+        job.updated_at = updated_at
+    db.add(job)
+    db.commit()
+    return job.id
+
+
+class TestClaimDeletionJob:
+    """Test that a deletion job is only ever claimed by one worker."""
+
+    def test_pending_job_is_claimed_once(self, db):
+        job_id = _job(db)
+        service = BulkDeleteService(db)
+
+        claimed = service.claim_deletion_job(job_id)
+
+        assert claimed is not None and claimed.status == JobStatus.RUNNING
+        assert service.claim_deletion_job(job_id) is None
+
+    def test_only_stale_running_jobs_are_reclaimed(self, db):
+        live_id = _job(db, JobStatus.RUNNING)
+        stale_id = _job(db, JobStatus.RUNNING, utc_now() - timedelta(days=1))
+        service = BulkDeleteService(db)
+
+        assert service.claim_deletion_job(live_id) is None
+        assert service.claim_deletion_job(stale_id) is not None
+
+    def test_live_running_job_is_retried_later(self, db):
+        live_id = _job(db, JobStatus.RUNNING)
+        done_id = _job(db, JobStatus.COMPLETED)
+        service = BulkDeleteService(db)
+
+        assert service.process_deletion_job(live_id) is True
+        assert service.process_deletion_job(done_id) is False
+        assert service.process_deletion_job(uuid.uuid4()) is False
@@ -0,0 +1,157 @@
+"""
+Unit tests for the incremental export reader and stream validation.
+"""
+import json
+import zipfile
+
+import pytest
+
+from app.utils.import_export import ExportDataReader, ZipHandler, validate_import_stream
+from app.utils.import_export.export_writer import ExportDataWriter
+
+TIMESTAMP = "2025-01-01T00:00:00Z"
+
+
+def _entry(title: str, entry_date: str = "2025-01-01") -> dict:
+    return {
+        "title": title,
+        "content": f"{title} body",
+        "entry_date": entry_date,
+        "entry_datetime_utc": TIMESTAMP,
+        "entry_timezone": "UTC",
+        "created_at": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+    }
+
+
+def _journal(title: str, entries: list) -> dict:
+    return {"title": title, "entries": entries, "created_at": TIMESTAMP, "updated_at": TIMESTAMP}
+
+
+def _legacy_document(journals: list) -> dict:
+    # Key order of JournivExportDTO.model_dump(): journals before mood_definitions
+    return {
+        "export_version": "1.0",
+        "export_date": TIMESTAMP,
+        "app_version": "test",
+        "user_email": "reader@example.com",
+        "journals": journals,
+        "mood_definitions": [{"name": "happy", "category": "positive"}],
+        "stats": {"entry_count": sum(len(j["entries"]) for j in journals)},
+    }
+
+
+class TestExportDataReader:
+    """Test two-pass incremental reading."""
+
+    def test_scan_collects_outline_regardless_of_key_order(self, tmp_path):
+        data_path = tmp_path / "data.json"
+        data_path.write_text(json.dumps(_legacy_document([
+            _journal("First", [_entry("a"), _entry("b")]),
+            _journal("Second", []),
+        ])))
+
+        reader = ExportDataReader(data_path).scan()
+
+        assert reader.metadata["mood_definitions"] == [{"name": "happy", "category": "positive"}]
+        assert reader.metadata["stats"] == {"entry_count": 2}
+        assert [journal["title"] for journal in reader.journals] == ["First", "Second"]
+        assert "entries" not in reader.journals[0]
+        assert reader.journals[0]["updated_at"] == TIMESTAMP
+        assert reader.entry_counts == [2, 0]
+        assert reader.total_entries == 2
+
+    def test_iter_journals_skips_unconsumed_entries(self, tmp_path):
+        data_path = tmp_path / "data.json"
+        data_path.write_text(json.dumps(_legacy_document([
+            _journal("First", [_entry("a"), _entry("b")]),
+            _journal("Second", [_entry("c")]),
+        ])))
+        reader = ExportDataReader(data_path)
+
+        seen = []
+        for journal_fields, entries in reader.iter_journals():
+            seen.append((journal_fields["title"], next(entries)["title"]))
+
+        assert seen == [("First", "a"), ("Second", "c")]
+
+    def test_reads_streamed_export(self, tmp_path):
+        data_path = tmp_path / "data.json"
+        with open(data_path, "w", encoding="utf-8") as stream:
+            writer = ExportDataWriter(stream)
+            writer.begin({"export_version": "1.0", "mood_definitions": []})
+            writer.begin_journal({"title": "Only", "created_at": TIMESTAMP, "updated_at": TIMESTAMP})
+            for index in range(3):
+                writer.write_entry(_entry(f"e{index}"))
+            writer.end_journal()
+            writer.end({"stats": {"entry_count": 3}})
+
+        reader = ExportDataReader(data_path)
+        entries = [entry["title"] for _, journal_entries in reader.iter_journals() for entry in journal_entries]
+
+        assert entries == ["e0", "e1", "e2"]
+
+
+class TestValidateImportStream:
+    """Test per-record validation during the scan pass."""
+
+    def test_valid_document(self, tmp_path):
+        data_path = tmp_path / "data.json"
+        data_path.write_text(json.dumps(_legacy_document([
+            _journal("First", [_entry("a"), _entry("b")]),
+        ])))
+
+        result = validate_import_stream(ExportDataReader(data_path), "journiv")
+
+        assert result.valid
+        assert result.warnings == ["Journal 1: Contains entries with duplicate dates"]
+
+    def test_reports_invalid_entry_with_position(self, tmp_path):
+        bad_entry = _entry("bad")
+        del bad_entry["entry_datetime_utc"]
+        data_path = tmp_path / "data.json"
+        data_path.write_text(json.dumps(_legacy_document([
+            _journal("First", [_entry("a"), bad_entry]),
+        ])))
+
+        result = validate_import_stream(ExportDataReader(data_path), "journiv")
+
+        assert not result.valid
+        assert result.errors[0].startswith("Journal 1, Entry 2: Invalid entry")
+
+    def test_rejects_malformed_json(self, tmp_path):
+        data_path = tmp_path / "data.json"
+        data_path.write_text('{"export_version": "1.0", "journals": [')
+
+        result = validate_import_stream(ExportDataReader(data_path), "journiv")
+
+        assert not result.valid
+
+
+class TestOpenImportZip:
+    """Test opening an import archive without extracting media."""
+
+    def test_extracts_only_data_file(self, tmp_path):
+        zip_path = tmp_path / "import.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr("data.json", json.dumps(_legacy_document([])))
+            zipf.writestr("media/entry/photo.png", b"image-bytes")
+        extract_to = tmp_path / "extract"
+
+        result = ZipHandler.open_import_zip(zip_path, extract_to)
+
+        with result["media"] as media:
+            assert sorted(p.name for p in extract_to.rglob("*")) == ["data.json"]
+            assert "entry/photo.png" in media
+            assert len(media) == 1
+            with media.open("entry/photo.png") as member:
+                assert member.read() == b"image-bytes"
+
+    def test_rejects_unsafe_paths(self, tmp_path):
+        zip_path = tmp_path / "import.zip"
+        with zipfile.ZipFile(zip_path, "w") as zipf:
+            zipf.writestr("data.json", "{}")
+            zipf.writestr("media/../../escape.txt", b"x")
+
+        with pytest.raises(ValueError, match="unsafe path"):
+            ZipHandler.open_import_zip(zip_path, tmp_path / "extract")
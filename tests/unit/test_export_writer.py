@@ -0,0 +1,81 @@
+"""
+Unit tests for the incremental export writer.
+"""
+import io
+import json
+import zipfile
+
+import pytest
+
+from app.utils.import_export import ZipHandler
+from app.utils.import_export.export_writer import ExportDataWriter
+
+
+def _write_document(stream, journals):
+    writer = ExportDataWriter(stream)
+    writer.begin({"export_version": "1.0", "user_email": "ü@example.com", "mood_definitions": []})
+    for journal in journals:
+        writer.begin_journal({"title": journal["title"]})
+        for entry in journal["entries"]:
+            writer.write_entry(entry)
+        writer.end_journal()
+    writer.end({"stats": {"journal_count": len(journals)}})
+
+
+class TestExportDataWriter:
+    """Test incremental serialization of the export document."""
+
+    def test_output_matches_json_dump(self):
+        journals = [
+            {"title": "First", "entries": [{"title": "a", "content": "☃ \"quoted\""}, {"title": "b"}]},
+            {"title": "Empty", "entries": []},
+        ]
+        stream = io.StringIO()
+
+        _write_document(stream, journals)
+
+        assert json.loads(stream.getvalue()) == {
+            "export_version": "1.0",
+            "user_email": "ü@example.com",
+            "mood_definitions": [],
+            "journals": journals,
+            "stats": {"journal_count": 2},
+        }
+
+    def test_rejects_out_of_order_calls(self):
+        writer = ExportDataWriter(io.StringIO())
+        writer.begin({})
+
+        with pytest.raises(RuntimeError):
+            writer.write_entry({"title": "orphan"})
+
+        writer.begin_journal({"title": "Open"})
+        with pytest.raises(RuntimeError):
+            writer.end({})
+
+    def test_streaming_zip_contains_data_and_media(self, tmp_path):
+        media_source = tmp_path / "photo.png"
+        media_source.write_bytes(b"image-bytes")
+        output_path = tmp_path / "export.zip"
+
+        def write_data(stream):
+            _write_document(stream, [{"title": "Only", "entries": [{"title": "x"}]}])
+            return {"entry/media_photo.png": media_source}
+
+        size = ZipHandler.create_streaming_export_zip(output_path, write_data)
+
+        assert size == output_path.stat().st_size
+        with zipfile.ZipFile(output_path) as zipf:
+            assert json.loads(zipf.read("data.json"))["journals"][0]["entries"] == [{"title": "x"}]
+            assert zipf.read("media/entry/media_photo.png") == b"image-bytes"
+
+    def test_streaming_zip_removes_partial_archive_on_validation_error(self, tmp_path):
+        output_path = tmp_path / "export.zip"
+
+        def write_data(stream):
+            stream.write("{")
+            raise ValueError("Export validation failed")
+
+        with pytest.raises(ValueError):
+            ZipHandler.create_streaming_export_zip(output_path, write_data)
+        assert not output_path.exists()
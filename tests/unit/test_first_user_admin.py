@@ -0,0 +1,36 @@
+"""
+Unit tests for promoting the first registered user to admin.
+"""
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.models.enums import UserRole
+from app.schemas.user import UserCreate
+from app.services.user_service import UserService
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def _register(db, name):
+    return UserService(db).create_user(
+        UserCreate(email=f"{name}@example.com", password="Pass-1234-Aa1!", name=name)
+    )
+
+
+class TestFirstUserAdmin:
+    """Test that only the first user registered on SQLite becomes an admin."""
+
+    def test_first_user_becomes_admin(self, db):
+        first = _register(db, "first")
+        second = _register(db, "second")
+
+        assert first.role == UserRole.ADMIN
+        assert second.role == UserRole.USER
+        assert UserService(db).count_admin_users() == 1
@@ -0,0 +1,70 @@
+"""
+Unit tests for copying imported media out of an export.
+"""
+import io
+import uuid
+import zlib
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.config import settings
+from app.schemas.dto import ImportResultSummary, MediaDTO
+from app.services.import_service import ImportService
+
+
+class _FailingStream(io.BytesIO):
+    """A media stream that fails after its first chunk."""
+
+    def __init__(self, error: BaseException):
+        super().__init__(b"partial")
+        self.error = error
+
+    def read(self, size=-1):
+        if self.tell():
+            raise self.error
+        return super().read(size)
+
+
+def _import(tmp_path, monkeypatch, error):
+    monkeypatch.setattr(settings, "media_root", str(tmp_path / "media"))
+    monkeypatch.setattr(ImportService, "_open_media_source", staticmethod(lambda *_: _FailingStream(error)))
+    summary = ImportResultSummary()
+    result = ImportService(db=None)._import_media(
+        entry_id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        media_dto=MediaDTO(
+            filename="photo.jpg",
+            file_path="media/photo.jpg",
+            media_type="image",
+            file_size=7,
+            mime_type="image/jpeg",
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+        ),
+        media_dir=tmp_path,
+        id_mapper=None,
+        bulk=None,
+        existing_checksums=set(),
+        imported_media={},
+        pending_media_ids=[],
+        summary=summary,
+    )
+    return result, summary
+
+
+@pytest.mark.parametrize("error", [zlib.error("invalid block type"), EOFError("truncated")])
+def test_corrupt_member_is_skipped(tmp_path, monkeypatch, error):
+    result, summary = _import(tmp_path, monkeypatch, error)
+
+    assert result["imported"] is False
+    assert summary.media_files_skipped == 1
+    assert "Corrupted media file" in summary.warnings[0]
+    assert not list((tmp_path / "media" / "images").iterdir())
+
+
+def test_other_failures_remove_partial_copy(tmp_path, monkeypatch):
+    with pytest.raises(OSError):
+        _import(tmp_path, monkeypatch, OSError("disk full"))
+
+    assert not list((tmp_path / "media" / "images").iterdir())
@@ -0,0 +1,72 @@
+"""
+Unit tests for the queued logging pipeline and request log sampling.
+"""
+import logging
+import queue
+
+from app.core.logging_config import NonBlockingQueueHandler, _log_with_context
+from app.middleware.request_logging import RequestLogSampler
+
+
+def _record(message="hello %s", args=("world",)):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, args, None)
+
+
+class TestNonBlockingQueueHandler:
+    """Test that the queue handler never blocks and counts overflow."""
+
+    def test_records_are_queued_unformatted(self):
+        handler = NonBlockingQueueHandler(queue.Queue())
+
+        handler.handle(_record())
+
+        queued = handler.queue.get_nowait()
+        assert queued.msg == "hello %s"
+        assert queued.getMessage() == "hello world"
+
+    def test_full_queue_drops_and_counts(self):
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+
+        for _ in range(3):
+            handler.handle(_record())
+
+        assert handler.queue.qsize() == 1
+        assert handler.dropped == 2
+
+
+class TestLogWithContext:
+    """Test that context messages are only rendered when formatted."""
+
+    def test_context_is_rendered_and_sanitized_lazily(self):
+        logger = logging.getLogger("tests.logging_pipeline")
+        logger.propagate = False
+        handler = NonBlockingQueueHandler(queue.Queue())
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        try:
+            _log_with_context(logger, logging.DEBUG, "skipped")
+            _log_with_context(logger, logging.INFO, "saved", request_id="r1", entry_id=7, token="abc")
+        finally:
+            logger.removeHandler(handler)
+
+        assert handler.queue.qsize() == 1
+        record = handler.queue.get_nowait()
+        assert not isinstance(record.msg, str)
+        assert record.getMessage() == "[r1] saved (entry_id=7, token=***MASKED***)"
+
+
+class TestRequestLogSampler:
+    """Test per-route sample rates for successful requests."""
+
+    def test_longest_prefix_wins(self):
+        sampler = RequestLogSampler(0.5, {"/api/v1": 0.25, "/api/v1/health": 0})
+
+        assert sampler.rate("/api/v1/health") == 0
+        assert sampler.rate("/api/v1/entries") == 0.25
+        assert sampler.rate("/docs") == 0.5
+
+    def test_full_and_zero_rates(self):
+        sampler = RequestLogSampler(1.0, {"/api/v1/health": 0})
+
+        assert all(sampler.sample("/api/v1/entries") for _ in range(20))
+        assert not any(sampler.sample("/api/v1/health") for _ in range(20))
@@ -0,0 +1,85 @@
+"""
+Unit tests for claiming queued media processing jobs.
+"""
+import threading
+import uuid
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.core.config import settings
+from app.core.time_utils import utc_now
+from app.models.entry import EntryMedia
+from app.models.enums import MediaType, UploadStatus
+from app.services import file_processing_service
+from app.services.file_processing_service import FileProcessingService
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def _stale_media(db, attempts):
+    media = EntryMedia(
+        entry_id=uuid.uuid4(),
+        media_type=MediaType.IMAGE,
+        file_path="images/a.jpg",
+        original_filename="a.jpg",
+        file_size=1,
+        mime_type="image/jpeg",
+        upload_status=UploadStatus.PROCESSING,
+        processing_attempts=attempts,
+        updated_at=utc_now() - timedelta(seconds=settings.media_processing_stale_seconds + 60),
+    )
+    db.add(media)
+    db.commit()
+    return str(media.id)
+
+
+class TestMediaClaim:
+    """Test that media which keeps killing its worker is not retried forever."""
+
+    def test_stale_media_is_reclaimed_until_attempts_run_out(self, db):
+        retryable = _stale_media(db, settings.media_processing_max_attempts - 1)
+        exhausted = _stale_media(db, settings.media_processing_max_attempts)
+        service = FileProcessingService(db)
+
+        assert service.claim(exhausted) is None
+        assert service.claim(retryable) is not None
+
+    def test_exhausted_media_is_marked_failed(self, db):
+        media_id = _stale_media(db, settings.media_processing_max_attempts)
+
+        assert FileProcessingService(db).fail_exhausted_media() == 1
+        assert db.get(EntryMedia, uuid.UUID(media_id)).upload_status == UploadStatus.FAILED
+
+
+class TestRecoverySweep:
+    """Test that stale media is picked up again without a restart."""
+
+    def test_sweep_requeues_stale_media(self, db, monkeypatch):
+        media_id = _stale_media(db, 0)
+        dispatched = threading.Event()
+
+        def fake_dispatch(queued_id, delay_seconds=0):
+            if queued_id == media_id:
+                dispatched.set()
+
+        monkeypatch.setattr(file_processing_service, "_dispatch", fake_dispatch)
+        monkeypatch.setattr("app.core.database.engine", db.get_bind())
+        sweep = threading.Thread(target=file_processing_service._recovery_loop, args=(0.01,))
+        sweep.start()
+        try:
+            assert dispatched.wait(5)
+        finally:
+            file_processing_service._recovery_stop.set()
+            sweep.join()
+            file_processing_service._recovery_stop.clear()
@@ -0,0 +1,108 @@
+"""
+Unit tests for on-demand media derivatives.
+"""
+import os
+import uuid
+
+import pytest
+from PIL import Image
+
+from app.core.config import settings
+from app.services.bulk_delete_service import MediaFile, unlink_media_files
+from app.services.media_derivative_service import MediaDerivativeService
+
+
+@pytest.fixture
+def derivatives(tmp_path, monkeypatch):
+    monkeypatch.setattr(MediaDerivativeService, "_cache_bytes", None)
+    return MediaDerivativeService(media_root=tmp_path, max_cache_bytes=10 * 1024 * 1024)
+
+
+def _image(path, size=(1200, 800), mode="RGB"):
+    Image.new(mode, size, "red").save(path)
+    return path
+
+
+class TestNegotiation:
+    """Test width snapping and format selection."""
+
+    def test_snap_width_rounds_up_and_caps(self):
+        assert MediaDerivativeService.snap_width(1) == 160
+        assert MediaDerivativeService.snap_width(321) == 640
+        assert MediaDerivativeService.snap_width(10_000) == MediaDerivativeService.WIDTHS[-1]
+
+    def test_negotiate_format_prefers_accepted_modern_formats(self):
+        supported = MediaDerivativeService.supported_formats()
+        if "webp" in supported:
+            assert MediaDerivativeService.negotiate_format("image/webp,*/*") == "webp"
+        assert MediaDerivativeService.negotiate_format("text/html") == "jpeg"
+        assert MediaDerivativeService.negotiate_format(None) == "jpeg"
+
+
+class TestGetDerivative:
+    """Test generation, caching and eviction."""
+
+    def test_resizes_without_upscaling(self, derivatives, tmp_path):
+        source = _image(tmp_path / "photo.png")
+        media_id = uuid.uuid4()
+
+        resized = derivatives.get_derivative(source, media_id, 300, "jpeg")
+        narrow = derivatives.get_derivative(_image(tmp_path / "small.png", (100, 50)), uuid.uuid4(), 640, "jpeg")
+
+        with Image.open(resized) as img:
+            assert img.size == (320, 213)
+            assert img.format == "JPEG"
+        with Image.open(narrow) as img:
+            assert img.size == (100, 50)
+
+    def test_cache_hit_reuses_file(self, derivatives, tmp_path):
+        source = _image(tmp_path / "photo.png")
+        media_id = uuid.uuid4()
+        first = derivatives.get_derivative(source, media_id, 640, "jpeg")
+        source_mtime_ns = source.stat().st_mtime_ns
+        os.utime(first, ns=(source_mtime_ns, source_mtime_ns))
+        inode = first.stat().st_ino
+
+        second = derivatives.get_derivative(source, media_id, 600, "jpeg")
+
+        assert second == first
+        assert second.stat().st_ino == inode
+        assert second.stat().st_mtime_ns > source_mtime_ns
+
+    def test_evicts_least_recently_used(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(MediaDerivativeService, "_cache_bytes", None)
+        source = _image(tmp_path / "photo.png")
+        first_id, second_id = uuid.uuid4(), uuid.uuid4()
+        unlimited = MediaDerivativeService(media_root=tmp_path, max_cache_bytes=10 * 1024 * 1024)
+        oldest = unlimited.get_derivative(source, first_id, 640, "jpeg")
+        os.utime(oldest, (1, 1))
+        quota = oldest.stat().st_size * 2 - 1
+
+        limited = MediaDerivativeService(media_root=tmp_path, max_cache_bytes=quota)
+        newest = limited.get_derivative(source, second_id, 640, "jpeg")
+
+        assert newest.exists()
+        assert not oldest.exists()
+
+    def test_purge_removes_media_derivatives(self, derivatives, tmp_path):
+        source = _image(tmp_path / "photo.png")
+        media_id = uuid.uuid4()
+        path = derivatives.get_derivative(source, media_id, 160, "jpeg")
+
+        derivatives.purge(media_id)
+
+        assert not path.exists()
+
+    def test_hard_delete_removes_derivatives(self, derivatives, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "media_root", str(tmp_path))
+        source = _image(tmp_path / "photo.png")
+        media_id, missing_id = uuid.uuid4(), uuid.uuid4()
+        path = derivatives.get_derivative(source, media_id, 160, "jpeg")
+        orphan = derivatives.get_derivative(source, missing_id, 160, "jpeg")
+
+        removed = unlink_media_files([MediaFile(media_id, str(source)), MediaFile(missing_id)])
+
+        assert removed == 1
+        assert not source.exists()
+        assert not path.exists()
+        assert not orphan.exists()
@@ -0,0 +1,56 @@
+"""
+Unit tests for the streaming upload pipeline in app.services.media_service.
+"""
+import hashlib
+import io
+
+import pytest
+from fastapi import UploadFile
+
+from app.core.exceptions import FileTooLargeError, InvalidFileTypeError
+from app.models.enums import MediaType
+from app.services import media_service as media_service_module
+from app.services.media_service import MediaService
+
+PNG_HEADER = bytes.fromhex("89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c489")
+
+
+@pytest.fixture
+def media_service(tmp_path, monkeypatch):
+    monkeypatch.setattr(media_service_module.settings, "media_root", str(tmp_path))
+    monkeypatch.setattr(media_service_module.settings, "max_file_size_mb", 1)
+    return MediaService()
+
+
+def _upload(filename: str, content: bytes) -> UploadFile:
+    return UploadFile(file=io.BytesIO(content), filename=filename)
+
+
+class TestSaveUploadedStream:
+    """Test chunked upload streaming."""
+
+    async def test_streams_file_with_incremental_checksum(self, media_service, tmp_path):
+        content = PNG_HEADER + b"\0" * (MediaService.UPLOAD_CHUNK_SIZE * 3 + 17)
+
+        info = await media_service.save_uploaded_stream(_upload("photo.png", content), "user")
+
+        assert info["media_type"] == MediaType.IMAGE
+        assert info["mime_type"] == "image/png"
+        assert info["file_size"] == len(content)
+        assert info["checksum"] == hashlib.sha256(content).hexdigest()
+        assert (tmp_path / info["file_path"]).read_bytes() == content
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    async def test_aborts_mid_stream_when_limit_exceeded(self, media_service, tmp_path):
+        content = PNG_HEADER + b"\0" * (1024 * 1024)
+
+        with pytest.raises(FileTooLargeError):
+            await media_service.save_uploaded_stream(_upload("photo.png", content), "user")
+
+        assert not [path for path in tmp_path.rglob("*") if path.is_file()]
+
+    async def test_rejects_type_from_first_block(self, media_service, tmp_path):
+        with pytest.raises(InvalidFileTypeError):
+            await media_service.save_uploaded_stream(_upload("notes.png", b"just some text"), "user")
+
+        assert not [path for path in tmp_path.rglob("*") if path.is_file()]
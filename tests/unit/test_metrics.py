@@ -0,0 +1,95 @@
+"""
+Unit tests for the Prometheus metrics instrumentation.
+"""
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from prometheus_client.mmap_dict import MmapedDict, mmap_key
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
+from sqlmodel import create_engine
+
+from app.core.metrics import instrument_engine, is_authorized, record_cache_lookup, render_metrics
+from app.middleware.metrics import MetricsMiddleware
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(f"journiv_{name}", labels) or 0.0
+
+
+class TestMetricsMiddleware:
+    """Test that request latency is labelled by route template."""
+
+    def test_route_template_is_used_as_label(self):
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/items/{item_id}")
+        async def read_item(item_id: int):
+            return {"id": item_id}
+
+        labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+        before = _sample("http_request_duration_seconds_count", **labels)
+        client = TestClient(app)
+        client.get("/items/1")
+        client.get("/items/2")
+
+        assert _sample("http_request_duration_seconds_count", **labels) == before + 2
+        assert client.get("/missing").status_code == 404
+        assert _sample("http_request_duration_seconds_count", method="GET", route="unmatched", status="404") >= 1
+
+
+class TestEngineInstrumentation:
+    """Test query and pool metrics of an instrumented engine."""
+
+    def test_queries_are_counted_by_operation(self):
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        instrument_engine(engine, "test")
+        before = _sample("db_queries_total", engine="test", operation="SELECT")
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            assert _sample("db_pool_checked_out_connections", engine="test") == 1
+
+        assert _sample("db_queries_total", engine="test", operation="SELECT") == before + 1
+        assert _sample("db_query_duration_seconds_count", engine="test", operation="SELECT") == before + 1
+        assert _sample("db_pool_checked_out_connections", engine="test") == 0
+
+
+class TestRenderMetrics:
+    """Test the text exposition output."""
+
+    def test_cache_lookups_are_exposed(self):
+        record_cache_lookup("unit", True)
+        record_cache_lookup("unit", False)
+
+        body, content_type = render_metrics()
+
+        assert content_type.startswith("text/plain")
+        assert b'journiv_cache_lookups_total{cache="unit",result="hit"} 1.0' in body
+        assert b'journiv_cache_lookups_total{cache="unit",result="miss"} 1.0' in body
+
+    def test_service_directories_are_aggregated(self, tmp_path, monkeypatch):
+        key = mmap_key("journiv_unit_jobs", "journiv_unit_jobs_total", [], [], "Unit jobs.")
+        for service, value in (("app", 1.0), ("celery-worker", 2.0)):
+            (tmp_path / service).mkdir()
+            values = MmapedDict(str(tmp_path / service / "counter_7.db"))
+            values.write_value(key, value, 0)
+            values.close()
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path / "app"))
+
+        body, _ = render_metrics()
+
+        assert b"journiv_unit_jobs_total 3.0" in body
+
+
+class TestIsAuthorized:
+    """Test the bearer token check of the metrics endpoint."""
+
+    def test_token_is_required_when_configured(self):
+        assert is_authorized(None, None)
+        assert is_authorized("Bearer secret", "secret")
+        assert is_authorized("bearer secret", "secret")
+        assert not is_authorized(None, "secret")
+        assert not is_authorized("Bearer wrong", "secret")
+        assert not is_authorized("Basic secret", "secret")
@@ -0,0 +1,72 @@
+"""
+Unit tests for keyset pagination cursors.
+"""
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+from app.core.pagination import InvalidCursorError, after_cursor, decode_cursor, encode_cursor, next_cursor
+
+
+class CursorRow(SQLModel, table=True):
+    __tablename__ = "test_cursor_row"
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    created_at: datetime
+
+
+class TestCursorTokens:
+    """Test cursor encoding round trips and rejection of bad tokens."""
+
+    def test_round_trip(self):
+        key = (True, datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc), uuid.uuid4())
+
+        token = encode_cursor(key)
+
+        assert "=" not in token
+        assert decode_cursor(token, (bool, datetime, uuid.UUID)) == key
+
+    def test_naive_datetimes_are_treated_as_utc(self):
+        token = encode_cursor((datetime(2025, 1, 1),))
+
+        assert decode_cursor(token, (datetime,)) == (datetime(2025, 1, 1, tzinfo=timezone.utc),)
+
+    @pytest.mark.parametrize("token", ["not-a-cursor", "", encode_cursor((1, 2)), encode_cursor(("x", "y"))])
+    def test_rejects_invalid_tokens(self, token):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(token, (datetime, uuid.UUID))
+
+    def test_next_cursor_only_for_full_pages(self):
+        rows = [(datetime(2025, 1, 1, tzinfo=timezone.utc), uuid.uuid4())]
+
+        assert next_cursor(rows, 2, lambda row: row) is None
+        assert decode_cursor(next_cursor(rows, 1, lambda row: row), (datetime, uuid.UUID)) == rows[0]
+
+
+def test_after_cursor_pages_through_ties():
+    engine = create_engine("sqlite://")
+    CursorRow.__table__.create(engine)
+    same_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    with Session(engine) as session:
+        for day in (1, 1, 1, 2, 3):
+            session.add(CursorRow(created_at=same_time.replace(day=day)))
+        session.commit()
+
+        sort_columns = (CursorRow.created_at, CursorRow.id)
+        key = lambda row: (row.created_at, row.id)
+        seen = []
+        cursor = None
+        while True:
+            statement = select(CursorRow)
+            if cursor:
+                statement = statement.where(after_cursor(sort_columns, decode_cursor(cursor, (datetime, uuid.UUID))))
+            page = list(session.exec(statement.order_by(*(column.desc() for column in sort_columns)).limit(2)))
+            seen.extend(page)
+            cursor = next_cursor(page, 2, key)
+            if not cursor:
+                break
+
+        expected = session.exec(select(CursorRow).order_by(CursorRow.created_at.desc(), CursorRow.id.desc())).all()
+        assert [row.id for row in seen] == [row.id for row in expected]
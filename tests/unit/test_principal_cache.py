@@ -0,0 +1,109 @@
+"""
+Unit tests for the authenticated principal cache.
+"""
+import uuid
+
+import fakeredis
+
+from app.core import principal_cache
+from app.core.principal_cache import VERSION_KEY_PREFIX, PrincipalCache
+from app.models.enums import UserRole
+from app.models.user import User
+
+
+def _user(**overrides) -> User:
+    fields = {
+        "id": uuid.uuid4(),
+        "email": "principal@example.com",
+        "password": "hashed-password",
+        "name": "Principal",
+        "role": UserRole.USER,
+        "is_active": True,
+    }
+    fields.update(overrides)
+    return User(**fields)
+
+
+class TestPrincipalCache:
+    """Test caching, expiry and version-based invalidation."""
+
+    def test_hit_returns_detached_copy_without_password(self):
+        cache = PrincipalCache(ttl_seconds=60, max_entries=10)
+        user = _user(role=UserRole.ADMIN)
+        cache.put(user, cache.version(user.id))
+
+        cached = cache.get(user.id)
+
+        assert cached is not user
+        assert (cached.id, cached.email, cached.role, cached.is_active) == (
+            user.id, user.email, UserRole.ADMIN, True
+        )
+        assert cached.password is None
+
+    def test_invalidate_drops_entry(self):
+        cache = PrincipalCache(ttl_seconds=60, max_entries=10)
+        user = _user()
+        cache.put(user, cache.version(user.id))
+
+        cache.invalidate(user.id)
+
+        assert cache.get(user.id) is None
+
+    def test_put_with_outdated_version_is_not_served(self):
+        cache = PrincipalCache(ttl_seconds=60, max_entries=10)
+        user = _user()
+        version = cache.version(user.id)
+        # The user changes while the request that read `version` is loading it
+        cache.invalidate(user.id)
+        cache.put(user, version)
+
+        assert cache.get(user.id) is None
+
+    def test_expired_entries_are_misses(self, monkeypatch):
+        cache = PrincipalCache(ttl_seconds=60, max_entries=10)
+        user = _user()
+        cache.put(user, cache.version(user.id))
+        now = principal_cache.time.monotonic()
+        monkeypatch.setattr(principal_cache.time, "monotonic", lambda: now + 61)
+
+        assert cache.get(user.id) is None
+
+    def test_evicts_least_recently_used(self):
+        cache = PrincipalCache(ttl_seconds=60, max_entries=2)
+        first, second, third = _user(), _user(), _user()
+        for user in (first, second):
+            cache.put(user, cache.version(user.id))
+        cache.get(first.id)
+
+        cache.put(third, cache.version(third.id))
+
+        assert cache.get(second.id) is None
+        assert cache.get(first.id) is not None
+        assert cache.get(third.id) is not None
+
+    def test_disabled_cache_never_hits(self):
+        cache = PrincipalCache(ttl_seconds=0, max_entries=10)
+        user = _user()
+        cache.put(user, cache.version(user.id))
+
+        assert cache.get(user.id) is None
+
+    def test_hits_recheck_shared_version_once_per_poll(self, monkeypatch):
+        redis_client = fakeredis.FakeRedis(decode_responses=True)
+        cache = PrincipalCache(ttl_seconds=60, max_entries=10, redis_client=redis_client, poll_seconds=30)
+        user = _user()
+        cache.put(user, cache.version(user.id))
+        reads = []
+        read_version = redis_client.get
+        monkeypatch.setattr(redis_client, "get", lambda key: reads.append(key) or read_version(key))
+
+        assert all(cache.get(user.id) is not None for _ in range(5))
+        assert len(reads) == 1
+
+        # Another worker changes the user; seen once the poll interval has passed
+        redis_client.incr(f"{VERSION_KEY_PREFIX}{user.id}")
+        assert cache.get(user.id) is not None
+        now = principal_cache.time.monotonic()
+        monkeypatch.setattr(principal_cache.time, "monotonic", lambda: now + 31)
+
+        assert cache.get(user.id) is None
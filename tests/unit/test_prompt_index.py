@@ -0,0 +1,89 @@
+"""
+Unit tests for the in-memory prompt selection index.
+"""
+import uuid
+from datetime import date
+
+from app.core.cache import InMemoryCache
+from app.core.reference_cache import PROMPTS_NAMESPACE, ReferenceCache
+from app.core.time_utils import utc_now
+from app.schemas.prompt import PromptResponse
+from app.services.prompt_index import PromptIndex, PromptSelection, stable_index
+
+
+def _prompt(text, category=None, difficulty_level=1):
+    now = utc_now()
+    return PromptResponse(
+        id=uuid.uuid4(),
+        text=text,
+        category=category,
+        difficulty_level=difficulty_level,
+        is_active=True,
+        usage_count=0,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class TestPromptSelection:
+    """Test bucketed random selection and stable daily selection."""
+
+    def test_random_respects_filters(self):
+        gratitude = _prompt("Thankful for?", category="gratitude", difficulty_level=2)
+        selection = PromptSelection.build([gratitude, _prompt("Goals?", category="goals", difficulty_level=2)])
+
+        assert selection.random("gratitude") == gratitude
+        assert selection.random("gratitude", 2) == gratitude
+        assert selection.random(None, 2) is not None
+        assert selection.random("gratitude", 5) is None
+        assert len(selection) == 2
+
+    def test_daily_prompt_does_not_depend_on_input_order(self):
+        prompts = [_prompt(f"Prompt {number}") for number in range(10)]
+        user_id = uuid.uuid4()
+        day = date(2025, 4, 1)
+
+        forward = PromptSelection.build(prompts).daily(user_id, day)
+        backward = PromptSelection.build(reversed(prompts)).daily(user_id, day)
+
+        assert forward == backward
+
+    def test_stable_index_is_deterministic(self):
+        assert stable_index("user_2025-04-01", 7) == stable_index("user_2025-04-01", 7)
+        assert 0 <= stable_index("anything", 3) < 3
+
+    def test_empty_selection(self):
+        selection = PromptSelection.build([])
+
+        assert selection.random() is None
+        assert selection.daily(uuid.uuid4(), date(2025, 4, 1)) is None
+
+
+class TestPromptIndex:
+    """Test that selections follow the shared prompts version."""
+
+    def test_selection_is_dropped_after_invalidation(self):
+        reference_cache = ReferenceCache(InMemoryCache(), ttl_seconds=60, poll_seconds=0)
+        index = PromptIndex(reference_cache)
+        selection = PromptSelection.build([_prompt("Hello?")])
+        index.put(None, index.version(), selection)
+
+        assert index.get(None) is selection
+
+        reference_cache.invalidate(PROMPTS_NAMESPACE)
+
+        assert index.get(None) is None
+
+    def test_owners_are_bounded(self):
+        index = PromptIndex(ReferenceCache(InMemoryCache(), ttl_seconds=60, poll_seconds=60), max_owners=1)
+        version = index.version()
+        index.put(None, version, PromptSelection.build([]))
+        index.put(uuid.uuid4(), version, PromptSelection.build([]))
+
+        assert index.get(None) is None
+
+    def test_disabled_reference_cache_keeps_nothing(self):
+        index = PromptIndex(ReferenceCache(None, ttl_seconds=60))
+        index.put(None, index.version(), PromptSelection.build([]))
+
+        assert index.get(None) is None
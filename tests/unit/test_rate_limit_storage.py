@@ -0,0 +1,68 @@
+"""
+Unit tests for the leased Redis rate limit storage.
+"""
+import uuid
+
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import SlidingWindowCounterRateLimiter
+
+from app.core.rate_limit_storage import LeasedRedisStorage
+
+
+def _workers(count, lease_size=10):
+    return [
+        SlidingWindowCounterRateLimiter(LeasedRedisStorage("leased+fakeredis://", lease_size=lease_size))
+        for _ in range(count)
+    ]
+
+
+class TestLeasedRedisStorage:
+    """Test shared limits across workers that lease tokens locally."""
+
+    def test_scheme_is_registered(self):
+        assert isinstance(storage_from_string("leased+fakeredis://"), LeasedRedisStorage)
+
+    def test_limit_holds_across_workers(self):
+        limit = parse("100/minute")
+        client = uuid.uuid4().hex
+        workers = _workers(3)
+
+        admitted = sum(workers[hit % 3].hit(limit, client) for hit in range(300))
+
+        assert 70 <= admitted <= 100
+
+    def test_small_limits_are_exact(self):
+        limit = parse("5/minute")
+        client = uuid.uuid4().hex
+        worker_a, worker_b = _workers(2)
+
+        admitted = [worker.hit(limit, client) for worker in (worker_a, worker_b) * 4]
+
+        assert admitted.count(True) == 5
+
+    def test_hits_are_served_from_a_lease(self):
+        limit = parse("1000/hour")
+        client = uuid.uuid4().hex
+        (worker,) = _workers(1)
+
+        assert worker.hit(limit, client)
+        previous, _, current, _ = worker.storage.get_sliding_window(limit.key_for(client), limit.get_expiry())
+
+        # One round trip reserved a batch of ten, nine remain leased locally
+        assert previous + current == 10
+        assert all(worker.hit(limit, client) for _ in range(9))
+        _, _, current, _ = worker.storage.get_sliding_window(limit.key_for(client), limit.get_expiry())
+        assert current == 10
+
+    def test_clear_resets_the_window(self):
+        limit = parse("2/minute")
+        client = uuid.uuid4().hex
+        (worker,) = _workers(1)
+        worker.hit(limit, client)
+        worker.hit(limit, client)
+        assert not worker.hit(limit, client)
+
+        worker.clear(limit, client)
+
+        assert worker.hit(limit, client)
@@ -0,0 +1,71 @@
+"""
+Unit tests for the shared reference data cache.
+"""
+import json
+
+from app.core.cache import InMemoryCache
+from app.core.reference_cache import ReferenceCache
+
+
+def _loader(data, calls):
+    def load():
+        calls.append(1)
+        return data
+    return load
+
+
+class TestReferenceCache:
+    """Test serialized hits and invalidation across workers sharing one backend."""
+
+    def test_listing_is_loaded_once_and_served_as_bytes(self):
+        cache = ReferenceCache(InMemoryCache(), ttl_seconds=60, poll_seconds=60)
+        calls = []
+        load = _loader([{"name": "happy"}], calls)
+
+        first = cache.get_or_load("moods", "__all__", load)
+        second = cache.get_or_load("moods", "__all__", load)
+
+        assert len(calls) == 1
+        assert first == second
+        assert json.loads(second) == [{"name": "happy"}]
+
+    def test_invalidation_reaches_other_workers(self):
+        backend = InMemoryCache()
+        worker_a = ReferenceCache(backend, ttl_seconds=60, poll_seconds=0)
+        worker_b = ReferenceCache(backend, ttl_seconds=60, poll_seconds=0)
+        worker_a.get_or_load("prompts", "any", lambda: ["old"])
+        assert json.loads(worker_b.get_or_load("prompts", "any", lambda: ["unused"])) == ["old"]
+
+        worker_a.invalidate("prompts")
+
+        assert json.loads(worker_b.get_or_load("prompts", "any", lambda: ["new"])) == ["new"]
+
+    def test_workers_poll_the_version_at_most_once_per_interval(self):
+        backend = InMemoryCache()
+        worker_a = ReferenceCache(backend, ttl_seconds=60, poll_seconds=0)
+        worker_b = ReferenceCache(backend, ttl_seconds=60, poll_seconds=60)
+        worker_b.get_or_load("moods", "__all__", lambda: ["old"])
+
+        worker_a.invalidate("moods")
+
+        # Served from worker_b's memory until its next poll
+        assert json.loads(worker_b.get_or_load("moods", "__all__", lambda: ["new"])) == ["old"]
+
+    def test_namespaces_are_isolated(self):
+        cache = ReferenceCache(InMemoryCache(), ttl_seconds=60, poll_seconds=60)
+        cache.get_or_load("moods", "__all__", lambda: ["mood"])
+        cache.get_or_load("prompts", "__all__", lambda: ["prompt"])
+
+        cache.invalidate("prompts")
+
+        assert json.loads(cache.get_or_load("moods", "__all__", lambda: ["other"])) == ["mood"]
+        assert json.loads(cache.get_or_load("prompts", "__all__", lambda: ["fresh"])) == ["fresh"]
+
+    def test_disabled_without_backend(self):
+        cache = ReferenceCache(None, ttl_seconds=60)
+        calls = []
+
+        cache.get_or_load("moods", "__all__", _loader([], calls))
+        cache.get_or_load("moods", "__all__", _loader([], calls))
+
+        assert len(calls) == 2
@@ -0,0 +1,59 @@
+"""
+Unit tests for the in-memory tag autocomplete index.
+"""
+import uuid
+
+from app.core.cache import InMemoryCache
+from app.core.reference_cache import ReferenceCache
+from app.schemas.tag import TagSuggestion
+from app.services.tag_index import TagAutocomplete, TagIndex
+
+
+def _tags(**usage):
+    return [TagSuggestion(id=uuid.uuid4(), name=name, usage_count=count) for name, count in usage.items()]
+
+
+def _names(suggestions):
+    return [suggestion.name for suggestion in suggestions]
+
+
+class TestTagAutocomplete:
+    """Test prefix and trigram matching and usage ranking."""
+
+    def test_prefix_matches_are_ranked_by_usage(self):
+        autocomplete = TagAutocomplete(_tags(work=3, workout=9, weekend=5, walking=1))
+
+        assert _names(autocomplete.suggest("wo", 10)) == ["workout", "work"]
+        assert _names(autocomplete.suggest("W", 2)) == ["workout", "weekend"]
+
+    def test_infix_matches_follow_prefix_matches(self):
+        autocomplete = TagAutocomplete(_tags(homework=50, work=1, network=7, walk=3))
+
+        assert _names(autocomplete.suggest("work", 10)) == ["work", "homework", "network"]
+        assert _names(autocomplete.suggest("work", 2)) == ["work", "homework"]
+
+    def test_short_queries_only_match_prefixes(self):
+        autocomplete = TagAutocomplete(_tags(travel=1, art=1))
+
+        assert _names(autocomplete.suggest("a", 10)) == ["art"]
+
+    def test_no_match(self):
+        autocomplete = TagAutocomplete(_tags(family=1))
+
+        assert autocomplete.suggest("xyz", 10) == []
+        assert autocomplete.suggest("  ", 10) == []
+
+
+class TestTagIndex:
+    """Test that indexes follow each user's tags version."""
+
+    def test_invalidation_only_drops_that_user(self):
+        index = TagIndex(ReferenceCache(InMemoryCache(), ttl_seconds=60, poll_seconds=0))
+        alice, bob = uuid.uuid4(), uuid.uuid4()
+        for user_id in (alice, bob):
+            index.put(user_id, index.version(user_id), TagAutocomplete(_tags(home=1)))
+
+        index.invalidate(alice)
+
+        assert index.get(alice) is None
+        assert index.get(bob) is not None
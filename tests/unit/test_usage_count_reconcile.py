@@ -0,0 +1,116 @@
+"""
+Unit tests for tag and prompt usage count maintenance.
+"""
+import uuid
+from datetime import date
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.core.time_utils import utc_now
+from app.models.entry import Entry
+from app.models.entry_tag_link import EntryTagLink
+from app.models.prompt import Prompt
+from app.models.tag import Tag
+from app.services.tag_service import TagService
+from app.services.usage_count_service import UsageCountService
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def _entry(db, user_id, prompt_id=None):
+    entry = Entry(
+        user_id=user_id,
+        journal_id=uuid.uuid4(),
+        content="Entry",
+        entry_date=date(2025, 1, 1),
+        entry_datetime_utc=utc_now(),
+        prompt_id=prompt_id,
+    )
+    db.add(entry)
+    return entry.id
+
+
+def _tag(db, user_id, name, usage_count, links):
+    tag = Tag(user_id=user_id, name=name, usage_count=usage_count)
+    db.add(tag)
+    for _ in range(links):
+        db.add(EntryTagLink(entry_id=_entry(db, user_id), tag_id=tag.id))
+    return tag.id
+
+
+def _usage_counts(db, model):
+    return dict(db.exec(select(model.id, model.usage_count)).all())
+
+
+class TestReconcile:
+    """Test that reconciliation fixes drift without losing concurrent updates."""
+
+    def test_corrects_drift_in_chunks(self, db):
+        user_id = uuid.uuid4()
+        tags = {
+            _tag(db, user_id, "accurate", 2, 2): 2,
+            _tag(db, user_id, "overcounted", 5, 1): 1,
+            _tag(db, user_id, "undercounted", 0, 3): 3,
+            _tag(db, user_id, "unused", 4, 0): 0,
+            _tag(db, user_id, "exact", 1, 1): 1,
+        }
+        prompt = Prompt(text="What went well today?", usage_count=3)
+        db.add(prompt)
+        _entry(db, user_id, prompt.id)
+        db.commit()
+
+        report = UsageCountService(db).reconcile(batch_size=2)
+
+        assert report == {
+            "tags": {"checked": 5, "corrected": 3, "drift": 4 + 3 + 4},
+            "prompts": {"checked": 1, "corrected": 1, "drift": 2},
+        }
+        assert _usage_counts(db, Tag) == tags
+        assert _usage_counts(db, Prompt) == {prompt.id: 1}
+        assert UsageCountService(db).reconcile(batch_size=2)["tags"]["corrected"] == 0
+
+    def test_concurrent_change_is_not_overwritten(self, db, monkeypatch):
+        user_id = uuid.uuid4()
+        raced = _tag(db, user_id, "raced", 5, 1)
+        drifted = _tag(db, user_id, "drifted", 7, 2)
+        db.commit()
+        service = UsageCountService(db)
+        execute_chunk = service._execute_chunk
+
+        def execute_after_concurrent_increment(statement, parameters):
+            # Another request links the tag between the read and the update
+            db.execute(sa.update(Tag.__table__).where(Tag.id == raced).values(usage_count=Tag.usage_count + 1))
+            execute_chunk(statement, parameters)
+
+        monkeypatch.setattr(service, "_execute_chunk", execute_after_concurrent_increment)
+        report = service.reconcile(batch_size=2)
+
+        assert report["tags"]["corrected"] == 2
+        assert _usage_counts(db, Tag) == {raced: 6, drifted: 2}
+
+
+class TestAdjustUsageCounts:
+    """Test the relative usage count updates made by tag writes."""
+
+    def test_adjusts_relative_to_stored_value_and_never_below_zero(self, db):
+        user_id = uuid.uuid4()
+        busy = _tag(db, user_id, "busy", 3, 0)
+        rare = _tag(db, user_id, "rare", 0, 0)
+        db.commit()
+        service = TagService(db)
+
+        # A change committed elsewhere after this session last read the tags
+        db.execute(sa.update(Tag.__table__).where(Tag.id == busy).values(usage_count=10))
+        service._adjust_usage_counts([busy, rare], -1)
+        db.commit()
+
+        assert _usage_counts(db, Tag) == {busy: 9, rare: 0}